@@ -50,6 +50,7 @@ from app.schemas.tags import TagRef
 from app.schemas.tasks import TaskCommentCreate, TaskCommentRead, TaskCreate, TaskRead, TaskUpdate
 from app.services.activity_log import record_activity
 from app.services.openclaw.coordination_service import GatewayCoordinationService
+from app.services.openclaw.notification_outbox import publish_agent_notifications
 from app.services.openclaw.policies import OpenClawAuthorizationPolicy
 from app.services.openclaw.provisioning_db import AgentLifecycleService
 from app.services.tags import replace_tags, validate_tag_ids
@@ -734,8 +735,6 @@ async def create_task(
         task_id=task.id,
         tag_ids=normalized_tag_ids,
     )
-    await session.commit()
-    await session.refresh(task)
     record_activity(
         session,
         event_type="task.created",
@@ -743,18 +742,20 @@ async def create_task(
         message=f"Task created by lead: {task.title}.",
         agent_id=agent_ctx.agent.id,
     )
-    await session.commit()
     if task.assigned_agent_id:
         assigned_agent = await Agent.objects.by_id(task.assigned_agent_id).first(
             session,
         )
         if assigned_agent:
-            await tasks_api.notify_agent_on_task_assign(
+            tasks_api.notify_agent_on_task_assign(
                 session=session,
                 board=board,
                 task=task,
                 agent=assigned_agent,
             )
+    await session.commit()
+    publish_agent_notifications(session)
+    await session.refresh(task)
     return await tasks_api._task_read_response(
         session,
         task=task,
@@ -4,14 +4,20 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from app.api.deps import require_org_admin
 from app.core.auth import AuthContext, get_auth_context
+from app.core.auth_metrics import auth_metrics
 from app.core.auth_mode import AuthMode
 from app.core.config import settings
+from app.core.kdf_executor import kdf_executor
+from app.schemas.auth import AuthMetricsRead, AuthTimingRead, KdfExecutorRead
 from app.schemas.errors import LLMErrorResponse
 from app.schemas.users import UserRead
+from app.services.organizations import OrganizationContext
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 AUTH_CONTEXT_DEP = Depends(get_auth_context)
+ORG_ADMIN_DEP = Depends(require_org_admin)
 
 
 @router.post(
@@ -81,3 +87,43 @@ async def local_auth_status() -> dict[str, object]:
         "bypass_available": not token_required,
         "reason": "Token is configured." if token_required else "No token configured.",
     }
+
+
+@router.get(
+    "/metrics",
+    response_model=AuthMetricsRead,
+    summary="Authentication Timing Counters",
+    description=(
+        "Per-route counters for this API process showing which authenticator ran "
+        "(agent or user) and how long it took, plus the load of the token-hashing "
+        "thread pool."
+    ),
+)
+async def auth_timing_metrics(
+    _ctx: OrganizationContext = ORG_ADMIN_DEP,
+) -> AuthMetricsRead:
+    """Return per-route authentication counters and KDF pool load for this process."""
+    kdf = kdf_executor.stats()
+    return AuthMetricsRead(
+        routes=[
+            AuthTimingRead(
+                path=sample.path,
+                authenticator=sample.authenticator,
+                count=sample.count,
+                failures=sample.failures,
+                avg_ms=round(sample.avg_ms, 3),
+                max_ms=sample.max_ms,
+            )
+            for sample in auth_metrics.snapshot()
+        ],
+        kdf=KdfExecutorRead(
+            max_workers=kdf.max_workers,
+            max_pending=kdf.max_pending,
+            pending=kdf.pending,
+            peak_pending=kdf.peak_pending,
+            completed=kdf.completed,
+            rejected=kdf.rejected,
+            avg_wait_ms=round(kdf.total_wait_ms / kdf.completed, 3) if kdf.completed else 0.0,
+            avg_run_ms=round(kdf.total_run_ms / kdf.completed, 3) if kdf.completed else 0.0,
+        ),
+    )
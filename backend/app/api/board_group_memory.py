@@ -34,6 +34,7 @@ from app.models.users import User
 from app.schemas.board_group_memory import BoardGroupMemoryCreate, BoardGroupMemoryRead
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.mentions import extract_mentions, matches_agent_mention
+from app.services.openclaw.fanout import fan_out
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.organizations import (
     is_org_admin,
@@ -48,6 +49,7 @@ if TYPE_CHECKING:
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
     from app.services.organizations import OrganizationContext
 
 router = APIRouter(tags=["board-group-memory"])
@@ -245,10 +247,7 @@ def _group_header(*, is_broadcast: bool, mentioned: bool) -> str:
 
 @dataclass(frozen=True)
 class _NotifyGroupContext:
-    session: AsyncSession
-    dispatch: GatewayDispatchService
     group: BoardGroup
-    board_by_id: dict[UUID, Board]
     mentions: set[str]
     is_broadcast: bool
     actor_name: str
@@ -256,25 +255,12 @@ class _NotifyGroupContext:
     base_url: str
 
 
-async def _notify_group_target(
-    context: _NotifyGroupContext,
-    agent: Agent,
-) -> None:
-    session_key = agent.openclaw_session_id
-    board_id = agent.board_id
-    if not session_key or board_id is None:
-        return
-    board = context.board_by_id.get(board_id)
-    if board is None:
-        return
-    config = await context.dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
+def _group_target_message(context: _NotifyGroupContext, agent: Agent, board: Board) -> str:
     header = _group_header(
         is_broadcast=context.is_broadcast,
         mentioned=matches_agent_mention(agent, context.mentions),
     )
-    message = (
+    return (
         f"{header}\n"
         f"Group: {context.group.name}\n"
         f"From: {context.actor_name}\n\n"
@@ -283,14 +269,6 @@ async def _notify_group_target(
         f"POST {context.base_url}/api/v1/boards/{board.id}/group-memory\n"
         'Body: {"content":"...","tags":["chat"]}'
     )
-    error = await context.dispatch.try_send_agent_message(
-        session_key=session_key,
-        config=config,
-        agent_name=agent.name,
-        message=message,
-    )
-    if error is not None:
-        return
 
 
 async def _notify_group_memory_targets(
@@ -334,18 +312,46 @@ async def _notify_group_memory_targets(
     base_url = settings.base_url or "http://localhost:8000"
 
     context = _NotifyGroupContext(
-        session=session,
-        dispatch=GatewayDispatchService(session),
         group=group,
-        board_by_id=board_by_id,
         mentions=mentions,
         is_broadcast=is_broadcast,
         actor_name=actor_name,
         snippet=snippet,
         base_url=base_url,
     )
+    # Gateway configs come from the request session, so resolve them up front and
+    # keep the concurrent part to gateway sends.
+    dispatch = GatewayDispatchService(session)
+    config_by_board_id: dict[UUID, GatewayClientConfig | None] = {}
+    deliveries: list[tuple[Agent, GatewayClientConfig, str]] = []
     for agent in targets.values():
-        await _notify_group_target(context, agent)
+        board = board_by_id.get(agent.board_id) if agent.board_id is not None else None
+        if board is None:
+            continue
+        if board.id not in config_by_board_id:
+            config_by_board_id[board.id] = await dispatch.optional_gateway_config_for_board(
+                board,
+            )
+        config = config_by_board_id[board.id]
+        if config is None:
+            continue
+        deliveries.append((agent, config, _group_target_message(context, agent, board)))
+
+    async def _send(delivery: tuple[Agent, GatewayClientConfig, str]) -> None:
+        agent, config, message = delivery
+        await dispatch.send_agent_message(
+            session_key=agent.openclaw_session_id or "",
+            config=config,
+            agent_name=agent.name,
+            message=message,
+        )
+
+    await fan_out(
+        deliveries,
+        _send,
+        limit_key=lambda delivery: delivery[1].url,
+        timeout_s=settings.gateway_fanout_timeout_seconds,
+    )
 
 
 @group_router.get("", response_model=DefaultLimitOffsetPage[BoardGroupMemoryRead])
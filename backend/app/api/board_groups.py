@@ -11,6 +11,7 @@ from sqlalchemy import func
 from sqlmodel import col, select
 
 from app.api.deps import ActorContext, require_admin_or_agent, require_org_admin, require_org_member
+from app.core.config import settings
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
@@ -30,7 +31,7 @@ from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.view_models import BoardGroupSnapshot
 from app.services.board_group_snapshot import build_group_snapshot
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
-from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+from app.services.openclaw.fanout import fan_out
 from app.services.openclaw.provisioning import OpenClawGatewayProvisioner
 from app.services.organizations import (
     OrganizationContext,
@@ -260,18 +261,28 @@ async def _sync_gateway_heartbeats(
     gateway_ids = list(agents_by_gateway_id.keys())
     gateways = await Gateway.objects.by_ids(gateway_ids).all(session)
     gateway_by_id = {gateway.id: gateway for gateway in gateways}
+    syncable: list[tuple[Gateway, list[Agent]]] = []
     for gateway_id, gateway_agents in agents_by_gateway_id.items():
         gateway = gateway_by_id.get(gateway_id)
         if gateway is None or not gateway.url or not gateway.workspace_root:
             failed_agent_ids.extend([agent.id for agent in gateway_agents])
             continue
-        try:
-            await OpenClawGatewayProvisioner().sync_gateway_agent_heartbeats(
-                gateway,
-                gateway_agents,
-            )
-        except OpenClawGatewayError:
-            failed_agent_ids.extend([agent.id for agent in gateway_agents])
+        syncable.append((gateway, gateway_agents))
+
+    async def _sync(target: tuple[Gateway, list[Agent]]) -> None:
+        gateway, gateway_agents = target
+        await OpenClawGatewayProvisioner().sync_gateway_agent_heartbeats(gateway, gateway_agents)
+
+    # One config patch per gateway; different gateways are synced concurrently.
+    outcomes = await fan_out(
+        syncable,
+        _sync,
+        limit_key=lambda target: target[0].url,
+        timeout_s=settings.gateway_fanout_timeout_seconds,
+    )
+    for outcome in outcomes:
+        if not outcome.ok:
+            failed_agent_ids.extend([agent.id for agent in outcome.target[1]])
     return failed_agent_ids
 
 
@@ -28,8 +28,10 @@ from app.models.board_memory import BoardMemory
 from app.schemas.board_memory import BoardMemoryCreate, BoardMemoryRead
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.mentions import extract_mentions, matches_agent_mention
-from app.services.openclaw.gateway_dispatch import GatewayDispatchService
-from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+from app.services.openclaw.notification_outbox import (
+    publish_agent_notifications,
+    queue_agent_notification,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -94,34 +96,26 @@ async def _fetch_memory_events(
     return await statement.all(session)
 
 
-async def _send_control_command(
+def _queue_control_command(
     *,
     session: AsyncSession,
     board: Board,
     actor: ActorContext,
-    dispatch: GatewayDispatchService,
-    config: GatewayClientConfig,
+    agents: list[Agent],
     command: str,
 ) -> None:
-    pause_targets: list[Agent] = await Agent.objects.filter_by(
-        board_id=board.id,
-    ).all(
-        session,
-    )
-    for agent in pause_targets:
+    for agent in agents:
         if actor.actor_type == "agent" and actor.agent and agent.id == actor.agent.id:
             continue
-        if not agent.openclaw_session_id:
-            continue
-        error = await dispatch.try_send_agent_message(
-            session_key=agent.openclaw_session_id,
-            config=config,
-            agent_name=agent.name,
+        queue_agent_notification(
+            session,
+            board=board,
+            agent=agent,
             message=command,
             deliver=True,
+            # Runtimes parse control commands verbatim, so they are never digested.
+            urgent=True,
         )
-        if error is not None:
-            continue
 
 
 def _chat_targets(
@@ -157,31 +151,27 @@ async def _notify_chat_targets(
     memory: BoardMemory,
     actor: ActorContext,
 ) -> None:
-    if not memory.content:
-        return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
+    if not memory.content or board.gateway_id is None:
         return
+    agents = await Agent.objects.filter_by(board_id=board.id).all(session)
 
     normalized = memory.content.strip()
     command = normalized.lower()
     # Special-case control commands to reach all board agents.
     # These are intended to be parsed verbatim by agent runtimes.
     if command in {"/pause", "/resume"}:
-        await _send_control_command(
+        _queue_control_command(
             session=session,
             board=board,
             actor=actor,
-            dispatch=dispatch,
-            config=config,
+            agents=agents,
             command=command,
         )
         return
 
     mentions = extract_mentions(memory.content)
     targets = _chat_targets(
-        agents=await Agent.objects.filter_by(board_id=board.id).all(session),
+        agents=agents,
         mentions=mentions,
         actor=actor,
     )
@@ -192,9 +182,8 @@ async def _notify_chat_targets(
     if len(snippet) > MAX_SNIPPET_LENGTH:
         snippet = f"{snippet[: MAX_SNIPPET_LENGTH - 3]}..."
     base_url = settings.base_url or "http://localhost:8000"
+
     for agent in targets.values():
-        if not agent.openclaw_session_id:
-            continue
         mentioned = matches_agent_mention(agent, mentions)
         header = "BOARD CHAT MENTION" if mentioned else "BOARD CHAT"
         message = (
@@ -206,14 +195,7 @@ async def _notify_chat_targets(
             f"POST {base_url}/api/v1/agent/boards/{board.id}/memory\n"
             'Body: {"content":"...","tags":["chat"]}'
         )
-        error = await dispatch.try_send_agent_message(
-            session_key=agent.openclaw_session_id,
-            config=config,
-            agent_name=agent.name,
-            message=message,
-        )
-        if error is not None:
-            continue
+        queue_agent_notification(session, board=board, agent=agent, message=message)
 
 
 @router.get("", response_model=DefaultLimitOffsetPage[BoardMemoryRead])
@@ -294,8 +276,6 @@ async def create_board_memory(
         source=source,
     )
     session.add(memory)
-    await session.commit()
-    await session.refresh(memory)
     if is_chat:
         await _notify_chat_targets(
             session=session,
@@ -303,4 +283,8 @@ async def create_board_memory(
             memory=memory,
             actor=actor,
         )
+    # Chat notifications commit with the entry and are delivered by the queue worker.
+    await session.commit()
+    publish_agent_notifications(session)
+    await session.refresh(memory)
     return memory
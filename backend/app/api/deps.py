@@ -18,25 +18,25 @@ of re-implementing permission checks in the router.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 
-from app.core.agent_auth import AgentAuthContext, get_agent_auth_context_optional
+from app.core.agent_auth import get_agent_auth_context_optional
 from app.core.auth import AuthContext, get_auth_context, get_auth_context_optional
+from app.core.auth_metrics import Authenticator, auth_metrics, route_path
 from app.db.session import get_session
 from app.models.boards import Board
-from app.models.organizations import Organization
 from app.models.tasks import Task
 from app.services.admin_access import require_admin
 from app.services.organizations import (
     OrganizationContext,
-    ensure_member_for_user,
-    get_active_membership,
     is_org_admin,
     require_board_access,
+    resolve_org_context,
 )
 
 if TYPE_CHECKING:
@@ -46,8 +46,6 @@ if TYPE_CHECKING:
     from app.models.users import User
 
 AUTH_DEP = Depends(get_auth_context)
-AUTH_OPTIONAL_DEP = Depends(get_auth_context_optional)
-AGENT_AUTH_OPTIONAL_DEP = Depends(get_agent_auth_context_optional)
 SESSION_DEP = Depends(get_session)
 
 
@@ -66,17 +64,58 @@ class ActorContext:
     agent: Agent | None = None
 
 
+async def resolve_actor_optional(
+    request: Request,
+    session: AsyncSession = SESSION_DEP,
+) -> ActorContext | None:
+    """Resolve the caller by running only the authenticator its headers select.
+
+    `X-Agent-Token` routes to agent auth; everything else goes to user auth. The
+    other authenticator never runs, and each attempt is timed per route template.
+    """
+    agent_token = request.headers.get("X-Agent-Token")
+    authenticator: Authenticator = "agent" if agent_token else "user"
+    started = time.perf_counter()
+    actor: ActorContext | None = None
+    try:
+        if agent_token:
+            agent_auth = await get_agent_auth_context_optional(
+                request=request,
+                agent_token=agent_token,
+                authorization=request.headers.get("Authorization"),
+                session=session,
+            )
+            if agent_auth is not None:
+                actor = ActorContext(actor_type="agent", agent=agent_auth.agent)
+        else:
+            auth = await get_auth_context_optional(
+                request=request,
+                credentials=None,
+                session=session,
+            )
+            if auth is not None:
+                require_admin(auth)
+                actor = ActorContext(actor_type="user", user=auth.user)
+        return actor
+    finally:
+        auth_metrics.record(
+            path=route_path(request),
+            authenticator=authenticator,
+            duration_ms=(time.perf_counter() - started) * 1000,
+            ok=actor is not None,
+        )
+
+
+ACTOR_OPTIONAL_DEP = Depends(resolve_actor_optional)
+
+
 def require_admin_or_agent(
-    auth: AuthContext | None = AUTH_OPTIONAL_DEP,
-    agent_auth: AgentAuthContext | None = AGENT_AUTH_OPTIONAL_DEP,
+    actor: ActorContext | None = ACTOR_OPTIONAL_DEP,
 ) -> ActorContext:
     """Authorize either an admin user or an authenticated agent."""
-    if auth is not None:
-        require_admin(auth)
-        return ActorContext(actor_type="user", user=auth.user)
-    if agent_auth is not None:
-        return ActorContext(actor_type="agent", agent=agent_auth.agent)
-    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    if actor is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    return actor
 
 
 ACTOR_DEP = Depends(require_admin_or_agent)
@@ -89,17 +128,10 @@ async def require_org_member(
     """Resolve and require active organization membership for the current user."""
     if auth.user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    member = await get_active_membership(session, auth.user)
-    if member is None:
-        member = await ensure_member_for_user(session, auth.user)
-    if member is None:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    organization = await Organization.objects.by_id(member.organization_id).first(
-        session,
-    )
-    if organization is None:
+    ctx = await resolve_org_context(session, auth.user)
+    if ctx is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    return OrganizationContext(organization=organization, member=member)
+    return ctx
 
 
 ORG_MEMBER_DEP = Depends(require_org_member)
@@ -5,14 +5,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
 
 from app.api.deps import require_org_admin
 from app.core.auth import AuthContext, get_auth_context
 from app.db.session import get_session
 from app.schemas.common import OkResponse
 from app.schemas.gateway_api import (
+    GatewayChatHistoryCacheMetrics,
     GatewayCommandsResponse,
     GatewayResolveQuery,
+    GatewayRpcMetricsResponse,
     GatewaySessionHistoryResponse,
     GatewaySessionMessageRequest,
     GatewaySessionResponse,
@@ -31,6 +34,9 @@ SESSION_DEP = Depends(get_session)
 AUTH_DEP = Depends(get_auth_context)
 ORG_ADMIN_DEP = Depends(require_org_admin)
 BOARD_ID_QUERY = Query(default=None)
+HISTORY_LIMIT_QUERY = Query(default=None, ge=1, le=500)
+HISTORY_BEFORE_QUERY = Query(default=None, ge=0)
+HISTORY_AFTER_QUERY = Query(default=None, ge=0)
 
 
 def _query_to_resolve_input(
@@ -39,6 +45,7 @@ def _query_to_resolve_input(
     gateway_token: str | None = Query(default=None),
     gateway_disable_device_pairing: bool = Query(default=False),
     gateway_allow_insecure_tls: bool = Query(default=False),
+    gateway_disable_compression: bool = Query(default=False),
 ) -> GatewayResolveQuery:
     return GatewaySessionService.to_resolve_query(
         board_id=board_id,
@@ -46,6 +53,7 @@ def _query_to_resolve_input(
         gateway_token=gateway_token,
         gateway_disable_device_pairing=gateway_disable_device_pairing,
         gateway_allow_insecure_tls=gateway_allow_insecure_tls,
+        gateway_disable_compression=gateway_disable_compression,
     )
 
 
@@ -106,17 +114,27 @@ async def get_gateway_session(
 async def get_session_history(
     session_id: str,
     board_id: str | None = BOARD_ID_QUERY,
+    limit: int | None = HISTORY_LIMIT_QUERY,
+    before: int | None = HISTORY_BEFORE_QUERY,
+    after: int | None = HISTORY_AFTER_QUERY,
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
 ) -> GatewaySessionHistoryResponse:
-    """Fetch chat history for a gateway session."""
+    """Fetch a page of chat history for a gateway session.
+
+    Without cursors the newest `limit` messages are returned. `before` pages back
+    through older messages; `after` returns only messages newer than a prior page.
+    """
     service = GatewaySessionService(session)
     return await service.get_session_history(
         session_id=session_id,
         board_id=board_id,
         organization_id=ctx.organization.id,
         user=auth.user,
+        limit=limit,
+        before=before,
+        after=after,
     )
 
 
@@ -150,3 +168,38 @@ async def gateway_commands(
         methods=GATEWAY_METHODS,
         events=GATEWAY_EVENTS,
     )
+
+
+@router.get("/rpc-metrics", response_model=GatewayRpcMetricsResponse)
+async def gateway_rpc_metrics(
+    session: AsyncSession = SESSION_DEP,
+    _auth: AuthContext = AUTH_DEP,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+) -> GatewayRpcMetricsResponse:
+    """Return per-method RPC latency/error histograms and handshake timings.
+
+    Metrics are in-process and cover the organization's gateways as seen by the
+    worker serving this request.
+    """
+    service = GatewaySessionService(session)
+    return await service.rpc_metrics(organization_id=ctx.organization.id)
+
+
+@router.get("/rpc-metrics/prometheus", response_class=PlainTextResponse)
+async def gateway_rpc_metrics_text(
+    session: AsyncSession = SESSION_DEP,
+    _auth: AuthContext = AUTH_DEP,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+) -> PlainTextResponse:
+    """Return the same gateway RPC metrics in the Prometheus text exposition format."""
+    service = GatewaySessionService(session)
+    text = await service.rpc_metrics_text(organization_id=ctx.organization.id)
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
+
+
+@router.get("/chat-history-metrics", response_model=GatewayChatHistoryCacheMetrics)
+async def gateway_chat_history_metrics(
+    _ctx: OrganizationContext = ORG_ADMIN_DEP,
+) -> GatewayChatHistoryCacheMetrics:
+    """Return chat history cache size and hit rate for this backend worker."""
+    return GatewaySessionService.chat_history_metrics()
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, Query
 from sqlmodel import col
 
 from app.api.deps import require_org_admin
+from app.core.agent_token_cache import agent_token_cache
 from app.core.auth import AuthContext, get_auth_context
 from app.db import crud
 from app.db.pagination import paginate
@@ -18,6 +19,7 @@ from app.models.gateways import Gateway
 from app.models.skills import GatewayInstalledSkill
 from app.schemas.common import OkResponse
 from app.schemas.gateways import (
+    GatewayCircuitRead,
     GatewayCreate,
     GatewayRead,
     GatewayTemplatesSyncResult,
@@ -25,9 +27,12 @@ from app.schemas.gateways import (
 )
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.openclaw.admin_service import GatewayAdminLifecycleService
+from app.services.openclaw.circuit_breaker import gateway_circuit_breakers
 from app.services.openclaw.session_service import GatewayTemplateSyncQuery
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -71,6 +76,15 @@ def _template_sync_query(
 SYNC_QUERY_DEP = Depends(_template_sync_query)
 
 
+def _gateway_read(gateway: Gateway) -> GatewayRead:
+    model = GatewayRead.model_validate(gateway, from_attributes=True)
+    model.circuit = GatewayCircuitRead.model_validate(
+        gateway_circuit_breakers.snapshot(gateway.url),
+        from_attributes=True,
+    )
+    return model
+
+
 @router.get("", response_model=DefaultLimitOffsetPage[GatewayRead])
 async def list_gateways(
     session: AsyncSession = SESSION_DEP,
@@ -82,7 +96,11 @@ async def list_gateways(
         .order_by(col(Gateway.created_at).desc())
         .statement
     )
-    return await paginate(session, statement)
+
+    def _transform(items: Sequence[Any]) -> Sequence[Any]:
+        return [_gateway_read(gateway) for gateway in items]
+
+    return await paginate(session, statement, transformer=_transform)
 
 
 @router.post("", response_model=GatewayRead)
@@ -91,7 +109,7 @@ async def create_gateway(
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
-) -> Gateway:
+) -> GatewayRead:
     """Create a gateway and provision or refresh its main agent."""
     service = GatewayAdminLifecycleService(session)
     await service.assert_gateway_runtime_compatible(
@@ -99,6 +117,7 @@ async def create_gateway(
         token=payload.token,
         allow_insecure_tls=payload.allow_insecure_tls,
         disable_device_pairing=payload.disable_device_pairing,
+        disable_compression=payload.disable_compression,
     )
     data = payload.model_dump()
     gateway_id = uuid4()
@@ -106,7 +125,7 @@ async def create_gateway(
     data["organization_id"] = ctx.organization.id
     gateway = await crud.create(session, Gateway, **data)
     await service.ensure_main_agent(gateway, auth, action="provision")
-    return gateway
+    return _gateway_read(gateway)
 
 
 @router.get("/{gateway_id}", response_model=GatewayRead)
@@ -114,14 +133,14 @@ async def get_gateway(
     gateway_id: UUID,
     session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
-) -> Gateway:
+) -> GatewayRead:
     """Return one gateway by id for the caller's organization."""
     service = GatewayAdminLifecycleService(session)
     gateway = await service.require_gateway(
         gateway_id=gateway_id,
         organization_id=ctx.organization.id,
     )
-    return gateway
+    return _gateway_read(gateway)
 
 
 @router.patch("/{gateway_id}", response_model=GatewayRead)
@@ -131,7 +150,7 @@ async def update_gateway(
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
-) -> Gateway:
+) -> GatewayRead:
     """Patch a gateway and refresh the main-agent provisioning state."""
     service = GatewayAdminLifecycleService(session)
     gateway = await service.require_gateway(
@@ -144,6 +163,7 @@ async def update_gateway(
         or "token" in updates
         or "allow_insecure_tls" in updates
         or "disable_device_pairing" in updates
+        or "disable_compression" in updates
     ):
         raw_next_url = updates.get("url", gateway.url)
         next_url = raw_next_url.strip() if isinstance(raw_next_url, str) else ""
@@ -154,16 +174,20 @@ async def update_gateway(
         next_disable_device_pairing = bool(
             updates.get("disable_device_pairing", gateway.disable_device_pairing),
         )
+        next_disable_compression = bool(
+            updates.get("disable_compression", gateway.disable_compression),
+        )
         if next_url:
             await service.assert_gateway_runtime_compatible(
                 url=next_url,
                 token=next_token,
                 allow_insecure_tls=next_allow_insecure_tls,
                 disable_device_pairing=next_disable_device_pairing,
+                disable_compression=next_disable_compression,
             )
     await crud.patch(session, gateway, updates)
     await service.ensure_main_agent(gateway, auth, action="update")
-    return gateway
+    return _gateway_read(gateway)
 
 
 @router.post("/{gateway_id}/templates/sync", response_model=GatewayTemplatesSyncResult)
@@ -199,6 +223,7 @@ async def delete_gateway(
     if main_agent is not None:
         await service.clear_agent_foreign_keys(agent_id=main_agent.id)
         await session.delete(main_agent)
+        agent_token_cache.invalidate_agent(main_agent.id)
 
     duplicate_main_agents = await Agent.objects.filter_by(
         gateway_id=gateway.id,
@@ -209,6 +234,7 @@ async def delete_gateway(
             continue
         await service.clear_agent_foreign_keys(agent_id=agent.id)
         await session.delete(agent)
+        agent_token_cache.invalidate_agent(agent.id)
 
     # NOTE: The migration declares `ondelete="CASCADE"` for gateway_installed_skills.gateway_id,
     # but some backends/test environments (e.g. SQLite without FK pragma) may not
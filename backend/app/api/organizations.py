@@ -11,7 +11,7 @@ from sqlalchemy import func
 from sqlmodel import col, select
 
 from app.api.deps import require_org_admin, require_org_member
-from app.core.auth import get_auth_context
+from app.core.auth import get_auth_context, invalidate_user_cache
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
@@ -61,6 +61,7 @@ from app.services.organizations import (
     apply_member_access_update,
     get_active_membership,
     get_member,
+    invalidate_org_access_cache,
     is_org_admin,
     normalize_invited_email,
     normalize_role,
@@ -389,6 +390,8 @@ async def delete_my_org(
         active_organization_id=None,
         commit=False,
     )
+    invalidate_user_cache()
+    invalidate_org_access_cache(organization_id=org_id)
     await crud.delete_where(
         session,
         Organization,
@@ -564,6 +567,7 @@ async def remove_org_member(
         col(OrganizationBoardAccess.organization_member_id) == member.id,
         commit=False,
     )
+    invalidate_org_access_cache(user_id=member.user_id, member_id=member.id)
 
     user = await User.objects.by_id(member.user_id).first(session)
     if user is not None and user.active_organization_id == ctx.organization.id:
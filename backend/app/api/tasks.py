@@ -57,9 +57,10 @@ from app.services.approval_task_links import (
     pending_approval_conflicts_by_task,
 )
 from app.services.mentions import extract_mentions, matches_agent_mention
-from app.services.openclaw.gateway_dispatch import GatewayDispatchService
-from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
-from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+from app.services.openclaw.notification_outbox import (
+    publish_agent_notifications,
+    queue_agent_notification,
+)
 from app.services.organizations import require_board_access
 from app.services.tags import (
     TagState,
@@ -500,102 +501,60 @@ def _serialize_comment(event: ActivityEvent) -> dict[str, object]:
     return TaskCommentRead.model_validate(event).model_dump(mode="json")
 
 
-async def _send_lead_task_message(
-    *,
-    dispatch: GatewayDispatchService,
-    session_key: str,
-    config: GatewayClientConfig,
-    message: str,
-) -> OpenClawGatewayError | None:
-    return await dispatch.try_send_agent_message(
-        session_key=session_key,
-        config=config,
-        agent_name="Lead Agent",
-        message=message,
-        deliver=False,
-    )
+def _task_notification_message(*, header: str, board: Board, task: Task, action: str) -> str:
+    description = _truncate_snippet(task.description or "")
+    details = [
+        f"Board: {board.name}",
+        f"Task: {task.title}",
+        f"Task ID: {task.id}",
+        f"Status: {task.status}",
+    ]
+    if description:
+        details.append(f"Description: {description}")
+    return f"{header}\n" + "\n".join(details) + f"\n\n{action}"
 
 
-async def _send_agent_task_message(
-    *,
-    dispatch: GatewayDispatchService,
-    session_key: str,
-    config: GatewayClientConfig,
-    agent_name: str,
-    message: str,
-) -> OpenClawGatewayError | None:
-    return await dispatch.try_send_agent_message(
-        session_key=session_key,
-        config=config,
-        agent_name=agent_name,
-        message=message,
-        deliver=False,
+async def _board_lead(session: AsyncSession, board: Board) -> Agent | None:
+    return (
+        await Agent.objects.filter_by(board_id=board.id)
+        .filter(col(Agent.is_board_lead).is_(True))
+        .first(session)
     )
 
 
-async def _notify_agent_on_task_assign(
+def _notify_agent_on_task_assign(
     *,
     session: AsyncSession,
     board: Board,
     task: Task,
     agent: Agent,
 ) -> None:
-    if not agent.openclaw_session_id:
-        return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
-    description = _truncate_snippet(task.description or "")
-    details = [
-        f"Board: {board.name}",
-        f"Task: {task.title}",
-        f"Task ID: {task.id}",
-        f"Status: {task.status}",
-    ]
-    if description:
-        details.append(f"Description: {description}")
-    message = (
-        "TASK ASSIGNED\n"
-        + "\n".join(details)
-        + ("\n\nTake action: open the task and begin work. " "Post updates as task comments.")
-    )
-    error = await _send_agent_task_message(
-        dispatch=dispatch,
-        session_key=agent.openclaw_session_id,
-        config=config,
-        agent_name=agent.name,
-        message=message,
+    queue_agent_notification(
+        session,
+        board=board,
+        agent=agent,
+        task_id=task.id,
+        message=_task_notification_message(
+            header="TASK ASSIGNED",
+            board=board,
+            task=task,
+            action="Take action: open the task and begin work. Post updates as task comments.",
+        ),
+        activity_event_type="task.assignee",
+        activity_message=f"Agent notified for assignment: {agent.name}.",
+        failure_message="Assignee notify failed",
     )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.assignee_notified",
-            message=f"Agent notified for assignment: {agent.name}.",
-            agent_id=agent.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.assignee_notify_failed",
-            message=f"Assignee notify failed: {error}",
-            agent_id=agent.id,
-            task_id=task.id,
-        )
-        await session.commit()
 
 
-async def notify_agent_on_task_assign(
+def notify_agent_on_task_assign(
     *,
     session: AsyncSession,
     board: Board,
     task: Task,
     agent: Agent,
 ) -> None:
-    """Notify an assignee via gateway after task assignment."""
-    await _notify_agent_on_task_assign(
+    """Queue an assignee notification; the caller commits and publishes it."""
+    _notify_agent_on_task_assign(
         session=session,
         board=board,
         task=task,
@@ -609,55 +568,24 @@ async def _notify_lead_on_task_create(
     board: Board,
     task: Task,
 ) -> None:
-    lead = (
-        await Agent.objects.filter_by(board_id=board.id)
-        .filter(col(Agent.is_board_lead).is_(True))
-        .first(session)
-    )
-    if lead is None or not lead.openclaw_session_id:
-        return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
+    lead = await _board_lead(session, board)
+    if lead is None:
         return
-    description = _truncate_snippet(task.description or "")
-    details = [
-        f"Board: {board.name}",
-        f"Task: {task.title}",
-        f"Task ID: {task.id}",
-        f"Status: {task.status}",
-    ]
-    if description:
-        details.append(f"Description: {description}")
-    message = (
-        "NEW TASK ADDED\n"
-        + "\n".join(details)
-        + "\n\nTake action: triage, assign, or plan next steps."
-    )
-    error = await _send_lead_task_message(
-        dispatch=dispatch,
-        session_key=lead.openclaw_session_id,
-        config=config,
-        message=message,
+    queue_agent_notification(
+        session,
+        board=board,
+        agent=lead,
+        task_id=task.id,
+        message=_task_notification_message(
+            header="NEW TASK ADDED",
+            board=board,
+            task=task,
+            action="Take action: triage, assign, or plan next steps.",
+        ),
+        activity_event_type="task.lead",
+        activity_message=f"Lead agent notified for task: {task.title}.",
+        failure_message="Lead notify failed",
     )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.lead_notified",
-            message=f"Lead agent notified for task: {task.title}.",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.lead_notify_failed",
-            message=f"Lead notify failed: {error}",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
 
 
 async def _notify_lead_on_task_unassigned(
@@ -666,55 +594,24 @@ async def _notify_lead_on_task_unassigned(
     board: Board,
     task: Task,
 ) -> None:
-    lead = (
-        await Agent.objects.filter_by(board_id=board.id)
-        .filter(col(Agent.is_board_lead).is_(True))
-        .first(session)
-    )
-    if lead is None or not lead.openclaw_session_id:
+    lead = await _board_lead(session, board)
+    if lead is None:
         return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if config is None:
-        return
-    description = _truncate_snippet(task.description or "")
-    details = [
-        f"Board: {board.name}",
-        f"Task: {task.title}",
-        f"Task ID: {task.id}",
-        f"Status: {task.status}",
-    ]
-    if description:
-        details.append(f"Description: {description}")
-    message = (
-        "TASK BACK IN INBOX\n"
-        + "\n".join(details)
-        + "\n\nTake action: assign a new owner or adjust the plan."
-    )
-    error = await _send_lead_task_message(
-        dispatch=dispatch,
-        session_key=lead.openclaw_session_id,
-        config=config,
-        message=message,
+    queue_agent_notification(
+        session,
+        board=board,
+        agent=lead,
+        task_id=task.id,
+        message=_task_notification_message(
+            header="TASK BACK IN INBOX",
+            board=board,
+            task=task,
+            action="Take action: assign a new owner or adjust the plan.",
+        ),
+        activity_event_type="task.lead_unassigned",
+        activity_message=f"Lead notified task returned to inbox: {task.title}.",
+        failure_message="Lead notify failed",
     )
-    if error is None:
-        record_activity(
-            session,
-            event_type="task.lead_unassigned_notified",
-            message=f"Lead notified task returned to inbox: {task.title}.",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
-    else:
-        record_activity(
-            session,
-            event_type="task.lead_unassigned_notify_failed",
-            message=f"Lead notify failed: {error}",
-            agent_id=lead.id,
-            task_id=task.id,
-        )
-        await session.commit()
 
 
 def _status_values(status_filter: str | None) -> list[str]:
@@ -1329,28 +1226,28 @@ async def create_task(
         task_id=task.id,
         tag_ids=normalized_tag_ids,
     )
-    await session.commit()
-    await session.refresh(task)
-
     record_activity(
         session,
         event_type="task.created",
         task_id=task.id,
         message=f"Task created: {task.title}.",
     )
-    await session.commit()
     await _notify_lead_on_task_create(session=session, board=board, task=task)
     if task.assigned_agent_id:
         assigned_agent = await Agent.objects.by_id(task.assigned_agent_id).first(
             session,
         )
         if assigned_agent:
-            await _notify_agent_on_task_assign(
+            _notify_agent_on_task_assign(
                 session=session,
                 board=board,
                 task=task,
                 agent=assigned_agent,
             )
+    # Notifications commit with the task and are delivered by the queue worker.
+    await session.commit()
+    publish_agent_notifications(session)
+    await session.refresh(task)
     return await _task_read_response(
         session,
         task=task,
@@ -1619,16 +1516,10 @@ async def _notify_task_comment_targets(
     )
     if board is None:
         return
-    dispatch = GatewayDispatchService(session)
-    config = await dispatch.optional_gateway_config_for_board(board)
-    if not config:
-        return
 
     snippet = _truncate_snippet(request.message)
     actor_name = _comment_actor_name(request.actor)
     for agent in request.targets.values():
-        if not agent.openclaw_session_id:
-            continue
         mentioned = matches_agent_mention(agent, request.mention_names)
         header = "TASK MENTION" if mentioned else "NEW TASK COMMENT"
         action_line = (
@@ -1647,11 +1538,11 @@ async def _notify_task_comment_targets(
             "If you are mentioned but not assigned, reply in the task "
             "thread but do not change task status."
         )
-        await _send_agent_task_message(
-            dispatch=dispatch,
-            session_key=agent.openclaw_session_id,
-            config=config,
-            agent_name=agent.name,
+        queue_agent_notification(
+            session,
+            board=board,
+            agent=agent,
+            task_id=request.task.id,
             message=notification,
         )
 
@@ -1958,7 +1849,7 @@ async def _lead_notify_new_assignee(
         else None
     )
     if board:
-        await _notify_agent_on_task_assign(
+        _notify_agent_on_task_assign(
             session=session,
             board=board,
             task=update.task,
@@ -2048,9 +1939,10 @@ async def _apply_lead_task_update(
         previous_status=update.previous_status,
         actor_agent_id=update.actor.agent.id,
     )
+    await _lead_notify_new_assignee(session, update=update)
     await session.commit()
+    publish_agent_notifications(session)
     await session.refresh(update.task)
-    await _lead_notify_new_assignee(session, update=update)
     return await _task_read_response(
         session,
         task=update.task,
@@ -2232,7 +2124,6 @@ async def _record_task_comment_from_update(
         ),
     )
     session.add(event)
-    await session.commit()
 
 
 async def _record_task_update_activity(
@@ -2260,7 +2151,6 @@ async def _record_task_update_activity(
         previous_status=update.previous_status,
         actor_agent_id=actor_agent_id,
     )
-    await session.commit()
 
 
 async def _notify_task_update_assignment_changes(
@@ -2307,7 +2197,7 @@ async def _notify_task_update_assignment_changes(
         else None
     )
     if board:
-        await _notify_agent_on_task_assign(
+        _notify_agent_on_task_assign(
             session=session,
             board=board,
             task=update.task,
@@ -2388,11 +2278,13 @@ async def _finalize_updated_task(
         )
 
     session.add(update.task)
-    await session.commit()
-    await session.refresh(update.task)
     await _record_task_comment_from_update(session, update=update)
     await _record_task_update_activity(session, update=update)
     await _notify_task_update_assignment_changes(session, update=update)
+    # The update, its activity and queued notifications commit together.
+    await session.commit()
+    publish_agent_notifications(session)
+    await session.refresh(update.task)
 
     return await _task_read_response(
         session,
@@ -2417,8 +2309,6 @@ async def create_task_comment(
         agent_id=_comment_actor_id(actor),
     )
     session.add(event)
-    await session.commit()
-    await session.refresh(event)
     targets, mention_names = await _comment_targets(
         session,
         task=task,
@@ -2435,4 +2325,7 @@ async def create_task_comment(
             mention_names=mention_names,
         ),
     )
+    await session.commit()
+    publish_agent_notifications(session)
+    await session.refresh(event)
     return event
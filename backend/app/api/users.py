@@ -8,7 +8,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import col, select
 
-from app.core.auth import AuthContext, delete_clerk_user, get_auth_context
+from app.core.auth import (
+    AuthContext,
+    delete_clerk_user,
+    get_auth_context,
+    invalidate_user_cache,
+)
 from app.db import crud
 from app.db.session import get_session
 from app.models.activity_events import ActivityEvent
@@ -189,6 +194,7 @@ async def _delete_organization_tree(
         active_organization_id=None,
         commit=False,
     )
+    invalidate_user_cache()
     await crud.delete_where(
         session,
         Organization,
@@ -289,4 +295,5 @@ async def delete_me(
         commit=False,
     )
     await session.commit()
+    invalidate_user_cache(user.clerk_user_id)
     return OkResponse()
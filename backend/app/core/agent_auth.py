@@ -4,10 +4,17 @@ This module is used for *agent-originated* API calls (as opposed to human users)
 
 Key ideas:
 - Agents authenticate with an opaque token presented as `X-Agent-Token: <token>`.
+- Tokens carry a public selector, so lookup is one indexed row fetch plus a single
+  hash verification rather than a scan over every agent.
+- Verified tokens are cached (`app.core.agent_token_cache`), so steady-state agent
+  calls skip PBKDF2 entirely.
+- PBKDF2 runs on the bounded `kdf_executor` pool, never on the event loop; when the
+  pool is saturated agent auth answers 503 instead of queueing without bound.
 - For convenience, some deployments may also allow `Authorization: Bearer <token>`
   for agents (controlled by caller/dependency).
 - To reduce write-amplification, we only touch `Agent.last_seen_at` at a fixed
-  interval and we avoid touching it for safe/read-only HTTP methods.
+  interval, and touches are buffered (`app.core.agent_presence`) and flushed in
+  batches instead of committed per request.
 
 This is intentionally separate from user authentication (Clerk/local bearer token)
 so we can evolve agent policy independently.
@@ -15,14 +22,24 @@ so we can evolve agent policy independently.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import TYPE_CHECKING, Literal
 
 from fastapi import Depends, Header, HTTPException, Request, status
-from sqlmodel import col, select
-
-from app.core.agent_tokens import verify_agent_token
+from sqlmodel import col
+
+from app.core.agent_presence import agent_presence_buffer
+from app.core.agent_token_cache import agent_token_cache
+from app.core.agent_tokens import (
+    agent_token_selector,
+    legacy_agent_token_selector,
+    verify_agent_token,
+)
+from app.core.auth_metrics import auth_metrics, route_path
+from app.core.config import settings
+from app.core.kdf_executor import KdfBusyError, kdf_executor
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db.session import get_session
@@ -34,7 +51,6 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 _LAST_SEEN_TOUCH_INTERVAL = timedelta(seconds=30)
-_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 SESSION_DEP = Depends(get_session)
 
 
@@ -46,16 +62,69 @@ class AgentAuthContext:
     agent: Agent
 
 
+async def _find_agent_by_selector(session: AsyncSession, selector: str) -> Agent | None:
+    return await Agent.objects.filter_by(agent_token_selector=selector).first(session)
+
+
+async def _token_matches(agent: Agent | None, token: str) -> bool:
+    if agent is None or agent.agent_token_hash is None:
+        return False
+    return await kdf_executor.run(verify_agent_token, token, agent.agent_token_hash)
+
+
+async def _find_agent_for_legacy_token(session: AsyncSession, token: str) -> Agent | None:
+    """Resolve a pre-selector token, indexing the agent on first successful match."""
+    legacy_selector = legacy_agent_token_selector(token)
+    agent = await _find_agent_by_selector(session, legacy_selector)
+    if agent is not None:
+        return agent if await _token_matches(agent, token) else None
+    if not settings.agent_auth_legacy_token_scan:
+        return None
+    # Only rows that have never been matched are scanned; each legacy agent pays this
+    # once and then moves onto the indexed path above.
+    candidates = await Agent.objects.filter(
+        col(Agent.agent_token_hash).is_not(None),
+        col(Agent.agent_token_selector).is_(None),
+    ).all(session)
+    for candidate in candidates:
+        if await _token_matches(candidate, token):
+            candidate.agent_token_selector = legacy_selector
+            session.add(candidate)
+            await session.commit()
+            return candidate
+    return None
+
+
+async def _verify_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
+    selector = agent_token_selector(token)
+    if selector is None:
+        return await _find_agent_for_legacy_token(session, token)
+    agent = await _find_agent_by_selector(session, selector)
+    return agent if await _token_matches(agent, token) else None
+
+
 async def _find_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
-    agents = list(
-        await session.exec(
-            select(Agent).where(col(Agent.agent_token_hash).is_not(None)),
-        ),
-    )
-    for agent in agents:
-        if agent.agent_token_hash and verify_agent_token(token, agent.agent_token_hash):
+    cached = await agent_token_cache.get(token)
+    if cached is not None:
+        agent = await Agent.objects.by_id(cached.agent_id).first(session)
+        if cached.matches(agent):
             return agent
-    return None
+        await agent_token_cache.discard(token)
+    agent = await _verify_agent_for_token(session, token)
+    if agent is not None:
+        await agent_token_cache.put(token, agent)
+    return agent
+
+
+async def _lookup_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
+    try:
+        return await _find_agent_for_token(session, token)
+    except KdfBusyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Agent authentication is temporarily overloaded; retry shortly.",
+            headers={"Retry-After": "1"},
+        ) from exc
 
 
 def _resolve_agent_token(
@@ -78,31 +147,20 @@ def _resolve_agent_token(
     return None
 
 
-async def _touch_agent_presence(
-    request: Request,
-    session: AsyncSession,
-    agent: Agent,
-) -> None:
+def _touch_agent_presence(agent: Agent) -> None:
     """Best-effort update of last_seen/status for any authenticated agent request.
 
     Heartbeats are the primary presence mechanism, but agents may still make API
     calls (task comments, memory updates, etc). Touch presence so the UI reflects
-    real activity even if the heartbeat loop isn't running.
+    real activity even if the heartbeat loop isn't running. The touch is buffered
+    and persisted by the periodic presence flush rather than committed here.
     """
     now = utcnow()
-    if agent.last_seen_at is not None and now - agent.last_seen_at < _LAST_SEEN_TOUCH_INTERVAL:
+    last_seen = agent_presence_buffer.last_seen(agent)
+    if last_seen is not None and now - last_seen < _LAST_SEEN_TOUCH_INTERVAL:
         return
-
-    agent.last_seen_at = now
-    agent.updated_at = now
-    if agent.status not in {"updating", "deleting"}:
-        agent.status = "online"
-    session.add(agent)
-
-    # For safe HTTP methods, endpoints typically do not commit. Persist the touch
-    # so agents that only poll/read still show as online.
-    if request.method.upper() in _SAFE_METHODS:
-        await session.commit()
+    agent_presence_buffer.record(agent.id, now)
+    agent_presence_buffer.apply(agent)
 
 
 async def get_agent_auth_context(
@@ -125,7 +183,14 @@ async def get_agent_auth_context(
             bool(authorization),
         )
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    agent = await _find_agent_for_token(session, resolved)
+    started = time.perf_counter()
+    agent = await _lookup_agent_for_token(session, resolved)
+    auth_metrics.record(
+        path=route_path(request),
+        authenticator="agent",
+        duration_ms=(time.perf_counter() - started) * 1000,
+        ok=agent is not None,
+    )
     if agent is None:
         logger.warning(
             "agent auth invalid token path=%s token_prefix=%s",
@@ -133,7 +198,7 @@ async def get_agent_auth_context(
             resolved[:6],
         )
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    await _touch_agent_presence(request, session, agent)
+    _touch_agent_presence(agent)
     return AgentAuthContext(actor_type="agent", agent=agent)
 
 
@@ -158,7 +223,7 @@ async def get_agent_auth_context_optional(
                 bool(authorization),
             )
         return None
-    agent = await _find_agent_for_token(session, resolved)
+    agent = await _lookup_agent_for_token(session, resolved)
     if agent is None:
         logger.warning(
             "agent auth optional invalid token path=%s token_prefix=%s",
@@ -166,5 +231,5 @@ async def get_agent_auth_context_optional(
             resolved[:6],
         )
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    await _touch_agent_presence(request, session, agent)
+    _touch_agent_presence(agent)
     return AgentAuthContext(actor_type="agent", agent=agent)
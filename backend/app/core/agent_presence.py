@@ -0,0 +1,164 @@
+"""Write-behind buffer for agent presence touches.
+
+Authenticated agent calls mark the agent as recently seen. Persisting that on every
+request produces a steady stream of single-row UPDATE transactions on the hot
+`agents` table, so touches are recorded in this in-process map instead and flushed
+periodically as one batched UPDATE.
+
+Readers merge buffered values (`apply`) so status computed in this worker reflects
+presence that has not been flushed yet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import bindparam, case, or_, update
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.logging import get_logger
+from app.models.agents import Agent
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+_STICKY_STATUSES = ("updating", "deleting")
+
+
+class AgentPresenceBuffer:
+    """In-process map of agent id to the most recent unflushed `last_seen_at`."""
+
+    def __init__(self) -> None:
+        self._pending: dict[UUID, datetime] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, agent_id: UUID, seen_at: datetime) -> None:
+        """Buffer a presence touch, keeping the latest timestamp per agent."""
+        current = self._pending.get(agent_id)
+        if current is None or seen_at > current:
+            self._pending[agent_id] = seen_at
+
+    def last_seen(self, agent: Agent) -> datetime | None:
+        """Return the effective last-seen time merging persisted and buffered values."""
+        buffered = self._pending.get(agent.id)
+        if buffered is None:
+            return agent.last_seen_at
+        if agent.last_seen_at is None or buffered > agent.last_seen_at:
+            return buffered
+        return agent.last_seen_at
+
+    def agent_ids_seen_since(self, since: datetime) -> list[UUID]:
+        """Return ids of agents with buffered presence newer than `since`."""
+        return [agent_id for agent_id, seen_at in self._pending.items() if seen_at > since]
+
+    def apply(self, agent: Agent) -> Agent:
+        """Merge buffered presence into an in-memory agent row without dirtying it.
+
+        Values are loaded as if already persisted, so a request that later commits
+        the session does not write them; the periodic flush does.
+        """
+        buffered = self._pending.get(agent.id)
+        if buffered is None:
+            return agent
+        if agent.last_seen_at is not None and agent.last_seen_at >= buffered:
+            return agent
+        set_committed_value(agent, "last_seen_at", buffered)
+        set_committed_value(agent, "updated_at", max(agent.updated_at, buffered))
+        if agent.status not in _STICKY_STATUSES:
+            set_committed_value(agent, "status", "online")
+        return agent
+
+    async def flush(self, session: AsyncSession) -> int:
+        """Persist buffered touches with one batched UPDATE; return rows submitted."""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        table = Agent.__table__  # type: ignore[attr-defined]
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("agent_id"))
+            .where(
+                or_(
+                    table.c.last_seen_at.is_(None),
+                    table.c.last_seen_at < bindparam("seen_at"),
+                ),
+            )
+            .values(
+                last_seen_at=bindparam("seen_at"),
+                updated_at=bindparam("seen_at"),
+                status=case(
+                    # Expanding IN params are not allowed with executemany.
+                    (
+                        or_(*(table.c.status == value for value in _STICKY_STATUSES)),
+                        table.c.status,
+                    ),
+                    else_="online",
+                ),
+            )
+        )
+        params = [
+            {"agent_id": agent_id, "seen_at": seen_at} for agent_id, seen_at in pending.items()
+        ]
+        try:
+            await session.exec(statement, params=params)
+            await session.commit()
+        except BaseException:
+            # Re-buffer (also when cancelled) so the next flush retries; newer touches win.
+            for agent_id, seen_at in pending.items():
+                self.record(agent_id, seen_at)
+            await session.rollback()
+            raise
+        logger.debug("agent.presence.flushed count=%s", len(params))
+        return len(params)
+
+    async def _flush_loop(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        interval_seconds: float,
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                async with session_factory() as session:
+                    await self.flush(session)
+            except Exception:
+                # Keep flushing: an unexpected error must not stop presence persistence.
+                logger.exception("agent.presence.flush_failed pending=%s", len(self))
+
+    def start(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        *,
+        interval_seconds: float,
+    ) -> None:
+        """Start the periodic flush task on the running loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._flush_loop(session_factory, interval_seconds))
+
+    async def stop(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """Cancel the periodic task and flush whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        try:
+            async with session_factory() as session:
+                await self.flush(session)
+        except Exception:
+            logger.exception("agent.presence.final_flush_failed pending=%s", len(self))
+
+
+agent_presence_buffer = AgentPresenceBuffer()
@@ -0,0 +1,223 @@
+"""Bounded TTL cache of verified agent tokens.
+
+Agents call the API every few seconds, and each call would otherwise re-run the
+PBKDF2 verification in `verify_agent_token`. This cache maps a keyed digest of the
+presented token to the agent id plus a fingerprint of the stored token hash.
+
+Entries are self-validating: a hit is only honoured when the agent row still exists
+and its `agent_token_hash` fingerprint matches, so rotation, deletion or any other
+hash change invalidates the entry even when another worker made the change. Local
+entries are additionally dropped eagerly via `invalidate_agent`.
+
+When `AGENT_AUTH_CACHE_REDIS_URL` is set, verified entries are also shared across
+worker processes through Redis (keys are HMACs under `AGENT_AUTH_CACHE_SECRET`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from redis import asyncio as redis_async
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from app.models.agents import Agent
+
+logger = get_logger(__name__)
+
+_REDIS_KEY_PREFIX = "agent-auth:token:"
+
+
+def token_hash_fingerprint(stored_hash: str) -> str:
+    """Return a short, non-reversible fingerprint of a stored token hash."""
+    return hashlib.sha256(stored_hash.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass(frozen=True)
+class CachedAgentToken:
+    """Verified token entry: the agent it resolved to and the hash it matched."""
+
+    agent_id: UUID
+    hash_fingerprint: str
+    expires_at: float
+
+    def matches(self, agent: Agent | None) -> bool:
+        """Return whether the entry is still valid for the current agent row."""
+        return (
+            agent is not None
+            and agent.id == self.agent_id
+            and agent.agent_token_hash is not None
+            and token_hash_fingerprint(agent.agent_token_hash) == self.hash_fingerprint
+        )
+
+
+class AgentTokenCache:
+    """In-process LRU/TTL cache with an optional shared Redis tier."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        secret: str = "",
+        redis_url: str = "",
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._key = secret.encode("utf-8") if secret else secrets.token_bytes(32)
+        self._entries: OrderedDict[str, CachedAgentToken] = OrderedDict()
+        self._keys_by_agent: dict[UUID, set[str]] = {}
+        self._redis_url = redis_url
+        self._redis: redis_async.Redis | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether caching is active."""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def _digest(self, token: str) -> str:
+        return hmac.new(self._key, token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def _redis_client(self) -> redis_async.Redis | None:
+        if not self._redis_url:
+            return None
+        if self._redis is None:
+            self._redis = redis_async.Redis.from_url(self._redis_url)
+        return self._redis
+
+    def _store_local(self, digest: str, entry: CachedAgentToken) -> None:
+        self._drop_local(digest)
+        self._entries[digest] = entry
+        self._keys_by_agent.setdefault(entry.agent_id, set()).add(digest)
+        while len(self._entries) > self.max_entries:
+            oldest, _ = next(iter(self._entries.items()))
+            self._drop_local(oldest)
+
+    def _drop_local(self, digest: str) -> None:
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return
+        keys = self._keys_by_agent.get(entry.agent_id)
+        if keys is not None:
+            keys.discard(digest)
+            if not keys:
+                del self._keys_by_agent[entry.agent_id]
+
+    def _get_local(self, digest: str) -> CachedAgentToken | None:
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._drop_local(digest)
+            return None
+        self._entries.move_to_end(digest)
+        return entry
+
+    async def _get_shared(self, digest: str) -> CachedAgentToken | None:
+        client = self._redis_client()
+        if client is None:
+            return None
+        try:
+            raw = await client.get(f"{_REDIS_KEY_PREFIX}{digest}")
+        except RedisError:
+            logger.warning("agent_auth.cache.redis_get_failed", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        value = raw.decode("utf-8") if isinstance(raw, bytes) else str(raw)
+        agent_id, _, fingerprint = value.partition(":")
+        try:
+            entry = CachedAgentToken(
+                agent_id=UUID(agent_id),
+                hash_fingerprint=fingerprint,
+                expires_at=time.monotonic() + self.ttl_seconds,
+            )
+        except ValueError:
+            return None
+        self._store_local(digest, entry)
+        return entry
+
+    async def get(self, token: str) -> CachedAgentToken | None:
+        """Return the cached entry for a presented token, if any."""
+        if not self.enabled:
+            return None
+        digest = self._digest(token)
+        entry = self._get_local(digest) or await self._get_shared(digest)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def put(self, token: str, agent: Agent) -> None:
+        """Remember that `token` verified against the agent's current hash."""
+        if not self.enabled or agent.agent_token_hash is None:
+            return
+        digest = self._digest(token)
+        fingerprint = token_hash_fingerprint(agent.agent_token_hash)
+        self._store_local(
+            digest,
+            CachedAgentToken(
+                agent_id=agent.id,
+                hash_fingerprint=fingerprint,
+                expires_at=time.monotonic() + self.ttl_seconds,
+            ),
+        )
+        client = self._redis_client()
+        if client is None:
+            return
+        try:
+            await client.set(
+                f"{_REDIS_KEY_PREFIX}{digest}",
+                f"{agent.id}:{fingerprint}",
+                ex=max(1, int(self.ttl_seconds)),
+            )
+        except RedisError:
+            logger.warning("agent_auth.cache.redis_set_failed", exc_info=True)
+
+    async def discard(self, token: str) -> None:
+        """Drop the entry for a token that no longer validates."""
+        digest = self._digest(token)
+        self._drop_local(digest)
+        client = self._redis_client()
+        if client is None:
+            return
+        try:
+            await client.delete(f"{_REDIS_KEY_PREFIX}{digest}")
+        except RedisError:
+            logger.warning("agent_auth.cache.redis_delete_failed", exc_info=True)
+
+    def invalidate_agent(self, agent_id: UUID) -> None:
+        """Drop every local entry for an agent (token rotated or agent deleted).
+
+        Shared Redis entries are invalidated lazily by the hash fingerprint check.
+        """
+        for digest in list(self._keys_by_agent.get(agent_id, ())):
+            self._drop_local(digest)
+
+    def clear(self) -> None:
+        """Drop all local entries and reset counters."""
+        self._entries.clear()
+        self._keys_by_agent.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+agent_token_cache = AgentTokenCache(
+    ttl_seconds=settings.agent_auth_cache_ttl_seconds,
+    max_entries=settings.agent_auth_cache_max_entries,
+    secret=settings.agent_auth_cache_secret,
+    redis_url=settings.agent_auth_cache_redis_url,
+)
@@ -1,4 +1,10 @@
-"""Token generation and verification helpers for agent authentication."""
+"""Token generation and verification helpers for agent authentication.
+
+Agent tokens use a `<selector>.<verifier>` layout. The selector is public and stored
+in an indexed column so authentication is a single row lookup followed by one hash
+verification. Tokens minted before this layout (no separator) are still accepted via
+a derived legacy selector; see `legacy_agent_token_selector`.
+"""
 
 from __future__ import annotations
 
@@ -9,11 +15,35 @@ import secrets
 
 ITERATIONS = 200_000
 SALT_BYTES = 16
+SELECTOR_BYTES = 9
+VERIFIER_BYTES = 32
+TOKEN_SEPARATOR = "."
+LEGACY_SELECTOR_PREFIX = "legacy:"
 
 
 def generate_agent_token() -> str:
-    """Generate a new URL-safe random token for an agent."""
-    return secrets.token_urlsafe(32)
+    """Generate a new `<selector>.<verifier>` token for an agent."""
+    selector = secrets.token_urlsafe(SELECTOR_BYTES)
+    verifier = secrets.token_urlsafe(VERIFIER_BYTES)
+    return f"{selector}{TOKEN_SEPARATOR}{verifier}"
+
+
+def agent_token_selector(token: str) -> str | None:
+    """Return the public selector for a token, or `None` for legacy tokens."""
+    selector, separator, verifier = token.partition(TOKEN_SEPARATOR)
+    if not separator or not selector or not verifier:
+        return None
+    return selector
+
+
+def legacy_agent_token_selector(token: str) -> str:
+    """Derive a stable lookup selector for a token minted without a selector.
+
+    Legacy tokens are 256-bit random values, so an unsalted digest is safe to store
+    and lets previously-seen legacy tokens use the same indexed lookup path.
+    """
+    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    return f"{LEGACY_SELECTOR_PREFIX}{digest[:32]}"
 
 
 def _b64encode(value: bytes) -> str:
@@ -26,7 +56,11 @@ def _b64decode(value: str) -> bytes:
 
 
 def hash_agent_token(token: str) -> str:
-    """Hash an agent token using PBKDF2-HMAC-SHA256 with a random salt."""
+    """Hash an agent token using PBKDF2-HMAC-SHA256 with a random salt.
+
+    The full token (selector included) is hashed, so legacy and selector tokens share
+    one stored hash format.
+    """
     salt = secrets.token_bytes(SALT_BYTES)
     digest = hashlib.pbkdf2_hmac("sha256", token.encode("utf-8"), salt, ITERATIONS)
     return f"pbkdf2_sha256${ITERATIONS}${_b64encode(salt)}${_b64encode(digest)}"
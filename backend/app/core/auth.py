@@ -13,13 +13,19 @@ The public surface area is the `get_auth_context*` dependencies, which return an
 Notes:
 - This file documents *why* some choices exist (e.g. claim extraction fallbacks)
   so maintainers can safely modify auth behavior later.
+- Verified Clerk claims are cached by token digest until the JWT `exp`, and synced
+  user rows are cached briefly by Clerk user id, so dashboard polling does not pay
+  the JWT verify, threadpool hop and user sync on every request.
 """
 
 from __future__ import annotations
 
+import hashlib
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from hmac import compare_digest
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import httpx
 from clerk_backend_api import Clerk
@@ -29,11 +35,15 @@ from clerk_backend_api.security.types import AuthenticateRequestOptions, AuthSta
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, ValidationError
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
 from starlette.concurrency import run_in_threadpool
 
 from app.core.auth_mode import AuthMode
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.ttl_cache import TTLCache
 from app.db import crud
 from app.db.session import get_session
 from app.models.users import User
@@ -49,6 +59,17 @@ SESSION_DEP = Depends(get_session)
 LOCAL_AUTH_USER_ID = "local-auth-user"
 LOCAL_AUTH_EMAIL = "admin@home.local"
 LOCAL_AUTH_NAME = "Local User"
+_AUTH_CACHE_MAX_ENTRIES = 10_000
+# Token digest -> verified claims; per-entry TTL is capped by the JWT `exp`.
+_CLAIMS_CACHE: TTLCache[str, dict[str, object]] = TTLCache(
+    ttl_seconds=settings.clerk_claims_cache_ttl_seconds,
+    max_entries=_AUTH_CACHE_MAX_ENTRIES,
+)
+# Clerk user id -> column snapshot of the synced `User` row.
+_USER_CACHE: TTLCache[str, dict[str, Any]] = TTLCache(
+    ttl_seconds=settings.auth_user_cache_ttl_seconds,
+    max_entries=_AUTH_CACHE_MAX_ENTRIES,
+)
 
 
 class ClerkTokenPayload(BaseModel):
@@ -194,6 +215,12 @@ def _make_authenticate_request_options() -> AuthenticateRequestOptions:
     )
 
 
+@lru_cache(maxsize=1)
+def _clerk_sdk(secret_key: str) -> Clerk:
+    # One SDK instance per process; JWKS keys are cached inside the SDK module.
+    return Clerk(bearer_auth=secret_key)
+
+
 async def _authenticate_clerk_request(request: Request) -> RequestState:
     # The SDK docs use httpx.Request as the request object; build one from the ASGI request.
     httpx_request = httpx.Request(
@@ -202,10 +229,85 @@ async def _authenticate_clerk_request(request: Request) -> RequestState:
         headers=dict(request.headers),
     )
     options = _make_authenticate_request_options()
-    sdk = Clerk(bearer_auth=options.secret_key or "")
+    sdk = _clerk_sdk(options.secret_key or "")
     return await run_in_threadpool(sdk.authenticate_request, httpx_request, options)
 
 
+def _claims_ttl_seconds(claims: dict[str, object]) -> float | None:
+    exp = claims.get("exp")
+    if isinstance(exp, bool) or not isinstance(exp, int | float):
+        return None
+    return float(exp) - time.time()
+
+
+async def _verified_clerk_claims(request: Request) -> dict[str, object] | None:
+    """Return verified Clerk claims for a request, or `None` when not signed in.
+
+    Only bearer-header tokens are cached; cookie-based sessions always go through
+    the SDK. Entries never outlive the token's own `exp`.
+    """
+    token = _extract_bearer_token(request.headers.get("Authorization"))
+    cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest() if token else None
+    if cache_key is not None:
+        cached = _CLAIMS_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+    request_state = await _authenticate_clerk_request(request)
+    if request_state.status != AuthStatus.SIGNED_IN or not isinstance(request_state.payload, dict):
+        return None
+    claims: dict[str, object] = {str(k): v for k, v in request_state.payload.items()}
+    if cache_key is not None:
+        ttl = _claims_ttl_seconds(claims)
+        if ttl is not None:
+            _CLAIMS_CACHE.set(cache_key, dict(claims), ttl_seconds=ttl)
+    return claims
+
+
+def invalidate_user_cache(clerk_user_id: str | None = None) -> None:
+    """Drop cached user rows for one Clerk user id, or all of them.
+
+    ORM updates/deletes of `User` invalidate automatically; call this after bulk
+    `update_where`/`delete_where` statements, which bypass ORM events.
+    """
+    if clerk_user_id is None:
+        _USER_CACHE.clear()
+    else:
+        _USER_CACHE.pop(clerk_user_id)
+
+
+def _on_user_changed(_mapper: object, _connection: object, target: User) -> None:
+    invalidate_user_cache(target.clerk_user_id)
+
+
+event.listen(User, "after_update", _on_user_changed)
+event.listen(User, "after_delete", _on_user_changed)
+
+
+async def _resolve_clerk_user(
+    session: AsyncSession,
+    *,
+    clerk_user_id: str,
+    claims: dict[str, object],
+) -> User:
+    snapshot = _USER_CACHE.get(clerk_user_id)
+    if snapshot is not None:
+        cached_user = User.model_validate(snapshot)
+        make_transient_to_detached(cached_user)
+        # `load=False` attaches the cached row to this session without a SELECT.
+        return await session.merge(cached_user, load=False)
+
+    user = await _get_or_sync_user(
+        session,
+        clerk_user_id=clerk_user_id,
+        claims=claims,
+    )
+    state = sa_inspect(user, raiseerr=False)
+    if state is not None and state.persistent:
+        _USER_CACHE.set(clerk_user_id, user.model_dump())
+    return user
+
+
 async def _fetch_clerk_profile(clerk_user_id: str) -> tuple[str | None, str | None]:
     secret = settings.clerk_secret_key.strip()
     secret_kind = secret.split("_", maxsplit=1)[0] if "_" in secret else "unknown"
@@ -454,10 +556,9 @@ async def get_auth_context(
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
         return local_auth
 
-    request_state = await _authenticate_clerk_request(request)
-    if request_state.status != AuthStatus.SIGNED_IN or not isinstance(request_state.payload, dict):
+    claims = await _verified_clerk_claims(request)
+    if claims is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    claims: dict[str, object] = {str(k): v for k, v in request_state.payload.items()}
     try:
         clerk_user_id = _parse_subject(claims)
     except ValidationError as exc:
@@ -465,7 +566,7 @@ async def get_auth_context(
 
     if not clerk_user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-    user = await _get_or_sync_user(
+    user = await _resolve_clerk_user(
         session,
         clerk_user_id=clerk_user_id,
         claims=claims,
@@ -495,11 +596,9 @@ async def get_auth_context_optional(
             required=False,
         )
 
-    request_state = await _authenticate_clerk_request(request)
-    if request_state.status != AuthStatus.SIGNED_IN or not isinstance(request_state.payload, dict):
+    claims = await _verified_clerk_claims(request)
+    if claims is None:
         return None
-    claims: dict[str, object] = {str(k): v for k, v in request_state.payload.items()}
-
     try:
         clerk_user_id = _parse_subject(claims)
     except ValidationError:
@@ -507,7 +606,7 @@ async def get_auth_context_optional(
 
     if not clerk_user_id:
         return None
-    user = await _get_or_sync_user(
+    user = await _resolve_clerk_user(
         session,
         clerk_user_id=clerk_user_id,
         claims=claims,
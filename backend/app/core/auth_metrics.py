@@ -0,0 +1,91 @@
+"""Per-route counters for request authentication.
+
+Records which authenticator ran for each route template and how long it took, so
+wasted or slow auth work is visible without a tracing backend.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from fastapi import Request
+
+Authenticator = Literal["agent", "user"]
+
+
+@dataclass
+class _AuthTiming:
+    count: int = 0
+    failures: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass(frozen=True)
+class AuthTimingSample:
+    """Aggregated auth timings for one (route, authenticator) pair."""
+
+    path: str
+    authenticator: Authenticator
+    count: int
+    failures: int
+    total_ms: float
+    max_ms: float
+
+    @property
+    def avg_ms(self) -> float:
+        """Mean authentication time in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+
+def route_path(request: Request) -> str:
+    """Return the route template for a request, falling back to the raw path."""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else request.url.path
+
+
+class AuthMetrics:
+    """In-process registry of auth timings keyed by route template."""
+
+    def __init__(self) -> None:
+        self._timings: dict[tuple[str, Authenticator], _AuthTiming] = {}
+
+    def record(
+        self,
+        *,
+        path: str,
+        authenticator: Authenticator,
+        duration_ms: float,
+        ok: bool,
+    ) -> None:
+        """Record one authentication attempt."""
+        timing = self._timings.setdefault((path, authenticator), _AuthTiming())
+        timing.count += 1
+        if not ok:
+            timing.failures += 1
+        timing.total_ms += duration_ms
+        timing.max_ms = max(timing.max_ms, duration_ms)
+
+    def snapshot(self) -> list[AuthTimingSample]:
+        """Return samples sorted by route template then authenticator."""
+        return [
+            AuthTimingSample(
+                path=path,
+                authenticator=authenticator,
+                count=timing.count,
+                failures=timing.failures,
+                total_ms=round(timing.total_ms, 3),
+                max_ms=round(timing.max_ms, 3),
+            )
+            for (path, authenticator), timing in sorted(self._timings.items())
+        ]
+
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+        self._timings.clear()
+
+
+auth_metrics = AuthMetrics()
@@ -46,10 +46,97 @@ class Settings(BaseSettings):
     clerk_api_url: str = "https://api.clerk.com"
     clerk_verify_iat: bool = True
     clerk_leeway: float = 10.0
+    # Verified Clerk claims are cached until the JWT `exp` (capped by this TTL);
+    # synced user rows are cached for a shorter window. 0 disables either cache.
+    clerk_claims_cache_ttl_seconds: float = Field(default=60.0, ge=0)
+    auth_user_cache_ttl_seconds: float = Field(default=15.0, ge=0)
+    # Granted org-membership/board-access decisions shared across requests. 0 disables.
+    org_access_cache_ttl_seconds: float = Field(default=10.0, ge=0)
 
     cors_origins: str = ""
     base_url: str = ""
 
+    # Agent auth: accept pre-selector agent tokens by scanning not-yet-indexed rows.
+    # Disable once every agent has been re-keyed (e.g. template sync with rotate_tokens).
+    agent_auth_legacy_token_scan: bool = True
+    # Verified agent-token cache (skips PBKDF2 on repeat calls). TTL 0 disables it.
+    agent_auth_cache_ttl_seconds: float = Field(default=300.0, ge=0)
+    agent_auth_cache_max_entries: int = Field(default=10_000, ge=0)
+    # Optional cross-worker tier; the secret keys token digests and must be shared.
+    agent_auth_cache_redis_url: str = ""
+    agent_auth_cache_secret: str = ""
+
+    # Bounded thread pool for PBKDF2 token hashing; calls beyond the pending cap are shed.
+    kdf_max_workers: int = Field(default=4, ge=1)
+    kdf_max_pending: int = Field(default=64, ge=1)
+
+    # Agent presence touches are buffered in-process and flushed in one batched UPDATE.
+    agent_presence_flush_seconds: float = Field(default=5.0, gt=0)
+
+    # OpenClaw gateway RPC: pooled, multiplexed websocket connections per gateway config.
+    gateway_pool_enabled: bool = True
+    gateway_pool_max_connections: int = Field(default=2, ge=1)
+    gateway_pool_max_in_flight: int = Field(default=32, ge=1)
+    gateway_pool_idle_seconds: float = Field(default=300.0, gt=0)
+    gateway_keepalive_seconds: float = Field(default=20.0, gt=0)
+    # Background subscriber consuming gateway push events (presence/heartbeat/agent/chat).
+    # Individual gateways opt out via `gateways.event_subscription_enabled`.
+    gateway_events_enabled: bool = True
+    gateway_events_refresh_seconds: float = Field(default=60.0, gt=0)
+    gateway_events_flush_seconds: float = Field(default=2.0, gt=0)
+    gateway_events_max_backoff_seconds: float = Field(default=60.0, gt=0)
+    # Heartbeats from one agent within this interval share a single activity row.
+    gateway_events_heartbeat_activity_seconds: float = Field(default=60.0, gt=0)
+    # Coalescing TTL cache for read-only gateway RPCs (per-method TTLs in gateway_cache).
+    gateway_rpc_cache_enabled: bool = True
+    gateway_rpc_cache_max_entries: int = Field(default=1024, ge=0)
+    # Per-gateway circuit breaker: fast-fail after consecutive transport failures.
+    gateway_circuit_enabled: bool = True
+    gateway_circuit_failure_threshold: int = Field(default=5, ge=1)
+    gateway_circuit_open_seconds: float = Field(default=30.0, gt=0)
+    # Multi-agent fan-out (broadcasts, chat notifications, teardown): per-gateway
+    # concurrency and a per-target time limit.
+    gateway_fanout_concurrency: int = Field(default=16, ge=1)
+    gateway_fanout_timeout_seconds: float = Field(default=60.0, gt=0)
+    # Sessions already ensured (sessions.patch) by this worker; later sends skip the patch.
+    gateway_known_session_ttl_seconds: float = Field(default=600.0, ge=0)
+    gateway_known_session_max_entries: int = Field(default=10_000, ge=0)
+    # Per-session chat history cache; refreshes fetch only messages newer than the cached tail.
+    gateway_chat_history_max_sessions: int = Field(default=256, ge=0)
+    gateway_chat_history_max_messages: int = Field(default=1000, gt=0)
+    gateway_chat_history_ttl_seconds: float = Field(default=900.0, ge=0)
+    gateway_chat_history_fresh_seconds: float = Field(default=2.0, ge=0)
+    gateway_chat_history_tail_size: int = Field(default=50, gt=0)
+    # Gateway runtime versions for compatibility checks, per URL and token; refreshed in
+    # the background past half the TTL and from every handshake. TTL 0 disables it.
+    gateway_version_cache_ttl_seconds: float = Field(default=300.0, ge=0)
+    gateway_version_cache_max_entries: int = Field(default=256, ge=0)
+    # Negotiate permessage-deflate on gateway websockets (gateways can opt out individually).
+    gateway_compression_enabled: bool = True
+    # Compiled agent workspace templates: compile every template file at startup, and
+    # keep this many compiled identity/soul override templates (keyed by content hash).
+    workspace_templates_warm_on_startup: bool = True
+    workspace_template_override_cache_size: int = Field(default=256, ge=0)
+    # Digests of agent workspace files last pushed per (gateway, agent, file); unchanged
+    # files are not re-sent on provision/template sync. TTL 0 disables the cache.
+    agent_file_digest_cache_ttl_seconds: float = Field(default=86400.0, ge=0)
+    agent_file_digest_cache_max_entries: int = Field(default=50_000, ge=0)
+    # Agents synced concurrently per gateway by template sync (board leads go first).
+    gateway_template_sync_concurrency: int = Field(default=8, ge=1)
+    # Per-(gateway, method) RPC latency/error histograms, exposed via /gateways/rpc-metrics.
+    gateway_metrics_enabled: bool = True
+    # Agent notification outbox: rows commit with the triggering change and the queue
+    # worker delivers them (Redis wake-up, plus a periodic sweep for retries).
+    notification_outbox_poll_seconds: float = Field(default=5.0, gt=0)
+    notification_outbox_batch_size: int = Field(default=100, ge=1)
+    notification_outbox_max_attempts: int = Field(default=5, ge=1)
+    notification_outbox_retry_base_seconds: float = Field(default=5.0, gt=0)
+    notification_outbox_retry_max_seconds: float = Field(default=300.0, gt=0)
+    # Non-urgent notifications to one agent session within this window (0 disables the
+    # wait) are sent as a single digest of at most `notification_digest_max_messages`.
+    notification_digest_window_seconds: float = Field(default=2.0, ge=0)
+    notification_digest_max_messages: int = Field(default=20, ge=1)
+
     # Database lifecycle
     db_auto_migrate: bool = False
 
@@ -90,6 +177,10 @@ class Settings(BaseSettings):
                     "LOCAL_AUTH_TOKEN must be at least 50 characters and non-placeholder when AUTH_MODE=local "
                     "(or leave it blank to disable token validation).",
                 )
+        if self.agent_auth_cache_redis_url.strip() and not self.agent_auth_cache_secret.strip():
+            raise ValueError(
+                "AGENT_AUTH_CACHE_SECRET must be set when AGENT_AUTH_CACHE_REDIS_URL is set.",
+            )
         # In dev, default to applying Alembic migrations at startup to avoid
         # schema drift (e.g. missing newly-added columns).
         if "db_auto_migrate" not in self.model_fields_set and self.environment == "dev":
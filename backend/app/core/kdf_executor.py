@@ -0,0 +1,153 @@
+"""Bounded executor for password-grade key derivation work.
+
+PBKDF2 token hashing/verification takes tens of milliseconds per call. Running it
+inline in async dependencies stalls every other coroutine on the worker (including
+open SSE streams), so KDF calls are routed through a small dedicated thread pool.
+`hashlib.pbkdf2_hmac` releases the GIL, so the pool also gives real parallelism.
+
+Admission is capped: once `max_pending` calls are queued or running, further
+load-sheddable calls fail fast with `KdfBusyError` so an auth storm degrades into
+quick 503s instead of an unbounded backlog.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class KdfBusyError(RuntimeError):
+    """Raised when the KDF executor is saturated and sheds a call."""
+
+
+@dataclass(frozen=True)
+class KdfExecutorStats:
+    """Point-in-time view of KDF executor load."""
+
+    max_workers: int
+    max_pending: int
+    pending: int
+    peak_pending: int
+    completed: int
+    rejected: int
+    total_wait_ms: float
+    total_run_ms: float
+
+
+class KdfExecutor:
+    """Size-limited thread pool with admission control and queue-depth counters."""
+
+    def __init__(self, *, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(self.max_workers, max_pending)
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait_ms = 0.0
+        self._total_run_ms = 0.0
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="kdf",
+            )
+        return self._pool
+
+    async def run(
+        self,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Run `func` on the KDF pool, shedding load when the queue is full."""
+        return await self._submit(func, *args, shed_load=True, **kwargs)
+
+    async def run_unbounded(
+        self,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Run `func` on the KDF pool without admission control.
+
+        Used for low-volume administrative paths (token minting) that must not be
+        rejected during an agent auth storm.
+        """
+        return await self._submit(func, *args, shed_load=False, **kwargs)
+
+    async def _submit(
+        self,
+        func: Callable[..., T],
+        *args: object,
+        shed_load: bool,
+        **kwargs: object,
+    ) -> T:
+        if shed_load and self._pending >= self.max_pending:
+            self._rejected += 1
+            logger.warning(
+                "kdf.executor.rejected pending=%s max_pending=%s",
+                self._pending,
+                self.max_pending,
+            )
+            raise KdfBusyError("KDF executor saturated")
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        submitted = time.perf_counter()
+        started: list[float] = []
+
+        def _call() -> T:
+            started.append(time.perf_counter())
+            return func(*args, **kwargs)
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor(), _call)
+        finally:
+            finished = time.perf_counter()
+            self._pending -= 1
+            self._completed += 1
+            if started:
+                self._total_wait_ms += (started[0] - submitted) * 1000
+                self._total_run_ms += (finished - started[0]) * 1000
+
+    def stats(self) -> KdfExecutorStats:
+        """Return current queue depth and cumulative counters."""
+        return KdfExecutorStats(
+            max_workers=self.max_workers,
+            max_pending=self.max_pending,
+            pending=self._pending,
+            peak_pending=self._peak_pending,
+            completed=self._completed,
+            rejected=self._rejected,
+            total_wait_ms=round(self._total_wait_ms, 3),
+            total_run_ms=round(self._total_run_ms, 3),
+        )
+
+    def shutdown(self) -> None:
+        """Stop worker threads; a later call lazily recreates the pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+kdf_executor = KdfExecutor(
+    max_workers=settings.kdf_max_workers,
+    max_pending=settings.kdf_max_pending,
+)
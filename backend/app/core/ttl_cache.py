@@ -0,0 +1,100 @@
+"""Small in-process LRU cache with per-entry TTLs.
+
+Used for short-lived memoization of verified auth state and read-mostly lookups.
+Entries expire on read; the cache is bounded by `max_entries` with LRU eviction.
+It is not thread-safe and is meant to be used from the event loop thread.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class TTLCacheStats:
+    """Counters describing cache effectiveness."""
+
+    size: int
+    hits: int
+    misses: int
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU mapping whose entries expire after a TTL."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the cache stores anything at all."""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: K) -> V | None:
+        """Return a live entry for `key`, or `None` when missing/expired."""
+        item = self._entries.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, *, ttl_seconds: float | None = None) -> None:
+        """Store `value`, optionally with a TTL shorter than the cache default."""
+        if not self.enabled:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def values(self) -> list[V]:
+        """Return live values without touching LRU order or hit/miss counters."""
+        now = time.monotonic()
+        return [value for expires_at, value in self._entries.values() if expires_at > now]
+
+    def pop(self, key: K) -> None:
+        """Drop a single entry if present."""
+        self._entries.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Drop every entry matching `predicate`; return the number removed."""
+        doomed = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+        for key in doomed:
+            del self._entries[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> TTLCacheStats:
+        """Return current size and hit/miss counters."""
+        return TTLCacheStats(size=len(self._entries), hits=self.hits, misses=self.misses)
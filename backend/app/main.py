@@ -31,11 +31,16 @@ from app.api.tags import router as tags_router
 from app.api.task_custom_fields import router as task_custom_fields_router
 from app.api.tasks import router as tasks_router
 from app.api.users import router as users_router
+from app.core.agent_presence import agent_presence_buffer
 from app.core.config import settings
 from app.core.error_handling import install_error_handling
+from app.core.kdf_executor import kdf_executor
 from app.core.logging import configure_logging, get_logger
-from app.db.session import init_db
+from app.db.session import async_session_maker, init_db
 from app.schemas.health import HealthStatusResponse
+from app.services.openclaw.gateway_events import gateway_event_service
+from app.services.openclaw.gateway_rpc import gateway_connection_pool
+from app.services.openclaw.workspace_templates import workspace_templates
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -436,10 +441,24 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         settings.db_auto_migrate,
     )
     await init_db()
+    if settings.workspace_templates_warm_on_startup:
+        workspace_templates.warm()
+    agent_presence_buffer.start(
+        async_session_maker,
+        interval_seconds=settings.agent_presence_flush_seconds,
+    )
+    if settings.gateway_pool_enabled:
+        gateway_connection_pool.start()
+    if settings.gateway_events_enabled:
+        gateway_event_service.start(async_session_maker)
     logger.info("app.lifecycle.started")
     try:
         yield
     finally:
+        await gateway_event_service.stop(async_session_maker)
+        await agent_presence_buffer.stop(async_session_maker)
+        await gateway_connection_pool.close()
+        kdf_executor.shutdown()
         logger.info("app.lifecycle.stopped")
 
 
@@ -1,6 +1,7 @@
 """Model exports for SQLAlchemy/SQLModel metadata discovery."""
 
 from app.models.activity_events import ActivityEvent
+from app.models.agent_notifications import AgentNotification
 from app.models.agents import Agent
 from app.models.approval_task_links import ApprovalTaskLink
 from app.models.approvals import Approval
@@ -33,6 +34,7 @@ from app.models.users import User
 __all__ = [
     "ActivityEvent",
     "Agent",
+    "AgentNotification",
     "ApprovalTaskLink",
     "Approval",
     "BoardGroupMemory",
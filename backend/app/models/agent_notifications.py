@@ -0,0 +1,43 @@
+"""Outbox rows for gateway messages owed to agent sessions."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import Column, Text
+from sqlmodel import Field
+
+from app.core.time import utcnow
+from app.models.base import QueryModel
+
+RUNTIME_ANNOTATION_TYPES = (datetime,)
+
+
+class AgentNotification(QueryModel, table=True):
+    """Pending agent notification, written in the same transaction as its trigger.
+
+    Board, agent and task ids are plain columns rather than foreign keys so deleting
+    them never waits on undelivered notifications; delivery drops rows whose targets
+    are gone.
+    """
+
+    __tablename__ = "agent_notifications"  # pyright: ignore[reportAssignmentType]
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    board_id: UUID = Field(index=True)
+    agent_id: UUID = Field(index=True)
+    task_id: UUID | None = Field(default=None, index=True)
+    message: str = Field(sa_column=Column(Text, nullable=False))
+    deliver: bool = Field(default=False)
+    # Urgent rows skip the digest window and are never merged with other rows.
+    urgent: bool = Field(default=False)
+    # Activity recorded after delivery: `<event_type>_notified` or `<event_type>_notify_failed`.
+    activity_event_type: str | None = None
+    activity_message: str | None = None
+    failure_message: str | None = None
+    status: str = Field(default="pending", index=True)
+    attempts: int = Field(default=0)
+    last_error: str | None = None
+    next_attempt_at: datetime = Field(default_factory=utcnow, index=True)
+    created_at: datetime = Field(default_factory=utcnow)
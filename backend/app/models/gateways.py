@@ -24,7 +24,9 @@ class Gateway(QueryModel, table=True):
     url: str
     token: str | None = Field(default=None)
     disable_device_pairing: bool = Field(default=False)
+    disable_compression: bool = Field(default=False)
     workspace_root: str
     allow_insecure_tls: bool = Field(default=False)
+    event_subscription_enabled: bool = Field(default=True)
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
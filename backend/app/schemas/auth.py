@@ -0,0 +1,56 @@
+"""Schemas for authentication diagnostics endpoints."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+from sqlmodel import SQLModel
+
+
+class AuthTimingRead(SQLModel):
+    """Aggregated authentication timings for one route and authenticator."""
+
+    path: str = Field(
+        description="Route template the requests were served by.",
+        examples=["/api/v1/boards/{board_id}/tasks"],
+    )
+    authenticator: Literal["agent", "user"] = Field(
+        description="Authenticator that ran, selected from request headers.",
+        examples=["agent"],
+    )
+    count: int = Field(description="Authentication attempts recorded.", examples=[120])
+    failures: int = Field(description="Attempts that resolved no actor.", examples=[2])
+    avg_ms: float = Field(description="Mean authentication time in milliseconds.", examples=[0.4])
+    max_ms: float = Field(description="Slowest authentication in milliseconds.", examples=[42.0])
+
+
+class KdfExecutorRead(SQLModel):
+    """Load and queue-depth counters of the token-hashing (KDF) thread pool."""
+
+    max_workers: int = Field(description="Worker threads hashing tokens.", examples=[4])
+    max_pending: int = Field(
+        description="Queued or running hashes beyond which agent auth is shed.",
+        examples=[64],
+    )
+    pending: int = Field(description="Hashes queued or running right now.", examples=[3])
+    peak_pending: int = Field(description="Highest pending count seen.", examples=[12])
+    completed: int = Field(description="Hashes finished since startup.", examples=[840])
+    rejected: int = Field(description="Hashes shed because the pool was full.", examples=[0])
+    avg_wait_ms: float = Field(
+        description="Mean time a hash waited for a worker thread, in milliseconds.",
+        examples=[0.8],
+    )
+    avg_run_ms: float = Field(
+        description="Mean time a worker spent hashing, in milliseconds.",
+        examples=[45.0],
+    )
+
+
+class AuthMetricsRead(SQLModel):
+    """Authentication diagnostics for this API process."""
+
+    routes: list[AuthTimingRead] = Field(
+        description="Per-route authentication timings.",
+    )
+    kdf: KdfExecutorRead = Field(description="Token-hashing thread pool load.")
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlmodel import SQLModel
+from sqlmodel import Field, SQLModel
 
 from app.schemas.common import NonEmptyStr
 
@@ -23,6 +23,7 @@ class GatewayResolveQuery(SQLModel):
     gateway_token: str | None = None
     gateway_disable_device_pairing: bool = False
     gateway_allow_insecure_tls: bool = False
+    gateway_disable_compression: bool = False
 
 
 class GatewaysStatusResponse(SQLModel):
@@ -54,6 +55,18 @@ class GatewaySessionHistoryResponse(SQLModel):
     """Gateway session history response payload."""
 
     history: list[object]
+    before_cursor: int = Field(
+        default=0,
+        description="Position of the first returned message; pass as `before` for older pages.",
+    )
+    after_cursor: int = Field(
+        default=0,
+        description="Position after the last returned message; pass as `after` for newer ones.",
+    )
+    has_more: bool = Field(
+        default=False,
+        description="Whether more messages exist in the paging direction.",
+    )
 
 
 class GatewayCommandsResponse(SQLModel):
@@ -62,3 +75,48 @@ class GatewayCommandsResponse(SQLModel):
     protocol_version: int
     methods: list[str]
     events: list[str]
+
+
+class GatewayRpcLatencyBucket(SQLModel):
+    """Cumulative latency histogram bucket."""
+
+    le_ms: float | None = Field(
+        default=None,
+        description="Bucket upper bound in milliseconds; null for the +Inf bucket.",
+    )
+    count: int
+
+
+class GatewayRpcMethodMetrics(SQLModel):
+    """Latency, error and byte counters for one gateway method, or one gateway's handshakes."""
+
+    gateway_url: str
+    method: str
+    count: int
+    gateway_errors: int
+    transport_errors: int
+    mean_ms: float | None = None
+    p50_ms: float | None = None
+    p95_ms: float | None = None
+    p99_ms: float | None = None
+    buckets: list[GatewayRpcLatencyBucket]
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+class GatewayRpcMetricsResponse(SQLModel):
+    """Per-method request and per-gateway handshake metrics for this backend worker."""
+
+    requests: list[GatewayRpcMethodMetrics]
+    handshakes: list[GatewayRpcMethodMetrics]
+
+
+class GatewayChatHistoryCacheMetrics(SQLModel):
+    """Chat history cache size and read counters for this backend worker."""
+
+    sessions: int
+    messages: int
+    hits: int = Field(description="Reads served from the cache without a gateway call.")
+    incremental: int = Field(description="Reads refreshed by fetching only a short tail.")
+    misses: int = Field(description="Reads that fetched the full cached transcript window.")
+    hit_rate: float
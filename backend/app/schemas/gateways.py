@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import field_validator
@@ -19,6 +20,8 @@ class GatewayBase(SQLModel):
     workspace_root: str
     allow_insecure_tls: bool = False
     disable_device_pairing: bool = False
+    disable_compression: bool = False
+    event_subscription_enabled: bool = True
 
 
 class GatewayCreate(GatewayBase):
@@ -47,6 +50,8 @@ class GatewayUpdate(SQLModel):
     workspace_root: str | None = None
     allow_insecure_tls: bool | None = None
     disable_device_pairing: bool | None = None
+    disable_compression: bool | None = None
+    event_subscription_enabled: bool | None = None
 
     @field_validator("token", mode="before")
     @classmethod
@@ -60,6 +65,19 @@ class GatewayUpdate(SQLModel):
         return value
 
 
+class GatewayCircuitRead(SQLModel):
+    """Circuit-breaker state for a gateway as seen by this backend worker."""
+
+    state: Literal["closed", "open", "half_open"] = "closed"
+    consecutive_failures: int = 0
+    total_failures: int = 0
+    total_rejected: int = 0
+    latency_ms: float | None = None
+    opened_at: datetime | None = None
+    retry_at: datetime | None = None
+    last_error: str | None = None
+
+
 class GatewayRead(GatewayBase):
     """Gateway payload returned from read endpoints."""
 
@@ -68,6 +86,7 @@ class GatewayRead(GatewayBase):
     token: str | None = None
     created_at: datetime
     updated_at: datetime
+    circuit: GatewayCircuitRead = Field(default_factory=GatewayCircuitRead)
 
 
 class GatewayTemplatesSyncError(SQLModel):
@@ -88,4 +107,8 @@ class GatewayTemplatesSyncResult(SQLModel):
     agents_updated: int
     agents_skipped: int
     main_updated: bool
+    # Workspace files written, left untouched (unchanged or preserved) and deleted.
+    files_written: int = 0
+    files_skipped: int = 0
+    files_deleted: int = 0
     errors: list[GatewayTemplatesSyncError] = Field(default_factory=list)
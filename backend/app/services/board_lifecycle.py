@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING
 from fastapi import HTTPException, status
 from sqlmodel import col, select
 
+from app.core.agent_token_cache import agent_token_cache
+from app.core.config import settings
 from app.db import crud
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
@@ -28,6 +30,7 @@ from app.models.task_dependencies import TaskDependency
 from app.models.task_fingerprints import TaskFingerprint
 from app.models.tasks import Task
 from app.schemas.common import OkResponse
+from app.services.openclaw.fanout import fan_out
 from app.services.openclaw.gateway_resolver import gateway_client_config, require_gateway_for_board
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 from app.services.openclaw.provisioning import OpenClawGatewayProvisioner
@@ -58,19 +61,29 @@ async def delete_board(session: AsyncSession, *, board: Board) -> OkResponse:
         gateway = await require_gateway_for_board(session, board, require_workspace_root=True)
         # Ensure URL is present (required for gateway cleanup calls).
         gateway_client_config(gateway)
-        for agent in agents:
-            try:
-                await OpenClawGatewayProvisioner().delete_agent_lifecycle(
-                    agent=agent,
-                    gateway=gateway,
-                )
-            except OpenClawGatewayError as exc:
-                if _is_missing_gateway_agent_error(exc):
-                    continue
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
-                    detail=f"Gateway cleanup failed: {exc}",
-                ) from exc
+
+        async def _delete(agent: Agent) -> str | None:
+            return await OpenClawGatewayProvisioner().delete_agent_lifecycle(
+                agent=agent,
+                gateway=gateway,
+            )
+
+        outcomes = await fan_out(
+            agents,
+            _delete,
+            limit_key=gateway.url,
+            timeout_s=settings.gateway_fanout_timeout_seconds,
+        )
+        for outcome in outcomes:
+            exc = outcome.error
+            if exc is None:
+                continue
+            if isinstance(exc, OpenClawGatewayError) and _is_missing_gateway_agent_error(exc):
+                continue
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"Gateway cleanup failed: {exc}",
+            ) from exc
 
     if task_ids:
         await crud.delete_where(
@@ -155,6 +168,8 @@ async def delete_board(session: AsyncSession, *, board: Board) -> OkResponse:
             commit=False,
         )
         await crud.delete_where(session, Agent, col(Agent.id).in_(agent_ids))
+        for agent_id in agent_ids:
+            agent_token_cache.invalidate_agent(agent_id)
 
     await session.delete(board)
     await session.commit()
@@ -173,6 +173,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
             token=gateway.token,
             allow_insecure_tls=gateway.allow_insecure_tls,
             disable_device_pairing=gateway.disable_device_pairing,
+            disable_compression=gateway.disable_compression,
         )
         target_id = GatewayAgentIdentity.openclaw_agent_id(gateway)
         try:
@@ -191,6 +192,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
         token: str | None,
         allow_insecure_tls: bool = False,
         disable_device_pairing: bool = False,
+        disable_compression: bool = False,
     ) -> None:
         """Validate that a gateway runtime meets minimum supported version."""
         config = GatewayClientConfig(
@@ -198,6 +200,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
             token=token,
             allow_insecure_tls=allow_insecure_tls,
             disable_device_pairing=disable_device_pairing,
+            disable_compression=disable_compression,
         )
         try:
             result = await check_gateway_version_compatibility(config)
@@ -231,7 +234,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail="Organization owner not found (required for gateway agent USER.md rendering).",
             )
-        raw_token = mint_agent_token(agent)
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(
             agent,
             action=action,
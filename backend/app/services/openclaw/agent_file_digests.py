@@ -0,0 +1,97 @@
+"""Digests of agent workspace files last pushed to each gateway."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache, TTLCacheStats
+
+_CacheKey = tuple[str, str, str]
+# `agents.files.list` fields that may carry a hex SHA-256 of the file content.
+_METADATA_DIGEST_FIELDS = ("sha256", "contentHash", "hash")
+
+
+@dataclass(frozen=True, slots=True)
+class PushedAgentFile:
+    """Digest and UTF-8 byte size of the content last written to a gateway."""
+
+    digest: str
+    size: int
+
+
+def content_digest(content: str) -> str:
+    """Return the hex SHA-256 of `content` as UTF-8."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _metadata_digest(entry: dict[str, Any]) -> str | None:
+    for field in _METADATA_DIGEST_FIELDS:
+        value = entry.get(field)
+        if isinstance(value, str) and value.strip():
+            return value.strip().lower().removeprefix("sha256:")
+    return None
+
+
+class AgentFileDigests:
+    """TTL map of (gateway id, agent id, file name) to the last pushed file digest."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._entries: TTLCache[_CacheKey, PushedAgentFile] = TTLCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+
+    def unchanged(
+        self,
+        gateway_id: str,
+        agent_id: str,
+        name: str,
+        content: str,
+        *,
+        entry: dict[str, Any] | None,
+    ) -> bool:
+        """Return whether `content` is already on the gateway and need not be written."""
+        if not entry or bool(entry.get("missing")):
+            return False
+        digest = content_digest(content)
+        reported = _metadata_digest(entry)
+        if reported is not None:
+            return reported == digest
+        pushed = self._entries.get((gateway_id, agent_id, name))
+        if pushed is None or pushed.digest != digest:
+            return False
+        size = entry.get("size")
+        return not isinstance(size, int) or size == pushed.size
+
+    def remember(self, gateway_id: str, agent_id: str, name: str, content: str) -> None:
+        """Record `content` as written to the gateway."""
+        self._entries.set(
+            (gateway_id, agent_id, name),
+            PushedAgentFile(
+                digest=content_digest(content),
+                size=len(content.encode("utf-8")),
+            ),
+        )
+
+    def forget(self, gateway_id: str, agent_id: str, name: str | None = None) -> int:
+        """Drop one file's digest, or every file of the agent when `name` is None."""
+        return self._entries.pop_where(
+            lambda key, _: key[:2] == (gateway_id, agent_id) and name in (None, key[2]),
+        )
+
+    def stats(self) -> TTLCacheStats:
+        """Return cache size and hit/miss counters."""
+        return self._entries.stats()
+
+    def clear(self) -> None:
+        """Drop every digest, forcing the next sync to write all files."""
+        self._entries.clear()
+
+
+agent_file_digests = AgentFileDigests(
+    ttl_seconds=settings.agent_file_digest_cache_ttl_seconds,
+    max_entries=settings.agent_file_digest_cache_max_entries,
+)
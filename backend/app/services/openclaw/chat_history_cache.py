@@ -0,0 +1,306 @@
+"""Incremental, paged per-session cache of gateway chat history."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.ttl_cache import TTLCache
+from app.services.openclaw.gateway_version_cache import _token_fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from app.services.openclaw.gateway_rpc import GatewayConfig
+
+logger = get_logger(__name__)
+
+_DROPPING_METHODS = frozenset({"sessions.reset", "sessions.delete"})
+_STALING_METHODS = frozenset({"chat.send", "chat.abort", "sessions.compact"})
+# Number of trailing cached messages that must reappear in a fetched tail.
+_ANCHOR_SIZE = 3
+# Each retry widens the tail by this factor, up to `max_messages`.
+_TAIL_GROWTH = 4
+
+# (gateway URL, token fingerprint, session key)
+_CacheKey = tuple[str, str, str]
+
+
+def _cache_key(config: GatewayConfig, session_key: str) -> _CacheKey:
+    return ((config.url or "").strip(), _token_fingerprint(config.token), session_key)
+
+
+def _message_key(message: object) -> str:
+    if isinstance(message, dict):
+        for field in ("id", "messageId"):
+            value = message.get(field)
+            if isinstance(value, (str, int)):
+                return f"{field}:{value}"
+    return json.dumps(message, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _stitched(cached: list[object], tail: list[object]) -> list[object] | None:
+    """Return `cached` extended by `tail`, or `None` when the two do not overlap.
+
+    The overlapping cached messages are replaced by their fetched copies, so a
+    message updated under the same id (e.g. a streamed reply) is refreshed.
+    """
+    anchor = [_message_key(message) for message in cached[-_ANCHOR_SIZE:]]
+    tail_keys = [_message_key(message) for message in tail]
+    for start in range(len(tail_keys) - len(anchor), -1, -1):
+        if tail_keys[start : start + len(anchor)] == anchor:
+            return cached[: -len(anchor)] + tail[start:]
+    return None
+
+
+def _hit_rate(hits: int, incremental: int, misses: int) -> float:
+    total = hits + incremental + misses
+    if total == 0:
+        return 0.0
+    return (hits + incremental) / total
+
+
+def _consume_exception(task: asyncio.Task[_SessionHistory]) -> None:
+    # Every waiter may have been cancelled; retrieve the error so it is not logged.
+    if not task.cancelled():
+        task.exception()
+
+
+@dataclass
+class _SessionHistory:
+    messages: list[object]
+    # Position of `messages[0]`.
+    base: int
+    fetched_at: float
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.messages)
+
+
+@dataclass(frozen=True)
+class ChatHistoryPage:
+    """One page of cached chat history with cursors for further paging."""
+
+    messages: list[object]
+    # Position of the first message in the page; pass as `before` for older messages.
+    before_cursor: int
+    # Position after the last message in the page; pass as `after` for newer messages.
+    after_cursor: int
+    # Whether more messages exist in the paging direction.
+    has_more: bool
+
+
+@dataclass(frozen=True)
+class ChatHistoryCacheStats:
+    """Counters describing chat history cache effectiveness."""
+
+    sessions: int
+    messages: int
+    hits: int
+    incremental: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of reads served without a full transcript fetch."""
+        return _hit_rate(self.hits, self.incremental, self.misses)
+
+
+class ChatHistoryCache:
+    """Bounded LRU of recent chat transcripts keyed by gateway URL, token and session key."""
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int,
+        max_messages: int,
+        ttl_seconds: float,
+        fresh_seconds: float,
+        tail_size: int,
+    ) -> None:
+        self.max_messages = max_messages
+        self.fresh_seconds = fresh_seconds
+        self.tail_size = min(tail_size, max_messages)
+        self._entries: TTLCache[_CacheKey, _SessionHistory] = TTLCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_sessions,
+        )
+        self._in_flight: dict[_CacheKey, asyncio.Task[_SessionHistory]] = {}
+        self._hits = 0
+        self._incremental = 0
+        self._misses = 0
+
+    async def read(
+        self,
+        session_key: str,
+        *,
+        config: GatewayConfig,
+        fetch: Callable[[int], Awaitable[list[object]]],
+        limit: int | None = None,
+        before: int | None = None,
+        after: int | None = None,
+    ) -> ChatHistoryPage:
+        """Return a page of history, refreshing the cached transcript when needed.
+
+        `fetch(limit)` must return the newest `limit` messages of the session.
+        Backward pages (`before`) are served from the cache when it has the session.
+        """
+        key = _cache_key(config, session_key)
+        entry = self._entries.get(key)
+        if entry is not None and (
+            before is not None or time.monotonic() - entry.fetched_at < self.fresh_seconds
+        ):
+            self._hits += 1
+        else:
+            entry = await self._refresh(key, entry, fetch)
+        logger.debug(
+            "gateway.chat_history.read session_key=%s cached=%s hit_rate=%.2f",
+            session_key,
+            len(entry.messages),
+            _hit_rate(self._hits, self._incremental, self._misses),
+        )
+        return self._page(entry, limit=limit, before=before, after=after)
+
+    async def _refresh(
+        self,
+        key: _CacheKey,
+        entry: _SessionHistory | None,
+        fetch: Callable[[int], Awaitable[list[object]]],
+    ) -> _SessionHistory:
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._fetch(key, entry, fetch))
+            task.add_done_callback(_consume_exception)
+            self._in_flight[key] = task
+        # Shielded so a cancelled reader does not cancel a refresh other readers share.
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        key: _CacheKey,
+        entry: _SessionHistory | None,
+        fetch: Callable[[int], Awaitable[list[object]]],
+    ) -> _SessionHistory:
+        owner = False
+        try:
+            refreshed = await self._fetch_newer(entry, fetch)
+        finally:
+            owner = self._in_flight.get(key) is asyncio.current_task()
+            if owner:
+                del self._in_flight[key]
+        # A mutation that raced this refresh detached it; do not store its result.
+        if owner:
+            self._entries.set(key, refreshed)
+        return refreshed
+
+    async def _fetch_newer(
+        self,
+        entry: _SessionHistory | None,
+        fetch: Callable[[int], Awaitable[list[object]]],
+    ) -> _SessionHistory:
+        if entry is None or not entry.messages:
+            self._misses += 1
+            messages = await fetch(self.max_messages)
+            base = 0 if entry is None else entry.end
+            return self._trimmed(_SessionHistory(list(messages), base, time.monotonic()))
+        tail_limit = self.tail_size
+        while True:
+            tail = await fetch(tail_limit)
+            stitched = _stitched(entry.messages, tail)
+            if stitched is not None:
+                self._incremental += 1
+                return self._trimmed(_SessionHistory(stitched, entry.base, time.monotonic()))
+            if len(tail) < tail_limit or tail_limit >= self.max_messages:
+                # The transcript was reset, or more messages arrived than the cache holds.
+                self._misses += 1
+                return self._trimmed(_SessionHistory(list(tail), entry.end, time.monotonic()))
+            tail_limit = min(tail_limit * _TAIL_GROWTH, self.max_messages)
+
+    def _trimmed(self, entry: _SessionHistory) -> _SessionHistory:
+        overflow = len(entry.messages) - self.max_messages
+        if overflow > 0:
+            entry.messages = entry.messages[overflow:]
+            entry.base += overflow
+        return entry
+
+    @staticmethod
+    def _page(
+        entry: _SessionHistory,
+        *,
+        limit: int | None,
+        before: int | None,
+        after: int | None,
+    ) -> ChatHistoryPage:
+        low = entry.base if after is None else min(max(after, entry.base), entry.end)
+        high = entry.end if before is None else max(min(before, entry.end), low)
+        if after is not None:
+            if limit is not None:
+                high = min(high, low + limit)
+            has_more = high < entry.end
+        else:
+            if limit is not None:
+                low = max(low, high - limit)
+            has_more = low > entry.base
+        return ChatHistoryPage(
+            messages=entry.messages[low - entry.base : high - entry.base],
+            before_cursor=low,
+            after_cursor=high,
+            has_more=has_more,
+        )
+
+    def mark_stale_after(
+        self,
+        method: str,
+        params: dict[str, Any] | None,
+        *,
+        config: GatewayConfig,
+    ) -> None:
+        """Expire or drop the cached session touched by a completed call to `method`."""
+        if not params or (method not in _STALING_METHODS and method not in _DROPPING_METHODS):
+            return
+        session_key = params.get("sessionKey", params.get("key"))
+        if not isinstance(session_key, str):
+            return
+        key = _cache_key(config, session_key)
+        self._in_flight.pop(key, None)
+        if method in _DROPPING_METHODS:
+            self._entries.pop(key)
+            return
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.fetched_at = 0.0
+
+    def clear(self) -> None:
+        """Drop every cached transcript and reset counters."""
+        self._entries.clear()
+        self._in_flight.clear()
+        self._hits = 0
+        self._incremental = 0
+        self._misses = 0
+
+    def stats(self) -> ChatHistoryCacheStats:
+        """Return cached session/message counts and read counters."""
+        sessions = self._entries.values()
+        return ChatHistoryCacheStats(
+            sessions=len(sessions),
+            messages=sum(len(entry.messages) for entry in sessions),
+            hits=self._hits,
+            incremental=self._incremental,
+            misses=self._misses,
+        )
+
+
+chat_history_cache = ChatHistoryCache(
+    max_sessions=settings.gateway_chat_history_max_sessions,
+    max_messages=settings.gateway_chat_history_max_messages,
+    ttl_seconds=settings.gateway_chat_history_ttl_seconds,
+    fresh_seconds=settings.gateway_chat_history_fresh_seconds,
+    tail_size=settings.gateway_chat_history_tail_size,
+)
@@ -0,0 +1,186 @@
+"""Per-gateway circuit breakers for OpenClaw RPC calls.
+
+Breakers are keyed by gateway URL and shared by every caller in the process. After
+`failure_threshold` consecutive transport failures (refused connections, timeouts,
+dropped sockets) the circuit opens and calls fail immediately with the last error
+instead of paying a connect timeout each. Once `open_seconds` have passed a single
+half-open probe is let through: success closes the circuit, failure re-opens it.
+
+Error responses from a reachable gateway (bad params, missing scopes) count as
+successes; they say nothing about reachability.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Literal
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+
+logger = get_logger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+_LATENCY_EWMA_ALPHA = 0.2
+
+
+@dataclass(frozen=True)
+class GatewayCircuitSnapshot:
+    """Point-in-time view of one gateway circuit breaker."""
+
+    state: CircuitState
+    consecutive_failures: int
+    total_failures: int
+    total_rejected: int
+    latency_ms: float | None
+    opened_at: datetime | None
+    retry_at: datetime | None
+    last_error: str | None
+
+
+CLOSED_SNAPSHOT = GatewayCircuitSnapshot(
+    state="closed",
+    consecutive_failures=0,
+    total_failures=0,
+    total_rejected=0,
+    latency_ms=None,
+    opened_at=None,
+    retry_at=None,
+    last_error=None,
+)
+
+
+class GatewayCircuitBreaker:
+    """Closed/open/half-open failure tracker for one gateway."""
+
+    def __init__(self, key: str, *, failure_threshold: int, open_seconds: float) -> None:
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._state: CircuitState = "closed"
+        self._consecutive_failures = 0
+        self._total_failures = 0
+        self._total_rejected = 0
+        self._latency_s: float | None = None
+        self._opened_at: datetime | None = None
+        self._opened_monotonic = 0.0
+        self._probe_started: float | None = None
+        self.last_error: str | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state without claiming a probe."""
+        return self._state
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed; claims the probe slot when half-open."""
+        if self._state == "closed":
+            return True
+        now = monotonic()
+        if self._state == "open" and now - self._opened_monotonic < self.open_seconds:
+            self._total_rejected += 1
+            return False
+        # A probe that never reported back (e.g. cancelled) frees its slot after one window.
+        if self._probe_started is not None and now - self._probe_started < self.open_seconds:
+            self._total_rejected += 1
+            return False
+        self._state = "half_open"
+        self._probe_started = now
+        return True
+
+    def retry_in(self) -> float:
+        """Return seconds until the next probe is allowed."""
+        if self._state == "closed":
+            return 0.0
+        started = self._probe_started if self._state == "half_open" else self._opened_monotonic
+        return max(0.0, self.open_seconds - (monotonic() - (started or 0.0)))
+
+    def record_success(self, latency_s: float) -> None:
+        """Record a call that reached the gateway."""
+        if self._latency_s is None:
+            self._latency_s = latency_s
+        else:
+            self._latency_s += _LATENCY_EWMA_ALPHA * (latency_s - self._latency_s)
+        if self._state != "closed":
+            logger.info("gateway.circuit.closed key=%s", self.key)
+        self._state = "closed"
+        self._consecutive_failures = 0
+        self._probe_started = None
+        self._opened_at = None
+
+    def record_failure(self, error: str) -> None:
+        """Record a transport failure; opens the circuit at the threshold."""
+        self._consecutive_failures += 1
+        self._total_failures += 1
+        self.last_error = error
+        if self._state == "half_open" or self._consecutive_failures >= self.failure_threshold:
+            if self._state != "open":
+                logger.warning(
+                    "gateway.circuit.opened key=%s consecutive_failures=%s",
+                    self.key,
+                    self._consecutive_failures,
+                )
+            self._state = "open"
+            self._opened_at = utcnow()
+            self._opened_monotonic = monotonic()
+            self._probe_started = None
+
+    def snapshot(self) -> GatewayCircuitSnapshot:
+        """Return counters and state for reporting."""
+        retry_at = None
+        if self._state != "closed":
+            retry_at = utcnow() + timedelta(seconds=self.retry_in())
+        return GatewayCircuitSnapshot(
+            state=self._state,
+            consecutive_failures=self._consecutive_failures,
+            total_failures=self._total_failures,
+            total_rejected=self._total_rejected,
+            latency_ms=None if self._latency_s is None else round(self._latency_s * 1000, 1),
+            opened_at=self._opened_at,
+            retry_at=retry_at,
+            last_error=self.last_error,
+        )
+
+
+class GatewayCircuitBreakerRegistry:
+    """Process-wide map of gateway URL to its circuit breaker."""
+
+    def __init__(self, *, failure_threshold: int, open_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._breakers: dict[str, GatewayCircuitBreaker] = {}
+
+    def get(self, key: str) -> GatewayCircuitBreaker:
+        """Return the breaker for `key`, creating a closed one on first use."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = GatewayCircuitBreaker(
+                key,
+                failure_threshold=self.failure_threshold,
+                open_seconds=self.open_seconds,
+            )
+            self._breakers[key] = breaker
+        return breaker
+
+    def snapshot(self, key: str) -> GatewayCircuitSnapshot:
+        """Return the breaker state for `key` (closed when never used)."""
+        breaker = self._breakers.get(key)
+        return CLOSED_SNAPSHOT if breaker is None else breaker.snapshot()
+
+    def reset(self, key: str) -> None:
+        """Forget the breaker for `key`, e.g. after its gateway was reconfigured."""
+        self._breakers.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every breaker."""
+        self._breakers.clear()
+
+
+gateway_circuit_breakers = GatewayCircuitBreakerRegistry(
+    failure_threshold=settings.gateway_circuit_failure_threshold,
+    open_seconds=settings.gateway_circuit_open_seconds,
+)
@@ -33,6 +33,7 @@ from app.services.openclaw.exceptions import (
     map_gateway_error_message,
     map_gateway_error_to_http_exception,
 )
+from app.services.openclaw.fanout import fan_out
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_resolver import gateway_client_config
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
@@ -48,6 +49,7 @@ from app.services.openclaw.provisioning_db import (
 from app.services.openclaw.shared import GatewayAgentIdentity
 
 _T = TypeVar("_T")
+_BROADCAST_ERRORS = (HTTPException, OpenClawGatewayError, TimeoutError, ValueError)
 
 
 class AbstractGatewayMessagingService(OpenClawDBService, ABC):
@@ -520,13 +522,12 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             main_agent_name=main_agent.name if main_agent else None,
         )
 
-    async def _ensure_and_message_board_lead(
+    async def _ensure_board_lead(
         self,
         *,
         gateway: Gateway,
         config: GatewayClientConfig,
         board: Board,
-        message: str,
     ) -> tuple[Agent, bool]:
         lead, lead_created = await OpenClawProvisioningService(
             self.session
@@ -544,6 +545,21 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail="Lead agent has no session key",
             )
+        return lead, lead_created
+
+    async def _ensure_and_message_board_lead(
+        self,
+        *,
+        gateway: Gateway,
+        config: GatewayClientConfig,
+        board: Board,
+        message: str,
+    ) -> tuple[Agent, bool]:
+        lead, lead_created = await self._ensure_board_lead(
+            gateway=gateway,
+            config=config,
+            board=board,
+        )
         await self._dispatch_gateway_message(
             session_key=lead.openclaw_session_id or "",
             config=config,
@@ -643,6 +659,14 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             lead_created=lead_created,
         )
 
+    @staticmethod
+    def _broadcast_failure(board: Board, exc: Exception) -> GatewayLeadBroadcastBoardResult:
+        return GatewayLeadBroadcastBoardResult(
+            board_id=board.id,
+            ok=False,
+            error=map_gateway_error_message(GatewayOperation.LEAD_BROADCAST_DISPATCH, exc),
+        )
+
     async def broadcast_gateway_lead_message(
         self,
         *,
@@ -668,45 +692,61 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             statement = statement.where(col(Board.id).in_(payload.board_ids))
         boards = list(await self.session.exec(statement))
 
-        results: list[GatewayLeadBroadcastBoardResult] = []
-        sent = 0
-        failed = 0
-
+        # Lead provisioning shares this request's DB session, so it stays sequential;
+        # the gateway sends are then fanned out concurrently.
+        results_by_board: dict[UUID, GatewayLeadBroadcastBoardResult] = {}
+        deliveries: list[tuple[Board, Agent]] = []
         for board in boards:
-            message = self._build_gateway_lead_message(
-                board=board,
-                actor_agent_name=actor_agent.name,
-                kind=payload.kind,
-                content=payload.content,
-                correlation_id=payload.correlation_id,
-                reply_tags=payload.reply_tags,
-                reply_source=payload.reply_source,
-            )
             try:
-                lead, _lead_created = await self._ensure_and_message_board_lead(
+                lead, _lead_created = await self._ensure_board_lead(
                     gateway=gateway,
                     config=config,
                     board=board,
-                    message=message,
-                )
-                board_result = GatewayLeadBroadcastBoardResult(
-                    board_id=board.id,
-                    lead_agent_id=lead.id,
-                    lead_agent_name=lead.name,
-                    ok=True,
                 )
-                sent += 1
-            except (HTTPException, OpenClawGatewayError, TimeoutError, ValueError) as exc:
-                board_result = GatewayLeadBroadcastBoardResult(
-                    board_id=board.id,
-                    ok=False,
-                    error=map_gateway_error_message(
-                        GatewayOperation.LEAD_BROADCAST_DISPATCH,
-                        exc,
-                    ),
-                )
-                failed += 1
-            results.append(board_result)
+            except _BROADCAST_ERRORS as exc:
+                results_by_board[board.id] = self._broadcast_failure(board, exc)
+                continue
+            deliveries.append((board, lead))
+
+        async def _deliver(delivery: tuple[Board, Agent]) -> None:
+            board, lead = delivery
+            await self._dispatch_gateway_message(
+                session_key=lead.openclaw_session_id or "",
+                config=config,
+                agent_name=lead.name,
+                message=self._build_gateway_lead_message(
+                    board=board,
+                    actor_agent_name=actor_agent.name,
+                    kind=payload.kind,
+                    content=payload.content,
+                    correlation_id=payload.correlation_id,
+                    reply_tags=payload.reply_tags,
+                    reply_source=payload.reply_source,
+                ),
+                deliver=False,
+            )
+
+        outcomes = await fan_out(
+            deliveries,
+            _deliver,
+            limit_key=config.url,
+            timeout_s=settings.gateway_fanout_timeout_seconds,
+            errors=_BROADCAST_ERRORS,
+        )
+        for outcome in outcomes:
+            board, lead = outcome.target
+            if outcome.error is not None:
+                results_by_board[board.id] = self._broadcast_failure(board, outcome.error)
+                continue
+            results_by_board[board.id] = GatewayLeadBroadcastBoardResult(
+                board_id=board.id,
+                lead_agent_id=lead.id,
+                lead_agent_name=lead.name,
+                ok=True,
+            )
+        results = [results_by_board[board.id] for board in boards]
+        sent = sum(1 for result in results if result.ok)
+        failed = len(results) - sent
 
         record_activity(
             self.session,
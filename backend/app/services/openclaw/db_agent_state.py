@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from typing import Literal
 
-from app.core.agent_tokens import generate_agent_token, hash_agent_token
+from app.core.agent_token_cache import agent_token_cache
+from app.core.agent_tokens import agent_token_selector, generate_agent_token, hash_agent_token
+from app.core.kdf_executor import kdf_executor
 from app.core.time import utcnow
 from app.models.agents import Agent
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
@@ -17,11 +19,17 @@ def ensure_heartbeat_config(agent: Agent) -> None:
         agent.heartbeat_config = DEFAULT_HEARTBEAT_CONFIG.copy()
 
 
-def mint_agent_token(agent: Agent) -> str:
-    """Generate a new raw token and update the agent's token hash."""
+async def mint_agent_token(agent: Agent) -> str:
+    """Generate a new raw token and update the agent's token hash and selector.
+
+    Re-minting replaces any legacy token, moving the agent onto the indexed
+    selector lookup path.
+    """
 
     raw_token = generate_agent_token()
-    agent.agent_token_hash = hash_agent_token(raw_token)
+    agent.agent_token_hash = await kdf_executor.run_unbounded(hash_agent_token, raw_token)
+    agent.agent_token_selector = agent_token_selector(raw_token)
+    agent_token_cache.invalidate_agent(agent.id)
     return raw_token
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from time import time
@@ -124,6 +125,86 @@ def load_or_create_device_identity() -> DeviceIdentity:
     return identity
 
 
+@dataclass(frozen=True)
+class LoadedDeviceIdentity:
+    """Device identity with its key material parsed once and kept in memory."""
+
+    identity: DeviceIdentity
+    private_key: Ed25519PrivateKey
+    public_key_raw_base64url: str
+
+    @property
+    def device_id(self) -> str:
+        """Return the device id derived from the public key."""
+        return self.identity.device_id
+
+    def sign(self, payload: str) -> str:
+        """Sign a device payload and return the base64url signature."""
+        return _base64url_encode(self.private_key.sign(payload.encode("utf-8")))
+
+
+def _file_stamp(path: Path) -> tuple[Path, int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return path, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _load_keys(identity: DeviceIdentity) -> LoadedDeviceIdentity:
+    private_key = serialization.load_pem_private_key(
+        identity.private_key_pem.encode("utf-8"),
+        password=None,
+    )
+    if not isinstance(private_key, Ed25519PrivateKey):
+        msg = "device identity private key is not Ed25519"
+        raise ValueError(msg)
+    return LoadedDeviceIdentity(
+        identity=identity,
+        private_key=private_key,
+        public_key_raw_base64url=public_key_raw_base64url_from_pem(identity.public_key_pem),
+    )
+
+
+class DeviceIdentityHolder:
+    """Process-wide cache of the parsed device identity.
+
+    Each gateway connect needs the device id, raw public key and a signature.
+    Reading and parsing `device.json` and both PEMs every time is wasted work, so
+    the parsed identity is kept until the identity file's stat (path, inode, mtime,
+    size) changes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loaded: LoadedDeviceIdentity | None = None
+        self._stamp: tuple[Path, int, int, int] | None = None
+
+    def get(self) -> LoadedDeviceIdentity:
+        """Return the cached identity, reloading it when the file changed."""
+        path = _identity_path()
+        loaded = self._loaded
+        if loaded is not None and self._stamp is not None and _file_stamp(path) == self._stamp:
+            return loaded
+        with self._lock:
+            stamp = _file_stamp(path)
+            if self._loaded is not None and stamp is not None and stamp == self._stamp:
+                return self._loaded
+            loaded = _load_keys(load_or_create_device_identity())
+            self._loaded = loaded
+            self._stamp = _file_stamp(path)
+            return loaded
+
+    def clear(self) -> None:
+        """Forget the cached identity so the next `get` reloads from disk."""
+        with self._lock:
+            self._loaded = None
+            self._stamp = None
+
+
+device_identity_holder = DeviceIdentityHolder()
+
+
 def public_key_raw_base64url_from_pem(public_key_pem: str) -> str:
     """Return raw Ed25519 public key in base64url form expected by OpenClaw."""
     return _base64url_encode(_derive_public_key_raw(public_key_pem))
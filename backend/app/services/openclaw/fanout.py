@@ -0,0 +1,125 @@
+"""Bounded-concurrency fan-out for multi-target gateway operations.
+
+Broadcasts, chat notifications and teardown loops message many agents at once.
+`fan_out` runs one coroutine per target inside an `asyncio.TaskGroup`, bounded by a
+semaphore per gateway URL so one large board cannot monopolize a gateway, and
+returns one `FanOutResult` per target in input order.
+
+Target callables must not share an `AsyncSession`; resolve DB state before fanning
+out and keep the per-target work to gateway I/O.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+logger = get_logger(__name__)
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+
+DEFAULT_FAN_OUT_ERRORS: tuple[type[Exception], ...] = (OpenClawGatewayError, TimeoutError)
+
+
+@dataclass(frozen=True)
+class FanOutResult(Generic[_K, _T]):
+    """Outcome of one fan-out target: a value or the captured error."""
+
+    target: _K
+    value: _T | None = None
+    error: Exception | None = None
+    duration_ms: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the target completed without a captured error."""
+        return self.error is None
+
+
+class GatewayFanOutLimiter:
+    """Per-gateway semaphores bounding concurrent fan-out work on each event loop."""
+
+    def __init__(self, *, max_concurrency: int) -> None:
+        self.max_concurrency = max_concurrency
+        self._semaphores: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+    def semaphore(self, key: str) -> asyncio.Semaphore:
+        """Return the semaphore for `key` bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        entry = self._semaphores.get(key)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Semaphore(self.max_concurrency))
+            self._semaphores[key] = entry
+        return entry[1]
+
+
+gateway_fan_out_limiter = GatewayFanOutLimiter(
+    max_concurrency=settings.gateway_fanout_concurrency,
+)
+
+
+async def fan_out(
+    targets: Sequence[_K],
+    fn: Callable[[_K], Awaitable[_T]],
+    *,
+    limit_key: str | Callable[[_K], str],
+    timeout_s: float | None = None,
+    errors: tuple[type[Exception], ...] = DEFAULT_FAN_OUT_ERRORS,
+) -> list[FanOutResult[_K, _T]]:
+    """Run `fn` for every target concurrently and return per-target results in order.
+
+    `limit_key` names the gateway (usually its URL) whose semaphore bounds the work,
+    or maps each target to one. `timeout_s` bounds each target separately; a timeout
+    is captured as `TimeoutError`. Exceptions listed in `errors` are captured per
+    target; anything else cancels the remaining targets and is re-raised.
+    """
+    if not targets:
+        return []
+    results: list[FanOutResult[_K, _T] | None] = [None] * len(targets)
+
+    async def _run(index: int, target: _K) -> None:
+        key = limit_key if isinstance(limit_key, str) else limit_key(target)
+        async with gateway_fan_out_limiter.semaphore(key):
+            started_at = perf_counter()
+            try:
+                async with asyncio.timeout(timeout_s):
+                    value = await fn(target)
+            except errors as exc:
+                results[index] = FanOutResult(
+                    target=target,
+                    error=exc,
+                    duration_ms=int((perf_counter() - started_at) * 1000),
+                )
+                return
+            results[index] = FanOutResult(
+                target=target,
+                value=value,
+                duration_ms=int((perf_counter() - started_at) * 1000),
+            )
+
+    started_at = perf_counter()
+    try:
+        async with asyncio.TaskGroup() as group:
+            for index, target in enumerate(targets):
+                group.create_task(_run(index, target))
+    except BaseExceptionGroup as exc_group:
+        # Surface the first unexpected error itself so callers' handlers still match.
+        raise exc_group.exceptions[0] from exc_group
+    completed = [result for result in results if result is not None]
+    logger.debug(
+        "gateway.fan_out.done targets=%s failed=%s duration_ms=%s",
+        len(completed),
+        sum(1 for result in completed if not result.ok),
+        int((perf_counter() - started_at) * 1000),
+    )
+    return completed
@@ -0,0 +1,187 @@
+"""Short-lived response cache for read-only gateway RPC methods.
+
+Dashboard pages poll the same gateway reads (`sessions.list`, `status`, ...) from
+many requests at once. Responses are cached per (gateway config, method, params)
+with a per-method TTL, concurrent identical reads share one in-flight RPC, and
+mutating methods drop the reads they affect once they complete.
+
+Cached payloads are deep-copied on the way out so callers can mutate them freely.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Collection
+
+    from app.services.openclaw.gateway_rpc import GatewayConfig
+
+# Per-method TTLs in seconds. Session and status reads change with every chat turn,
+# so they only absorb bursts; model and config listings change rarely.
+CACHEABLE_METHOD_TTLS: dict[str, float] = {
+    "sessions.list": 2.0,
+    "status": 2.0,
+    "health": 5.0,
+    "agents.list": 5.0,
+    "config.get": 5.0,
+    "agents.files.list": 10.0,
+    "models.list": 60.0,
+}
+
+_SESSION_READS = frozenset({"sessions.list", "status"})
+_AGENT_READS = frozenset({"agents.list", "agents.files.list", "config.get", "status"})
+_CONFIG_READS = frozenset({"config.get", "agents.list", "models.list", "status", "health"})
+
+# Mutating methods and the cached reads they make stale.
+INVALIDATED_BY: dict[str, frozenset[str]] = {
+    "sessions.patch": _SESSION_READS,
+    "sessions.reset": _SESSION_READS,
+    "sessions.delete": _SESSION_READS,
+    "sessions.compact": _SESSION_READS,
+    "chat.send": _SESSION_READS,
+    "agents.create": _AGENT_READS | _SESSION_READS,
+    "agents.update": _AGENT_READS,
+    "agents.delete": _AGENT_READS | _SESSION_READS,
+    "agents.files.set": frozenset({"agents.files.list"}),
+    "agents.files.delete": frozenset({"agents.files.list"}),
+    "config.set": _CONFIG_READS,
+    "config.apply": _CONFIG_READS,
+    "config.patch": _CONFIG_READS,
+    "update.run": frozenset(CACHEABLE_METHOD_TTLS),
+}
+
+_CacheKey = tuple["GatewayConfig", str, str]
+
+
+def _params_key(params: dict[str, Any] | None) -> str:
+    if not params:
+        return ""
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _consume_exception(task: asyncio.Task[object]) -> None:
+    # Every waiter may have been cancelled; retrieve the error so it is not logged.
+    if not task.cancelled():
+        task.exception()
+
+
+@dataclass(frozen=True)
+class GatewayResponseCacheStats:
+    """Counters describing response cache effectiveness."""
+
+    size: int
+    hits: int
+    misses: int
+    coalesced: int
+    invalidations: int
+
+
+class GatewayResponseCache:
+    """TTL cache with request coalescing for read-only gateway RPC responses."""
+
+    def __init__(self, *, max_entries: int) -> None:
+        self._entries: TTLCache[_CacheKey, object] = TTLCache(
+            ttl_seconds=max(CACHEABLE_METHOD_TTLS.values()),
+            max_entries=max_entries,
+        )
+        self._in_flight: dict[_CacheKey, asyncio.Task[object]] = {}
+        # Bumped by invalidation so reads that raced a mutation are not stored.
+        self._generations: dict[tuple[GatewayConfig, str], int] = {}
+        self._coalesced = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def cacheable(method: str) -> bool:
+        """Return whether responses for `method` may be served from the cache."""
+        return method in CACHEABLE_METHOD_TTLS
+
+    async def get_or_fetch(
+        self,
+        method: str,
+        params: dict[str, Any] | None,
+        *,
+        config: GatewayConfig,
+        fetch: Callable[[], Awaitable[object]],
+    ) -> object:
+        """Return a cached response, join an identical in-flight call, or fetch."""
+        key: _CacheKey = (config, method, _params_key(params))
+        cached = self._entries.get(key)
+        if cached is not None:
+            return deepcopy(cached)
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not loop:
+            generation = self._generations.get((config, method), 0)
+            task = loop.create_task(self._fetch(key, fetch, generation))
+            task.add_done_callback(_consume_exception)
+            self._in_flight[key] = task
+        else:
+            self._coalesced += 1
+        # Shielded so a cancelled caller does not cancel the RPC other callers share.
+        payload = await asyncio.shield(task)
+        return deepcopy(payload)
+
+    async def _fetch(
+        self,
+        key: _CacheKey,
+        fetch: Callable[[], Awaitable[object]],
+        generation: int,
+    ) -> object:
+        config, method, _ = key
+        try:
+            payload = await fetch()
+        finally:
+            if self._in_flight.get(key) is asyncio.current_task():
+                del self._in_flight[key]
+        if self._generations.get((config, method), 0) == generation:
+            self._entries.set(key, payload, ttl_seconds=CACHEABLE_METHOD_TTLS[method])
+        return payload
+
+    def invalidate_after(self, method: str, *, config: GatewayConfig) -> int:
+        """Drop cached reads made stale by a completed call to `method`."""
+        methods = INVALIDATED_BY.get(method)
+        if not methods:
+            return 0
+        return self.invalidate(config, methods)
+
+    def invalidate(self, config: GatewayConfig, methods: Collection[str] | None = None) -> int:
+        """Drop cached and in-flight reads for a gateway; return entries removed."""
+        targets = CACHEABLE_METHOD_TTLS.keys() if methods is None else methods
+        for method in targets:
+            generation_key = (config, method)
+            self._generations[generation_key] = self._generations.get(generation_key, 0) + 1
+        for key in [key for key in self._in_flight if key[0] == config and key[1] in targets]:
+            del self._in_flight[key]
+        self._invalidations += 1
+        return self._entries.pop_where(lambda key, _: key[0] == config and key[1] in targets)
+
+    def clear(self) -> None:
+        """Drop every entry and reset counters."""
+        self._entries.clear()
+        self._in_flight.clear()
+        self._coalesced = 0
+        self._invalidations = 0
+
+    def stats(self) -> GatewayResponseCacheStats:
+        """Return current size and hit/miss/coalescing counters."""
+        entries = self._entries.stats()
+        return GatewayResponseCacheStats(
+            size=entries.size,
+            hits=entries.hits,
+            misses=entries.misses,
+            coalesced=self._coalesced,
+            invalidations=self._invalidations,
+        )
+
+
+gateway_response_cache = GatewayResponseCache(
+    max_entries=settings.gateway_rpc_cache_max_entries,
+)
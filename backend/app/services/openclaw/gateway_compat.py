@@ -13,6 +13,7 @@ from app.services.openclaw.gateway_rpc import (
     openclaw_call,
     openclaw_connect_metadata,
 )
+from app.services.openclaw.gateway_version_cache import gateway_version_cache
 
 _CALVER_PATTERN = re.compile(
     r"^v?(?P<year>\d{4})\.(?P<month>\d{1,2})\.(?P<day>\d{1,2})(?:-(?P<rev>\d+))?$",
@@ -155,14 +156,11 @@ def evaluate_gateway_version(
     )
 
 
-async def check_gateway_version_compatibility(
-    config: GatewayConfig,
-    *,
-    minimum_version: str | None = None,
-) -> GatewayVersionCheckResult:
-    """Evaluate gateway compatibility using connect metadata with config fallback."""
+async def _resolve_gateway_version(config: GatewayConfig) -> str | None:
+    """Read the runtime version over a fresh connection and cache it."""
     connect_payload = await openclaw_connect_metadata(config=config)
-    current_version = extract_connect_server_version(connect_payload)
+    connect_version = extract_connect_server_version(connect_payload)
+    current_version = connect_version
     if current_version is None or _parse_version_parts(current_version) is None:
         try:
             config_payload = await openclaw_call("config.get", config=config)
@@ -175,6 +173,36 @@ async def check_gateway_version_compatibility(
             fallback_version = extract_config_last_touched_version(config_payload)
             if fallback_version is not None:
                 current_version = fallback_version
+    gateway_version_cache.remember(
+        config,
+        connect_version=connect_version,
+        current_version=current_version,
+    )
+    return current_version
+
+
+async def check_gateway_version_compatibility(
+    config: GatewayConfig,
+    *,
+    minimum_version: str | None = None,
+) -> GatewayVersionCheckResult:
+    """Evaluate gateway compatibility using connect metadata with config fallback.
+
+    Versions come from `gateway_version_cache` when it has a usable entry, which is
+    refreshed in the background once past half its TTL.
+    """
+    cached = gateway_version_cache.get(config)
+    if cached is not None and (
+        cached.resolved or _parse_version_parts(cached.current_version or "") is not None
+    ):
+        if gateway_version_cache.needs_refresh(cached):
+            gateway_version_cache.refresh_in_background(
+                config,
+                lambda: _resolve_gateway_version(config),
+            )
+        current_version = cached.current_version
+    else:
+        current_version = await _resolve_gateway_version(config)
     return evaluate_gateway_version(
         current_version=current_version,
         minimum_version=minimum_version,
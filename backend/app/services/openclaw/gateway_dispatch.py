@@ -18,7 +18,10 @@ from app.services.openclaw.gateway_resolver import (
     require_gateway_for_board,
 )
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
-from app.services.openclaw.gateway_rpc import OpenClawGatewayError, ensure_session, send_message
+from app.services.openclaw.gateway_rpc import (
+    OpenClawGatewayError,
+    ensure_session_and_send_message,
+)
 
 
 class GatewayDispatchService(OpenClawDBService):
@@ -47,8 +50,13 @@ class GatewayDispatchService(OpenClawDBService):
         message: str,
         deliver: bool = False,
     ) -> None:
-        await ensure_session(session_key, config=config, label=agent_name)
-        await send_message(message, session_key=session_key, config=config, deliver=deliver)
+        await ensure_session_and_send_message(
+            message,
+            session_key=session_key,
+            config=config,
+            label=agent_name,
+            deliver=deliver,
+        )
 
     async def try_send_agent_message(
         self,
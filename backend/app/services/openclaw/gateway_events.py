@@ -0,0 +1,380 @@
+"""Background subscriber for OpenClaw gateway push events.
+
+Each gateway with `event_subscription_enabled` gets one dedicated connection that
+consumes `presence`, `heartbeat`, `agent`, `chat`, `health` and `tick` events.
+Agent-scoped events are reduced to "session seen at" signals and applied in
+batches: liveness goes through the agent presence write-behind buffer (one batched
+UPDATE for many agents) and heartbeat events are recorded in the activity stream.
+
+Every backend worker runs its own subscriber. Presence updates only move
+`last_seen_at` forward, and heartbeat activity rows get a deterministic id per
+(agent, `gateway_events_heartbeat_activity_seconds` interval) and are inserted
+with ON CONFLICT DO NOTHING, so several workers seeing the same heartbeat still
+record it once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from time import monotonic
+from typing import TYPE_CHECKING
+from uuid import uuid5
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col
+from websockets.exceptions import WebSocketException
+
+from app.core.agent_presence import agent_presence_buffer
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.gateways import Gateway
+from app.services.openclaw.constants import _SECURE_RANDOM
+from app.services.openclaw.gateway_resolver import optional_gateway_client_config
+from app.services.openclaw.gateway_rpc import (
+    GatewayConfig,
+    GatewayConnection,
+    OpenClawGatewayError,
+    open_gateway_connection,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+    from uuid import UUID
+
+    from sqlalchemy.sql.dml import Insert
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+SUBSCRIBED_EVENTS = frozenset({"presence", "heartbeat", "agent", "chat", "health", "tick"})
+_AGENT_SIGNAL_EVENTS = frozenset({"presence", "heartbeat", "agent", "chat"})
+_NESTED_ENTRY_KEYS = ("presence", "entries", "sessions")
+_BASE_BACKOFF_SECONDS = 1.0
+_BACKOFF_JITTER = 0.2
+_CONNECT_ERRORS = (OpenClawGatewayError, OSError, TimeoutError, ValueError, WebSocketException)
+
+
+def event_session_keys(payload: object) -> list[str]:
+    """Return the agent session keys referenced by an event payload."""
+    entries: list[object]
+    if isinstance(payload, list):
+        entries = payload
+    elif isinstance(payload, dict):
+        nested = next(
+            (payload[key] for key in _NESTED_ENTRY_KEYS if isinstance(payload.get(key), list)),
+            None,
+        )
+        entries = nested if nested is not None else [payload]
+    else:
+        return []
+    keys: list[str] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        key = entry.get("sessionKey") or entry.get("session_key")
+        if isinstance(key, str) and key.strip():
+            keys.append(key.strip())
+    return keys
+
+
+@dataclass
+class _SessionSignal:
+    seen_at: datetime
+    heartbeat: bool = False
+
+
+def heartbeat_activity_id(agent_id: UUID, seen_at: datetime, interval_seconds: float) -> UUID:
+    """Return the activity event id shared by an agent's heartbeats in one interval."""
+    bucket = int(seen_at.replace(tzinfo=UTC).timestamp() // interval_seconds)
+    return uuid5(agent_id, f"agent.heartbeat:{bucket}")
+
+
+def _insert_ignoring_duplicates(session: AsyncSession) -> Insert:
+    table = ActivityEvent.__table__  # type: ignore[attr-defined]
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing(index_elements=[table.c.id])
+    return postgresql.insert(table).on_conflict_do_nothing(index_elements=[table.c.id])
+
+
+class GatewayEventBatch:
+    """Per-gateway session signals waiting to be applied in one transaction."""
+
+    def __init__(self) -> None:
+        self._pending: dict[UUID, dict[str, _SessionSignal]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(signals) for signals in self._pending.values())
+
+    def _merge(self, gateway_id: UUID, key: str, seen_at: datetime, *, heartbeat: bool) -> None:
+        signals = self._pending.setdefault(gateway_id, {})
+        signal = signals.get(key)
+        if signal is None:
+            signal = signals[key] = _SessionSignal(seen_at=seen_at)
+        elif seen_at > signal.seen_at:
+            signal.seen_at = seen_at
+        signal.heartbeat = signal.heartbeat or heartbeat
+
+    def record(self, gateway_id: UUID, event: str, payload: object, seen_at: datetime) -> None:
+        """Fold one gateway event into the pending batch."""
+        if event not in _AGENT_SIGNAL_EVENTS:
+            return
+        for key in event_session_keys(payload):
+            self._merge(gateway_id, key, seen_at, heartbeat=event == "heartbeat")
+
+    async def apply(self, session: AsyncSession) -> int:
+        """Resolve pending session keys to agents and apply them; return agents touched."""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        interval_seconds = settings.gateway_events_heartbeat_activity_seconds
+        touched = 0
+        heartbeats: list[dict[str, Any]] = []
+        try:
+            for gateway_id, signals in pending.items():
+                agents = (
+                    await Agent.objects.filter_by(gateway_id=gateway_id)
+                    .filter(col(Agent.openclaw_session_id).in_(list(signals)))
+                    .all(session)
+                )
+                for agent in agents:
+                    signal = signals.get(agent.openclaw_session_id or "")
+                    if signal is None:
+                        continue
+                    agent_presence_buffer.record(agent.id, signal.seen_at)
+                    if signal.heartbeat:
+                        heartbeats.append(
+                            {
+                                "id": heartbeat_activity_id(
+                                    agent.id,
+                                    signal.seen_at,
+                                    interval_seconds,
+                                ),
+                                "event_type": "agent.heartbeat",
+                                "message": (
+                                    f"Heartbeat received from {agent.name} (gateway event)."
+                                ),
+                                "agent_id": agent.id,
+                                "task_id": None,
+                                "created_at": signal.seen_at,
+                            },
+                        )
+                    touched += 1
+            if heartbeats:
+                await session.exec(_insert_ignoring_duplicates(session), params=heartbeats)
+            await session.commit()
+        except SQLAlchemyError:
+            await session.rollback()
+            # Re-buffer so the next apply retries; newer signals win.
+            for gateway_id, signals in pending.items():
+                for key, signal in signals.items():
+                    self._merge(gateway_id, key, signal.seen_at, heartbeat=signal.heartbeat)
+            raise
+        logger.debug("gateway.events.applied agents=%s", touched)
+        return touched
+
+
+@dataclass(frozen=True)
+class GatewaySubscriptionStats:
+    """Point-in-time state of one gateway event subscription."""
+
+    gateway_id: UUID
+    connected: bool
+    events: int
+    reconnects: int
+    last_event_at: datetime | None
+    last_error: str | None
+
+
+class GatewayEventSubscriber:
+    """Hold one event connection to a gateway, reconnecting with jittered backoff."""
+
+    def __init__(
+        self,
+        gateway_id: UUID,
+        config: GatewayConfig,
+        *,
+        sink: Callable[[UUID, str, object, datetime], None],
+        max_backoff_seconds: float,
+    ) -> None:
+        self.gateway_id = gateway_id
+        self.config = config
+        self._sink = sink
+        self._max_backoff_seconds = max_backoff_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._connected = False
+        self._events = 0
+        self._reconnects = 0
+        self._last_event_at: datetime | None = None
+        self._last_error: str | None = None
+
+    def _on_event(self, event: str, payload: object) -> None:
+        if event not in SUBSCRIBED_EVENTS:
+            return
+        now = utcnow()
+        self._events += 1
+        self._last_event_at = now
+        self._sink(self.gateway_id, event, payload, now)
+
+    async def _run(self) -> None:
+        delay = _BASE_BACKOFF_SECONDS
+        while True:
+            connection: GatewayConnection | None = None
+            try:
+                connection = await open_gateway_connection(self.config, on_event=self._on_event)
+                self._connected = True
+                self._last_error = None
+                delay = _BASE_BACKOFF_SECONDS
+                logger.info("gateway.events.connected gateway_id=%s", self.gateway_id)
+                await connection.wait_closed()
+            except _CONNECT_ERRORS as exc:
+                self._last_error = str(exc) or exc.__class__.__name__
+                logger.warning(
+                    "gateway.events.connect_failed gateway_id=%s error_type=%s retry_s=%.1f",
+                    self.gateway_id,
+                    exc.__class__.__name__,
+                    delay,
+                )
+            finally:
+                self._connected = False
+                if connection is not None:
+                    await connection.close()
+            self._reconnects += 1
+            await asyncio.sleep(
+                delay * (1.0 + _SECURE_RANDOM.uniform(-_BACKOFF_JITTER, _BACKOFF_JITTER)),
+            )
+            delay = min(delay * 2.0, self._max_backoff_seconds)
+
+    def start(self) -> None:
+        """Start the subscription task on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def failure(self) -> BaseException | None:
+        """Return the exception the subscription task died with, if it died."""
+        if self._task is None or not self._task.done() or self._task.cancelled():
+            return None
+        return self._task.exception()
+
+    async def stop(self) -> None:
+        """Cancel the subscription and close its connection."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def stats(self) -> GatewaySubscriptionStats:
+        """Return connection state and counters."""
+        return GatewaySubscriptionStats(
+            gateway_id=self.gateway_id,
+            connected=self._connected,
+            events=self._events,
+            reconnects=self._reconnects,
+            last_event_at=self._last_event_at,
+            last_error=self._last_error,
+        )
+
+
+class GatewayEventService:
+    """Keep one subscriber per enabled gateway and apply their events in batches."""
+
+    def __init__(
+        self,
+        *,
+        refresh_seconds: float,
+        flush_seconds: float,
+        max_backoff_seconds: float,
+    ) -> None:
+        self.refresh_seconds = refresh_seconds
+        self.flush_seconds = flush_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.batch = GatewayEventBatch()
+        self._subscribers: dict[UUID, GatewayEventSubscriber] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def reconcile(self, session: AsyncSession) -> None:
+        """Start, restart or stop subscribers to match the enabled gateway rows."""
+        gateways = await Gateway.objects.filter_by(event_subscription_enabled=True).all(session)
+        desired: dict[UUID, GatewayConfig] = {}
+        for gateway in gateways:
+            config = optional_gateway_client_config(gateway)
+            if config is not None:
+                desired[gateway.id] = config
+        for gateway_id, subscriber in list(self._subscribers.items()):
+            if desired.get(gateway_id) != subscriber.config:
+                await subscriber.stop()
+                del self._subscribers[gateway_id]
+        for gateway_id, config in desired.items():
+            existing = self._subscribers.get(gateway_id)
+            if existing is not None:
+                failure = existing.failure()
+                if failure is not None:
+                    logger.error(
+                        "gateway.events.subscriber_died gateway_id=%s",
+                        gateway_id,
+                        exc_info=failure,
+                    )
+                    existing.start()
+                continue
+            subscriber = GatewayEventSubscriber(
+                gateway_id,
+                config,
+                sink=self.batch.record,
+                max_backoff_seconds=self.max_backoff_seconds,
+            )
+            subscriber.start()
+            self._subscribers[gateway_id] = subscriber
+
+    async def _run(self, session_factory: Callable[[], AsyncSession]) -> None:
+        next_refresh = 0.0
+        while True:
+            try:
+                async with session_factory() as session:
+                    if monotonic() >= next_refresh:
+                        await self.reconcile(session)
+                        next_refresh = monotonic() + self.refresh_seconds
+                    await self.batch.apply(session)
+            except SQLAlchemyError:
+                logger.exception("gateway.events.apply_failed pending=%s", len(self.batch))
+            await asyncio.sleep(self.flush_seconds)
+
+    def start(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """Start reconciling subscribers and applying events on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(session_factory))
+
+    async def stop(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """Stop every subscriber and apply whatever events are still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        subscribers, self._subscribers = self._subscribers, {}
+        for subscriber in subscribers.values():
+            await subscriber.stop()
+        try:
+            async with session_factory() as session:
+                await self.batch.apply(session)
+        except SQLAlchemyError:
+            logger.exception("gateway.events.final_apply_failed pending=%s", len(self.batch))
+
+    def stats(self) -> list[GatewaySubscriptionStats]:
+        """Return per-gateway subscription state."""
+        return [subscriber.stats() for subscriber in self._subscribers.values()]
+
+
+gateway_event_service = GatewayEventService(
+    refresh_seconds=settings.gateway_events_refresh_seconds,
+    flush_seconds=settings.gateway_events_flush_seconds,
+    max_backoff_seconds=settings.gateway_events_max_backoff_seconds,
+)
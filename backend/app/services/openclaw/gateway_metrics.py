@@ -0,0 +1,286 @@
+"""In-process latency and error metrics for gateway RPC traffic.
+
+Request latency is recorded per (gateway, method) at the wire: from the request
+frame being written until its response frame arrives, excluding connection setup
+and pool queueing. Connection setup (socket, TLS and the `connect` handshake) is
+recorded separately per gateway, so pooled and one-shot connections can be
+compared when tuning timeouts and pool sizes.
+
+Requests also count the bytes of their request and response frames before
+websocket compression, so per-method payload volume (template syncs, chat
+history) is visible next to latency.
+
+Gateways are labelled by URL without query string, so tokens never appear in
+snapshots or the text exposition.
+"""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from typing import Literal
+from urllib.parse import urlparse, urlunparse
+
+from app.core.config import settings
+
+RequestOutcome = Literal["ok", "gateway_error", "transport_error"]
+
+HANDSHAKE_METHOD = "connect"
+# Upper bucket bounds in seconds; the implicit last bucket is +Inf.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def gateway_metrics_label(gateway_url: str) -> str:
+    """Return the metrics label for a gateway URL (query string and fragment removed)."""
+    parsed = urlparse(gateway_url.strip())
+    return str(urlunparse(parsed._replace(query="", fragment="")))
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count and sum."""
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency sample."""
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+
+    def cumulative(self) -> list[int]:
+        """Return cumulative counts per bucket, ending with the +Inf bucket."""
+        running = 0
+        cumulative: list[int] = []
+        for count in self.counts:
+            running += count
+            cumulative.append(running)
+        return cumulative
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the `q` quantile in seconds by interpolating within its bucket."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        lower = 0.0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.bounds):
+                    # Samples above the largest bound; report that bound.
+                    return self.bounds[-1]
+                upper = self.bounds[index]
+                return lower + (upper - lower) * max(rank - seen, 0) / count
+            seen += count
+            if index < len(self.bounds):
+                lower = self.bounds[index]
+        return self.bounds[-1]
+
+
+@dataclass
+class _SeriesMetrics:
+    histogram: LatencyHistogram
+    gateway_errors: int = 0
+    transport_errors: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+@dataclass(frozen=True)
+class GatewayMetricsSeries:
+    """Point-in-time metrics for one gateway method, or one gateway's handshakes."""
+
+    gateway_url: str
+    method: str
+    count: int
+    gateway_errors: int
+    transport_errors: int
+    total_seconds: float
+    p50_seconds: float | None
+    p95_seconds: float | None
+    p99_seconds: float | None
+    bucket_bounds: tuple[float, ...]
+    bucket_counts: tuple[int, ...]
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    @property
+    def errors(self) -> int:
+        """Return gateway and transport errors combined."""
+        return self.gateway_errors + self.transport_errors
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+
+
+class GatewayMetricsRegistry:
+    """Request and handshake metrics keyed by gateway URL and method."""
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._requests: dict[tuple[str, str], _SeriesMetrics] = {}
+        self._handshakes: dict[str, _SeriesMetrics] = {}
+
+    def observe_request(
+        self,
+        gateway_url: str,
+        method: str,
+        seconds: float,
+        *,
+        outcome: RequestOutcome = "ok",
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """Record one request's wire latency, outcome and frame sizes."""
+        if not self.enabled:
+            return
+        series = self._requests.get((gateway_url, method))
+        if series is None:
+            series = _SeriesMetrics(LatencyHistogram())
+            self._requests[(gateway_url, method)] = series
+        self._record(series, seconds, outcome)
+        series.bytes_sent += bytes_sent
+        series.bytes_received += bytes_received
+
+    def observe_handshake(
+        self,
+        gateway_url: str,
+        seconds: float,
+        *,
+        outcome: RequestOutcome = "ok",
+    ) -> None:
+        """Record one connection setup (socket, TLS and `connect` handshake)."""
+        if not self.enabled:
+            return
+        series = self._handshakes.get(gateway_url)
+        if series is None:
+            series = _SeriesMetrics(LatencyHistogram())
+            self._handshakes[gateway_url] = series
+        self._record(series, seconds, outcome)
+
+    @staticmethod
+    def _record(series: _SeriesMetrics, seconds: float, outcome: RequestOutcome) -> None:
+        series.histogram.observe(seconds)
+        if outcome == "gateway_error":
+            series.gateway_errors += 1
+        elif outcome == "transport_error":
+            series.transport_errors += 1
+
+    @staticmethod
+    def _series(gateway_url: str, method: str, series: _SeriesMetrics) -> GatewayMetricsSeries:
+        histogram = series.histogram
+        return GatewayMetricsSeries(
+            gateway_url=gateway_url,
+            method=method,
+            count=histogram.count,
+            gateway_errors=series.gateway_errors,
+            transport_errors=series.transport_errors,
+            total_seconds=histogram.total_seconds,
+            p50_seconds=histogram.quantile(0.5),
+            p95_seconds=histogram.quantile(0.95),
+            p99_seconds=histogram.quantile(0.99),
+            bucket_bounds=histogram.bounds,
+            bucket_counts=tuple(histogram.cumulative()),
+            bytes_sent=series.bytes_sent,
+            bytes_received=series.bytes_received,
+        )
+
+    def requests(self) -> list[GatewayMetricsSeries]:
+        """Return request metrics sorted by gateway and method."""
+        return [
+            self._series(gateway_url, method, series)
+            for (gateway_url, method), series in sorted(
+                self._requests.items(), key=lambda item: item[0]
+            )
+        ]
+
+    def handshakes(self) -> list[GatewayMetricsSeries]:
+        """Return connection setup metrics sorted by gateway."""
+        return [
+            self._series(gateway_url, HANDSHAKE_METHOD, series)
+            for gateway_url, series in sorted(self._handshakes.items(), key=lambda item: item[0])
+        ]
+
+    def render_text(self, gateway_urls: set[str] | None = None) -> str:
+        """Render metrics in the Prometheus text exposition format.
+
+        `gateway_urls` restricts the output to those gateways when given.
+        """
+        lines: list[str] = []
+        sections = (
+            (
+                "openclaw_gateway_request",
+                "Gateway RPC latency from request frame to response, excluding connection setup.",
+                "Failed gateway RPC requests by error kind.",
+                self.requests(),
+            ),
+            (
+                "openclaw_gateway_handshake",
+                "Gateway connection setup latency (socket, TLS and connect handshake).",
+                "Failed gateway connection setups by error kind.",
+                self.handshakes(),
+            ),
+        )
+        for prefix, help_text, errors_help, rows in sections:
+            visible = [
+                row for row in rows if gateway_urls is None or row.gateway_url in gateway_urls
+            ]
+            lines.append(f"# HELP {prefix}_seconds {help_text}")
+            lines.append(f"# TYPE {prefix}_seconds histogram")
+            for row in visible:
+                labels = _labels(gateway=row.gateway_url, method=row.method)
+                bounds = [f"{bound:g}" for bound in row.bucket_bounds] + ["+Inf"]
+                for bound, count in zip(bounds, row.bucket_counts, strict=True):
+                    lines.append(f'{prefix}_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{prefix}_seconds_sum{{{labels}}} {row.total_seconds:.6f}")
+                lines.append(f"{prefix}_seconds_count{{{labels}}} {row.count}")
+            lines.append(f"# HELP {prefix}_errors_total {errors_help}")
+            lines.append(f"# TYPE {prefix}_errors_total counter")
+            for row in visible:
+                for kind, value in (
+                    ("gateway", row.gateway_errors),
+                    ("transport", row.transport_errors),
+                ):
+                    labels = _labels(gateway=row.gateway_url, method=row.method, kind=kind)
+                    lines.append(f"{prefix}_errors_total{{{labels}}} {value}")
+        lines.append(
+            "# HELP openclaw_gateway_request_bytes_total "
+            "Gateway RPC frame bytes before compression, by direction.",
+        )
+        lines.append("# TYPE openclaw_gateway_request_bytes_total counter")
+        for row in self.requests():
+            if gateway_urls is not None and row.gateway_url not in gateway_urls:
+                continue
+            for direction, value in (("sent", row.bytes_sent), ("received", row.bytes_received)):
+                labels = _labels(gateway=row.gateway_url, method=row.method, direction=direction)
+                lines.append(f"openclaw_gateway_request_bytes_total{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Drop every recorded series."""
+        self._requests.clear()
+        self._handshakes.clear()
+
+
+gateway_metrics = GatewayMetricsRegistry(enabled=settings.gateway_metrics_enabled)
@@ -37,6 +37,7 @@ def gateway_client_config(gateway: Gateway) -> GatewayClientConfig:
         token=token,
         allow_insecure_tls=gateway.allow_insecure_tls,
         disable_device_pairing=gateway.disable_device_pairing,
+        disable_compression=gateway.disable_compression,
     )
 
 
@@ -53,6 +54,7 @@ def optional_gateway_client_config(gateway: Gateway | None) -> GatewayClientConf
         token=token,
         allow_insecure_tls=gateway.allow_insecure_tls,
         disable_device_pairing=gateway.disable_device_pairing,
+        disable_compression=gateway.disable_compression,
     )
 
 
@@ -3,6 +3,10 @@
 This is the low-level, DB-free interface for talking to the OpenClaw gateway.
 Keep gateway RPC protocol details and client helpers here so OpenClaw services
 operate within a single scope (no `app.integrations.*` plumbing).
+
+RPC calls go through `gateway_connection_pool`, which keeps a few long-lived,
+already-handshaken connections per `GatewayConfig` and multiplexes concurrent
+requests over them by request id.
 """
 
 from __future__ import annotations
@@ -10,22 +14,37 @@ from __future__ import annotations
 import asyncio
 import json
 import ssl
-from dataclasses import dataclass
-from time import perf_counter, time
-from typing import Any, Literal
+from contextlib import asynccontextmanager, contextmanager, suppress
+from dataclasses import dataclass, field
+from functools import partial
+from time import monotonic, perf_counter, time
+from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import urlencode, urlparse, urlunparse
 from uuid import uuid4
 
 import websockets
 from websockets.exceptions import WebSocketException
 
+from app.core.config import settings
 from app.core.logging import TRACE_LEVEL, get_logger
+from app.services.openclaw.chat_history_cache import chat_history_cache
+from app.services.openclaw.circuit_breaker import gateway_circuit_breakers
 from app.services.openclaw.device_identity import (
     build_device_auth_payload,
-    load_or_create_device_identity,
-    public_key_raw_base64url_from_pem,
-    sign_device_payload,
+    device_identity_holder,
 )
+from app.services.openclaw.gateway_cache import gateway_response_cache
+from app.services.openclaw.gateway_metrics import gateway_metrics, gateway_metrics_label
+from app.services.openclaw.gateway_version_cache import gateway_version_cache
+from app.services.openclaw.session_registry import is_missing_session_error, known_sessions
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+
+    from app.services.openclaw.circuit_breaker import GatewayCircuitBreaker
+    from app.services.openclaw.gateway_metrics import RequestOutcome
+
+    GatewayEventHandler = Callable[[str, object], None]
 
 PROTOCOL_VERSION = 3
 logger = get_logger(__name__)
@@ -166,6 +185,27 @@ class OpenClawGatewayError(RuntimeError):
     """Raised when OpenClaw gateway calls fail."""
 
 
+_TRANSPORT_ERRORS = (
+    TimeoutError,
+    ConnectionError,
+    OSError,
+    ValueError,
+    WebSocketException,
+)
+
+
+class GatewayCircuitOpenError(OpenClawGatewayError):
+    """Raised without contacting a gateway whose circuit breaker is open."""
+
+
+@dataclass(frozen=True)
+class GatewayCall:
+    """One RPC request within an `openclaw_batch`."""
+
+    method: str
+    params: dict[str, Any] | None = None
+
+
 @dataclass(frozen=True)
 class GatewayConfig:
     """Connection configuration for the OpenClaw gateway."""
@@ -174,6 +214,19 @@ class GatewayConfig:
     token: str | None = None
     allow_insecure_tls: bool = False
     disable_device_pairing: bool = False
+    disable_compression: bool = False
+
+
+@dataclass
+class _CallTraffic:
+    """Frame sizes in bytes, before compression, for one request and its response."""
+
+    sent: int = 0
+    received: int = 0
+
+
+def _frame_size(frame: str | bytes) -> int:
+    return len(frame) if isinstance(frame, bytes) else len(frame.encode("utf-8"))
 
 
 def _build_gateway_url(config: GatewayConfig) -> str:
@@ -194,6 +247,52 @@ def _redacted_url_for_log(raw_url: str) -> str:
     return str(urlunparse(parsed._replace(query="", fragment="")))
 
 
+def _request_outcome(outcome: object) -> RequestOutcome:
+    if isinstance(outcome, OpenClawGatewayError):
+        return "gateway_error"
+    if isinstance(outcome, BaseException):
+        return "transport_error"
+    return "ok"
+
+
+def _observe_requests(
+    gateway_url: str,
+    calls: Sequence[GatewayCall],
+    outcomes: Sequence[object],
+    started_at: float,
+    traffic: Sequence[_CallTraffic] = (),
+) -> None:
+    elapsed = perf_counter() - started_at
+    metrics_url = gateway_metrics_label(gateway_url)
+    for index, (call, outcome) in enumerate(zip(calls, outcomes, strict=False)):
+        sizes = traffic[index] if index < len(traffic) else _CallTraffic()
+        gateway_metrics.observe_request(
+            metrics_url,
+            call.method,
+            elapsed,
+            outcome=_request_outcome(outcome),
+            bytes_sent=sizes.sent,
+            bytes_received=sizes.received,
+        )
+
+
+@contextmanager
+def _timed_handshake(gateway_url: str) -> Iterator[None]:
+    """Record connection setup time for the gateway; exceptions count as failures."""
+    metrics_url = gateway_metrics_label(gateway_url)
+    started_at = perf_counter()
+    try:
+        yield
+    except Exception as exc:
+        gateway_metrics.observe_handshake(
+            metrics_url,
+            perf_counter() - started_at,
+            outcome=_request_outcome(exc),
+        )
+        raise
+    gateway_metrics.observe_handshake(metrics_url, perf_counter() - started_at)
+
+
 def _create_ssl_context(config: GatewayConfig) -> ssl.SSLContext | None:
     """Create an insecure SSL context override for explicit opt-in TLS bypass.
 
@@ -243,7 +342,7 @@ def _build_device_connect_payload(
     auth_token: str | None,
     connect_nonce: str | None,
 ) -> dict[str, Any]:
-    identity = load_or_create_device_identity()
+    identity = device_identity_holder.get()
     signed_at_ms = int(time() * 1000)
     payload = build_device_auth_payload(
         device_id=identity.device_id,
@@ -257,8 +356,8 @@ def _build_device_connect_payload(
     )
     device_payload: dict[str, Any] = {
         "id": identity.device_id,
-        "publicKey": public_key_raw_base64url_from_pem(identity.public_key_pem),
-        "signature": sign_device_payload(identity.private_key_pem, payload),
+        "publicKey": identity.public_key_raw_base64url,
+        "signature": identity.sign(payload),
         "signedAt": signed_at_ms,
     }
     if connect_nonce:
@@ -266,6 +365,26 @@ def _build_device_connect_payload(
     return device_payload
 
 
+_NOT_A_RESPONSE = object()
+
+
+def _parse_response(data: dict[str, Any], request_id: str) -> object:
+    """Return the result of a frame answering `request_id`, or `_NOT_A_RESPONSE`."""
+    if data.get("type") == "res" and data.get("id") == request_id:
+        ok = data.get("ok")
+        if ok is not None and not ok:
+            error = data.get("error", {}).get("message", "Gateway error")
+            raise OpenClawGatewayError(error)
+        return data.get("payload")
+
+    if data.get("id") == request_id:
+        if data.get("error"):
+            message = data["error"].get("message", "Gateway error")
+            raise OpenClawGatewayError(message)
+        return data.get("result")
+    return _NOT_A_RESPONSE
+
+
 async def _await_response(
     ws: websockets.ClientConnection,
     request_id: str,
@@ -279,26 +398,12 @@ async def _await_response(
             request_id,
             data.get("type"),
         )
+        result = _parse_response(data, request_id)
+        if result is not _NOT_A_RESPONSE:
+            return result
 
-        if data.get("type") == "res" and data.get("id") == request_id:
-            ok = data.get("ok")
-            if ok is not None and not ok:
-                error = data.get("error", {}).get("message", "Gateway error")
-                raise OpenClawGatewayError(error)
-            return data.get("payload")
-
-        if data.get("id") == request_id:
-            if data.get("error"):
-                message = data["error"].get("message", "Gateway error")
-                raise OpenClawGatewayError(message)
-            return data.get("result")
 
-
-async def _send_request(
-    ws: websockets.ClientConnection,
-    method: str,
-    params: dict[str, Any] | None,
-) -> object:
+def _request_frame(method: str, params: dict[str, Any] | None) -> tuple[str, str]:
     request_id = str(uuid4())
     message = {
         "type": "req",
@@ -313,8 +418,40 @@ async def _send_request(
         request_id,
         sorted((params or {}).keys()),
     )
-    await ws.send(json.dumps(message))
-    return await _await_response(ws, request_id)
+    return request_id, json.dumps(message)
+
+
+async def _send_requests(
+    ws: websockets.ClientConnection,
+    calls: Sequence[GatewayCall],
+    traffic: list[_CallTraffic] | None = None,
+) -> list[object]:
+    """Pipeline `calls` and return each result or gateway error in call order.
+
+    Frame sizes per call are appended to `traffic` when given.
+    """
+    request_ids: list[str] = []
+    sizes: dict[str, _CallTraffic] = {}
+    for call in calls:
+        request_id, frame = _request_frame(call.method, call.params)
+        await ws.send(frame)
+        request_ids.append(request_id)
+        sizes[request_id] = _CallTraffic(sent=_frame_size(frame))
+    if traffic is not None:
+        traffic.extend(sizes[request_id] for request_id in request_ids)
+    outcomes: dict[str, object] = {}
+    while len(outcomes) < len(request_ids):
+        raw = await ws.recv()
+        data = json.loads(raw)
+        request_id = data.get("id")
+        if request_id not in request_ids or request_id in outcomes:
+            continue
+        sizes[request_id].received = _frame_size(raw)
+        try:
+            outcomes[request_id] = _parse_response(data, request_id)
+        except OpenClawGatewayError as exc:
+            outcomes[request_id] = exc
+    return [outcomes[request_id] for request_id in request_ids]
 
 
 def _build_connect_params(
@@ -382,7 +519,9 @@ async def _ensure_connected(
         "params": _build_connect_params(config, connect_nonce=connect_nonce),
     }
     await ws.send(json.dumps(response))
-    return await _await_response(ws, connect_id)
+    hello = await _await_response(ws, connect_id)
+    gateway_version_cache.record_hello(config, hello)
+    return hello
 
 
 async def _recv_first_message_or_none(
@@ -394,6 +533,476 @@ async def _recv_first_message_or_none(
         return None
 
 
+def _connect_kwargs(
+    config: GatewayConfig,
+    gateway_url: str,
+    *,
+    keepalive: bool = False,
+) -> dict[str, Any]:
+    origin = _build_control_ui_origin(gateway_url) if config.disable_device_pairing else None
+    connect_kwargs: dict[str, Any] = {
+        "ssl": _create_ssl_context(config),
+        # Negotiate permessage-deflate; workspace files and chat history are large,
+        # highly compressible text. Gateways can opt out (e.g. CPU-bound hosts).
+        "compression": (
+            "deflate"
+            if settings.gateway_compression_enabled and not config.disable_compression
+            else None
+        ),
+    }
+    if keepalive:
+        connect_kwargs["ping_interval"] = settings.gateway_keepalive_seconds
+        connect_kwargs["ping_timeout"] = settings.gateway_keepalive_seconds
+    else:
+        connect_kwargs["ping_interval"] = None
+    if origin is not None:
+        connect_kwargs["origin"] = origin
+    return connect_kwargs
+
+
+class _ConnectionUnavailableError(ConnectionError):
+    """Raised when a pooled connection closed before a request could be sent."""
+
+
+class GatewayConnection:
+    """Authenticated gateway websocket that multiplexes requests by request id.
+
+    A single reader task owns `recv()` and resolves the waiting future for each
+    response frame, so any number of requests can be in flight at once.
+    """
+
+    def __init__(
+        self,
+        ws: websockets.ClientConnection,
+        *,
+        hello: object,
+        gateway_url: str,
+        on_event: GatewayEventHandler | None = None,
+    ) -> None:
+        self._ws = ws
+        self.hello = hello
+        self._metrics_url = gateway_metrics_label(gateway_url)
+        self._on_event = on_event
+        self._pending: dict[str, asyncio.Future[object]] = {}
+        self._received_bytes: dict[str, int] = {}
+        self.last_used = monotonic()
+        self._reader = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def open(
+        cls,
+        config: GatewayConfig,
+        gateway_url: str,
+        *,
+        on_event: GatewayEventHandler | None = None,
+    ) -> GatewayConnection:
+        """Connect, complete the `connect` handshake and start demultiplexing.
+
+        `on_event` receives `(event, payload)` for every event frame pushed by the
+        gateway after the handshake.
+        """
+        with _timed_handshake(gateway_url):
+            ws = await websockets.connect(
+                gateway_url,
+                **_connect_kwargs(config, gateway_url, keepalive=True),
+            )
+            try:
+                first_message = await _recv_first_message_or_none(ws)
+                hello = await _ensure_connected(ws, first_message, config)
+            except BaseException:
+                await ws.close()
+                raise
+        return cls(ws, hello=hello, gateway_url=gateway_url, on_event=on_event)
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the reader stopped (the socket is unusable)."""
+        return self._reader.done()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests awaiting a response."""
+        return len(self._pending)
+
+    def idle_for(self, now: float) -> float:
+        """Return seconds since the last request, or 0 while requests are in flight."""
+        return 0.0 if self._pending else now - self.last_used
+
+    async def request(self, method: str, params: dict[str, Any] | None) -> object:
+        """Send one request and wait for its response frame."""
+        [outcome] = await self.request_many([GatewayCall(method, params)])
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    async def request_many(self, calls: Sequence[GatewayCall]) -> list[object]:
+        """Pipeline requests and return each result or exception in call order.
+
+        Every frame is written before any response is awaited, so the batch costs
+        one round trip rather than one per call.
+        """
+        if self.closed:
+            raise _ConnectionUnavailableError("Gateway connection closed")
+        loop = asyncio.get_running_loop()
+        request_ids: list[str] = []
+        sent: list[asyncio.Future[object]] = []
+        send_error: ConnectionError | None = None
+        self.last_used = monotonic()
+        try:
+            for call in calls:
+                request_id, frame = _request_frame(call.method, call.params)
+                future: asyncio.Future[object] = loop.create_future()
+                self._pending[request_id] = future
+                request_ids.append(request_id)
+                started_at = perf_counter()
+                try:
+                    await self._ws.send(frame)
+                except WebSocketException as exc:
+                    self._pending.pop(request_id, None)
+                    if not sent:
+                        raise _ConnectionUnavailableError(str(exc)) from exc
+                    send_error = ConnectionError(f"Gateway connection lost: {exc}")
+                    break
+                future.add_done_callback(
+                    partial(self._observe, call.method, started_at, request_id, _frame_size(frame)),
+                )
+                sent.append(future)
+            outcomes: list[object] = list(await asyncio.gather(*sent, return_exceptions=True))
+            if send_error is not None:
+                unsent = calls[len(sent) :]
+                _observe_requests(self._metrics_url, unsent, [send_error] * len(unsent), started_at)
+                outcomes.extend([send_error] * len(unsent))
+            return outcomes
+        finally:
+            for request_id in request_ids:
+                self._pending.pop(request_id, None)
+            self.last_used = monotonic()
+
+    def _observe(
+        self,
+        method: str,
+        started_at: float,
+        request_id: str,
+        bytes_sent: int,
+        future: asyncio.Future[object],
+    ) -> None:
+        bytes_received = self._received_bytes.pop(request_id, 0)
+        if future.cancelled():
+            return
+        gateway_metrics.observe_request(
+            self._metrics_url,
+            method,
+            perf_counter() - started_at,
+            outcome=_request_outcome(future.exception()),
+            bytes_sent=bytes_sent,
+            bytes_received=bytes_received,
+        )
+
+    def _dispatch(self, data: dict[str, Any], size: int) -> None:
+        if data.get("type") == "event" and self._on_event is not None:
+            event = data.get("event")
+            if isinstance(event, str):
+                try:
+                    self._on_event(event, data.get("payload"))
+                except Exception:
+                    logger.exception("gateway.rpc.event_handler_failed event=%s", event)
+            return
+        request_id = data.get("id")
+        future = self._pending.get(request_id) if isinstance(request_id, str) else None
+        if future is None or future.done():
+            logger.log(
+                TRACE_LEVEL,
+                "gateway.rpc.recv.unrouted type=%s event=%s",
+                data.get("type"),
+                data.get("event"),
+            )
+            return
+        try:
+            result = _parse_response(data, request_id)  # type: ignore[arg-type]
+        except OpenClawGatewayError as exc:
+            self._received_bytes[str(request_id)] = size
+            future.set_exception(exc)
+            return
+        if result is not _NOT_A_RESPONSE:
+            self._received_bytes[str(request_id)] = size
+            future.set_result(result)
+
+    async def _read_loop(self) -> None:
+        reason = "Gateway connection closed"
+        try:
+            async for raw in self._ws:
+                try:
+                    data = json.loads(raw)
+                except ValueError:
+                    logger.warning("gateway.rpc.recv.invalid_json")
+                    continue
+                if isinstance(data, dict):
+                    self._dispatch(data, _frame_size(raw))
+        except (WebSocketException, OSError) as exc:
+            reason = f"Gateway connection lost: {exc}"
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(reason))
+
+    async def wait_closed(self) -> None:
+        """Wait until the socket closes (for subscribers that only consume events)."""
+        await asyncio.shield(self._reader)
+
+    async def close(self) -> None:
+        """Close the socket and stop the reader."""
+        with suppress(WebSocketException, OSError):
+            await self._ws.close()
+        self._reader.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._reader
+
+
+@dataclass
+class _GatewaySlot:
+    loop: asyncio.AbstractEventLoop
+    semaphore: asyncio.Semaphore
+    lock: asyncio.Lock
+    connections: list[GatewayConnection] = field(default_factory=list)
+    # Calls currently using the slot; the idle sweep leaves busy slots alone.
+    active: int = 0
+
+
+async def _close_connections(connections: Sequence[GatewayConnection]) -> None:
+    for connection in connections:
+        await connection.close()
+
+
+class GatewayConnectionPool:
+    """Per-`GatewayConfig` pool of long-lived, authenticated gateway connections.
+
+    Requests go to the least-loaded live connection; a new connection (with a fresh
+    `connect` handshake) is opened only when every existing one is busy and the
+    pool is below `max_connections`. Dead connections are dropped and replaced on
+    demand, idle ones are closed, and at most `max_in_flight` requests per gateway
+    are outstanding at once. Idle connections are closed when their gateway is next
+    called, and by a periodic sweep (`start`) for gateways that are no longer called.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int,
+        max_in_flight: int,
+        idle_seconds: float,
+    ) -> None:
+        self.max_connections = max(1, max_connections)
+        self.max_in_flight = max(1, max_in_flight)
+        self.idle_seconds = idle_seconds
+        self._slots: dict[GatewayConfig, _GatewaySlot] = {}
+        self._sweeper: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def _discard(slot: _GatewaySlot) -> None:
+        """Close a slot's connections from outside the loop that owns them."""
+        # A stopped or closed loop can no longer run the close; its sockets go with it.
+        if slot.connections and slot.loop.is_running():
+            asyncio.run_coroutine_threadsafe(_close_connections(slot.connections), slot.loop)
+        slot.connections = []
+
+    def _slot(self, config: GatewayConfig) -> _GatewaySlot:
+        loop = asyncio.get_running_loop()
+        slot = self._slots.get(config)
+        # Connections are bound to the loop that opened them.
+        if slot is None or slot.loop is not loop:
+            if slot is not None:
+                self._discard(slot)
+            slot = _GatewaySlot(
+                loop=loop,
+                semaphore=asyncio.Semaphore(self.max_in_flight),
+                lock=asyncio.Lock(),
+            )
+            self._slots[config] = slot
+        return slot
+
+    async def _prune(self, slot: _GatewaySlot) -> None:
+        now = monotonic()
+        expired = [
+            connection
+            for connection in slot.connections
+            if not connection.closed and connection.idle_for(now) > self.idle_seconds
+        ]
+        # Detach before awaiting so connections opened meanwhile are kept.
+        slot.connections = [
+            connection
+            for connection in slot.connections
+            if not connection.closed and connection not in expired
+        ]
+        await _close_connections(expired)
+
+    async def sweep(self) -> int:
+        """Close idle connections of unused gateways and drop their empty slots.
+
+        Returns the number of slots dropped.
+        """
+        loop = asyncio.get_running_loop()
+        dropped = 0
+        for config, slot in list(self._slots.items()):
+            if slot.loop is not loop:
+                if slot.loop.is_closed():
+                    del self._slots[config]
+                    dropped += 1
+                continue
+            if slot.active:
+                continue
+            await self._prune(slot)
+            if not slot.connections and not slot.active and self._slots.get(config) is slot:
+                del self._slots[config]
+                dropped += 1
+        return dropped
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.idle_seconds)
+            dropped = await self.sweep()
+            if dropped:
+                logger.debug("gateway.rpc.pool.swept slots=%s", dropped)
+
+    def start(self) -> None:
+        """Start the periodic idle sweep on the running loop."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_loop())
+
+    @staticmethod
+    def _least_loaded(slot: _GatewaySlot) -> GatewayConnection | None:
+        return min(slot.connections, key=lambda conn: conn.in_flight, default=None)
+
+    async def _acquire(
+        self,
+        slot: _GatewaySlot,
+        config: GatewayConfig,
+        gateway_url: str,
+    ) -> GatewayConnection:
+        await self._prune(slot)
+        best = self._least_loaded(slot)
+        if best is not None and (
+            best.in_flight == 0 or len(slot.connections) >= self.max_connections
+        ):
+            return best
+        async with slot.lock:
+            await self._prune(slot)
+            best = self._least_loaded(slot)
+            if best is not None and (
+                best.in_flight == 0 or len(slot.connections) >= self.max_connections
+            ):
+                return best
+            started_at = perf_counter()
+            connection = await GatewayConnection.open(config, gateway_url)
+            logger.debug(
+                "gateway.rpc.pool.connected gateway_url=%s connections=%s duration_ms=%s",
+                _redacted_url_for_log(gateway_url),
+                len(slot.connections) + 1,
+                int((perf_counter() - started_at) * 1000),
+            )
+            slot.connections.append(connection)
+            return connection
+
+    async def call(
+        self,
+        method: str,
+        params: dict[str, Any] | None,
+        *,
+        config: GatewayConfig,
+        gateway_url: str,
+    ) -> object:
+        """Send one request over a pooled connection and return its result."""
+        [outcome] = await self.call_many(
+            [GatewayCall(method, params)],
+            config=config,
+            gateway_url=gateway_url,
+        )
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    async def call_many(
+        self,
+        calls: Sequence[GatewayCall],
+        *,
+        config: GatewayConfig,
+        gateway_url: str,
+    ) -> list[object]:
+        """Pipeline requests over one pooled connection; see `request_many`.
+
+        A batch counts as a single unit against the per-gateway in-flight limit.
+        """
+        slot = self._slot(config)
+        slot.active += 1
+        try:
+            async with slot.semaphore:
+                connection = await self._acquire(slot, config, gateway_url)
+                try:
+                    return await connection.request_many(calls)
+                except _ConnectionUnavailableError:
+                    # The pooled socket died while idle; nothing was sent, so retry
+                    # once on a freshly handshaken connection.
+                    logger.info(
+                        "gateway.rpc.pool.reconnect methods=%s gateway_url=%s",
+                        ",".join(call.method for call in calls),
+                        _redacted_url_for_log(gateway_url),
+                    )
+                    connection = await self._acquire(slot, config, gateway_url)
+                    return await connection.request_many(calls)
+        finally:
+            slot.active -= 1
+
+    async def close(self) -> None:
+        """Stop the idle sweep and close every pooled connection."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._sweeper
+            self._sweeper = None
+        loop = asyncio.get_running_loop()
+        slots, self._slots = self._slots, {}
+        for slot in slots.values():
+            if slot.loop is loop:
+                await _close_connections(slot.connections)
+            else:
+                self._discard(slot)
+
+
+gateway_connection_pool = GatewayConnectionPool(
+    max_connections=settings.gateway_pool_max_connections,
+    max_in_flight=settings.gateway_pool_max_in_flight,
+    idle_seconds=settings.gateway_pool_idle_seconds,
+)
+
+
+async def open_gateway_connection(
+    config: GatewayConfig,
+    *,
+    on_event: GatewayEventHandler | None = None,
+) -> GatewayConnection:
+    """Open a dedicated (unpooled) authenticated connection, e.g. for event streams."""
+    return await GatewayConnection.open(config, _build_gateway_url(config), on_event=on_event)
+
+
+@asynccontextmanager
+async def _one_shot_connection(
+    config: GatewayConfig,
+    gateway_url: str,
+) -> AsyncIterator[tuple[websockets.ClientConnection, object]]:
+    """Open an unpooled, handshaken connection that closes when the block exits."""
+    with _timed_handshake(gateway_url):
+        ws = await websockets.connect(gateway_url, **_connect_kwargs(config, gateway_url))
+        try:
+            first_message = await _recv_first_message_or_none(ws)
+            hello = await _ensure_connected(ws, first_message, config)
+        except BaseException:
+            await ws.close()
+            raise
+    try:
+        yield ws, hello
+    finally:
+        await ws.close()
+
+
 async def _openclaw_call_once(
     method: str,
     params: dict[str, Any] | None,
@@ -401,15 +1010,50 @@ async def _openclaw_call_once(
     config: GatewayConfig,
     gateway_url: str,
 ) -> object:
-    origin = _build_control_ui_origin(gateway_url) if config.disable_device_pairing else None
-    ssl_context = _create_ssl_context(config)
-    connect_kwargs: dict[str, Any] = {"ping_interval": None}
-    if origin is not None:
-        connect_kwargs["origin"] = origin
-    async with websockets.connect(gateway_url, ssl=ssl_context, **connect_kwargs) as ws:
-        first_message = await _recv_first_message_or_none(ws)
-        await _ensure_connected(ws, first_message, config)
-        return await _send_request(ws, method, params)
+    if settings.gateway_pool_enabled:
+        return await gateway_connection_pool.call(
+            method,
+            params,
+            config=config,
+            gateway_url=gateway_url,
+        )
+    calls = [GatewayCall(method, params)]
+    async with _one_shot_connection(config, gateway_url) as (ws, _):
+        started_at = perf_counter()
+        traffic: list[_CallTraffic] = []
+        try:
+            [payload] = await _send_requests(ws, calls, traffic)
+        except Exception as exc:
+            _observe_requests(gateway_url, calls, [exc], started_at, traffic)
+            raise
+        _observe_requests(gateway_url, calls, [payload], started_at, traffic)
+        if isinstance(payload, BaseException):
+            raise payload
+        return payload
+
+
+async def _openclaw_batch_once(
+    calls: Sequence[GatewayCall],
+    *,
+    config: GatewayConfig,
+    gateway_url: str,
+) -> list[object]:
+    if settings.gateway_pool_enabled:
+        return await gateway_connection_pool.call_many(
+            calls,
+            config=config,
+            gateway_url=gateway_url,
+        )
+    async with _one_shot_connection(config, gateway_url) as (ws, _):
+        started_at = perf_counter()
+        traffic: list[_CallTraffic] = []
+        try:
+            outcomes = await _send_requests(ws, calls, traffic)
+        except Exception as exc:
+            _observe_requests(gateway_url, calls, [exc] * len(calls), started_at, traffic)
+            raise
+        _observe_requests(gateway_url, calls, outcomes, started_at, traffic)
+        return outcomes
 
 
 async def _openclaw_connect_metadata_once(
@@ -417,14 +1061,22 @@ async def _openclaw_connect_metadata_once(
     config: GatewayConfig,
     gateway_url: str,
 ) -> object:
-    origin = _build_control_ui_origin(gateway_url) if config.disable_device_pairing else None
-    ssl_context = _create_ssl_context(config)
-    connect_kwargs: dict[str, Any] = {"ping_interval": None}
-    if origin is not None:
-        connect_kwargs["origin"] = origin
-    async with websockets.connect(gateway_url, ssl=ssl_context, **connect_kwargs) as ws:
-        first_message = await _recv_first_message_or_none(ws)
-        return await _ensure_connected(ws, first_message, config)
+    async with _one_shot_connection(config, gateway_url) as (_, hello):
+        return hello
+
+
+def _circuit_breaker(config: GatewayConfig) -> GatewayCircuitBreaker | None:
+    """Return the gateway's breaker, raising instead while its circuit is open."""
+    if not settings.gateway_circuit_enabled:
+        return None
+    breaker = gateway_circuit_breakers.get(config.url)
+    if not breaker.allow():
+        msg = (
+            f"Gateway circuit open; next attempt in {breaker.retry_in():.0f}s. "
+            f"Last error: {breaker.last_error}"
+        )
+        raise GatewayCircuitOpenError(msg)
+    return breaker
 
 
 async def openclaw_call(
@@ -432,8 +1084,39 @@ async def openclaw_call(
     params: dict[str, Any] | None = None,
     *,
     config: GatewayConfig,
+    use_cache: bool = True,
+) -> object:
+    """Call a gateway RPC method and return the result payload.
+
+    Read-only methods are served through `gateway_response_cache`; pass
+    `use_cache=False` for reads that must be fresh, e.g. a read-modify-write.
+    """
+    if (
+        use_cache
+        and settings.gateway_rpc_cache_enabled
+        and gateway_response_cache.cacheable(method)
+    ):
+        return await gateway_response_cache.get_or_fetch(
+            method,
+            params,
+            config=config,
+            fetch=lambda: _openclaw_call_uncached(method, params, config=config),
+        )
+    try:
+        return await _openclaw_call_uncached(method, params, config=config)
+    finally:
+        gateway_response_cache.invalidate_after(method, config=config)
+        known_sessions.forget_after(method, params, gateway_url=config.url)
+        chat_history_cache.mark_stale_after(method, params, config=config)
+
+
+async def _openclaw_call_uncached(
+    method: str,
+    params: dict[str, Any] | None,
+    *,
+    config: GatewayConfig,
 ) -> object:
-    """Call a gateway RPC method and return the result payload."""
+    breaker = _circuit_breaker(config)
     gateway_url = _build_gateway_url(config)
     started_at = perf_counter()
     logger.debug(
@@ -458,6 +1141,8 @@ async def openclaw_call(
             method,
             int((perf_counter() - started_at) * 1000),
         )
+        if breaker is not None:
+            breaker.record_success(perf_counter() - started_at)
         return payload
     except OpenClawGatewayError:
         logger.warning(
@@ -465,14 +1150,12 @@ async def openclaw_call(
             method,
             int((perf_counter() - started_at) * 1000),
         )
+        if breaker is not None:
+            breaker.record_success(perf_counter() - started_at)
         raise
-    except (
-        TimeoutError,
-        ConnectionError,
-        OSError,
-        ValueError,
-        WebSocketException,
-    ) as exc:  # pragma: no cover - network/protocol errors
+    except _TRANSPORT_ERRORS as exc:  # pragma: no cover - network/protocol errors
+        if breaker is not None:
+            breaker.record_failure(str(exc) or exc.__class__.__name__)
         logger.error(
             "gateway.rpc.call.transport_error method=%s duration_ms=%s error_type=%s",
             method,
@@ -482,8 +1165,93 @@ async def openclaw_call(
         raise OpenClawGatewayError(str(exc)) from exc
 
 
+async def openclaw_batch(
+    calls: Sequence[GatewayCall],
+    *,
+    config: GatewayConfig,
+    return_exceptions: bool = False,
+) -> list[object]:
+    """Pipeline several RPC calls over one authenticated connection.
+
+    All request frames are written in order before any response is awaited, and
+    results come back in call order. By default the first failed call (in call
+    order) is raised once every response has arrived; with `return_exceptions`
+    failures are returned in place as `OpenClawGatewayError` instances.
+    """
+    if not calls:
+        return []
+    breaker = _circuit_breaker(config)
+    gateway_url = _build_gateway_url(config)
+    methods = ",".join(call.method for call in calls)
+    started_at = perf_counter()
+    logger.debug(
+        "gateway.rpc.batch.start methods=%s gateway_url=%s",
+        methods,
+        _redacted_url_for_log(gateway_url),
+    )
+    try:
+        outcomes = await _openclaw_batch_once(calls, config=config, gateway_url=gateway_url)
+    except OpenClawGatewayError:
+        logger.warning(
+            "gateway.rpc.batch.gateway_error methods=%s duration_ms=%s",
+            methods,
+            int((perf_counter() - started_at) * 1000),
+        )
+        if breaker is not None:
+            breaker.record_success(perf_counter() - started_at)
+        raise
+    except _TRANSPORT_ERRORS as exc:  # pragma: no cover - network/protocol errors
+        if breaker is not None:
+            breaker.record_failure(str(exc) or exc.__class__.__name__)
+        logger.error(
+            "gateway.rpc.batch.transport_error methods=%s duration_ms=%s error_type=%s",
+            methods,
+            int((perf_counter() - started_at) * 1000),
+            exc.__class__.__name__,
+        )
+        raise OpenClawGatewayError(str(exc)) from exc
+    finally:
+        for call in calls:
+            gateway_response_cache.invalidate_after(call.method, config=config)
+            known_sessions.forget_after(call.method, call.params, gateway_url=config.url)
+            chat_history_cache.mark_stale_after(call.method, call.params, config=config)
+    results = [
+        (
+            OpenClawGatewayError(str(outcome))
+            if isinstance(outcome, BaseException) and not isinstance(outcome, OpenClawGatewayError)
+            else outcome
+        )
+        for outcome in outcomes
+    ]
+    if breaker is not None:
+        dropped = next(
+            (
+                outcome
+                for outcome in outcomes
+                if isinstance(outcome, BaseException)
+                and not isinstance(outcome, OpenClawGatewayError)
+            ),
+            None,
+        )
+        if dropped is None:
+            breaker.record_success(perf_counter() - started_at)
+        else:
+            breaker.record_failure(str(dropped) or dropped.__class__.__name__)
+    failures = [result for result in results if isinstance(result, OpenClawGatewayError)]
+    logger.debug(
+        "gateway.rpc.batch.done methods=%s failures=%s duration_ms=%s",
+        methods,
+        len(failures),
+        int((perf_counter() - started_at) * 1000),
+    )
+    if failures and not return_exceptions:
+        raise failures[0]
+    return results
+
+
 async def openclaw_connect_metadata(*, config: GatewayConfig) -> object:
     """Open a gateway connection and return the connect/hello payload."""
+    breaker = _circuit_breaker(config)
     gateway_url = _build_gateway_url(config)
     started_at = perf_counter()
     logger.debug(
@@ -499,20 +1267,20 @@ async def openclaw_connect_metadata(*, config: GatewayConfig) -> object:
             "gateway.rpc.connect_metadata.success duration_ms=%s",
             int((perf_counter() - started_at) * 1000),
         )
+        if breaker is not None:
+            breaker.record_success(perf_counter() - started_at)
         return metadata
     except OpenClawGatewayError:
         logger.warning(
             "gateway.rpc.connect_metadata.gateway_error duration_ms=%s",
             int((perf_counter() - started_at) * 1000),
         )
+        if breaker is not None:
+            breaker.record_success(perf_counter() - started_at)
         raise
-    except (
-        TimeoutError,
-        ConnectionError,
-        OSError,
-        ValueError,
-        WebSocketException,
-    ) as exc:  # pragma: no cover - network/protocol errors
+    except _TRANSPORT_ERRORS as exc:  # pragma: no cover - network/protocol errors
+        if breaker is not None:
+            breaker.record_failure(str(exc) or exc.__class__.__name__)
         logger.error(
             "gateway.rpc.connect_metadata.transport_error duration_ms=%s error_type=%s",
             int((perf_counter() - started_at) * 1000),
@@ -521,6 +1289,15 @@ async def openclaw_connect_metadata(*, config: GatewayConfig) -> object:
         raise OpenClawGatewayError(str(exc)) from exc
 
 
+def _send_message_params(message: str, *, session_key: str, deliver: bool) -> dict[str, Any]:
+    return {
+        "sessionKey": session_key,
+        "message": message,
+        "deliver": deliver,
+        "idempotencyKey": str(uuid4()),
+    }
+
+
 async def send_message(
     message: str,
     *,
@@ -529,13 +1306,11 @@ async def send_message(
     deliver: bool = False,
 ) -> object:
     """Send a chat message to a session."""
-    params: dict[str, Any] = {
-        "sessionKey": session_key,
-        "message": message,
-        "deliver": deliver,
-        "idempotencyKey": str(uuid4()),
-    }
-    return await openclaw_call("chat.send", params, config=config)
+    return await openclaw_call(
+        "chat.send",
+        _send_message_params(message, session_key=session_key, deliver=deliver),
+        config=config,
+    )
 
 
 async def get_chat_history(
@@ -555,6 +1330,13 @@ async def delete_session(session_key: str, *, config: GatewayConfig) -> object:
     return await openclaw_call("sessions.delete", {"key": session_key}, config=config)
 
 
+def _ensure_session_params(session_key: str, *, label: str | None) -> dict[str, Any]:
+    params: dict[str, Any] = {"key": session_key}
+    if label:
+        params["label"] = label
+    return params
+
+
 async def ensure_session(
     session_key: str,
     *,
@@ -562,7 +1344,51 @@ async def ensure_session(
     label: str | None = None,
 ) -> object:
     """Ensure a session exists and optionally update its label."""
-    params: dict[str, Any] = {"key": session_key}
-    if label:
-        params["label"] = label
-    return await openclaw_call("sessions.patch", params, config=config)
+    result = await openclaw_call(
+        "sessions.patch",
+        _ensure_session_params(session_key, label=label),
+        config=config,
+    )
+    known_sessions.remember(config.url, session_key, label=label)
+    return result
+
+
+async def ensure_session_and_send_message(
+    message: str,
+    *,
+    session_key: str,
+    config: GatewayConfig,
+    label: str | None = None,
+    deliver: bool = False,
+) -> object:
+    """Ensure a session and send a chat message to it; return the send result.
+
+    Sessions this worker already ensured with the same label (see `known_sessions`)
+    only get the `chat.send`. Otherwise `sessions.patch` and `chat.send` go out back
+    to back on one connection, so the pair costs a single round trip; a
+    `sessions.patch` failure is raised in preference to a send failure.
+    """
+    if known_sessions.is_known(config.url, session_key, label=label):
+        try:
+            return await send_message(
+                message,
+                session_key=session_key,
+                config=config,
+                deliver=deliver,
+            )
+        except OpenClawGatewayError as exc:
+            if not is_missing_session_error(exc) or isinstance(exc, GatewayCircuitOpenError):
+                raise
+            known_sessions.forget(config.url, session_key)
+    _, sent = await openclaw_batch(
+        [
+            GatewayCall("sessions.patch", _ensure_session_params(session_key, label=label)),
+            GatewayCall(
+                "chat.send",
+                _send_message_params(message, session_key=session_key, deliver=deliver),
+            ),
+        ],
+        config=config,
+    )
+    known_sessions.remember(config.url, session_key, label=label)
+    return sent
@@ -0,0 +1,177 @@
+"""In-process cache of gateway runtime versions for compatibility checks."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from app.services.openclaw.gateway_rpc import GatewayConfig
+
+logger = get_logger(__name__)
+
+_CacheKey = tuple[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedGatewayVersion:
+    """Version a gateway reported, and how it was learned.
+
+    `connect_version` is the hello payload's `server.version`. `current_version`
+    is the version compatibility is judged on; it differs when a full check fell
+    back to `config.get`. `resolved` is False for entries recorded from a
+    handshake alone, whose unusable versions still need a full check.
+    """
+
+    connect_version: str | None
+    current_version: str | None
+    resolved: bool
+    stored_at: float
+
+
+def _token_fingerprint(token: str | None) -> str:
+    if not token:
+        return ""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def _hello_server_version(hello: object) -> str | None:
+    server = hello.get("server") if isinstance(hello, dict) else None
+    version = server.get("version") if isinstance(server, dict) else None
+    if isinstance(version, str):
+        return version.strip() or None
+    if isinstance(version, (int, float)):
+        return str(version)
+    return None
+
+
+class GatewayVersionCache:
+    """TTL map of (gateway URL, token fingerprint) to the gateway's reported version."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: TTLCache[_CacheKey, CachedGatewayVersion] = TTLCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+        self._refreshing: dict[_CacheKey, asyncio.Task[None]] = {}
+
+    @staticmethod
+    def _key(config: GatewayConfig) -> _CacheKey:
+        return ((config.url or "").strip(), _token_fingerprint(config.token))
+
+    def get(self, config: GatewayConfig) -> CachedGatewayVersion | None:
+        """Return the live entry for the gateway, or `None`."""
+        return self._entries.get(self._key(config))
+
+    def _store(
+        self,
+        key: _CacheKey,
+        *,
+        connect_version: str | None,
+        current_version: str | None,
+        resolved: bool,
+    ) -> None:
+        self._entries.set(
+            key,
+            CachedGatewayVersion(
+                connect_version=connect_version,
+                current_version=current_version,
+                resolved=resolved,
+                stored_at=monotonic(),
+            ),
+        )
+
+    def remember(
+        self,
+        config: GatewayConfig,
+        *,
+        connect_version: str | None,
+        current_version: str | None,
+    ) -> None:
+        """Store the outcome of a full version check."""
+        self._store(
+            self._key(config),
+            connect_version=connect_version,
+            current_version=current_version,
+            resolved=True,
+        )
+
+    def record_hello(self, config: GatewayConfig, hello: object) -> None:
+        """Refresh the entry from a handshake's hello payload, if it reports a version."""
+        if not self._entries.enabled:
+            return
+        connect_version = _hello_server_version(hello)
+        if connect_version is None:
+            return
+        key = self._key(config)
+        known = self._entries.get(key)
+        if known is not None and known.connect_version == connect_version:
+            # Same runtime as before: keep what was resolved for it, restart the TTL.
+            self._store(
+                key,
+                connect_version=connect_version,
+                current_version=known.current_version,
+                resolved=known.resolved,
+            )
+            return
+        self._store(
+            key,
+            connect_version=connect_version,
+            current_version=connect_version,
+            resolved=False,
+        )
+
+    def needs_refresh(self, entry: CachedGatewayVersion) -> bool:
+        """Return whether `entry` is past half its TTL."""
+        return monotonic() - entry.stored_at >= self.ttl_seconds / 2
+
+    def refresh_in_background(
+        self,
+        config: GatewayConfig,
+        refresh: Callable[[], Awaitable[object]],
+    ) -> None:
+        """Run `refresh()` once per gateway at a time without awaiting it.
+
+        Failures are logged and otherwise ignored; the entry simply expires.
+        """
+        key = self._key(config)
+        running = self._refreshing.get(key)
+        if running is not None and not running.done():
+            return
+
+        async def _run() -> None:
+            try:
+                await refresh()
+            except Exception as exc:
+                logger.debug(
+                    "gateway.compat.version_cache.refresh_failed gateway_url=%s error=%s",
+                    key[0],
+                    str(exc),
+                )
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(_run())
+
+    def clear(self) -> None:
+        """Drop every entry and cancel background refreshes."""
+        self._entries.clear()
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+
+
+gateway_version_cache = GatewayVersionCache(
+    ttl_seconds=settings.gateway_version_cache_ttl_seconds,
+    max_entries=settings.gateway_version_cache_max_entries,
+)
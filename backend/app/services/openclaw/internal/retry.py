@@ -14,7 +14,7 @@ from app.services.openclaw.constants import (
     _SECURE_RANDOM,
     _TRANSIENT_GATEWAY_ERROR_MARKERS,
 )
-from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+from app.services.openclaw.gateway_rpc import GatewayCircuitOpenError, OpenClawGatewayError
 
 _T = TypeVar("_T")
 
@@ -22,6 +22,9 @@ _T = TypeVar("_T")
 def _is_transient_gateway_error(exc: Exception) -> bool:
     if not isinstance(exc, OpenClawGatewayError):
         return False
+    # An open circuit already reflects repeated failures; fail fast instead of waiting it out.
+    if isinstance(exc, GatewayCircuitOpenError):
+        return False
     message = str(exc).lower()
     if not message:
         return False
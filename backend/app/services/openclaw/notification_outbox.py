@@ -0,0 +1,349 @@
+"""Transactional outbox for agent notifications.
+
+API handlers add `AgentNotification` rows in the same transaction as the change
+that triggers them and publish a Redis wake-up after commit, so request latency
+never includes gateway round trips. The queue worker claims each row, sends it to
+the agent's session and records `*_notified` / `*_notify_failed` activity. Rows
+whose wake-up was lost (Redis down, worker restart) or that wait on a retry are
+picked up by `sweep_agent_notifications`.
+
+Non-urgent rows wait `notification_digest_window_seconds` before their first
+attempt; every pending non-urgent row for the same agent is then sent as one
+digest message, oldest first, so bursts (bulk assignment, comment threads, busy
+board chat) cost one `chat.send` instead of one per event. Urgent rows, such as
+`/pause` and `/resume` control commands, skip the window and are sent verbatim.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlmodel import col, select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db import crud
+from app.db.session import async_session_maker
+from app.models.agent_notifications import AgentNotification
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.tasks import Task
+from app.services.activity_log import record_activity
+from app.services.openclaw.gateway_dispatch import GatewayDispatchService
+from app.services.queue import QueuedTask, enqueue_task
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+
+logger = get_logger(__name__)
+
+TASK_TYPE = "agent_notification"
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_FAILED = "failed"
+_CLAIMABLE_STATUSES = (STATUS_PENDING, STATUS_SENDING)
+# A claimed row becomes claimable again after this long, covering workers that die
+# mid-delivery. Longer than any gateway send, so live deliveries are not repeated.
+_CLAIM_SECONDS = 120.0
+_QUEUED_IDS_KEY = "agent_notification_ids"
+
+
+def queue_agent_notification(
+    session: AsyncSession,
+    *,
+    board: Board,
+    agent: Agent,
+    message: str,
+    task_id: UUID | None = None,
+    deliver: bool = False,
+    urgent: bool = False,
+    activity_event_type: str | None = None,
+    activity_message: str | None = None,
+    failure_message: str | None = None,
+) -> AgentNotification | None:
+    """Add a notification for `agent` to the session; the caller commits it.
+
+    Returns None when the agent has no session or the board no gateway.
+    """
+    if not agent.openclaw_session_id or board.gateway_id is None:
+        return None
+    window = 0.0 if urgent else settings.notification_digest_window_seconds
+    notification = AgentNotification(
+        board_id=board.id,
+        agent_id=agent.id,
+        task_id=task_id,
+        message=message,
+        deliver=deliver,
+        urgent=urgent,
+        activity_event_type=activity_event_type,
+        activity_message=activity_message,
+        failure_message=failure_message,
+    )
+    notification.next_attempt_at = notification.created_at + timedelta(seconds=window)
+    session.add(notification)
+    session.info.setdefault(_QUEUED_IDS_KEY, []).append((notification.id, window))
+    return notification
+
+
+def publish_agent_notifications(session: AsyncSession) -> int:
+    """Wake the queue worker for notifications queued on `session`; call after commit.
+
+    Returns how many wake-ups were enqueued. Rows whose wake-up fails are still
+    delivered by the worker's periodic sweep.
+    """
+    queued: list[tuple[UUID, float]] = session.info.pop(_QUEUED_IDS_KEY, [])
+    published = 0
+    for notification_id, delay_seconds in queued:
+        task = QueuedTask(
+            task_type=TASK_TYPE,
+            payload={"notification_id": str(notification_id)},
+            created_at=datetime.now(UTC),
+        )
+        if enqueue_task(
+            task,
+            settings.rq_queue_name,
+            redis_url=settings.rq_redis_url,
+            delay_seconds=delay_seconds,
+        ):
+            published += 1
+    return published
+
+
+def _retry_delay_seconds(attempts: int) -> float:
+    base = settings.notification_outbox_retry_base_seconds * (2 ** max(0, attempts - 1))
+    return float(min(base, settings.notification_outbox_retry_max_seconds))
+
+
+async def _claim(session: AsyncSession, notification_id: UUID) -> bool:
+    now = utcnow()
+    claimed = await crud.update_where(
+        session,
+        AgentNotification,
+        col(AgentNotification.id) == notification_id,
+        col(AgentNotification.status).in_(_CLAIMABLE_STATUSES),
+        col(AgentNotification.next_attempt_at) <= now,
+        status=STATUS_SENDING,
+        next_attempt_at=now + timedelta(seconds=_CLAIM_SECONDS),
+        commit=True,
+    )
+    return claimed == 1
+
+
+async def _claim_digest_rows(
+    session: AsyncSession,
+    notification: AgentNotification,
+) -> list[AgentNotification]:
+    """Claim the agent's other pending non-urgent rows, due or still in their window."""
+    candidates = (
+        await AgentNotification.objects.filter(
+            col(AgentNotification.agent_id) == notification.agent_id,
+            col(AgentNotification.id) != notification.id,
+            col(AgentNotification.status) == STATUS_PENDING,
+            col(AgentNotification.urgent).is_(False),
+            col(AgentNotification.deliver) == notification.deliver,
+        )
+        .order_by(col(AgentNotification.created_at))
+        .limit(settings.notification_digest_max_messages - 1)
+        .all(session)
+    )
+    claimed: list[AgentNotification] = []
+    lease_until = utcnow() + timedelta(seconds=_CLAIM_SECONDS)
+    for candidate in candidates:
+        updated = await crud.update_where(
+            session,
+            AgentNotification,
+            col(AgentNotification.id) == candidate.id,
+            col(AgentNotification.status) == STATUS_PENDING,
+            status=STATUS_SENDING,
+            next_attempt_at=lease_until,
+        )
+        if updated == 1:
+            claimed.append(candidate)
+    task_ids = {row.task_id for row in claimed if row.task_id is not None}
+    existing = {task.id for task in await Task.objects.by_ids(task_ids).all(session)}
+    kept: list[AgentNotification] = []
+    for row in claimed:
+        if row.task_id is not None and row.task_id not in existing:
+            await session.delete(row)
+        else:
+            kept.append(row)
+    return kept
+
+
+def _message_header(message: str) -> str:
+    return message.strip().splitlines()[0] if message.strip() else "MESSAGE"
+
+
+def digest_message(notifications: list[AgentNotification]) -> str:
+    """Merge notifications into one message, oldest first, keeping each header."""
+    if len(notifications) == 1:
+        return notifications[0].message
+    ordered = sorted(notifications, key=lambda row: row.created_at)
+    headers = Counter(_message_header(row.message) for row in ordered)
+    summary = ", ".join(
+        header if count == 1 else f"{header} x{count}" for header, count in headers.items()
+    )
+    parts = [
+        f"NOTIFICATION DIGEST ({len(ordered)} messages, oldest first)",
+        f"Includes: {summary}",
+    ]
+    for index, row in enumerate(ordered, start=1):
+        parts.append(f"[{index}/{len(ordered)}]\n{row.message.strip()}")
+    return "\n\n".join(parts)
+
+
+async def _delivery_target(
+    session: AsyncSession,
+    notification: AgentNotification,
+) -> tuple[Agent, GatewayClientConfig] | None:
+    agent = await Agent.objects.by_id(notification.agent_id).first(session)
+    if agent is None or not agent.openclaw_session_id:
+        return None
+    if notification.task_id is not None:
+        if await Task.objects.by_id(notification.task_id).first(session) is None:
+            return None
+    board = await Board.objects.by_id(notification.board_id).first(session)
+    if board is None:
+        return None
+    config = await GatewayDispatchService(session).optional_gateway_config_for_board(board)
+    if config is None:
+        return None
+    return agent, config
+
+
+def _record_failure(notification: AgentNotification, error: Exception) -> str:
+    notification.attempts += 1
+    notification.last_error = str(error)
+    if notification.attempts >= settings.notification_outbox_max_attempts:
+        notification.status = STATUS_FAILED
+        return STATUS_FAILED
+    notification.status = STATUS_PENDING
+    notification.next_attempt_at = utcnow() + timedelta(
+        seconds=_retry_delay_seconds(notification.attempts),
+    )
+    return "retrying"
+
+
+async def _record_outcome(
+    session: AsyncSession,
+    *,
+    notifications: list[AgentNotification],
+    agent: Agent,
+    error: Exception | None,
+) -> str:
+    """Record one send covering `notifications`; return the first row's outcome."""
+    outcomes: list[str] = []
+    for notification in notifications:
+        event_type = notification.activity_event_type
+        if error is None:
+            if event_type:
+                record_activity(
+                    session,
+                    event_type=f"{event_type}_notified",
+                    message=notification.activity_message or f"Agent notified: {agent.name}.",
+                    agent_id=agent.id,
+                    task_id=notification.task_id,
+                )
+            await session.delete(notification)
+            outcomes.append("delivered")
+            continue
+        outcome = _record_failure(notification, error)
+        if outcome == STATUS_FAILED and event_type:
+            record_activity(
+                session,
+                event_type=f"{event_type}_notify_failed",
+                message=f"{notification.failure_message or 'Notify failed'}: {error}",
+                agent_id=agent.id,
+                task_id=notification.task_id,
+            )
+        session.add(notification)
+        outcomes.append(outcome)
+    await session.commit()
+    if error is not None:
+        logger.warning(
+            "notification.outbox.delivery_failed",
+            extra={
+                "notification_ids": [str(notification.id) for notification in notifications],
+                "agent_id": str(agent.id),
+                "attempts": notifications[0].attempts,
+                "outcome": outcomes[0],
+                "error": str(error),
+            },
+        )
+    return outcomes[0]
+
+
+async def deliver_agent_notification(notification_id: UUID) -> str | None:
+    """Claim and send one notification, merged with the agent's other pending ones.
+
+    Returns "delivered", "retrying", "failed" or "dropped" (target gone), or None
+    when the row is missing, already claimed, or not yet due.
+    """
+    async with async_session_maker() as session:
+        if not await _claim(session, notification_id):
+            return None
+        notification = await AgentNotification.objects.by_id(notification_id).first(session)
+        if notification is None:
+            return None
+        target = await _delivery_target(session, notification)
+        if target is None:
+            await session.delete(notification)
+            await session.commit()
+            return "dropped"
+        agent, config = target
+        batch = [notification]
+        if not notification.urgent:
+            batch.extend(await _claim_digest_rows(session, notification))
+        # Release the connection while the gateway call is in flight.
+        await session.commit()
+        error = await GatewayDispatchService(session).try_send_agent_message(
+            session_key=agent.openclaw_session_id or "",
+            config=config,
+            agent_name=agent.name,
+            message=digest_message(batch),
+            deliver=notification.deliver,
+        )
+        return await _record_outcome(
+            session,
+            notifications=batch,
+            agent=agent,
+            error=error,
+        )
+
+
+async def sweep_agent_notifications() -> int:
+    """Deliver due notifications missed by wake-ups or awaiting a retry.
+
+    Returns how many rows this call claimed.
+    """
+    async with async_session_maker() as session:
+        statement = (
+            select(AgentNotification.id)
+            .where(col(AgentNotification.status).in_(_CLAIMABLE_STATUSES))
+            .where(col(AgentNotification.next_attempt_at) <= utcnow())
+            .order_by(col(AgentNotification.next_attempt_at))
+            .limit(settings.notification_outbox_batch_size)
+        )
+        notification_ids = list(await session.exec(statement))
+    claimed = 0
+    for notification_id in notification_ids:
+        if await deliver_agent_notification(notification_id) is not None:
+            claimed += 1
+    return claimed
+
+
+async def process_agent_notification_task(task: QueuedTask) -> None:
+    """Queue worker handler for notification wake-ups."""
+    await deliver_agent_notification(UUID(str(task.payload["notification_id"])))
+
+
+def requeue_agent_notification_task(task: QueuedTask, delay_seconds: float) -> bool:
+    """Never requeue wake-ups: retries are tracked on the row and run by the sweep."""
+    del task, delay_seconds
+    return False
@@ -7,20 +7,19 @@ DB-backed workflows (template sync, lead-agent record creation) live in
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
-
 from app.core.config import settings
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.gateways import Gateway
 from app.services import souls_directory
+from app.services.openclaw.agent_file_digests import agent_file_digests
 from app.services.openclaw.constants import (
     BOARD_SHARED_TEMPLATE_MAP,
     DEFAULT_CHANNEL_HEARTBEAT_VISIBILITY,
@@ -40,8 +39,8 @@ from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConf
 from app.services.openclaw.gateway_rpc import (
     OpenClawGatewayError,
     ensure_session,
+    ensure_session_and_send_message,
     openclaw_call,
-    send_message,
 )
 from app.services.openclaw.internal.agent_key import agent_key as _agent_key
 from app.services.openclaw.internal.agent_key import slugify
@@ -49,9 +48,13 @@ from app.services.openclaw.internal.session_keys import (
     board_agent_session_key,
     board_lead_session_key,
 )
+from app.services.openclaw.session_registry import is_missing_session_error
 from app.services.openclaw.shared import GatewayAgentIdentity
+from app.services.openclaw.workspace_templates import workspace_templates
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from app.models.users import User
 
 
@@ -64,23 +67,21 @@ class ProvisionOptions:
     overwrite: bool = False
 
 
+@dataclass(slots=True)
+class AgentFileSyncStats:
+    """Workspace files written, skipped (unchanged or preserved) and deleted by a sync."""
+
+    written: int = 0
+    skipped: int = 0
+    deleted: int = 0
+
+
 _ROLE_SOUL_MAX_CHARS = 24_000
 _ROLE_SOUL_WORD_RE = re.compile(r"[a-z0-9]+")
 
 
 def _is_missing_session_error(exc: OpenClawGatewayError) -> bool:
-    message = str(exc).lower()
-    if not message:
-        return False
-    return any(
-        marker in message
-        for marker in (
-            "not found",
-            "unknown session",
-            "no such session",
-            "session does not exist",
-        )
-    )
+    return is_missing_session_error(exc)
 
 
 def _is_missing_agent_error(exc: OpenClawGatewayError) -> bool:
@@ -94,14 +95,6 @@ def _is_missing_agent_error(exc: OpenClawGatewayError) -> bool:
     return "agent" in message and "not found" in message
 
 
-def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[3]
-
-
-def _templates_root() -> Path:
-    return _repo_root() / "templates"
-
-
 def _heartbeat_config(agent: Agent) -> dict[str, Any]:
     merged = DEFAULT_HEARTBEAT_CONFIG.copy()
     if isinstance(agent.heartbeat_config, dict):
@@ -130,16 +123,6 @@ def _channel_heartbeat_visibility_patch(config_data: dict[str, Any]) -> dict[str
     return {"defaults": {"heartbeat": merged}}
 
 
-def _template_env() -> Environment:
-    return Environment(
-        loader=FileSystemLoader(_templates_root()),
-        # Render markdown verbatim (HTML escaping makes it harder for agents to read).
-        autoescape=select_autoescape(default=False),
-        undefined=StrictUndefined,
-        keep_trailing_newline=True,
-    )
-
-
 def _heartbeat_template_name(agent: Agent) -> str:
     return HEARTBEAT_LEAD_TEMPLATE if agent.is_board_lead else HEARTBEAT_AGENT_TEMPLATE
 
@@ -393,7 +376,6 @@ def _render_agent_files(
     include_bootstrap: bool,
     template_overrides: dict[str, str] | None = None,
 ) -> dict[str, str]:
-    env = _template_env()
     overrides: dict[str, str] = {}
     if agent.identity_template:
         overrides["IDENTITY.md"] = agent.identity_template
@@ -410,15 +392,12 @@ def _render_agent_files(
                 if template_overrides and name in template_overrides
                 else _heartbeat_template_name(agent)
             )
-            heartbeat_path = _templates_root() / heartbeat_template
-            if not heartbeat_path.exists():
-                msg = f"Missing template file: {heartbeat_template}"
-                raise FileNotFoundError(msg)
-            rendered[name] = env.get_template(heartbeat_template).render(**context).strip()
+            template = workspace_templates.template(heartbeat_template)
+            rendered[name] = template.render(**context).strip()
             continue
         override = overrides.get(name)
         if override:
-            rendered[name] = env.from_string(override).render(**context).strip()
+            rendered[name] = workspace_templates.from_source(override).render(**context).strip()
             continue
         template_name = (
             template_overrides[name] if template_overrides and name in template_overrides else name
@@ -426,11 +405,7 @@ def _render_agent_files(
         if template_name == "SOUL.md":
             # Use shared Jinja soul template as the default implementation.
             template_name = "BOARD_SOUL.md.j2"
-        path = _templates_root() / template_name
-        if not path.exists():
-            msg = f"Missing template file: {template_name}"
-            raise FileNotFoundError(msg)
-        rendered[name] = env.get_template(template_name).render(**context).strip()
+        rendered[name] = workspace_templates.template(template_name).render(**context).strip()
     return rendered
 
 
@@ -604,6 +579,13 @@ class OpenClawGatewayControlPlane(GatewayControlPlane):
     async def patch_agent_heartbeats(
         self,
         entries: list[tuple[str, str, dict[str, Any]]],
+    ) -> None:
+        batcher = _heartbeat_patch_batcher(self._config.url)
+        await batcher.patch(entries, lambda merged: self._patch_agent_heartbeats(merged))
+
+    async def _patch_agent_heartbeats(
+        self,
+        entries: list[tuple[str, str, dict[str, Any]]],
     ) -> None:
         base_hash, raw_list, config_data = await _gateway_config_agent_list(self._config)
         entry_by_id = _heartbeat_entry_map(entries)
@@ -619,10 +601,65 @@ class OpenClawGatewayControlPlane(GatewayControlPlane):
         await openclaw_call("config.patch", params, config=self._config)
 
 
+@dataclass
+class _HeartbeatPatchBatcher:
+    """Group-commits concurrent heartbeat `config.patch` writes to one gateway.
+
+    `config.patch` is a read-modify-write guarded by `baseHash`, so concurrent
+    provisioning (e.g. a parallel template sync) would reject all but one writer.
+    Entries queued while a patch is in flight are merged into the next single patch.
+    """
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    pending: list[tuple[list[tuple[str, str, dict[str, Any]]], asyncio.Future[None]]] = field(
+        default_factory=list
+    )
+
+    async def patch(
+        self,
+        entries: list[tuple[str, str, dict[str, Any]]],
+        apply: Callable[[list[tuple[str, str, dict[str, Any]]]], Awaitable[None]],
+    ) -> None:
+        done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.pending.append((entries, done))
+        async with self.lock:
+            if done.done():
+                # An earlier holder already wrote these entries as part of its batch.
+                done.result()
+                return
+            batch, self.pending = self.pending, []
+            merged = [entry for batch_entries, _ in batch for entry in batch_entries]
+            try:
+                await apply(merged)
+            except asyncio.CancelledError:
+                # Hand the other callers' entries to whoever takes the lock next.
+                self.pending[:0] = [item for item in batch if item[1] is not done]
+                raise
+            except Exception as exc:
+                for _, waiter in batch:
+                    if waiter is not done:
+                        waiter.set_exception(exc)
+                raise
+            for _, waiter in batch:
+                waiter.set_result(None)
+
+
+_heartbeat_patch_batchers: dict[str, tuple[asyncio.AbstractEventLoop, _HeartbeatPatchBatcher]] = {}
+
+
+def _heartbeat_patch_batcher(gateway_url: str) -> _HeartbeatPatchBatcher:
+    loop = asyncio.get_running_loop()
+    entry = _heartbeat_patch_batchers.get(gateway_url)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, _HeartbeatPatchBatcher())
+        _heartbeat_patch_batchers[gateway_url] = entry
+    return entry[1]
+
+
 async def _gateway_config_agent_list(
     config: GatewayClientConfig,
 ) -> tuple[str | None, list[object], dict[str, Any]]:
-    cfg = await openclaw_call("config.get", config=config)
+    cfg = await openclaw_call("config.get", config=config, use_cache=False)
     if not isinstance(cfg, dict):
         msg = "config.get returned invalid payload"
         raise OpenClawGatewayError(msg)
@@ -742,23 +779,36 @@ class BaseAgentLifecycleManager(ABC):
         existing_files: dict[str, dict[str, Any]],
         action: str,
         overwrite: bool = False,
-    ) -> None:
+    ) -> AgentFileSyncStats:
         preserve_files = (
             self._preserve_files(agent) if agent is not None else set(PRESERVE_AGENT_EDITABLE_FILES)
         )
         target_file_names = desired_file_names or set(rendered.keys())
         unsupported_names: list[str] = []
+        gateway_id = str(self._gateway.id)
+        stats = AgentFileSyncStats()
 
         for name, content in rendered.items():
             if content == "":
                 continue
+            entry = existing_files.get(name)
             # Preserve "editable" files only during updates. During first-time provisioning,
             # the gateway may pre-create defaults for USER/MEMORY/etc, and we still want to
             # apply Dashboard's templates.
             if action == "update" and not overwrite and name in preserve_files:
-                entry = existing_files.get(name)
                 if entry and not bool(entry.get("missing")):
+                    stats.skipped += 1
                     continue
+            # `overwrite` forces a rewrite even when the gateway copy looks current.
+            if not overwrite and agent_file_digests.unchanged(
+                gateway_id,
+                agent_id,
+                name,
+                content,
+                entry=entry,
+            ):
+                stats.skipped += 1
+                continue
             try:
                 await self._control_plane.set_agent_file(
                     agent_id=agent_id,
@@ -766,10 +816,13 @@ class BaseAgentLifecycleManager(ABC):
                     content=content,
                 )
             except OpenClawGatewayError as exc:
+                agent_file_digests.forget(gateway_id, agent_id, name)
                 if "unsupported file" in str(exc).lower():
                     unsupported_names.append(name)
                     continue
                 raise
+            agent_file_digests.remember(gateway_id, agent_id, name, content)
+            stats.written += 1
 
         if agent is not None and agent.is_board_lead and unsupported_names:
             unsupported_sorted = ", ".join(sorted(set(unsupported_names)))
@@ -780,12 +833,13 @@ class BaseAgentLifecycleManager(ABC):
             raise RuntimeError(msg)
 
         if agent is None or not self._allow_stale_file_deletion(agent):
-            return
+            return stats
 
         stale_names = (
             set(existing_files.keys()) & self._stale_file_candidates(agent)
         ) - target_file_names
         for name in sorted(stale_names):
+            agent_file_digests.forget(gateway_id, agent_id, name)
             try:
                 await self._control_plane.delete_agent_file(agent_id=agent_id, name=name)
             except OpenClawGatewayError as exc:
@@ -801,6 +855,8 @@ class BaseAgentLifecycleManager(ABC):
                 ):
                     continue
                 raise
+            stats.deleted += 1
+        return stats
 
     async def provision(
         self,
@@ -812,7 +868,7 @@ class BaseAgentLifecycleManager(ABC):
         options: ProvisionOptions,
         board: Board | None = None,
         session_label: str | None = None,
-    ) -> None:
+    ) -> AgentFileSyncStats:
         if not self._gateway.workspace_root:
             msg = "gateway_workspace_root is required"
             raise ValueError(msg)
@@ -855,7 +911,7 @@ class BaseAgentLifecycleManager(ABC):
             template_overrides=self._template_overrides(agent),
         )
 
-        await self._set_agent_files(
+        return await self._set_agent_files(
             agent=agent,
             agent_id=agent_id,
             rendered=rendered,
@@ -975,6 +1031,7 @@ def _control_plane_for_gateway(gateway: Gateway) -> OpenClawGatewayControlPlane:
             token=gateway.token,
             allow_insecure_tls=gateway.allow_insecure_tls,
             disable_device_pairing=gateway.disable_device_pairing,
+            disable_compression=gateway.disable_compression,
         ),
     )
 
@@ -1047,13 +1104,15 @@ class OpenClawGatewayProvisioner:
         wake: bool = True,
         deliver_wakeup: bool = True,
         wakeup_verb: str | None = None,
-    ) -> None:
+    ) -> AgentFileSyncStats:
         """Create/update an agent, sync all template files, and optionally wake the agent.
 
         Lifecycle steps (same for all agent types):
         1) create agent (idempotent)
-        2) set/update all template files
+        2) set/update template files whose content changed
         3) wake the agent session (chat.send)
+
+        Returns counts of workspace files written, skipped and deleted.
         """
 
         if not gateway.url:
@@ -1080,7 +1139,7 @@ class OpenClawGatewayProvisioner:
 
         control_plane = _control_plane_for_gateway(gateway)
         manager = manager_type(gateway, control_plane)
-        await manager.provision(
+        file_stats = await manager.provision(
             agent=agent,
             board=board,
             session_key=session_key,
@@ -1102,22 +1161,24 @@ class OpenClawGatewayProvisioner:
                     raise
 
         if not wake:
-            return
+            return file_stats
 
         client_config = GatewayClientConfig(
             url=gateway.url,
             token=gateway.token,
             allow_insecure_tls=gateway.allow_insecure_tls,
             disable_device_pairing=gateway.disable_device_pairing,
+            disable_compression=gateway.disable_compression,
         )
-        await ensure_session(session_key, config=client_config, label=agent.name)
         verb = wakeup_verb or ("provisioned" if action == "provision" else "updated")
-        await send_message(
+        await ensure_session_and_send_message(
             _wakeup_text(agent, verb=verb),
             session_key=session_key,
             config=client_config,
+            label=agent.name,
             deliver=deliver_wakeup,
         )
+        return file_stats
 
     async def delete_agent_lifecycle(
         self,
@@ -1143,6 +1204,7 @@ class OpenClawGatewayProvisioner:
             agent_gateway_id = GatewayAgentIdentity.openclaw_agent_id(gateway)
         else:
             agent_gateway_id = _agent_key(agent)
+        agent_file_digests.forget(str(gateway.id), agent_gateway_id)
         try:
             await control_plane.delete_agent(agent_gateway_id, delete_files=delete_files)
         except OpenClawGatewayError as exc:
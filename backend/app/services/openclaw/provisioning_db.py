@@ -11,7 +11,7 @@ from __future__ import annotations
 import asyncio
 import json
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar
 from uuid import UUID, uuid4
@@ -21,8 +21,12 @@ from sqlalchemy import asc, func, or_
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
+from app.core.agent_presence import agent_presence_buffer
+from app.core.agent_token_cache import agent_token_cache
 from app.core.agent_tokens import verify_agent_token
-from app.core.logging import TRACE_LEVEL
+from app.core.config import settings
+from app.core.kdf_executor import kdf_executor
+from app.core.logging import TRACE_LEVEL, get_logger
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
@@ -76,6 +80,7 @@ from app.services.openclaw.internal.session_keys import (
 )
 from app.services.openclaw.policies import OpenClawAuthorizationPolicy
 from app.services.openclaw.provisioning import (
+    AgentFileSyncStats,
     OpenClawGatewayControlPlane,
     OpenClawGatewayProvisioner,
 )
@@ -103,6 +108,8 @@ if TYPE_CHECKING:
 
 _T = TypeVar("_T")
 
+logger = get_logger(__name__)
+
 
 @dataclass(frozen=True)
 class GatewayTemplateSyncOptions:
@@ -116,6 +123,8 @@ class GatewayTemplateSyncOptions:
     force_bootstrap: bool = False
     overwrite: bool = False
     board_id: UUID | None = None
+    # Agents synced at once on this gateway; None uses `gateway_template_sync_concurrency`.
+    concurrency: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -212,7 +221,7 @@ class OpenClawProvisioningService(OpenClawDBService):
             identity_profile=merged_identity_profile,
             openclaw_session_id=self.lead_session_key(board),
         )
-        raw_token = mint_agent_token(agent)
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(agent, action=config_options.action, status="provisioning")
         await self.add_commit_refresh(agent)
 
@@ -255,6 +264,7 @@ class OpenClawProvisioningService(OpenClawDBService):
                 force_bootstrap=options.force_bootstrap,
                 overwrite=options.overwrite,
                 board_id=options.board_id,
+                concurrency=options.concurrency,
             )
 
         if template_user is None:
@@ -290,13 +300,14 @@ class OpenClawProvisioningService(OpenClawDBService):
                 token=gateway.token,
                 allow_insecure_tls=gateway.allow_insecure_tls,
                 disable_device_pairing=gateway.disable_device_pairing,
+                disable_compression=gateway.disable_compression,
             ),
         )
         ctx = _SyncContext(
             session=self.session,
             gateway=gateway,
             control_plane=control_plane,
-            backoff=GatewayBackoff(timeout_s=10 * 60, timeout_context="template sync"),
+            backoff=_template_sync_backoff(),
             options=options,
             provisioner=self._gateway,
         )
@@ -314,6 +325,7 @@ class OpenClawProvisioningService(OpenClawDBService):
         paused_board_ids = await _paused_board_ids(self.session, list(boards_by_id.keys()))
         if boards_by_id:
             query = Agent.objects.by_field_in("board_id", list(boards_by_id.keys())).order_by(
+                col(Agent.is_board_lead).desc(),
                 col(Agent.created_at).asc(),
             )
             if options.lead_only:
@@ -322,7 +334,7 @@ class OpenClawProvisioningService(OpenClawDBService):
         else:
             agents = []
 
-        stop_sync = False
+        targets: list[tuple[Agent, Board]] = []
         for agent in agents:
             board = boards_by_id.get(agent.board_id) if agent.board_id is not None else None
             if board is None:
@@ -336,7 +348,19 @@ class OpenClawProvisioningService(OpenClawDBService):
             if board.id in paused_board_ids:
                 result.agents_skipped += 1
                 continue
-            stop_sync = await _sync_one_agent(ctx, result, agent, board)
+            targets.append((agent, board))
+
+        # Board leads go first so lead workspaces are current (and a dead gateway is
+        # detected) before member agents are touched.
+        remaining_by_board: dict[UUID, int] = {}
+        for _, board in targets:
+            remaining_by_board[board.id] = remaining_by_board.get(board.id, 0) + 1
+        stop_sync = False
+        for batch in (
+            [target for target in targets if target[0].is_board_lead],
+            [target for target in targets if not target[0].is_board_lead],
+        ):
+            stop_sync = await _sync_agent_batch(ctx, result, batch, remaining_by_board)
             if stop_sync:
                 break
 
@@ -353,6 +377,12 @@ class _SyncContext:
     backoff: GatewayBackoff
     options: GatewayTemplateSyncOptions
     provisioner: OpenClawGatewayProvisioner
+    # Serializes `session` use (token rotation) across concurrent agent syncs.
+    session_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+def _template_sync_backoff() -> GatewayBackoff:
+    return GatewayBackoff(timeout_s=10 * 60, timeout_context="template sync")
 
 
 def _parse_tools_md(content: str) -> dict[str, str]:
@@ -460,7 +490,7 @@ def _append_sync_error(
 
 
 async def _rotate_agent_token(session: AsyncSession, agent: Agent) -> str:
-    token = mint_agent_token(agent)
+    token = await mint_agent_token(agent)
     agent.updated_at = utcnow()
     session.add(agent)
     await session.commit()
@@ -498,6 +528,12 @@ def _base_result(
     )
 
 
+def _add_file_stats(result: GatewayTemplatesSyncResult, stats: AgentFileSyncStats) -> None:
+    result.files_written += stats.written
+    result.files_skipped += stats.skipped
+    result.files_deleted += stats.deleted
+
+
 def _boards_by_id(
     boards: list[Board],
     *,
@@ -543,14 +579,17 @@ async def _resolve_agent_auth_token(
                 ),
             )
             return None, False
-        auth_token = await _rotate_agent_token(ctx.session, agent)
+        async with ctx.session_lock:
+            auth_token = await _rotate_agent_token(ctx.session, agent)
 
-    if agent.agent_token_hash and not verify_agent_token(
+    if agent.agent_token_hash and not await kdf_executor.run_unbounded(
+        verify_agent_token,
         auth_token,
         agent.agent_token_hash,
     ):
         if ctx.options.rotate_tokens:
-            auth_token = await _rotate_agent_token(ctx.session, agent)
+            async with ctx.session_lock:
+                auth_token = await _rotate_agent_token(ctx.session, agent)
         else:
             _append_sync_error(
                 result,
@@ -583,8 +622,8 @@ async def _sync_one_agent(
         return False
     try:
 
-        async def _do_provision() -> bool:
-            await ctx.provisioner.apply_agent_lifecycle(
+        async def _do_provision() -> AgentFileSyncStats:
+            return await ctx.provisioner.apply_agent_lifecycle(
                 agent=agent,
                 gateway=ctx.gateway,
                 board=board,
@@ -596,9 +635,8 @@ async def _sync_one_agent(
                 reset_session=ctx.options.reset_sessions,
                 wake=False,
             )
-            return True
 
-        await ctx.backoff.run(_do_provision)
+        _add_file_stats(result, await ctx.backoff.run(_do_provision))
         result.agents_updated += 1
     except TimeoutError as exc:  # pragma: no cover - gateway/network dependent
         result.agents_skipped += 1
@@ -617,6 +655,80 @@ async def _sync_one_agent(
         return False
 
 
+def _merge_sync_result(
+    result: GatewayTemplatesSyncResult,
+    outcome: GatewayTemplatesSyncResult,
+) -> None:
+    result.agents_updated += outcome.agents_updated
+    result.agents_skipped += outcome.agents_skipped
+    result.files_written += outcome.files_written
+    result.files_skipped += outcome.files_skipped
+    result.files_deleted += outcome.files_deleted
+    result.errors.extend(outcome.errors)
+
+
+async def _sync_agent_batch(
+    ctx: _SyncContext,
+    result: GatewayTemplatesSyncResult,
+    targets: list[tuple[Agent, Board]],
+    remaining_by_board: dict[UUID, int],
+) -> bool:
+    """Sync `targets` with a bounded pool of workers; return whether to stop the sync.
+
+    Each agent records into its own scratch result, merged in input order afterwards,
+    so errors are listed in agent order however workers interleave. After a fatal
+    outcome (gateway unreachable) no further agents are started, but agents already in
+    flight finish and are reported, including ones after the fatal agent in order that
+    a sequential run would not have reached. Each worker retries with its own backoff,
+    so one agent's success does not reset another's delay. `remaining_by_board` counts
+    agents left per board and logs each finished board.
+    """
+    if not targets:
+        return False
+    outcomes: list[GatewayTemplatesSyncResult | None] = [None] * len(targets)
+    pending = iter(enumerate(targets))
+    stop_sync = False
+
+    async def _worker() -> None:
+        nonlocal stop_sync
+        worker_ctx = replace(ctx, backoff=_template_sync_backoff())
+        while not stop_sync:
+            item = next(pending, None)
+            if item is None:
+                return
+            index, (agent, board) = item
+            outcome = _base_result(
+                ctx.gateway,
+                include_main=result.include_main,
+                reset_sessions=result.reset_sessions,
+            )
+            if await _sync_one_agent(worker_ctx, outcome, agent, board):
+                stop_sync = True
+            outcomes[index] = outcome
+            remaining_by_board[board.id] -= 1
+            if remaining_by_board[board.id] == 0:
+                logger.info(
+                    "gateway.templates.sync.board_done gateway_id=%s board_id=%s",
+                    ctx.gateway.id,
+                    board.id,
+                )
+
+    workers = min(
+        ctx.options.concurrency or settings.gateway_template_sync_concurrency, len(targets)
+    )
+    try:
+        async with asyncio.TaskGroup() as group:
+            for _ in range(max(1, workers)):
+                group.create_task(_worker())
+    except BaseExceptionGroup as exc_group:
+        # Surface the first unexpected error itself so callers' handlers still match.
+        raise exc_group.exceptions[0] from exc_group
+    for outcome in outcomes:
+        if outcome is not None:
+            _merge_sync_result(result, outcome)
+    return stop_sync
+
+
 async def _sync_main_agent(
     ctx: _SyncContext,
     result: GatewayTemplatesSyncResult,
@@ -654,8 +766,8 @@ async def _sync_main_agent(
     stop_sync = False
     try:
 
-        async def _do_provision_main() -> bool:
-            await ctx.provisioner.apply_agent_lifecycle(
+        async def _do_provision_main() -> AgentFileSyncStats:
+            return await ctx.provisioner.apply_agent_lifecycle(
                 agent=main_agent,
                 gateway=ctx.gateway,
                 board=None,
@@ -667,9 +779,8 @@ async def _sync_main_agent(
                 reset_session=ctx.options.reset_sessions,
                 wake=False,
             )
-            return True
 
-        await ctx.backoff.run(_do_provision_main)
+        _add_file_stats(result, await ctx.backoff.run(_do_provision_main))
     except TimeoutError as exc:  # pragma: no cover - gateway/network dependent
         _append_sync_error(result, agent=main_agent, message=str(exc))
         stop_sync = True
@@ -839,6 +950,7 @@ class AgentLifecycleService(OpenClawDBService):
 
     @classmethod
     def with_computed_status(cls, agent: Agent) -> Agent:
+        agent_presence_buffer.apply(agent)
         now = utcnow()
         if agent.status in {"deleting", "updating"}:
             return agent
@@ -860,12 +972,14 @@ class AgentLifecycleService(OpenClawDBService):
         statement = select(Agent)
         if board_id:
             statement = statement.where(col(Agent.board_id) == board_id)
-        statement = statement.where(
-            or_(
-                col(Agent.updated_at) >= since,
-                col(Agent.last_seen_at) >= since,
-            ),
-        ).order_by(asc(col(Agent.updated_at)))
+        recent_criteria: list[ColumnElement[bool]] = [
+            col(Agent.updated_at) >= since,
+            col(Agent.last_seen_at) >= since,
+        ]
+        buffered_ids = agent_presence_buffer.agent_ids_seen_since(since)
+        if buffered_ids:
+            recent_criteria.append(col(Agent.id).in_(buffered_ids))
+        statement = statement.where(or_(*recent_criteria)).order_by(asc(col(Agent.updated_at)))
         return list(await self.session.exec(statement))
 
     async def require_user_context(self, user: User | None) -> OrganizationContext:
@@ -1037,7 +1151,7 @@ class AgentLifecycleService(OpenClawDBService):
         data: dict[str, Any],
     ) -> tuple[Agent, str]:
         agent = Agent.model_validate(data)
-        raw_token = mint_agent_token(agent)
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(agent, action="provision", status="provisioning")
         agent.openclaw_session_id = self.resolve_session_key(agent)
         await self.add_commit_refresh(agent)
@@ -1313,8 +1427,8 @@ class AgentLifecycleService(OpenClawDBService):
         )
 
     @staticmethod
-    def mark_agent_update_pending(agent: Agent) -> str:
-        raw_token = mint_agent_token(agent)
+    async def mark_agent_update_pending(agent: Agent) -> str:
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(agent, action="update", status="updating")
         return raw_token
 
@@ -1389,7 +1503,7 @@ class AgentLifecycleService(OpenClawDBService):
         if agent.agent_token_hash is not None:
             return
 
-        raw_token = mint_agent_token(agent)
+        raw_token = await mint_agent_token(agent)
         mark_provision_requested(agent, action="provision", status="provisioning")
         await self.add_commit_refresh(agent)
         board = await self.require_board(
@@ -1529,9 +1643,10 @@ class AgentLifecycleService(OpenClawDBService):
                     else:
                         agents = []
                 for agent in agents:
+                    # Serialize first so buffered presence is merged before the cursor moves.
+                    payload = {"agent": self.serialize_agent(agent)}
                     updated_at = agent.updated_at or agent.last_seen_at or utcnow()
                     last_seen = max(updated_at, last_seen)
-                    payload = {"agent": self.serialize_agent(agent)}
                     yield {"event": "agent", "data": json.dumps(payload)}
                 await asyncio.sleep(2)
 
@@ -1627,7 +1742,7 @@ class AgentLifecycleService(OpenClawDBService):
             main_gateway=main_gateway,
             gateway_for_main=gateway_for_main,
         )
-        raw_token = self.mark_agent_update_pending(agent)
+        raw_token = await self.mark_agent_update_pending(agent)
         self.session.add(agent)
         await self.session.commit()
         await self.session.refresh(agent)
@@ -1865,6 +1980,7 @@ class AgentLifecycleService(OpenClawDBService):
         )
         await self.session.delete(agent)
         await self.session.commit()
+        agent_token_cache.invalidate_agent(agent.id)
 
         try:
             # Notify the gateway-main agent about cleanup for board-scoped deletes.
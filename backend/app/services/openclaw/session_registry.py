@@ -0,0 +1,68 @@
+"""In-process memo of gateway sessions this worker has already ensured."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+
+_FORGETTING_METHODS = frozenset({"sessions.reset", "sessions.delete"})
+_MISSING_SESSION_MARKERS = (
+    "not found",
+    "unknown session",
+    "no such session",
+    "session does not exist",
+)
+
+
+def is_missing_session_error(exc: Exception) -> bool:
+    """Return whether a gateway error reports that the target session does not exist."""
+    message = str(exc).lower()
+    if not message:
+        return False
+    return any(marker in message for marker in _MISSING_SESSION_MARKERS)
+
+
+class KnownSessionRegistry:
+    """TTL map of (gateway URL, session key) to the label the session was ensured with."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._entries: TTLCache[tuple[str, str], str] = TTLCache(
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+
+    def is_known(self, gateway_url: str, session_key: str, *, label: str | None) -> bool:
+        """Return whether the session was ensured recently with a compatible label."""
+        known_label = self._entries.get((gateway_url, session_key))
+        if known_label is None:
+            return False
+        # An unlabeled ensure does not touch the label, so any known label satisfies it.
+        return label is None or known_label == label
+
+    def remember(self, gateway_url: str, session_key: str, *, label: str | None) -> None:
+        """Record a successful `sessions.patch` for the session."""
+        self._entries.set((gateway_url, session_key), label or "")
+
+    def forget(self, gateway_url: str, session_key: str) -> None:
+        """Drop the session so the next send ensures it again."""
+        self._entries.pop((gateway_url, session_key))
+
+    def forget_after(self, method: str, params: dict[str, Any] | None, *, gateway_url: str) -> None:
+        """Drop sessions removed or reset by a completed call to `method`."""
+        if method not in _FORGETTING_METHODS or not params:
+            return
+        session_key = params.get("key")
+        if isinstance(session_key, str):
+            self.forget(gateway_url, session_key)
+
+    def clear(self) -> None:
+        """Forget every session."""
+        self._entries.clear()
+
+
+known_sessions = KnownSessionRegistry(
+    ttl_seconds=settings.gateway_known_session_ttl_seconds,
+    max_entries=settings.gateway_known_session_max_entries,
+)
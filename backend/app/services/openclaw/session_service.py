@@ -11,17 +11,28 @@ from fastapi import HTTPException, status
 
 from app.core.logging import TRACE_LEVEL
 from app.models.boards import Board
+from app.models.gateways import Gateway
 from app.schemas.gateway_api import (
+    GatewayChatHistoryCacheMetrics,
     GatewayResolveQuery,
+    GatewayRpcLatencyBucket,
+    GatewayRpcMethodMetrics,
+    GatewayRpcMetricsResponse,
     GatewaySessionHistoryResponse,
     GatewaySessionMessageRequest,
     GatewaySessionResponse,
     GatewaySessionsResponse,
     GatewaysStatusResponse,
 )
+from app.services.openclaw.chat_history_cache import chat_history_cache
 from app.services.openclaw.db_service import OpenClawDBService
 from app.services.openclaw.error_messages import normalize_gateway_error_message
 from app.services.openclaw.gateway_compat import check_gateway_version_compatibility
+from app.services.openclaw.gateway_metrics import (
+    GatewayMetricsSeries,
+    gateway_metrics,
+    gateway_metrics_label,
+)
 from app.services.openclaw.gateway_resolver import gateway_client_config, require_gateway_for_board
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import (
@@ -67,6 +78,7 @@ class GatewaySessionService(OpenClawDBService):
         gateway_token: str | None,
         gateway_disable_device_pairing: bool = False,
         gateway_allow_insecure_tls: bool = False,
+        gateway_disable_compression: bool = False,
     ) -> GatewayResolveQuery:
         return GatewayResolveQuery(
             board_id=board_id,
@@ -74,6 +86,7 @@ class GatewaySessionService(OpenClawDBService):
             gateway_token=gateway_token,
             gateway_disable_device_pairing=gateway_disable_device_pairing,
             gateway_allow_insecure_tls=gateway_allow_insecure_tls,
+            gateway_disable_compression=gateway_disable_compression,
         )
 
     @staticmethod
@@ -116,6 +129,7 @@ class GatewaySessionService(OpenClawDBService):
                     token=(params.gateway_token or "").strip() or None,
                     allow_insecure_tls=params.gateway_allow_insecure_tls,
                     disable_device_pairing=params.gateway_disable_device_pairing,
+                    disable_compression=params.gateway_disable_compression,
                 ),
                 None,
             )
@@ -331,19 +345,39 @@ class GatewaySessionService(OpenClawDBService):
         board_id: str | None,
         organization_id: UUID,
         user: User | None,
+        limit: int | None = None,
+        before: int | None = None,
+        after: int | None = None,
     ) -> GatewaySessionHistoryResponse:
         board, config, _ = await self.require_gateway(board_id, user=user)
         self._require_same_org(board, organization_id)
+
+        async def _fetch(fetch_limit: int) -> list[object]:
+            history = await get_chat_history(session_id, config=config, limit=fetch_limit)
+            if isinstance(history, dict) and isinstance(history.get("messages"), list):
+                return list(history["messages"])
+            return self.as_object_list(history)
+
         try:
-            history = await get_chat_history(session_id, config=config)
+            page = await chat_history_cache.read(
+                session_id,
+                config=config,
+                fetch=_fetch,
+                limit=limit,
+                before=before,
+                after=after,
+            )
         except OpenClawGatewayError as exc:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
                 detail=str(exc),
             ) from exc
-        if isinstance(history, dict) and isinstance(history.get("messages"), list):
-            return GatewaySessionHistoryResponse(history=history["messages"])
-        return GatewaySessionHistoryResponse(history=self.as_object_list(history))
+        return GatewaySessionHistoryResponse(
+            history=page.messages,
+            before_cursor=page.before_cursor,
+            after_cursor=page.after_cursor,
+            has_more=page.has_more,
+        )
 
     async def send_session_message(
         self,
@@ -366,3 +400,68 @@ class GatewaySessionService(OpenClawDBService):
                 status_code=status.HTTP_502_BAD_GATEWAY,
                 detail=str(exc),
             ) from exc
+
+    async def organization_gateway_labels(self, organization_id: UUID) -> set[str]:
+        """Return metrics labels for every gateway owned by the organization."""
+        gateways = await Gateway.objects.filter_by(organization_id=organization_id).all(
+            self.session,
+        )
+        return {gateway_metrics_label(gateway.url) for gateway in gateways}
+
+    @staticmethod
+    def _rpc_metrics_row(series: GatewayMetricsSeries) -> GatewayRpcMethodMetrics:
+        def _ms(seconds: float | None) -> float | None:
+            return None if seconds is None else round(seconds * 1000, 3)
+
+        bounds: list[float | None] = [*series.bucket_bounds, None]
+        return GatewayRpcMethodMetrics(
+            gateway_url=series.gateway_url,
+            method=series.method,
+            count=series.count,
+            gateway_errors=series.gateway_errors,
+            transport_errors=series.transport_errors,
+            mean_ms=_ms(series.total_seconds / series.count) if series.count else None,
+            p50_ms=_ms(series.p50_seconds),
+            p95_ms=_ms(series.p95_seconds),
+            p99_ms=_ms(series.p99_seconds),
+            buckets=[
+                GatewayRpcLatencyBucket(le_ms=_ms(bound), count=count)
+                for bound, count in zip(bounds, series.bucket_counts, strict=True)
+            ],
+            bytes_sent=series.bytes_sent,
+            bytes_received=series.bytes_received,
+        )
+
+    async def rpc_metrics(self, *, organization_id: UUID) -> GatewayRpcMetricsResponse:
+        """Return RPC metrics recorded by this worker for the organization's gateways."""
+        labels = await self.organization_gateway_labels(organization_id)
+        return GatewayRpcMetricsResponse(
+            requests=[
+                self._rpc_metrics_row(series)
+                for series in gateway_metrics.requests()
+                if series.gateway_url in labels
+            ],
+            handshakes=[
+                self._rpc_metrics_row(series)
+                for series in gateway_metrics.handshakes()
+                if series.gateway_url in labels
+            ],
+        )
+
+    @staticmethod
+    def chat_history_metrics() -> GatewayChatHistoryCacheMetrics:
+        """Return chat history cache counters recorded by this worker."""
+        stats = chat_history_cache.stats()
+        return GatewayChatHistoryCacheMetrics(
+            sessions=stats.sessions,
+            messages=stats.messages,
+            hits=stats.hits,
+            incremental=stats.incremental,
+            misses=stats.misses,
+            hit_rate=round(stats.hit_rate, 4),
+        )
+
+    async def rpc_metrics_text(self, *, organization_id: UUID) -> str:
+        """Render the organization's gateway RPC metrics in Prometheus text format."""
+        labels = await self.organization_gateway_labels(organization_id)
+        return gateway_metrics.render_text(labels)
@@ -0,0 +1,100 @@
+"""Process-wide compiled Jinja templates for agent workspace files."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from jinja2 import (
+    Environment,
+    FileSystemLoader,
+    StrictUndefined,
+    TemplateNotFound,
+    select_autoescape,
+)
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCacheStats
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+TEMPLATES_ROOT = Path(__file__).resolve().parents[3] / "templates"
+
+
+class WorkspaceTemplates:
+    """Compiled file templates plus an LRU of compiled override templates."""
+
+    def __init__(self, root: Path, *, override_cache_size: int) -> None:
+        self.root = root
+        self.override_cache_size = override_cache_size
+        self.env = self._environment()
+        self._overrides: OrderedDict[str, Template] = OrderedDict()
+        self.override_hits = 0
+        self.override_misses = 0
+
+    def _environment(self) -> Environment:
+        return Environment(
+            loader=FileSystemLoader(self.root),
+            # Render markdown verbatim (HTML escaping makes it harder for agents to read).
+            autoescape=select_autoescape(default=False),
+            undefined=StrictUndefined,
+            keep_trailing_newline=True,
+            # Compiled templates stay cached for the process; skip per-render mtime checks.
+            auto_reload=False,
+            cache_size=-1,
+        )
+
+    def template(self, name: str) -> Template:
+        """Return the compiled template file `name`, compiling it on first use."""
+        try:
+            return self.env.get_template(name)
+        except TemplateNotFound as exc:
+            msg = f"Missing template file: {name}"
+            raise FileNotFoundError(msg) from exc
+
+    def from_source(self, source: str) -> Template:
+        """Return a compiled template for an override source, reusing earlier compiles."""
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        template = self._overrides.get(key)
+        if template is not None:
+            self._overrides.move_to_end(key)
+            self.override_hits += 1
+            return template
+        self.override_misses += 1
+        template = self.env.from_string(source)
+        if self.override_cache_size > 0:
+            self._overrides[key] = template
+            while len(self._overrides) > self.override_cache_size:
+                self._overrides.popitem(last=False)
+        return template
+
+    def warm(self) -> int:
+        """Compile every template file now; return how many were compiled."""
+        names = self.env.list_templates(filter_func=lambda name: name.endswith(".j2"))
+        for name in names:
+            self.env.get_template(name)
+        return len(names)
+
+    def override_stats(self) -> TTLCacheStats:
+        """Return override LRU size and hit/miss counters."""
+        return TTLCacheStats(
+            size=len(self._overrides),
+            hits=self.override_hits,
+            misses=self.override_misses,
+        )
+
+    def clear(self) -> None:
+        """Drop every compiled template, e.g. after editing templates in development."""
+        self.env = self._environment()
+        self._overrides.clear()
+        self.override_hits = 0
+        self.override_misses = 0
+
+
+workspace_templates = WorkspaceTemplates(
+    TEMPLATES_ROOT,
+    override_cache_size=settings.workspace_template_override_cache_size,
+)
@@ -5,15 +5,18 @@ from __future__ import annotations
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from fastapi import HTTPException, status
-from sqlalchemy import or_
+from sqlalchemy import event, or_
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import settings
 from app.core.time import utcnow
+from app.core.ttl_cache import TTLCache
 from app.db import crud
 from app.models.boards import Board
 from app.models.organization_board_access import OrganizationBoardAccess
@@ -28,6 +31,7 @@ if TYPE_CHECKING:
     from uuid import UUID
 
     from sqlalchemy.sql.elements import ColumnElement
+    from sqlmodel import SQLModel
 
     from app.schemas.organizations import (
         OrganizationBoardAccessSpec,
@@ -62,6 +66,22 @@ DEFAULT_INSTALLER_SKILL_PACKS = (
 ADMIN_ROLES = {"owner", "admin"}
 ROLE_RANK = {"member": 0, "admin": 1, "owner": 2}
 
+_ORG_ACCESS_CACHE_MAX_ENTRIES = 10_000
+_REQUEST_MEMO_KEY = "organization_access_memo"
+
+# Only granted decisions are cached, so a stale entry can at worst outlive a
+# revocation by the TTL; local mutations invalidate eagerly.
+_ORG_CONTEXT_CACHE: TTLCache[tuple[UUID, UUID], tuple[dict[str, Any], dict[str, Any]]] = TTLCache(
+    ttl_seconds=settings.org_access_cache_ttl_seconds,
+    max_entries=_ORG_ACCESS_CACHE_MAX_ENTRIES,
+)
+_BOARD_ACCESS_CACHE: TTLCache[tuple[UUID, UUID, UUID, bool], dict[str, Any]] = TTLCache(
+    ttl_seconds=settings.org_access_cache_ttl_seconds,
+    max_entries=_ORG_ACCESS_CACHE_MAX_ENTRIES,
+)
+
+_ModelT = TypeVar("_ModelT", bound="SQLModel")
+
 
 @dataclass(frozen=True)
 class OrganizationContext:
@@ -76,6 +96,85 @@ def is_org_admin(member: OrganizationMember) -> bool:
     return member.role in ADMIN_ROLES
 
 
+def _request_memo(session: AsyncSession) -> dict[tuple[object, ...], Any]:
+    """Return the per-request access memo stored on the request's session."""
+    memo: dict[tuple[object, ...], Any] = session.info.setdefault(_REQUEST_MEMO_KEY, {})
+    return memo
+
+
+async def _attach_snapshot(
+    session: AsyncSession,
+    model: type[_ModelT],
+    snapshot: dict[str, Any],
+) -> _ModelT:
+    row = model.model_validate(snapshot)
+    make_transient_to_detached(row)
+    # `load=False` attaches the cached row to this session without a SELECT.
+    return await session.merge(row, load=False)
+
+
+def invalidate_org_access_cache(
+    *,
+    user_id: UUID | None = None,
+    organization_id: UUID | None = None,
+    member_id: UUID | None = None,
+    session: AsyncSession | None = None,
+) -> None:
+    """Drop cached membership/board-access decisions matching any given id.
+
+    With no ids, everything is dropped. ORM updates/deletes of members,
+    organizations and board-access rows invalidate automatically; call this after
+    bulk `update_where`/`delete_where` statements, which bypass ORM events. Pass
+    `session` to also reset that request's memo.
+    """
+    if session is not None:
+        session.info.pop(_REQUEST_MEMO_KEY, None)
+    if user_id is None and organization_id is None and member_id is None:
+        _ORG_CONTEXT_CACHE.clear()
+        _BOARD_ACCESS_CACHE.clear()
+        return
+
+    def _matches(key_user_id: UUID, member: dict[str, Any]) -> bool:
+        return (
+            (user_id is not None and key_user_id == user_id)
+            or (organization_id is not None and member["organization_id"] == organization_id)
+            or (member_id is not None and member["id"] == member_id)
+        )
+
+    _ORG_CONTEXT_CACHE.pop_where(lambda key, value: _matches(key[0], value[1]))
+    _BOARD_ACCESS_CACHE.pop_where(lambda key, value: _matches(key[0], value))
+
+
+def _on_member_changed(
+    _mapper: object,
+    _connection: object,
+    target: OrganizationMember,
+) -> None:
+    invalidate_org_access_cache(user_id=target.user_id, member_id=target.id)
+
+
+def _on_organization_changed(
+    _mapper: object,
+    _connection: object,
+    target: Organization,
+) -> None:
+    invalidate_org_access_cache(organization_id=target.id)
+
+
+def _on_board_access_changed(
+    _mapper: object,
+    _connection: object,
+    target: OrganizationBoardAccess,
+) -> None:
+    invalidate_org_access_cache(member_id=target.organization_member_id)
+
+
+for _event_name in ("after_update", "after_delete"):
+    event.listen(OrganizationMember, _event_name, _on_member_changed)
+    event.listen(Organization, _event_name, _on_organization_changed)
+    event.listen(OrganizationBoardAccess, _event_name, _on_board_access_changed)
+
+
 async def get_member(
     session: AsyncSession,
     *,
@@ -353,6 +452,45 @@ async def ensure_member_for_user(
     return member
 
 
+async def resolve_org_context(
+    session: AsyncSession,
+    user: User,
+) -> OrganizationContext | None:
+    """Resolve the user's active organization and membership, with caching.
+
+    Results are memoized for the request and shared across requests for
+    `ORG_ACCESS_CACHE_TTL_SECONDS`, skipping the membership and organization reads.
+    """
+    memo = _request_memo(session)
+    if user.active_organization_id is not None:
+        key = (user.id, user.active_organization_id)
+        memoized: OrganizationContext | None = memo.get(("org", *key))
+        if memoized is not None:
+            return memoized
+        cached = _ORG_CONTEXT_CACHE.get(key)
+        if cached is not None:
+            org_snapshot, member_snapshot = cached
+            ctx = OrganizationContext(
+                organization=await _attach_snapshot(session, Organization, org_snapshot),
+                member=await _attach_snapshot(session, OrganizationMember, member_snapshot),
+            )
+            memo[("org", *key)] = ctx
+            return ctx
+
+    member = await get_active_membership(session, user)
+    if member is None:
+        member = await ensure_member_for_user(session, user)
+    organization = await Organization.objects.by_id(member.organization_id).first(session)
+    if organization is None:
+        return None
+    ctx = OrganizationContext(organization=organization, member=member)
+    key = (user.id, member.organization_id)
+    memo[("org", *key)] = ctx
+    if user.active_organization_id == member.organization_id:
+        _ORG_CONTEXT_CACHE.set(key, (organization.model_dump(), member.model_dump()))
+    return ctx
+
+
 def member_all_boards_read(member: OrganizationMember) -> bool:
     """Return whether the member has organization-wide read access."""
     return member.all_boards_read or member.all_boards_write
@@ -396,23 +534,40 @@ async def require_board_access(
     board: Board,
     write: bool,
 ) -> OrganizationMember:
-    """Require board access for a user and return matching membership."""
-    member = await get_member(
+    """Require board access for a user and return matching membership.
+
+    Granted decisions are memoized for the request and cached across requests
+    for `ORG_ACCESS_CACHE_TTL_SECONDS`; denials are always re-checked.
+    """
+    key = (user.id, board.organization_id, board.id, write)
+    memo = _request_memo(session)
+    memoized: OrganizationMember | None = memo.get(("board", *key))
+    if memoized is not None:
+        return memoized
+    cached = _BOARD_ACCESS_CACHE.get(key)
+    if cached is not None:
+        member = await _attach_snapshot(session, OrganizationMember, cached)
+        memo[("board", *key)] = member
+        return member
+
+    found = await get_member(
         session,
         user_id=user.id,
         organization_id=board.organization_id,
     )
-    if member is None:
+    if found is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="No org access",
         )
-    if not await has_board_access(session, member=member, board=board, write=write):
+    if not await has_board_access(session, member=found, board=board, write=write):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Board access denied",
         )
-    return member
+    memo[("board", *key)] = found
+    _BOARD_ACCESS_CACHE.set(key, found.model_dump())
+    return found
 
 
 def board_access_filter(
@@ -484,6 +639,7 @@ async def apply_member_access_update(
     update: OrganizationMemberAccessUpdate,
 ) -> None:
     """Replace explicit member board-access rows from an access update."""
+    invalidate_org_access_cache(member_id=member.id, session=session)
     now = utcnow()
     member.all_boards_read = update.all_boards_read
     member.all_boards_write = update.all_boards_write
@@ -521,6 +677,7 @@ async def apply_invite_board_access(
     entries: Iterable[OrganizationBoardAccessSpec],
 ) -> None:
     """Replace explicit invite board-access rows for an invite."""
+    invalidate_org_access_cache(organization_id=invite.organization_id, session=session)
     await crud.delete_where(
         session,
         OrganizationInviteBoardAccess,
@@ -567,6 +724,7 @@ async def apply_invite_to_member(
     invite: OrganizationInvite,
 ) -> None:
     """Apply invite role/access grants onto an existing organization member."""
+    invalidate_org_access_cache(member_id=member.id, session=session)
     now = utcnow()
     member_changed = False
     invite_role = normalize_role(invite.role or "member")
@@ -128,9 +128,15 @@ def enqueue_task(
     queue_name: str,
     *,
     redis_url: str | None = None,
+    delay_seconds: float = 0,
 ) -> bool:
-    """Persist a task envelope in a Redis list-backed queue."""
+    """Persist a task envelope in a Redis list-backed queue.
+
+    With `delay_seconds`, the task becomes visible to workers only after that delay.
+    """
     try:
+        if delay_seconds > 0:
+            return _schedule_for_later(task, queue_name, delay_seconds, redis_url=redis_url)
         client = _redis_client(redis_url=redis_url)
         client.lpush(queue_name, task.to_json())
         logger.info(
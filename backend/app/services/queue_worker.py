@@ -9,6 +9,12 @@ from dataclasses import dataclass
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.services.openclaw.notification_outbox import TASK_TYPE as NOTIFICATION_TASK_TYPE
+from app.services.openclaw.notification_outbox import (
+    process_agent_notification_task,
+    requeue_agent_notification_task,
+    sweep_agent_notifications,
+)
 from app.services.queue import QueuedTask, dequeue_task
 from app.services.webhooks.dispatch import (
     process_webhook_queue_task,
@@ -24,6 +30,8 @@ class _TaskHandler:
     handler: Callable[[QueuedTask], Awaitable[None]]
     attempts_to_delay: Callable[[int], float]
     requeue: Callable[[QueuedTask, float], bool]
+    # Pause for `rq_dispatch_throttle_seconds` after each task of this type.
+    throttle: bool = True
 
 
 _TASK_HANDLERS: dict[str, _TaskHandler] = {
@@ -35,6 +43,12 @@ _TASK_HANDLERS: dict[str, _TaskHandler] = {
         ),
         requeue=lambda task, delay: requeue_webhook_queue_task(task, delay_seconds=delay),
     ),
+    NOTIFICATION_TASK_TYPE: _TaskHandler(
+        handler=process_agent_notification_task,
+        attempts_to_delay=lambda attempts: 0.0,
+        requeue=requeue_agent_notification_task,
+        throttle=False,
+    ),
 }
 
 
@@ -103,7 +117,8 @@ async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
                         "attempt": task.attempts,
                     },
                 )
-        await asyncio.sleep(settings.rq_dispatch_throttle_seconds)
+        if handler.throttle:
+            await asyncio.sleep(settings.rq_dispatch_throttle_seconds)
 
     if processed > 0:
         logger.info("queue.worker.batch_complete", extra={"count": processed})
@@ -113,9 +128,11 @@ async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
 async def _run_worker_loop() -> None:
     while True:
         try:
+            # Bounded blocking so outbox retries and missed wake-ups are swept regularly.
+            await sweep_agent_notifications()
             await flush_queue(
                 block=True,
-                block_timeout=0,
+                block_timeout=settings.notification_outbox_poll_seconds,
             )
         except Exception:
             logger.exception(
@@ -0,0 +1,38 @@
+"""Add indexed agent token selector for constant-time agent auth.
+
+Revision ID: a1c4e7f2b9d3
+Revises: b497b348ebb4
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a1c4e7f2b9d3"
+down_revision = "b497b348ebb4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add agents.agent_token_selector with a unique lookup index."""
+    op.add_column(
+        "agents",
+        sa.Column("agent_token_selector", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_agents_agent_token_selector"),
+        "agents",
+        ["agent_token_selector"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Remove agents.agent_token_selector and its index."""
+    op.drop_index(op.f("ix_agents_agent_token_selector"), table_name="agents")
+    op.drop_column("agents", "agent_token_selector")
@@ -0,0 +1,37 @@
+"""Add disable_compression setting to gateways.
+
+Revision ID: a4c7e2d9f1b6
+Revises: f1c8d2e6b3a7
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a4c7e2d9f1b6"
+down_revision = "f1c8d2e6b3a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add gateway toggle to opt out of websocket compression."""
+    op.add_column(
+        "gateways",
+        sa.Column(
+            "disable_compression",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+        ),
+    )
+    op.alter_column("gateways", "disable_compression", server_default=None)
+
+
+def downgrade() -> None:
+    """Remove gateway toggle to opt out of websocket compression."""
+    op.drop_column("gateways", "disable_compression")
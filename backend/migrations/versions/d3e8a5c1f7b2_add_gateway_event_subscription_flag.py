@@ -0,0 +1,38 @@
+"""Add event_subscription_enabled flag to gateways.
+
+Revision ID: d3e8a5c1f7b2
+Revises: a1c4e7f2b9d3
+Create Date: 2026-10-17 06:45:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d3e8a5c1f7b2"
+down_revision = "a1c4e7f2b9d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add gateways.event_subscription_enabled column with default True."""
+    op.add_column(
+        "gateways",
+        sa.Column(
+            "event_subscription_enabled",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("true"),
+        ),
+    )
+    op.alter_column("gateways", "event_subscription_enabled", server_default=None)
+
+
+def downgrade() -> None:
+    """Remove gateways.event_subscription_enabled column."""
+    op.drop_column("gateways", "event_subscription_enabled")
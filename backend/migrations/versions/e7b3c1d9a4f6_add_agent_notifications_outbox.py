@@ -0,0 +1,56 @@
+"""Add agent_notifications outbox table.
+
+Revision ID: e7b3c1d9a4f6
+Revises: d3e8a5c1f7b2
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e7b3c1d9a4f6"
+down_revision = "d3e8a5c1f7b2"
+branch_labels = None
+depends_on = None
+
+_INDEXED_COLUMNS = ("board_id", "agent_id", "task_id", "status", "next_attempt_at")
+
+
+def upgrade() -> None:
+    """Create the agent notification outbox table."""
+    op.create_table(
+        "agent_notifications",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("agent_id", sa.Uuid(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=True),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("deliver", sa.Boolean(), nullable=False),
+        sa.Column("activity_event_type", sa.String(), nullable=True),
+        sa.Column("activity_message", sa.String(), nullable=True),
+        sa.Column("failure_message", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    for column in _INDEXED_COLUMNS:
+        op.create_index(
+            op.f(f"ix_agent_notifications_{column}"),
+            "agent_notifications",
+            [column],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Drop the agent notification outbox table."""
+    for column in reversed(_INDEXED_COLUMNS):
+        op.drop_index(op.f(f"ix_agent_notifications_{column}"), table_name="agent_notifications")
+    op.drop_table("agent_notifications")
@@ -0,0 +1,37 @@
+"""Add urgent flag to agent_notifications.
+
+Revision ID: f1c8d2e6b3a7
+Revises: e7b3c1d9a4f6
+Create Date: 2026-10-17 10:15:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f1c8d2e6b3a7"
+down_revision = "e7b3c1d9a4f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add agent_notifications.urgent column with default False."""
+    op.add_column(
+        "agent_notifications",
+        sa.Column(
+            "urgent",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+    )
+    op.alter_column("agent_notifications", "urgent", server_default=None)
+
+
+def downgrade() -> None:
+    """Remove agent_notifications.urgent column."""
+    op.drop_column("agent_notifications", "urgent")
@@ -0,0 +1,90 @@
+"""Micro-benchmark for building the device block of a gateway `connect` request.
+
+Compares the uncached path (read `device.json`, parse both PEMs, sign) with the
+process-wide `device_identity_holder` used by `_build_device_connect_payload`.
+Runs against a throwaway identity file so the real one is never touched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000, help="Payloads per variant")
+    return parser.parse_args()
+
+
+def _report(label: str, iterations: int, elapsed: float) -> None:
+    per_call_us = elapsed / iterations * 1_000_000
+    print(f"{label:<10} {iterations} payloads in {elapsed:.3f}s ({per_call_us:.1f} us/payload)")
+
+
+def main() -> int:
+    args = _parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["OPENCLAW_GATEWAY_DEVICE_IDENTITY_PATH"] = str(Path(tmp) / "device.json")
+
+        from app.services.openclaw.device_identity import (
+            build_device_auth_payload,
+            load_or_create_device_identity,
+            public_key_raw_base64url_from_pem,
+            sign_device_payload,
+        )
+        from app.services.openclaw.gateway_rpc import (
+            DEFAULT_GATEWAY_CLIENT_ID,
+            DEFAULT_GATEWAY_CLIENT_MODE,
+            GATEWAY_OPERATOR_SCOPES,
+            _build_device_connect_payload,
+        )
+
+        scopes = list(GATEWAY_OPERATOR_SCOPES)
+
+        def _uncached() -> dict[str, object]:
+            identity = load_or_create_device_identity()
+            payload = build_device_auth_payload(
+                device_id=identity.device_id,
+                client_id=DEFAULT_GATEWAY_CLIENT_ID,
+                client_mode=DEFAULT_GATEWAY_CLIENT_MODE,
+                role="operator",
+                scopes=scopes,
+                signed_at_ms=0,
+                token="token",
+                nonce="nonce",
+            )
+            return {
+                "id": identity.device_id,
+                "publicKey": public_key_raw_base64url_from_pem(identity.public_key_pem),
+                "signature": sign_device_payload(identity.private_key_pem, payload),
+            }
+
+        def _cached() -> dict[str, object]:
+            return _build_device_connect_payload(
+                client_id=DEFAULT_GATEWAY_CLIENT_ID,
+                client_mode=DEFAULT_GATEWAY_CLIENT_MODE,
+                role="operator",
+                scopes=scopes,
+                auth_token="token",
+                connect_nonce="nonce",
+            )
+
+        for label, build in (("uncached", _uncached), ("cached", _cached)):
+            build()
+            started = perf_counter()
+            for _ in range(args.iterations):
+                build()
+            _report(label, args.iterations, perf_counter() - started)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,370 @@
+"""Bandwidth and latency benchmark for gateway websocket compression.
+
+Runs gateway RPC workloads against the local fake gateway with permessage-deflate
+negotiated and with it disabled. Traffic goes through a TCP relay that counts
+wire bytes and can cap bandwidth to emulate a remote gateway on a slow link:
+
+- `files`: `agents.files.set` with the backend's markdown templates as content,
+  as sent by template syncs and agent provisioning.
+- `history`: `chat.history` reads of sessions holding `--history-messages`
+  markdown messages.
+
+Each row reports throughput, p50/p99 latency, payload bytes (request and response
+frames before compression, from `gateway_metrics`) and wire bytes seen by the
+relay. Pass `--bandwidth-kbps 1000` to emulate a 1 Mbit/s link.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from scripts.benchmark_gateway_rpc import (  # noqa: E402
+    _drive,
+    _percentile,
+    _reset_client_state,
+)
+from scripts.fake_gateway import FakeGatewayOptions, FakeOpenClawGateway  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+SCENARIOS = ("files", "history")
+TEMPLATES_DIR = BACKEND_ROOT / "templates"
+_BENCH_AGENT_ID = "bench"
+
+
+class LinkRelay:
+    """Local TCP relay that counts bytes in each direction and can cap bandwidth.
+
+    The cap is shared by all connections in a direction, like a single link.
+    """
+
+    def __init__(self, upstream_host: str, upstream_port: int, *, bandwidth_kbps: float = 0.0):
+        self.upstream_host = upstream_host
+        self.upstream_port = upstream_port
+        self.bandwidth_kbps = bandwidth_kbps
+        self.bytes_up = 0
+        self.bytes_down = 0
+        self.port = 0
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._links = {"up": asyncio.Lock(), "down": asyncio.Lock()}
+
+    @property
+    def url(self) -> str:
+        """Return the `ws://` URL clients should connect to."""
+        return f"ws://127.0.0.1:{self.port}"
+
+    async def __aenter__(self) -> LinkRelay:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _pipe(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        direction: str,
+    ) -> None:
+        try:
+            while chunk := await reader.read(65536):
+                if direction == "up":
+                    self.bytes_up += len(chunk)
+                else:
+                    self.bytes_down += len(chunk)
+                if self.bandwidth_kbps > 0:
+                    async with self._links[direction]:
+                        await asyncio.sleep(len(chunk) * 8 / (self.bandwidth_kbps * 1000))
+                writer.write(chunk)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        upstream_reader, upstream_writer = await asyncio.open_connection(
+            self.upstream_host,
+            self.upstream_port,
+        )
+        self._writers.update((writer, upstream_writer))
+        try:
+            await asyncio.gather(
+                self._pipe(reader, upstream_writer, "up"),
+                self._pipe(upstream_reader, writer, "down"),
+            )
+        finally:
+            self._writers.difference_update((writer, upstream_writer))
+
+
+@dataclass(frozen=True)
+class CompressionBenchmarkOptions:
+    """Load shape for one benchmark run."""
+
+    scenarios: tuple[str, ...] = SCENARIOS
+    operations: int = 200
+    concurrency: int = 8
+    history_messages: int = 50
+    bandwidth_kbps: float = 0.0
+    pool: bool = True
+    gateway: FakeGatewayOptions = FakeGatewayOptions()
+
+
+@dataclass(frozen=True)
+class CompressionBenchmarkResult:
+    """Throughput, latency and byte counts for one scenario and compression mode."""
+
+    scenario: str
+    compression: bool
+    operations: int
+    errors: int
+    elapsed_s: float
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    payload_bytes: int
+    wire_bytes: int
+
+    @property
+    def wire_ratio(self) -> float:
+        """Return wire bytes per payload byte."""
+        return self.wire_bytes / self.payload_bytes if self.payload_bytes else 0.0
+
+
+def template_files() -> dict[str, str]:
+    """Return the backend's markdown templates, keyed by workspace file name."""
+    return {
+        path.name.removesuffix(".j2").removeprefix("BOARD_"): path.read_text(encoding="utf-8")
+        for path in sorted(TEMPLATES_DIR.glob("*.md.j2"))
+    }
+
+
+def _seed_history(gateway: FakeOpenClawGateway, session_key: str, messages: int) -> None:
+    paragraphs = [
+        paragraph
+        for content in template_files().values()
+        for paragraph in content.split("\n\n")
+        if paragraph.strip()
+    ]
+    gateway.state.sessions[session_key] = {"key": session_key}
+    gateway.state.transcripts[session_key] = [
+        {
+            "id": uuid4().hex,
+            "role": "assistant" if index % 2 else "user",
+            "content": "\n\n".join(paragraphs[index % len(paragraphs) :][:3]),
+        }
+        for index in range(messages)
+    ]
+
+
+def _scenario_operation(
+    scenario: str,
+    gateway: FakeOpenClawGateway,
+    relay: LinkRelay,
+    options: CompressionBenchmarkOptions,
+) -> Callable[[int], Awaitable[None]]:
+    from app.services.openclaw.gateway_rpc import GatewayConfig, openclaw_call
+
+    config = GatewayConfig(
+        url=relay.url,
+        token=options.gateway.token,
+        disable_device_pairing=True,
+    )
+
+    if scenario == "files":
+        gateway.state.files[_BENCH_AGENT_ID] = {}
+        files = sorted(template_files().items())
+
+        async def _set_file(index: int) -> None:
+            name, content = files[index % len(files)]
+            await openclaw_call(
+                "agents.files.set",
+                {"agentId": _BENCH_AGENT_ID, "name": name, "content": content},
+                config=config,
+            )
+
+        return _set_file
+
+    session_keys = [f"agent:bench-{index}:main" for index in range(4)]
+    for session_key in session_keys:
+        _seed_history(gateway, session_key, options.history_messages)
+
+    async def _history(index: int) -> None:
+        await openclaw_call(
+            "chat.history",
+            {"sessionKey": session_keys[index % len(session_keys)], "limit": 1000},
+            config=config,
+        )
+
+    return _history
+
+
+def _payload_bytes(gateway_url: str) -> int:
+    from app.services.openclaw.gateway_metrics import gateway_metrics, gateway_metrics_label
+
+    label = gateway_metrics_label(gateway_url)
+    return sum(
+        series.bytes_sent + series.bytes_received
+        for series in gateway_metrics.requests()
+        if series.gateway_url == label
+    )
+
+
+async def _run_once(
+    scenario: str,
+    options: CompressionBenchmarkOptions,
+    *,
+    compression: bool,
+) -> CompressionBenchmarkResult:
+    from app.core.config import settings
+    from app.services.openclaw.gateway_metrics import gateway_metrics
+
+    settings.gateway_compression_enabled = compression
+    await _reset_client_state()
+    gateway_metrics.clear()
+    async with FakeOpenClawGateway(options.gateway) as gateway:
+        async with LinkRelay(
+            gateway.host,
+            gateway.port,
+            bandwidth_kbps=options.bandwidth_kbps,
+        ) as relay:
+            operation = _scenario_operation(scenario, gateway, relay, options)
+            latencies, errors, elapsed = await _drive(
+                options.operations,
+                options.concurrency,
+                operation,
+            )
+            await _reset_client_state()
+            latencies.sort()
+            return CompressionBenchmarkResult(
+                scenario=scenario,
+                compression=compression,
+                operations=options.operations,
+                errors=errors,
+                elapsed_s=round(elapsed, 4),
+                throughput=round(options.operations / elapsed, 1) if elapsed else 0.0,
+                p50_ms=round(_percentile(latencies, 0.5), 2),
+                p99_ms=round(_percentile(latencies, 0.99), 2),
+                payload_bytes=_payload_bytes(relay.url),
+                wire_bytes=relay.bytes_up + relay.bytes_down,
+            )
+
+
+async def run_compression_benchmarks(
+    options: CompressionBenchmarkOptions,
+) -> list[CompressionBenchmarkResult]:
+    """Run each selected scenario with and without compression."""
+    from app.core.config import settings
+
+    previous = (settings.gateway_pool_enabled, settings.gateway_compression_enabled)
+    settings.gateway_pool_enabled = options.pool
+    results: list[CompressionBenchmarkResult] = []
+    try:
+        for scenario in options.scenarios:
+            for compression in (False, True):
+                results.append(await _run_once(scenario, options, compression=compression))
+    finally:
+        settings.gateway_pool_enabled, settings.gateway_compression_enabled = previous
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        choices=[*SCENARIOS, "all"],
+        default="all",
+        help="Scenario to run (default: all)",
+    )
+    parser.add_argument("--operations", type=int, default=200, help="Calls per run")
+    parser.add_argument("--concurrency", type=int, default=8, help="Calls in flight")
+    parser.add_argument(
+        "--history-messages",
+        type=int,
+        default=50,
+        help="Messages per session returned by chat.history",
+    )
+    parser.add_argument(
+        "--bandwidth-kbps",
+        type=float,
+        default=0.0,
+        help="Cap the relayed link at this many kbit/s per direction (default: unlimited)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Gateway delay/request")
+    parser.add_argument(
+        "--pool",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Use pooled gateway connections (default: true)",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Keep gateway client logs")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args()
+
+
+def _print_table(results: Sequence[CompressionBenchmarkResult]) -> None:
+    print(
+        f"{'scenario':<8} {'deflate':>7} {'ops':>5} {'errors':>6} {'ops/s':>8} "
+        f"{'p50_ms':>8} {'p99_ms':>8} {'payload_kb':>10} {'wire_kb':>9} {'ratio':>6}",
+    )
+    for result in results:
+        print(
+            f"{result.scenario:<8} {'on' if result.compression else 'off':>7} "
+            f"{result.operations:>5} {result.errors:>6} {result.throughput:>8.1f} "
+            f"{result.p50_ms:>8.2f} {result.p99_ms:>8.2f} "
+            f"{result.payload_bytes / 1024:>10.1f} {result.wire_bytes / 1024:>9.1f} "
+            f"{result.wire_ratio:>6.2f}",
+        )
+
+
+def main() -> int:
+    args = _parse_args()
+    options = CompressionBenchmarkOptions(
+        scenarios=SCENARIOS if args.scenario == "all" else (args.scenario,),
+        operations=args.operations,
+        concurrency=args.concurrency,
+        history_messages=args.history_messages,
+        bandwidth_kbps=args.bandwidth_kbps,
+        pool=args.pool,
+        gateway=FakeGatewayOptions(latency_ms=args.latency_ms),
+    )
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+    results = asyncio.run(run_compression_benchmarks(options))
+    if args.json:
+        print(
+            json.dumps(
+                [
+                    {**asdict(result), "wire_ratio": round(result.wire_ratio, 3)}
+                    for result in results
+                ],
+                indent=2,
+            ),
+        )
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,322 @@
+"""Load benchmark for gateway RPC paths against the local fake gateway.
+
+Starts `scripts/fake_gateway.py` in-process and drives three paths at a fixed
+concurrency:
+
+- `call`: `openclaw_call("sessions.patch", ...)`, one raw RPC per operation.
+- `dispatch`: `GatewayDispatchService.send_agent_message`, i.e. ensure session
+  plus `chat.send` as used by every agent notification.
+- `provision`: `OpenClawGatewayProvisioner.apply_agent_lifecycle` for board
+  leads (agent upsert, heartbeat config patch, template files, wake message).
+
+Each scenario reports throughput, p50/p99 latency, and what the gateway saw
+(connections, handshakes, requests). Compare `--pool` with `--no-pool` to
+measure connection pooling, or add `--latency-ms` to emulate a remote gateway.
+
+Concurrent provisioning races on the read-modify-write `config.patch`; stale
+`baseHash` rejections show up as errors. Pass `--no-check-base-hash` to measure
+provisioning throughput without those conflicts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from scripts.fake_gateway import FakeGatewayOptions, FakeOpenClawGateway  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+SCENARIOS = ("call", "dispatch", "provision")
+
+
+@dataclass(frozen=True)
+class BenchmarkOptions:
+    """Load shape for one benchmark run."""
+
+    scenarios: tuple[str, ...] = SCENARIOS
+    operations: int = 500
+    agents: int = 50
+    concurrency: int = 32
+    sessions: int = 64
+    pool: bool = True
+    gateway: FakeGatewayOptions = FakeGatewayOptions()
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Throughput and latency for one scenario, plus the gateway's view of it."""
+
+    scenario: str
+    operations: int
+    errors: int
+    elapsed_s: float
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    connections: int
+    handshakes: int
+    requests: int
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def _drive(
+    operations: int,
+    concurrency: int,
+    operation: Callable[[int], Awaitable[None]],
+) -> tuple[list[float], int, float]:
+    """Run `operation(index)` for every index with at most `concurrency` in flight."""
+    from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+
+    latencies: list[float] = []
+    errors = 0
+    next_index = 0
+
+    async def _worker() -> None:
+        nonlocal errors, next_index
+        while next_index < operations:
+            index = next_index
+            next_index += 1
+            started_at = perf_counter()
+            try:
+                await operation(index)
+            except OpenClawGatewayError:
+                errors += 1
+            latencies.append((perf_counter() - started_at) * 1000)
+
+    started_at = perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(max(1, min(concurrency, operations)))))
+    return latencies, errors, perf_counter() - started_at
+
+
+async def _reset_client_state() -> None:
+    from app.services.openclaw.agent_file_digests import agent_file_digests
+    from app.services.openclaw.circuit_breaker import gateway_circuit_breakers
+    from app.services.openclaw.gateway_cache import gateway_response_cache
+    from app.services.openclaw.gateway_rpc import gateway_connection_pool
+    from app.services.openclaw.gateway_version_cache import gateway_version_cache
+    from app.services.openclaw.session_registry import known_sessions
+
+    await gateway_connection_pool.close()
+    gateway_circuit_breakers.clear()
+    gateway_response_cache.clear()
+    known_sessions.clear()
+    gateway_version_cache.clear()
+    agent_file_digests.clear()
+
+
+def _scenario_operation(
+    scenario: str,
+    gateway_url: str,
+    options: BenchmarkOptions,
+) -> tuple[int, Callable[[int], Awaitable[None]]]:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.models.agents import Agent
+    from app.models.boards import Board
+    from app.models.gateways import Gateway
+    from app.services.openclaw.gateway_dispatch import GatewayDispatchService
+    from app.services.openclaw.gateway_rpc import GatewayConfig, openclaw_call
+    from app.services.openclaw.provisioning import OpenClawGatewayProvisioner
+
+    config = GatewayConfig(
+        url=gateway_url,
+        token=options.gateway.token,
+        disable_device_pairing=True,
+    )
+
+    if scenario == "call":
+
+        async def _call(index: int) -> None:
+            await openclaw_call(
+                "sessions.patch",
+                {"key": f"agent:bench-{index % options.sessions}:main", "label": "Bench"},
+                config=config,
+            )
+
+        return options.operations, _call
+
+    if scenario == "dispatch":
+        # Message dispatch never touches the database; an unbound session suffices.
+        dispatch = GatewayDispatchService(AsyncSession())
+
+        async def _dispatch(index: int) -> None:
+            await dispatch.send_agent_message(
+                session_key=f"agent:bench-{index % options.sessions}:main",
+                config=config,
+                agent_name=f"Bench {index % options.sessions}",
+                message=f"TASK ASSIGNED\nBenchmark task {index}",
+            )
+
+        return options.operations, _dispatch
+
+    organization_id = uuid4()
+    gateway = Gateway(
+        id=uuid4(),
+        organization_id=organization_id,
+        name="Benchmark Gateway",
+        url=gateway_url,
+        token=options.gateway.token,
+        workspace_root="/tmp/openclaw-benchmark",
+        disable_device_pairing=True,
+    )
+    provisioner = OpenClawGatewayProvisioner()
+
+    async def _provision(index: int) -> None:
+        board = Board(
+            id=uuid4(),
+            organization_id=organization_id,
+            name=f"Benchmark Board {index}",
+            slug=f"benchmark-board-{index}",
+            gateway_id=gateway.id,
+        )
+        # Board leads skip the role-soul directory lookup, keeping the run offline.
+        agent = Agent(
+            id=uuid4(),
+            name=f"Lead {index}",
+            board_id=board.id,
+            gateway_id=gateway.id,
+            is_board_lead=True,
+        )
+        await provisioner.apply_agent_lifecycle(
+            agent=agent,
+            gateway=gateway,
+            board=board,
+            auth_token="benchmark-token",
+            user=None,
+            deliver_wakeup=False,
+        )
+
+    return options.agents, _provision
+
+
+async def run_benchmarks(options: BenchmarkOptions) -> list[BenchmarkResult]:
+    """Run the selected scenarios against a fresh fake gateway each."""
+    from app.core.config import settings
+
+    settings.gateway_pool_enabled = options.pool
+    results: list[BenchmarkResult] = []
+    for scenario in options.scenarios:
+        await _reset_client_state()
+        async with FakeOpenClawGateway(options.gateway) as gateway:
+            operations, operation = _scenario_operation(scenario, gateway.url, options)
+            latencies, errors, elapsed = await _drive(
+                operations,
+                options.concurrency,
+                operation,
+            )
+            await _reset_client_state()
+            latencies.sort()
+            results.append(
+                BenchmarkResult(
+                    scenario=scenario,
+                    operations=operations,
+                    errors=errors,
+                    elapsed_s=round(elapsed, 4),
+                    throughput=round(operations / elapsed, 1) if elapsed else 0.0,
+                    p50_ms=round(_percentile(latencies, 0.5), 2),
+                    p99_ms=round(_percentile(latencies, 0.99), 2),
+                    connections=gateway.stats.connections,
+                    handshakes=gateway.stats.handshakes,
+                    requests=sum(gateway.stats.requests.values()),
+                ),
+            )
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        choices=[*SCENARIOS, "all"],
+        default="all",
+        help="Scenario to run (default: all)",
+    )
+    parser.add_argument("--operations", type=int, default=500, help="Calls/dispatches to run")
+    parser.add_argument("--agents", type=int, default=50, help="Agents to provision")
+    parser.add_argument("--concurrency", type=int, default=32, help="Operations in flight")
+    parser.add_argument("--sessions", type=int, default=64, help="Distinct session keys")
+    parser.add_argument(
+        "--pool",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Use pooled gateway connections (default: true)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Gateway delay/request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Injected error fraction")
+    parser.add_argument("--seed", type=int, default=None, help="Failure injection RNG seed")
+    parser.add_argument(
+        "--check-base-hash",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reject stale config.patch baseHash values (default: true)",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Keep gateway client logs")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args()
+
+
+def _print_table(results: Sequence[BenchmarkResult]) -> None:
+    header = (
+        f"{'scenario':<10} {'ops':>6} {'errors':>6} {'elapsed_s':>9} {'ops/s':>9} "
+        f"{'p50_ms':>8} {'p99_ms':>8} {'conns':>6} {'hshakes':>7} {'requests':>8}"
+    )
+    print(header)
+    for result in results:
+        print(
+            f"{result.scenario:<10} {result.operations:>6} {result.errors:>6} "
+            f"{result.elapsed_s:>9.3f} {result.throughput:>9.1f} {result.p50_ms:>8.2f} "
+            f"{result.p99_ms:>8.2f} {result.connections:>6} {result.handshakes:>7} "
+            f"{result.requests:>8}",
+        )
+
+
+def main() -> int:
+    args = _parse_args()
+    options = BenchmarkOptions(
+        scenarios=SCENARIOS if args.scenario == "all" else (args.scenario,),
+        operations=args.operations,
+        agents=args.agents,
+        concurrency=args.concurrency,
+        sessions=args.sessions,
+        pool=args.pool,
+        gateway=FakeGatewayOptions(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            seed=args.seed,
+            check_base_hash=args.check_base_hash,
+        ),
+    )
+    if not args.verbose:
+        # Per-call warnings (injected errors, config conflicts) would drown the report.
+        logging.disable(logging.WARNING)
+    results = asyncio.run(run_benchmarks(options))
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
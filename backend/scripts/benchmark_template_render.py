@@ -0,0 +1,214 @@
+"""Benchmark agent workspace template rendering per agent.
+
+Renders the full workspace file set (`_render_agent_files`) for a synthetic
+board of agents, as a gateway template sync does, in two modes:
+
+- `cold`: compiled templates are dropped before every agent, reproducing the
+  previous behaviour of building a fresh Jinja environment per render.
+- `cached`: the process-wide `workspace_templates` environment, warmed once, with
+  identity/soul override templates served from its LRU.
+
+A fraction of agents (`--override-ratio`) carry `identity_template` and
+`soul_template` overrides drawn from `--distinct-overrides` shared sources, like
+boards whose agents were created from a few presets. Reports per-agent render
+time (mean, p50, p99) and total time for each mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from scripts.benchmark_gateway_rpc import _percentile  # noqa: E402
+
+if TYPE_CHECKING:
+    from app.models.agents import Agent
+
+MODES = ("cold", "cached")
+
+
+@dataclass(frozen=True)
+class RenderBenchmarkOptions:
+    """Shape of the synthetic board to render."""
+
+    agents: int = 200
+    lead_every: int = 10
+    override_ratio: float = 0.5
+    distinct_overrides: int = 4
+
+
+@dataclass(frozen=True)
+class RenderBenchmarkResult:
+    """Per-agent render timings for one mode."""
+
+    mode: str
+    agents: int
+    files: int
+    total_ms: float
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+
+
+def _override_source(kind: str, index: int) -> str:
+    return (
+        f"# {kind} preset {index}\n\n"
+        "You are {{ agent_name }}, working on {{ board_name }}.\n"
+        "{% if identity_role %}Role: {{ identity_role }}\n{% endif %}"
+        "Board objective: {{ board_objective or 'not set' }}\n"
+        "Session: {{ session_key }}\n"
+    )
+
+
+def _agents(options: RenderBenchmarkOptions) -> list[tuple[Agent, dict[str, str]]]:
+    from app.models.agents import Agent
+    from app.models.boards import Board
+    from app.models.gateways import Gateway
+    from app.services.openclaw.provisioning import _build_context
+
+    gateway = Gateway(
+        id=uuid4(),
+        organization_id=uuid4(),
+        name="Benchmark Gateway",
+        url="ws://127.0.0.1:18789",
+        workspace_root="/tmp/openclaw-benchmark",
+    )
+    board = Board(
+        id=uuid4(),
+        organization_id=gateway.organization_id,
+        name="Benchmark Board",
+        slug="benchmark-board",
+        gateway_id=gateway.id,
+        objective="Ship the quarterly release",
+    )
+    with_overrides = int(options.agents * options.override_ratio)
+    agents: list[tuple[Agent, dict[str, str]]] = []
+    for index in range(options.agents):
+        preset = index % max(1, options.distinct_overrides)
+        agent = Agent(
+            id=uuid4(),
+            name=f"Agent {index}",
+            board_id=board.id,
+            gateway_id=gateway.id,
+            is_board_lead=index % options.lead_every == 0,
+            openclaw_session_id=f"agent:bench-{index}:main",
+            identity_profile={"role": "Engineer", "communication_style": "concise"},
+            identity_template=(
+                _override_source("identity", preset) if index < with_overrides else None
+            ),
+            soul_template=_override_source("soul", preset) if index < with_overrides else None,
+        )
+        context = _build_context(agent, board, gateway, "benchmark-token", None)
+        context["directory_role_soul_markdown"] = ""
+        context["directory_role_soul_source_url"] = ""
+        agents.append((agent, context))
+    return agents
+
+
+def run_render_benchmark(options: RenderBenchmarkOptions) -> list[RenderBenchmarkResult]:
+    """Render every agent's workspace files once per mode."""
+    from app.services.openclaw.constants import (
+        BOARD_SHARED_TEMPLATE_MAP,
+        DEFAULT_GATEWAY_FILES,
+        LEAD_GATEWAY_FILES,
+        LEAD_TEMPLATE_MAP,
+    )
+    from app.services.openclaw.provisioning import _render_agent_files
+    from app.services.openclaw.workspace_templates import workspace_templates
+
+    agents = _agents(options)
+    lead_overrides = {**BOARD_SHARED_TEMPLATE_MAP, **LEAD_TEMPLATE_MAP}
+    results: list[RenderBenchmarkResult] = []
+    for mode in MODES:
+        workspace_templates.clear()
+        if mode == "cached":
+            workspace_templates.warm()
+        latencies: list[float] = []
+        files = 0
+        for agent, context in agents:
+            started_at = perf_counter()
+            if mode == "cold":
+                workspace_templates.clear()
+            rendered = _render_agent_files(
+                context,
+                agent,
+                set(LEAD_GATEWAY_FILES if agent.is_board_lead else DEFAULT_GATEWAY_FILES),
+                include_bootstrap=True,
+                template_overrides=(
+                    lead_overrides if agent.is_board_lead else BOARD_SHARED_TEMPLATE_MAP
+                ),
+            )
+            latencies.append((perf_counter() - started_at) * 1000)
+            files += len(rendered)
+        total = sum(latencies)
+        latencies.sort()
+        results.append(
+            RenderBenchmarkResult(
+                mode=mode,
+                agents=len(agents),
+                files=files,
+                total_ms=round(total, 2),
+                mean_ms=round(total / len(latencies), 3) if latencies else 0.0,
+                p50_ms=round(_percentile(latencies, 0.5), 3),
+                p99_ms=round(_percentile(latencies, 0.99), 3),
+            ),
+        )
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=200, help="Agents to render")
+    parser.add_argument("--lead-every", type=int, default=10, help="One board lead per N agents")
+    parser.add_argument(
+        "--override-ratio",
+        type=float,
+        default=0.5,
+        help="Fraction of agents with identity/soul template overrides",
+    )
+    parser.add_argument(
+        "--distinct-overrides",
+        type=int,
+        default=4,
+        help="Distinct override sources shared by those agents",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    results = run_render_benchmark(
+        RenderBenchmarkOptions(
+            agents=args.agents,
+            lead_every=max(1, args.lead_every),
+            override_ratio=args.override_ratio,
+            distinct_overrides=args.distinct_overrides,
+        ),
+    )
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+        return 0
+    print(
+        f"{'mode':<7} {'agents':>6} {'files':>6} {'total_ms':>10} "
+        f"{'mean_ms':>8} {'p50_ms':>8} {'p99_ms':>8}",
+    )
+    for result in results:
+        print(
+            f"{result.mode:<7} {result.agents:>6} {result.files:>6} {result.total_ms:>10.2f} "
+            f"{result.mean_ms:>8.3f} {result.p50_ms:>8.3f} {result.p99_ms:>8.3f}",
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
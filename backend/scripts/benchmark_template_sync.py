@@ -0,0 +1,283 @@
+"""Benchmark gateway template sync across worker counts.
+
+Seeds an in-memory SQLite database with one gateway, `--boards` boards (one lead
+each) and `--agents` agents in total. It then runs
+`OpenClawProvisioningService.sync_gateway_templates` against the local fake
+gateway once per `--workers` value. Every agent's TOOLS.md on the fake gateway
+holds an AUTH_TOKEN, so agents are synced without re-keying unless
+`--rotate-tokens` is passed.
+
+Each run starts from an empty file-digest cache, so every workspace file is
+written. An immediate re-sync of the unchanged fleet is then timed as well.
+Add `--latency-ms` to emulate a remote gateway.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+from scripts.benchmark_gateway_rpc import _reset_client_state  # noqa: E402
+from scripts.fake_gateway import FakeGatewayOptions, FakeOpenClawGateway  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.models.gateways import Gateway
+    from app.models.users import User
+    from app.schemas.gateways import GatewayTemplatesSyncResult
+
+
+@dataclass(frozen=True)
+class TemplateSyncBenchmarkOptions:
+    """Fleet shape and worker counts for one benchmark run."""
+
+    agents: int = 300
+    boards: int = 10
+    workers: tuple[int, ...] = (1, 8)
+    rotate_tokens: bool = False
+    gateway: FakeGatewayOptions = FakeGatewayOptions(latency_ms=5.0)
+
+
+@dataclass(frozen=True)
+class TemplateSyncBenchmarkResult:
+    """Outcome and timing of a full sync and an unchanged re-sync with N workers."""
+
+    workers: int
+    agents_updated: int
+    agents_skipped: int
+    errors: int
+    files_written: int
+    elapsed_s: float
+    agents_per_s: float
+    resync_s: float
+    resync_files_written: int
+    requests: int
+
+
+async def _seed(session: AsyncSession, options: TemplateSyncBenchmarkOptions) -> Gateway:
+    from app.models.agents import Agent
+    from app.models.boards import Board
+    from app.models.gateways import Gateway
+    from app.services.openclaw.provisioning import _session_key
+
+    gateway = Gateway(
+        organization_id=uuid4(),
+        name="Benchmark Gateway",
+        url="ws://127.0.0.1:0",
+        workspace_root="/tmp/openclaw-benchmark",
+    )
+    boards = [
+        Board(
+            organization_id=gateway.organization_id,
+            name=f"Board {index}",
+            slug=f"board-{index}",
+            gateway_id=gateway.id,
+        )
+        for index in range(max(1, options.boards))
+    ]
+    session.add(gateway)
+    session.add_all(boards)
+    for index in range(options.agents):
+        board = boards[index % len(boards)]
+        agent = Agent(
+            name=f"Agent {index}",
+            board_id=board.id,
+            gateway_id=gateway.id,
+            is_board_lead=index < len(boards),
+        )
+        agent.openclaw_session_id = _session_key(agent)
+        session.add(agent)
+    await session.commit()
+    return gateway
+
+
+async def _seed_gateway(session: AsyncSession, gateway: FakeOpenClawGateway) -> None:
+    from sqlmodel import select
+
+    from app.models.agents import Agent
+    from app.services.openclaw.internal.agent_key import agent_key
+
+    agents: Sequence[Agent] = (await session.exec(select(Agent))).all()
+    for agent in agents:
+        gateway.state.files[agent_key(agent)] = {
+            "TOOLS.md": f"AUTH_TOKEN={agent.id.hex}\n",
+        }
+
+
+def _warm_souls_directory() -> None:
+    """Serve role souls from a warm, non-matching sitemap instead of the network."""
+    from app.services import souls_directory
+
+    souls_directory._sitemap_cache["loaded_at"] = time.time()
+    souls_directory._sitemap_cache["refs"] = [
+        souls_directory.SoulRef(handle="benchmark", slug="placeholder"),
+    ]
+
+
+async def _sync(
+    session: AsyncSession,
+    gateway: Gateway,
+    user: User,
+    *,
+    workers: int,
+    rotate_tokens: bool,
+) -> tuple[GatewayTemplatesSyncResult, float]:
+    from app.services.openclaw.provisioning_db import (
+        GatewayTemplateSyncOptions,
+        OpenClawProvisioningService,
+    )
+
+    started_at = perf_counter()
+    result = await OpenClawProvisioningService(session).sync_gateway_templates(
+        gateway,
+        GatewayTemplateSyncOptions(
+            user=user,
+            include_main=False,
+            rotate_tokens=rotate_tokens,
+            concurrency=workers,
+        ),
+    )
+    return result, perf_counter() - started_at
+
+
+async def run_template_sync_benchmark(
+    options: TemplateSyncBenchmarkOptions,
+) -> list[TemplateSyncBenchmarkResult]:
+    """Sync the seeded fleet once per worker count, each against a fresh gateway."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel import SQLModel
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.models.users import User
+
+    _warm_souls_directory()
+    user = User(clerk_user_id="benchmark-owner", email="owner@example.com", name="Owner")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    results: list[TemplateSyncBenchmarkResult] = []
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            gateway = await _seed(session, options)
+            for workers in options.workers:
+                await _reset_client_state()
+                async with FakeOpenClawGateway(options.gateway) as fake:
+                    await _seed_gateway(session, fake)
+                    gateway.url = fake.url
+                    session.add(gateway)
+                    await session.commit()
+                    result, elapsed = await _sync(
+                        session,
+                        gateway,
+                        user,
+                        workers=workers,
+                        rotate_tokens=options.rotate_tokens,
+                    )
+                    resync, resync_elapsed = await _sync(
+                        session,
+                        gateway,
+                        user,
+                        workers=workers,
+                        rotate_tokens=False,
+                    )
+                    await _reset_client_state()
+                    results.append(
+                        TemplateSyncBenchmarkResult(
+                            workers=workers,
+                            agents_updated=result.agents_updated,
+                            agents_skipped=result.agents_skipped,
+                            errors=len(result.errors),
+                            files_written=result.files_written,
+                            elapsed_s=round(elapsed, 3),
+                            agents_per_s=(
+                                round(result.agents_updated / elapsed, 1) if elapsed else 0.0
+                            ),
+                            resync_s=round(resync_elapsed, 3),
+                            resync_files_written=resync.files_written,
+                            requests=sum(fake.stats.requests.values()),
+                        ),
+                    )
+    finally:
+        await engine.dispose()
+    return results
+
+
+def _parse_workers(value: str) -> tuple[int, ...]:
+    workers = tuple(int(part) for part in value.split(",") if part.strip())
+    if not workers or any(count < 1 for count in workers):
+        msg = "--workers takes a comma-separated list of positive integers"
+        raise argparse.ArgumentTypeError(msg)
+    return workers
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=300, help="Agents on the gateway")
+    parser.add_argument("--boards", type=int, default=10, help="Boards (one lead each)")
+    parser.add_argument(
+        "--workers",
+        type=_parse_workers,
+        default=(1, 8),
+        help="Comma-separated worker counts to compare (default: 1,8)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Gateway delay/request")
+    parser.add_argument(
+        "--rotate-tokens",
+        action="store_true",
+        help="Re-key every agent during the first sync",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Keep sync and client logs")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args()
+
+
+def _print_table(results: Sequence[TemplateSyncBenchmarkResult]) -> None:
+    print(
+        f"{'workers':>7} {'updated':>7} {'skipped':>7} {'errors':>6} {'files':>6} "
+        f"{'sync_s':>8} {'agents/s':>8} {'resync_s':>8} {'rewrites':>8} {'requests':>8}",
+    )
+    for result in results:
+        print(
+            f"{result.workers:>7} {result.agents_updated:>7} {result.agents_skipped:>7} "
+            f"{result.errors:>6} {result.files_written:>6} {result.elapsed_s:>8.2f} "
+            f"{result.agents_per_s:>8.1f} {result.resync_s:>8.2f} "
+            f"{result.resync_files_written:>8} {result.requests:>8}",
+        )
+
+
+def main() -> int:
+    args = _parse_args()
+    options = TemplateSyncBenchmarkOptions(
+        agents=args.agents,
+        boards=args.boards,
+        workers=args.workers,
+        rotate_tokens=args.rotate_tokens,
+        gateway=FakeGatewayOptions(latency_ms=args.latency_ms),
+    )
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+    results = asyncio.run(run_template_sync_benchmark(options))
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,479 @@
+"""Local stand-in for an OpenClaw gateway, for benchmarks and integration tests.
+
+Speaks the subset of the gateway WebSocket protocol used by `gateway_rpc.py`:
+the `connect.challenge` event and `connect` handshake, then request/response
+frames for `chat.*`, `sessions.*`, `agents.*`, `agents.files.*`, `config.*`,
+`status`, `health` and `models.list`. State lives in memory per server.
+
+Latency (fixed plus uniform jitter, optionally per method) and failures are
+injectable: `error_rate` answers requests with an error frame, `drop_rate`
+closes the socket instead of answering. Requests on one connection are served
+concurrently, like the real gateway.
+
+Run standalone with `python scripts/fake_gateway.py --port 18789`, or use
+`FakeOpenClawGateway` as an async context manager from Python.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+PROTOCOL_VERSION = 3
+DEFAULT_VERSION = "2026.2.9"
+
+
+class FakeGatewayError(Exception):
+    """Raised by a method handler to answer with an error frame."""
+
+
+@dataclass(frozen=True)
+class FakeGatewayOptions:
+    """Latency and failure injection settings for `FakeOpenClawGateway`."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    # Per-method latency overriding `latency_ms`, e.g. {"agents.files.set": 40}.
+    method_latency_ms: dict[str, float] = field(default_factory=dict)
+    # Fraction of requests answered with an injected error frame.
+    error_rate: float = 0.0
+    # Fraction of requests whose connection is closed without a response.
+    drop_rate: float = 0.0
+    # Methods that always fail.
+    fail_methods: frozenset[str] = frozenset()
+    # Reject config writes whose `baseHash` is stale, like the real gateway.
+    check_base_hash: bool = True
+    # Accept permessage-deflate when clients offer it.
+    compression: bool = True
+    # When set, `connect` requires this token.
+    token: str | None = None
+    version: str = DEFAULT_VERSION
+    seed: int | None = None
+
+
+@dataclass
+class FakeGatewayStats:
+    """Counters collected by a running fake gateway."""
+
+    connections: int = 0
+    handshakes: int = 0
+    requests: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+    dropped: int = 0
+    bytes_received: int = 0
+    bytes_sent: int = 0
+
+
+def _config_hash(config: dict[str, Any]) -> str:
+    raw = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _merge_patch(target: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(target)
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_patch(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _required_str(params: dict[str, Any], name: str) -> str:
+    value = params.get(name)
+    if isinstance(value, str) and value:
+        return value
+    msg = f"missing required param: {name}"
+    raise FakeGatewayError(msg)
+
+
+class FakeGatewayState:
+    """In-memory sessions, transcripts, agents, workspace files and config."""
+
+    def __init__(self, *, check_base_hash: bool = True) -> None:
+        self.check_base_hash = check_base_hash
+        self.sessions: dict[str, dict[str, Any]] = {}
+        self.transcripts: dict[str, list[dict[str, Any]]] = {}
+        self.agents: dict[str, dict[str, Any]] = {}
+        self.files: dict[str, dict[str, str]] = {}
+        self.config: dict[str, Any] = {"agents": {"list": []}}
+
+    def handlers(self) -> dict[str, Callable[[dict[str, Any]], object]]:
+        """Return the method table served by the fake gateway."""
+        return {
+            "status": self.status,
+            "health": lambda _params: {"ok": True},
+            "models.list": lambda _params: {"models": []},
+            "sessions.list": self.sessions_list,
+            "sessions.patch": self.sessions_patch,
+            "sessions.reset": self.sessions_reset,
+            "sessions.delete": self.sessions_delete,
+            "sessions.compact": self.sessions_reset,
+            "chat.send": self.chat_send,
+            "chat.history": self.chat_history,
+            "chat.abort": lambda _params: {"ok": True},
+            "agents.list": self.agents_list,
+            "agents.create": self.agents_create,
+            "agents.update": self.agents_update,
+            "agents.delete": self.agents_delete,
+            "agents.files.list": self.files_list,
+            "agents.files.get": self.files_get,
+            "agents.files.set": self.files_set,
+            "agents.files.delete": self.files_delete,
+            "config.get": self.config_get,
+            "config.set": self.config_write,
+            "config.patch": self.config_write,
+            "config.apply": self.config_write,
+        }
+
+    def status(self, params: dict[str, Any]) -> object:
+        del params
+        return {"sessions": {"count": len(self.sessions)}, "agents": len(self.agents)}
+
+    def sessions_list(self, params: dict[str, Any]) -> object:
+        del params
+        return {"sessions": list(self.sessions.values())}
+
+    def sessions_patch(self, params: dict[str, Any]) -> object:
+        key = _required_str(params, "key")
+        session = self.sessions.setdefault(key, {"key": key})
+        if isinstance(params.get("label"), str):
+            session["label"] = params["label"]
+        self.transcripts.setdefault(key, [])
+        return {"ok": True, "key": key}
+
+    def sessions_reset(self, params: dict[str, Any]) -> object:
+        key = _required_str(params, "key")
+        if key not in self.sessions:
+            msg = f"session not found: {key}"
+            raise FakeGatewayError(msg)
+        self.transcripts[key] = []
+        return {"ok": True, "key": key}
+
+    def sessions_delete(self, params: dict[str, Any]) -> object:
+        key = _required_str(params, "key")
+        if self.sessions.pop(key, None) is None:
+            msg = f"session not found: {key}"
+            raise FakeGatewayError(msg)
+        self.transcripts.pop(key, None)
+        return {"ok": True, "key": key}
+
+    def chat_send(self, params: dict[str, Any]) -> object:
+        key = _required_str(params, "sessionKey")
+        if key not in self.sessions:
+            msg = f"session not found: {key}"
+            raise FakeGatewayError(msg)
+        message = {
+            "id": uuid4().hex,
+            "role": "user",
+            "content": params.get("message", ""),
+        }
+        self.transcripts[key].append(message)
+        return {"runId": uuid4().hex, "status": "started"}
+
+    def chat_history(self, params: dict[str, Any]) -> object:
+        key = _required_str(params, "sessionKey")
+        messages = self.transcripts.get(key, [])
+        limit = params.get("limit")
+        if isinstance(limit, int) and limit > 0:
+            messages = messages[-limit:]
+        return {"sessionKey": key, "messages": list(messages)}
+
+    def agents_list(self, params: dict[str, Any]) -> object:
+        del params
+        return {"agents": list(self.agents.values())}
+
+    def agents_create(self, params: dict[str, Any]) -> object:
+        agent_id = _required_str(params, "name")
+        if agent_id in self.agents:
+            msg = f"agent already exists: {agent_id}"
+            raise FakeGatewayError(msg)
+        self.agents[agent_id] = {"id": agent_id, "workspace": params.get("workspace")}
+        self.files.setdefault(agent_id, {})
+        return {"ok": True, "agentId": agent_id}
+
+    def agents_update(self, params: dict[str, Any]) -> object:
+        agent_id = _required_str(params, "agentId")
+        agent = self.agents.get(agent_id)
+        if agent is None:
+            msg = f"agent not found: {agent_id}"
+            raise FakeGatewayError(msg)
+        agent.update({key: value for key, value in params.items() if key != "agentId"})
+        return {"ok": True, "agentId": agent_id}
+
+    def agents_delete(self, params: dict[str, Any]) -> object:
+        agent_id = _required_str(params, "agentId")
+        if self.agents.pop(agent_id, None) is None:
+            msg = f"agent not found: {agent_id}"
+            raise FakeGatewayError(msg)
+        self.files.pop(agent_id, None)
+        return {"ok": True, "agentId": agent_id}
+
+    def _agent_files(self, params: dict[str, Any]) -> tuple[str, dict[str, str]]:
+        agent_id = _required_str(params, "agentId")
+        files = self.files.get(agent_id)
+        if files is None:
+            msg = f"agent not found: {agent_id}"
+            raise FakeGatewayError(msg)
+        return agent_id, files
+
+    def files_list(self, params: dict[str, Any]) -> object:
+        agent_id, files = self._agent_files(params)
+        return {
+            "agentId": agent_id,
+            "files": [
+                {"name": name, "size": len(content.encode("utf-8")), "missing": False}
+                for name, content in sorted(files.items())
+            ],
+        }
+
+    def files_get(self, params: dict[str, Any]) -> object:
+        _, files = self._agent_files(params)
+        name = _required_str(params, "name")
+        if name not in files:
+            msg = f"file not found: {name}"
+            raise FakeGatewayError(msg)
+        return {"file": {"name": name, "content": files[name]}}
+
+    def files_set(self, params: dict[str, Any]) -> object:
+        _, files = self._agent_files(params)
+        name = _required_str(params, "name")
+        content = params.get("content")
+        files[name] = content if isinstance(content, str) else ""
+        return {"ok": True, "name": name}
+
+    def files_delete(self, params: dict[str, Any]) -> object:
+        _, files = self._agent_files(params)
+        name = _required_str(params, "name")
+        if files.pop(name, None) is None:
+            msg = f"file not found: {name}"
+            raise FakeGatewayError(msg)
+        return {"ok": True, "name": name}
+
+    def config_get(self, params: dict[str, Any]) -> object:
+        del params
+        return {"config": self.config, "hash": _config_hash(self.config)}
+
+    def config_write(self, params: dict[str, Any]) -> object:
+        base_hash = params.get("baseHash")
+        stale = isinstance(base_hash, str) and base_hash != _config_hash(self.config)
+        if stale and self.check_base_hash:
+            msg = "config changed since last load; re-run config.get"
+            raise FakeGatewayError(msg)
+        raw = params.get("raw")
+        patch = json.loads(raw) if isinstance(raw, str) else {}
+        if not isinstance(patch, dict):
+            msg = "config raw must be a JSON object"
+            raise FakeGatewayError(msg)
+        self.config = _merge_patch(self.config, patch)
+        return {"ok": True, "hash": _config_hash(self.config)}
+
+
+class FakeOpenClawGateway:
+    """WebSocket server emulating an OpenClaw gateway on a local port."""
+
+    def __init__(
+        self,
+        options: FakeGatewayOptions | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.options = options or FakeGatewayOptions()
+        self.host = host
+        self.port = port
+        self.state = FakeGatewayState(check_base_hash=self.options.check_base_hash)
+        self.stats = FakeGatewayStats()
+        self._handlers = self.state.handlers()
+        self._random = random.Random(self.options.seed)  # noqa: S311 - not security relevant
+        self._server: Server | None = None
+
+    @property
+    def url(self) -> str:
+        """Return the `ws://` URL clients should connect to."""
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """Start listening; with `port=0` an ephemeral port is chosen."""
+        self._server = await serve(
+            self._serve,
+            self.host,
+            self.port,
+            compression="deflate" if self.options.compression else None,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Close every connection and stop listening."""
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> FakeOpenClawGateway:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    async def _send(self, ws: ServerConnection, frame: dict[str, Any]) -> None:
+        raw = json.dumps(frame)
+        self.stats.bytes_sent += len(raw.encode("utf-8"))
+        await ws.send(raw)
+
+    async def _serve(self, ws: ServerConnection) -> None:
+        self.stats.connections += 1
+        tasks: set[asyncio.Task[None]] = set()
+        await self._send(
+            ws,
+            {"type": "event", "event": "connect.challenge", "payload": {"nonce": uuid4().hex}},
+        )
+        authenticated = False
+        try:
+            async for raw in ws:
+                self.stats.bytes_received += len(raw if isinstance(raw, bytes) else raw.encode())
+                data = json.loads(raw)
+                if not isinstance(data, dict) or data.get("type") != "req":
+                    continue
+                if not authenticated:
+                    authenticated = await self._handshake(ws, data)
+                    if not authenticated:
+                        return
+                    continue
+                task = asyncio.create_task(self._respond(ws, data))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except ConnectionClosed:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _handshake(self, ws: ServerConnection, data: dict[str, Any]) -> bool:
+        request_id = data.get("id")
+        params = data.get("params") or {}
+        if data.get("method") != "connect":
+            await self._send(ws, self._error(request_id, "connect required"))
+            return False
+        token = (params.get("auth") or {}).get("token")
+        if self.options.token is not None and token != self.options.token:
+            await self._send(ws, self._error(request_id, "unauthorized: gateway token mismatch"))
+            return False
+        self.stats.handshakes += 1
+        hello = {
+            "type": "hello-ok",
+            "protocol": PROTOCOL_VERSION,
+            "server": {"version": self.options.version, "connId": uuid4().hex},
+            "features": {"methods": sorted([*self._handlers, "connect"]), "events": []},
+        }
+        await self._send(ws, {"type": "res", "id": request_id, "ok": True, "payload": hello})
+        return True
+
+    @staticmethod
+    def _error(request_id: object, message: str) -> dict[str, Any]:
+        return {"type": "res", "id": request_id, "ok": False, "error": {"message": message}}
+
+    async def _respond(self, ws: ServerConnection, data: dict[str, Any]) -> None:
+        method = str(data.get("method"))
+        request_id = data.get("id")
+        params = data.get("params") or {}
+        self.stats.requests[method] += 1
+        options = self.options
+        delay_ms = options.method_latency_ms.get(method, options.latency_ms)
+        if options.jitter_ms:
+            delay_ms += self._random.uniform(0, options.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+        if options.drop_rate and self._random.random() < options.drop_rate:
+            self.stats.dropped += 1
+            await ws.close()
+            return
+        handler = self._handlers.get(method)
+        try:
+            if method in options.fail_methods or (
+                options.error_rate and self._random.random() < options.error_rate
+            ):
+                msg = f"injected failure: {method}"
+                raise FakeGatewayError(msg)
+            if handler is None:
+                msg = f"unknown method: {method}"
+                raise FakeGatewayError(msg)
+            payload = handler(params if isinstance(params, dict) else {})
+        except FakeGatewayError as exc:
+            self.stats.errors += 1
+            frame = self._error(request_id, str(exc))
+        else:
+            frame = {"type": "res", "id": request_id, "ok": True, "payload": payload}
+        try:
+            await self._send(ws, frame)
+        except ConnectionClosed:
+            pass
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18789)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of errors")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of drops")
+    parser.add_argument("--token", default=None, help="Require this gateway token")
+    parser.add_argument(
+        "--compression",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Accept permessage-deflate (default: true)",
+    )
+    parser.add_argument("--version", default=DEFAULT_VERSION, help="Reported server version")
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    options = FakeGatewayOptions(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        token=args.token,
+        compression=args.compression,
+        version=args.version,
+    )
+    async with FakeOpenClawGateway(options, host=args.host, port=args.port) as gateway:
+        print(f"fake OpenClaw gateway listening on {gateway.url}")
+        await asyncio.Future()
+
+
+def main() -> int:
+    try:
+        asyncio.run(_run(_parse_args()))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,56 +1,148 @@
 # ruff: noqa: INP001
-"""Regression test sketch for agent-token lookup complexity.
+"""Regression tests for agent-token lookup complexity.
 
-Context:
-- Current implementation performs PBKDF2 verification in a loop over *all* agents
-  that have a token hash (`agent_auth._find_agent_for_token`).
-- This is O(N_agents) *and* each verify is expensive (PBKDF2 200k iterations).
-
-This test is marked xfail to document the desired behavior after a hardening
-refactor: O(1) lookup + single hash verify.
-
-Once token lookup is refactored, flip this to a normal passing test.
+Agent tokens carry a public selector stored in an indexed column, so resolving a token
+must be a single row lookup plus at most one PBKDF2 verification regardless of how
+many agents exist. Pre-selector (legacy) tokens are matched once by scan and then
+indexed by a derived selector.
 """
 
 from __future__ import annotations
 
-from types import SimpleNamespace
+from uuid import uuid4
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import agent_auth
+from app.core.agent_token_cache import agent_token_cache
+from app.core.agent_tokens import (
+    agent_token_selector,
+    hash_agent_token,
+    legacy_agent_token_selector,
+    verify_agent_token,
+)
+from app.models.agents import Agent
+from app.services.openclaw.db_agent_state import mint_agent_token
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _count_verifies(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    calls = {"n": 0}
+
+    def _counting_verify(token: str, stored_hash: str) -> bool:
+        calls["n"] += 1
+        return verify_agent_token(token, stored_hash)
+
+    monkeypatch.setattr(agent_auth, "verify_agent_token", _counting_verify)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_minted_tokens_carry_selector() -> None:
+    agent = Agent(name="a", gateway_id=uuid4())
+    token = await mint_agent_token(agent)
+
+    assert agent.agent_token_selector is not None
+    assert agent_token_selector(token) == agent.agent_token_selector
+    assert agent.agent_token_hash is not None
+    assert verify_agent_token(token, agent.agent_token_hash)
+
+
+def test_legacy_tokens_have_no_selector() -> None:
+    assert agent_token_selector("legacytokenwithoutseparator") is None
+    assert agent_token_selector(".missing-selector") is None
+    assert agent_token_selector("missing-verifier.") is None
 
 
 @pytest.mark.asyncio
-@pytest.mark.xfail(
-    reason="Known DoS risk: agent token verification is currently O(N_agents)."
-    " Refactor token scheme/lookup to O(1) and make this pass.",
-    strict=False,
-)
 async def test_agent_token_lookup_should_not_verify_more_than_once(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    # Fake a session that returns many agents with token hashes.
-    class _FakeSession:
-        async def exec(self, _stmt: object) -> list[object]:
-            agents = []
-            for i in range(50):
-                agents.append(
-                    SimpleNamespace(agent_token_hash=f"pbkdf2_sha256$1$salt{i}$digest{i}")
-                )
-            return agents
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            tokens: list[str] = []
+            for i in range(20):
+                agent = Agent(name=f"agent-{i}", gateway_id=uuid4())
+                tokens.append(await mint_agent_token(agent))
+                session.add(agent)
+            await session.commit()
+            agent_token_cache.clear()
 
-    calls = {"n": 0}
+            calls = _count_verifies(monkeypatch)
+            found = await agent_auth._find_agent_for_token(session, tokens[-1])
+            assert found is not None
+            assert found.name == "agent-19"
+            assert calls["n"] == 1
 
-    def _fake_verify(_token: str, _stored_hash: str) -> bool:
-        calls["n"] += 1
-        # Always invalid
-        return False
+            selector = agent_token_selector(tokens[0])
+            assert selector is not None
+            assert await agent_auth._find_agent_for_token(session, f"{selector}.wrong") is None
+            assert await agent_auth._find_agent_for_token(session, "nope.invalid") is None
+            assert calls["n"] == 2
+    finally:
+        await engine.dispose()
 
-    monkeypatch.setattr(agent_auth, "verify_agent_token", _fake_verify)
 
-    out = await agent_auth._find_agent_for_token(_FakeSession(), "invalid")  # type: ignore[arg-type]
-    assert out is None
+@pytest.mark.asyncio
+async def test_legacy_token_is_indexed_after_first_match(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(agent_auth.settings, "agent_auth_legacy_token_scan", True)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            legacy_token = "legacy-token-without-selector"
+            session.add(
+                Agent(
+                    name="legacy",
+                    gateway_id=uuid4(),
+                    agent_token_hash=hash_agent_token(legacy_token),
+                ),
+            )
+            await session.commit()
+
+            found = await agent_auth._find_agent_for_token(session, legacy_token)
+            assert found is not None
+            assert found.agent_token_selector == legacy_agent_token_selector(legacy_token)
+
+            agent_token_cache.clear()
+            calls = _count_verifies(monkeypatch)
+            again = await agent_auth._find_agent_for_token(session, legacy_token)
+            assert again is not None
+            assert again.id == found.id
+            assert calls["n"] == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_legacy_scan_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(agent_auth.settings, "agent_auth_legacy_token_scan", False)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            for i in range(5):
+                session.add(
+                    Agent(
+                        name=f"legacy-{i}",
+                        gateway_id=uuid4(),
+                        agent_token_hash=hash_agent_token(f"legacy-{i}"),
+                    ),
+                )
+            await session.commit()
 
-    # Desired behavior after refactor: avoid linear scan.
-    assert calls["n"] <= 1
+            calls = _count_verifies(monkeypatch)
+            assert await agent_auth._find_agent_for_token(session, "legacy-0") is None
+            assert calls["n"] == 0
+    finally:
+        await engine.dispose()
@@ -45,6 +45,7 @@ class _GatewayStub:
     workspace_root: str
     allow_insecure_tls: bool = False
     disable_device_pairing: bool = False
+    disable_compression: bool = False
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,99 @@
+# ruff: noqa: INP001
+"""Tests for content-hash diff sync of agent workspace files."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import pytest
+
+import app.services.openclaw.provisioning as provisioning
+from app.models.agents import Agent
+from app.services.openclaw.agent_file_digests import (
+    AgentFileDigests,
+    agent_file_digests,
+    content_digest,
+)
+from app.services.openclaw.gateway_rpc import GatewayConfig, gateway_connection_pool
+from scripts.fake_gateway import FakeOpenClawGateway
+
+
+@dataclass
+class _GatewayStub:
+    id: UUID
+    url: str
+    workspace_root: str = "/tmp/openclaw"
+
+
+@pytest.fixture(autouse=True)
+def _clear_digests() -> Iterator[None]:
+    agent_file_digests.clear()
+    yield
+    agent_file_digests.clear()
+
+
+@pytest.mark.asyncio
+async def test_resync_writes_only_files_whose_content_changed() -> None:
+    rendered = {"AGENTS.md": "# Agents\n", "TOOLS.md": "AUTH_TOKEN=abc\n", "SOUL.md": "calm"}
+    async with FakeOpenClawGateway() as gateway:
+        gateway.state.files["lead-a"] = {"ROUTING.md": "old routing"}
+        control_plane = provisioning.OpenClawGatewayControlPlane(
+            GatewayConfig(url=gateway.url, disable_device_pairing=True),
+        )
+        manager = provisioning.BoardAgentLifecycleManager(
+            _GatewayStub(id=uuid4(), url=gateway.url),  # type: ignore[arg-type]
+            control_plane,
+        )
+        agent = Agent(name="Lead", board_id=uuid4(), is_board_lead=True)
+
+        async def _sync(
+            files: dict[str, str],
+            *,
+            overwrite: bool = False,
+        ) -> provisioning.AgentFileSyncStats:
+            return await manager._set_agent_files(
+                agent=agent,
+                agent_id="lead-a",
+                rendered=files,
+                existing_files=await control_plane.list_agent_files("lead-a"),
+                action="update",
+                overwrite=overwrite,
+            )
+
+        first = await _sync(rendered)
+        unchanged = await _sync(rendered)
+        edited = await _sync({**rendered, "SOUL.md": "curious"})
+        # A workspace edit on the gateway changes the reported size, so it is rewritten.
+        gateway.state.files["lead-a"]["TOOLS.md"] = "AUTH_TOKEN=tampered\n"
+        tampered = await _sync({**rendered, "SOUL.md": "curious"})
+        forced = await _sync({**rendered, "SOUL.md": "curious"}, overwrite=True)
+        await gateway_connection_pool.close()
+
+    assert (first.written, first.skipped, first.deleted) == (3, 0, 1)
+    assert (unchanged.written, unchanged.skipped, unchanged.deleted) == (0, 3, 0)
+    assert (edited.written, edited.skipped) == (1, 2)
+    assert (tampered.written, tampered.skipped) == (1, 2)
+    assert (forced.written, forced.skipped) == (3, 0)
+    assert gateway.state.files["lead-a"] == {**rendered, "SOUL.md": "curious"}
+    assert gateway.stats.requests["agents.files.set"] == 3 + 1 + 1 + 3
+
+
+def test_gateway_reported_hash_takes_precedence_over_remembered_digest() -> None:
+    digests = AgentFileDigests(ttl_seconds=60, max_entries=16)
+    digest = content_digest("hello")
+
+    assert digests.unchanged("gw", "a", "AGENTS.md", "hello", entry={"sha256": digest})
+    assert not digests.unchanged("gw", "a", "AGENTS.md", "hello", entry={"hash": "0" * 64})
+
+    digests.remember("gw", "a", "AGENTS.md", "hello")
+    digests.remember("gw", "a", "TOOLS.md", "tools")
+    digests.remember("gw", "b", "AGENTS.md", "hello")
+    assert digests.unchanged("gw", "a", "AGENTS.md", "hello", entry={"size": 5})
+    assert not digests.unchanged("gw", "a", "AGENTS.md", "hello", entry={"missing": True})
+    assert not digests.unchanged("gw", "a", "AGENTS.md", "hello", entry=None)
+
+    assert digests.forget("gw", "a") == 2
+    assert not digests.unchanged("gw", "a", "AGENTS.md", "hello", entry={"size": 5})
+    assert digests.unchanged("gw", "b", "AGENTS.md", "hello", entry={"size": 5})
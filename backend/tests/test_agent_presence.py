@@ -0,0 +1,166 @@
+# ruff: noqa: INP001
+"""Tests for write-behind agent presence buffering."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import agent_auth
+from app.core.agent_presence import AgentPresenceBuffer
+from app.core.time import utcnow
+from app.models.agents import Agent
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_flush_persists_buffered_touches_in_one_batch() -> None:
+    buffer = AgentPresenceBuffer()
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            online = Agent(name="a", gateway_id=uuid4(), status="provisioning")
+            updating = Agent(name="b", gateway_id=uuid4(), status="updating")
+            session.add(online)
+            session.add(updating)
+            await session.commit()
+
+            seen_at = utcnow()
+            buffer.record(online.id, seen_at - timedelta(seconds=5))
+            buffer.record(online.id, seen_at)
+            buffer.record(updating.id, seen_at)
+            assert await buffer.flush(session) == 2
+            assert len(buffer) == 0
+
+            await session.refresh(online)
+            await session.refresh(updating)
+            assert online.last_seen_at == seen_at
+            assert online.status == "online"
+            assert updating.last_seen_at == seen_at
+            assert updating.status == "updating"
+    finally:
+        await engine.dispose()
+
+
+def test_apply_merges_newer_buffered_presence() -> None:
+    buffer = AgentPresenceBuffer()
+    agent = Agent(name="a", gateway_id=uuid4(), status="offline")
+    agent.last_seen_at = utcnow() - timedelta(minutes=30)
+    seen_at = utcnow()
+    buffer.record(agent.id, seen_at)
+
+    assert buffer.agent_ids_seen_since(seen_at - timedelta(seconds=1)) == [agent.id]
+    buffer.apply(agent)
+    assert agent.last_seen_at == seen_at
+    assert agent.status == "online"
+
+
+def test_touch_buffers_instead_of_committing(monkeypatch: pytest.MonkeyPatch) -> None:
+    buffer = AgentPresenceBuffer()
+    monkeypatch.setattr(agent_auth, "agent_presence_buffer", buffer)
+    agent = Agent(name="a", gateway_id=uuid4(), status="provisioning")
+
+    agent_auth._touch_agent_presence(agent)
+    first_seen = buffer.last_seen(agent)
+    assert first_seen is not None
+    assert agent.status == "online"
+
+    # Within the touch interval the buffered value is reused.
+    agent_auth._touch_agent_presence(agent)
+    assert buffer.last_seen(agent) == first_seen
+    assert len(buffer) == 1
+
+
+@pytest.mark.asyncio
+async def test_touch_does_not_dirty_the_session_attached_agent(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    buffer = AgentPresenceBuffer()
+    monkeypatch.setattr(agent_auth, "agent_presence_buffer", buffer)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(name="a", gateway_id=uuid4(), status="provisioning")
+            session.add(agent)
+            await session.commit()
+
+            agent_auth._touch_agent_presence(agent)
+            assert agent.status == "online"
+            assert agent not in session.dirty
+            # A later commit in the same request writes only what the request changed.
+            agent.name = "renamed"
+            await session.commit()
+            await session.refresh(agent)
+            assert (agent.name, agent.status, agent.last_seen_at) == (
+                "renamed",
+                "provisioning",
+                None,
+            )
+
+            assert await buffer.flush(session) == 1
+            await session.refresh(agent)
+            assert agent.status == "online"
+            assert agent.last_seen_at is not None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_flush_loop_survives_unexpected_errors_and_keeps_pending_touches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    buffer = AgentPresenceBuffer()
+    # One shared connection, so every session sees the same in-memory database.
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    attempts = 0
+
+    def _session_factory() -> AsyncSession:
+        nonlocal attempts
+        attempts += 1
+        session = AsyncSession(engine, expire_on_commit=False)
+        if attempts == 1:
+
+            async def _boom(*args: object, **kwargs: object) -> None:
+                raise RuntimeError("unexpected")
+
+            monkeypatch.setattr(session, "exec", _boom)
+        return session
+
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(name="a", gateway_id=uuid4(), status="provisioning")
+            session.add(agent)
+            await session.commit()
+        buffer.record(agent.id, utcnow())
+
+        buffer.start(_session_factory, interval_seconds=0.01)
+
+        async def _drained() -> None:
+            while len(buffer):
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(_drained(), timeout=5)
+        await buffer.stop(_session_factory)
+
+        assert attempts >= 2
+        async with AsyncSession(engine) as session:
+            refreshed = await session.get(Agent, agent.id)
+            assert refreshed is not None
+            assert refreshed.status == "online"
+    finally:
+        await engine.dispose()
@@ -12,6 +12,7 @@ import app.services.openclaw.internal.agent_key as agent_key_mod
 import app.services.openclaw.provisioning as agent_provisioning
 from app.services.openclaw.provisioning_db import AgentLifecycleService
 from app.services.openclaw.shared import GatewayAgentIdentity
+from app.services.openclaw.workspace_templates import workspace_templates
 from app.services.souls_directory import SoulRef
 
 
@@ -72,7 +73,7 @@ def test_agent_lifecycle_workspace_path_preserves_tilde_in_workspace_root():
 
 
 def test_templates_root_points_to_repo_templates_dir():
-    root = agent_provisioning._templates_root()
+    root = workspace_templates.root
     assert root.name == "templates"
     assert root.parent.name == "backend"
     assert (root / "BOARD_AGENTS.md.j2").exists()
@@ -121,6 +122,7 @@ class _GatewayStub:
     workspace_root: str
     allow_insecure_tls: bool = False
     disable_device_pairing: bool = False
+    disable_compression: bool = False
 
 
 @pytest.mark.asyncio
@@ -466,8 +468,8 @@ async def test_set_agent_files_update_overwrite_writes_preserved_user_md():
 async def test_control_plane_upsert_agent_create_then_update(monkeypatch):
     calls: list[tuple[str, dict[str, object] | None]] = []
 
-    async def _fake_openclaw_call(method, params=None, config=None):
-        _ = config
+    async def _fake_openclaw_call(method, params=None, config=None, use_cache=True):
+        _ = config, use_cache
         calls.append((method, params))
         if method == "agents.create":
             return {"ok": True}
@@ -500,8 +502,8 @@ async def test_control_plane_upsert_agent_create_then_update(monkeypatch):
 async def test_control_plane_upsert_agent_handles_already_exists(monkeypatch):
     calls: list[tuple[str, dict[str, object] | None]] = []
 
-    async def _fake_openclaw_call(method, params=None, config=None):
-        _ = config
+    async def _fake_openclaw_call(method, params=None, config=None, use_cache=True):
+        _ = config, use_cache
         calls.append((method, params))
         if method == "agents.create":
             raise agent_provisioning.OpenClawGatewayError("already exists")
@@ -0,0 +1,123 @@
+# ruff: noqa: INP001
+"""Tests for the verified agent-token cache and its invalidation rules."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import agent_auth
+from app.core.agent_token_cache import AgentTokenCache, agent_token_cache
+from app.core.agent_tokens import verify_agent_token
+from app.models.agents import Agent
+from app.services.openclaw.db_agent_state import mint_agent_token
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _count_verifies(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    calls = {"n": 0}
+
+    def _counting_verify(token: str, stored_hash: str) -> bool:
+        calls["n"] += 1
+        return verify_agent_token(token, stored_hash)
+
+    monkeypatch.setattr(agent_auth, "verify_agent_token", _counting_verify)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_repeat_lookup_skips_hash_verification(monkeypatch: pytest.MonkeyPatch) -> None:
+    agent_token_cache.clear()
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(name="cached", gateway_id=uuid4())
+            token = await mint_agent_token(agent)
+            session.add(agent)
+            await session.commit()
+
+            calls = _count_verifies(monkeypatch)
+            assert await agent_auth._find_agent_for_token(session, token) is not None
+            assert await agent_auth._find_agent_for_token(session, token) is not None
+            assert calls["n"] == 1
+            assert agent_token_cache.hits == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rotation_invalidates_cached_token() -> None:
+    agent_token_cache.clear()
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(name="rotated", gateway_id=uuid4())
+            old_token = await mint_agent_token(agent)
+            session.add(agent)
+            await session.commit()
+            assert await agent_auth._find_agent_for_token(session, old_token) is not None
+
+            new_token = await mint_agent_token(agent)
+            session.add(agent)
+            await session.commit()
+
+            assert await agent_auth._find_agent_for_token(session, old_token) is None
+            assert await agent_auth._find_agent_for_token(session, new_token) is not None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_hash_change_elsewhere_invalidates_cached_token() -> None:
+    agent_token_cache.clear()
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(name="changed", gateway_id=uuid4())
+            token = await mint_agent_token(agent)
+            session.add(agent)
+            await session.commit()
+            assert await agent_auth._find_agent_for_token(session, token) is not None
+
+            # Simulate another worker re-keying the agent without local invalidation.
+            agent.agent_token_hash = "pbkdf2_sha256$1$c2FsdA$ZGlnZXN0"
+            session.add(agent)
+            await session.commit()
+
+            assert await agent_auth._find_agent_for_token(session, token) is None
+
+            await session.delete(agent)
+            await session.commit()
+            assert await agent_auth._find_agent_for_token(session, token) is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_and_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = AgentTokenCache(ttl_seconds=10.0, max_entries=2)
+    agents = [Agent(name=f"a{i}", gateway_id=uuid4(), agent_token_hash=f"h{i}") for i in range(3)]
+    for index, agent in enumerate(agents):
+        await cache.put(f"token-{index}", agent)
+
+    assert await cache.get("token-0") is None
+    assert await cache.get("token-2") is not None
+
+    cache.invalidate_agent(agents[2].id)
+    assert await cache.get("token-2") is None
+
+    now = 1000.0
+    monkeypatch.setattr("app.core.agent_token_cache.time.monotonic", lambda: now)
+    await cache.put("token-1", agents[1])
+    now += 11.0
+    assert await cache.get("token-1") is None
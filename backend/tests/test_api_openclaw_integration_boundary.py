@@ -34,7 +34,13 @@ def test_api_uses_safe_gateway_dispatch_helper() -> None:
     repo_root = Path(__file__).resolve().parents[2]
     api_root = repo_root / "backend" / "app" / "api"
 
-    forbidden = {"ensure_session", "send_message", "openclaw_call"}
+    forbidden = {
+        "ensure_session",
+        "send_message",
+        "ensure_session_and_send_message",
+        "openclaw_call",
+        "openclaw_batch",
+    }
     violations: list[str] = []
     for path in api_root.rglob("*.py"):
         rel = path.relative_to(repo_root)
@@ -0,0 +1,127 @@
+# ruff: noqa: INP001, SLF001
+"""Tests for cached Clerk claims and synced user rows."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from clerk_backend_api.security.types import AuthStatus, RequestState
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import auth
+from app.core.ttl_cache import TTLCache
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _request(token: str) -> Any:
+    return SimpleNamespace(headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.mark.asyncio
+async def test_verified_claims_are_cached_until_exp(monkeypatch: pytest.MonkeyPatch) -> None:
+    auth._CLAIMS_CACHE.clear()
+    calls = {"n": 0}
+    exp = {"value": time.time() + 60}
+
+    async def _fake_authenticate(_request: Any) -> RequestState:
+        calls["n"] += 1
+        return RequestState(
+            status=AuthStatus.SIGNED_IN,
+            token="t",
+            payload={"sub": "user_1", "exp": exp["value"]},
+        )
+
+    monkeypatch.setattr(auth, "_authenticate_clerk_request", _fake_authenticate)
+
+    first = await auth._verified_clerk_claims(_request("token-a"))
+    second = await auth._verified_clerk_claims(_request("token-a"))
+    assert first == second
+    assert calls["n"] == 1
+
+    exp["value"] = time.time() - 1
+    await auth._verified_clerk_claims(_request("token-b"))
+    await auth._verified_clerk_claims(_request("token-b"))
+    assert calls["n"] == 3
+
+
+@pytest.mark.asyncio
+async def test_signed_out_requests_are_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    auth._CLAIMS_CACHE.clear()
+    calls = {"n": 0}
+
+    async def _fake_authenticate(_request: Any) -> RequestState:
+        calls["n"] += 1
+        return RequestState(status=AuthStatus.SIGNED_OUT)
+
+    monkeypatch.setattr(auth, "_authenticate_clerk_request", _fake_authenticate)
+
+    assert await auth._verified_clerk_claims(_request("token-c")) is None
+    assert await auth._verified_clerk_claims(_request("token-c")) is None
+    assert calls["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_synced_user_row_is_cached_and_invalidated_on_update(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    auth.invalidate_user_cache()
+
+    async def _no_profile(_clerk_user_id: str) -> tuple[None, None]:
+        return None, None
+
+    monkeypatch.setattr(auth, "_fetch_clerk_profile", _no_profile)
+    claims: dict[str, object] = {"sub": "user_2", "email": "u@example.com", "name": "U"}
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            user = await auth._resolve_clerk_user(session, clerk_user_id="user_2", claims=claims)
+
+        real_sync = auth._get_or_sync_user
+
+        async def _boom(*_args: Any, **_kwargs: Any) -> Any:
+            raise AssertionError("user sync should be served from cache")
+
+        monkeypatch.setattr(auth, "_get_or_sync_user", _boom)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            cached = await auth._resolve_clerk_user(session, clerk_user_id="user_2", claims=claims)
+            assert cached.id == user.id
+            assert cached.email == "u@example.com"
+
+            cached.name = "Renamed"
+            session.add(cached)
+            await session.commit()
+
+        monkeypatch.setattr(auth, "_get_or_sync_user", real_sync)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            fresh = await auth._resolve_clerk_user(session, clerk_user_id="user_2", claims=claims)
+            assert fresh.name == "Renamed"
+    finally:
+        auth.invalidate_user_cache()
+        await engine.dispose()
+
+
+def test_ttl_cache_caps_entry_ttl_and_evicts_lru(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("app.core.ttl_cache.time.monotonic", lambda: now)
+    cache: TTLCache[str, int] = TTLCache(ttl_seconds=10.0, max_entries=2)
+
+    cache.set("a", 1, ttl_seconds=60.0)
+    cache.set("b", 2, ttl_seconds=1.0)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+
+    now += 11.0
+    assert cache.get("a") is None
+    assert cache.stats().hits == 1
@@ -0,0 +1,99 @@
+# ruff: noqa: INP001
+"""Tests for header-directed actor authentication in API dependencies."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import deps
+from app.core.agent_auth import AgentAuthContext
+from app.core.auth import AuthContext
+from app.core.auth_metrics import auth_metrics
+from app.models.agents import Agent
+from app.models.users import User
+
+
+def _request(headers: dict[str, str]) -> Any:
+    return SimpleNamespace(
+        headers=headers,
+        scope={"route": SimpleNamespace(path="/api/v1/boards/{board_id}")},
+    )
+
+
+@pytest.mark.asyncio
+async def test_agent_header_runs_only_agent_authenticator(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    auth_metrics.reset()
+    agent = Agent(name="a", gateway_id=uuid4())
+
+    async def _agent_auth(**_kwargs: Any) -> AgentAuthContext:
+        return AgentAuthContext(actor_type="agent", agent=agent)
+
+    async def _boom(**_kwargs: Any) -> Any:  # pragma: no cover
+        raise AssertionError("user auth should not run for agent requests")
+
+    monkeypatch.setattr(deps, "get_agent_auth_context_optional", _agent_auth)
+    monkeypatch.setattr(deps, "get_auth_context_optional", _boom)
+
+    actor = await deps.resolve_actor_optional(
+        _request({"X-Agent-Token": "token", "Authorization": "Bearer x"}),
+        session=None,  # type: ignore[arg-type]
+    )
+
+    assert actor is not None
+    assert actor.actor_type == "agent"
+    [sample] = auth_metrics.snapshot()
+    assert sample.path == "/api/v1/boards/{board_id}"
+    assert sample.authenticator == "agent"
+    assert sample.count == 1
+    assert sample.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_user_request_skips_agent_authenticator(monkeypatch: pytest.MonkeyPatch) -> None:
+    auth_metrics.reset()
+
+    async def _user_auth(**_kwargs: Any) -> AuthContext | None:
+        return None
+
+    async def _boom(**_kwargs: Any) -> Any:  # pragma: no cover
+        raise AssertionError("agent auth should not run for user requests")
+
+    monkeypatch.setattr(deps, "get_agent_auth_context_optional", _boom)
+    monkeypatch.setattr(deps, "get_auth_context_optional", _user_auth)
+
+    actor = await deps.resolve_actor_optional(
+        _request({"Authorization": "Bearer x"}),
+        session=None,  # type: ignore[arg-type]
+    )
+    assert actor is None
+    with pytest.raises(HTTPException) as exc:
+        deps.require_admin_or_agent(actor)
+    assert exc.value.status_code == 401
+
+    [sample] = auth_metrics.snapshot()
+    assert sample.authenticator == "user"
+    assert sample.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_user_actor_is_returned(monkeypatch: pytest.MonkeyPatch) -> None:
+    user = User(clerk_user_id="u1")
+
+    async def _user_auth(**_kwargs: Any) -> AuthContext:
+        return AuthContext(actor_type="user", user=user)
+
+    monkeypatch.setattr(deps, "get_auth_context_optional", _user_auth)
+
+    actor = await deps.resolve_actor_optional(
+        _request({}),
+        session=None,  # type: ignore[arg-type]
+    )
+    assert actor is not None
+    assert deps.require_admin_or_agent(actor).user is user
@@ -0,0 +1,69 @@
+# ruff: noqa: INP001
+"""Tests for the local fake gateway and the RPC load benchmark built on it."""
+
+from __future__ import annotations
+
+import pytest
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
+from app.services.openclaw.gateway_rpc import (
+    GatewayConfig,
+    OpenClawGatewayError,
+    openclaw_call,
+)
+from scripts.benchmark_gateway_rpc import BenchmarkOptions, run_benchmarks
+from scripts.fake_gateway import FakeGatewayOptions, FakeOpenClawGateway
+
+
+@pytest.mark.asyncio
+async def test_fake_gateway_speaks_the_protocol_and_injects_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_pool_enabled", False)
+    options = FakeGatewayOptions(token="secret", fail_methods=frozenset({"health"}))
+    async with FakeOpenClawGateway(options) as gateway:
+        config = GatewayConfig(url=gateway.url, token="secret", disable_device_pairing=True)
+        await openclaw_call("sessions.patch", {"key": "agent:a:main"}, config=config)
+        await openclaw_call(
+            "chat.send",
+            {"sessionKey": "agent:a:main", "message": "hi", "deliver": False},
+            config=config,
+        )
+        history = await openclaw_call(
+            "chat.history",
+            {"sessionKey": "agent:a:main", "limit": 10},
+            config=config,
+        )
+        with pytest.raises(OpenClawGatewayError, match="injected failure"):
+            await openclaw_call("health", config=config)
+        with pytest.raises(OpenClawGatewayError, match="token mismatch"):
+            await openclaw_call(
+                "status",
+                config=GatewayConfig(url=gateway.url, token="wrong", disable_device_pairing=True),
+            )
+
+    assert isinstance(history, dict)
+    assert [message["content"] for message in history["messages"]] == ["hi"]
+    assert gateway.stats.connections == 5
+    assert gateway.stats.handshakes == 4
+    assert gateway.stats.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_benchmark_reuses_pooled_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_pool_enabled", True)
+    results = await run_benchmarks(
+        BenchmarkOptions(
+            operations=40,
+            agents=4,
+            concurrency=8,
+            sessions=8,
+            gateway=FakeGatewayOptions(check_base_hash=False),
+        ),
+    )
+
+    assert [result.scenario for result in results] == ["call", "dispatch", "provision"]
+    for result in results:
+        assert result.errors == 0
+        assert result.handshakes <= gateway_rpc.settings.gateway_pool_max_connections
+        assert result.requests >= result.operations
@@ -0,0 +1,177 @@
+# ruff: noqa: INP001
+"""Tests for the incremental, paged gateway chat history cache."""
+
+from __future__ import annotations
+
+import pytest
+
+import app.services.openclaw.session_service as session_service
+from app.services.openclaw.chat_history_cache import ChatHistoryCache
+from app.services.openclaw.gateway_rpc import GatewayConfig
+from app.services.openclaw.session_service import GatewaySessionService
+
+CONFIG = GatewayConfig(url="ws://gateway.example/ws", token="secret")
+
+
+class _FakeTranscript:
+    def __init__(self, count: int) -> None:
+        self.messages: list[object] = [{"id": f"m{index}"} for index in range(count)]
+        self.limits: list[int] = []
+
+    def append(self, count: int) -> None:
+        start = len(self.messages)
+        self.messages.extend({"id": f"m{index}"} for index in range(start, start + count))
+
+    async def fetch(self, limit: int) -> list[object]:
+        self.limits.append(limit)
+        return self.messages[-limit:]
+
+
+def _cache(**overrides: float) -> ChatHistoryCache:
+    options: dict[str, float] = {
+        "max_sessions": 8,
+        "max_messages": 100,
+        "ttl_seconds": 60,
+        "fresh_seconds": 0,
+        "tail_size": 5,
+    }
+    options.update(overrides)
+    return ChatHistoryCache(
+        max_sessions=int(options["max_sessions"]),
+        max_messages=int(options["max_messages"]),
+        ttl_seconds=options["ttl_seconds"],
+        fresh_seconds=options["fresh_seconds"],
+        tail_size=int(options["tail_size"]),
+    )
+
+
+def _ids(messages: list[object]) -> list[str]:
+    return [message["id"] for message in messages if isinstance(message, dict)]
+
+
+@pytest.mark.asyncio
+async def test_refresh_fetches_only_a_tail_and_widens_it_for_large_gaps() -> None:
+    cache = _cache()
+    transcript = _FakeTranscript(30)
+
+    first = await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+    transcript.append(2)
+    second = await cache.read("main", config=CONFIG, fetch=transcript.fetch, after=30)
+    transcript.append(12)
+    third = await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+
+    assert len(first.messages) == 30
+    assert _ids(second.messages) == ["m30", "m31"]
+    assert second.after_cursor == 32
+    assert len(third.messages) == 44
+    assert _ids(third.messages)[-1] == "m43"
+    assert transcript.limits == [100, 5, 5, 20]
+    stats = cache.stats()
+    assert (stats.misses, stats.incremental, stats.hits) == (1, 2, 0)
+    assert stats.messages == 44
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_refresh_replaces_overlapping_messages_updated_under_the_same_id() -> None:
+    cache = _cache()
+    transcript = _FakeTranscript(10)
+    transcript.messages[-1] = {"id": "m9", "text": "Thinking"}
+
+    await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+    # The streamed reply finished and a new message followed it.
+    transcript.messages[-1] = {"id": "m9", "text": "Done."}
+    transcript.append(1)
+    page = await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+
+    assert page.messages == transcript.messages
+    assert (page.before_cursor, page.after_cursor) == (0, 11)
+    assert cache.stats().incremental == 1
+
+
+@pytest.mark.asyncio
+async def test_pages_backwards_from_cache_and_bounds_messages_per_session() -> None:
+    cache = _cache(max_messages=20, fresh_seconds=60)
+    transcript = _FakeTranscript(50)
+
+    newest = await cache.read("main", config=CONFIG, fetch=transcript.fetch, limit=8)
+    older = await cache.read(
+        "main",
+        config=CONFIG,
+        fetch=transcript.fetch,
+        limit=8,
+        before=newest.before_cursor,
+    )
+    oldest = await cache.read(
+        "main",
+        config=CONFIG,
+        fetch=transcript.fetch,
+        limit=8,
+        before=older.before_cursor,
+    )
+
+    assert _ids(newest.messages) == [f"m{index}" for index in range(42, 50)]
+    assert newest.has_more
+    assert _ids(older.messages) == [f"m{index}" for index in range(34, 42)]
+    assert _ids(oldest.messages) == [f"m{index}" for index in range(30, 34)]
+    assert not oldest.has_more
+    assert transcript.limits == [20]
+    assert cache.stats().hits == 2
+
+
+@pytest.mark.asyncio
+async def test_reset_transcripts_replace_cache_and_send_marks_it_stale() -> None:
+    cache = _cache(fresh_seconds=60)
+    transcript = _FakeTranscript(10)
+
+    await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+    transcript.append(1)
+    stale = await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+    cache.mark_stale_after("chat.send", {"sessionKey": "main"}, config=CONFIG)
+    fresh = await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+
+    transcript.messages = [{"id": "r0"}, {"id": "r1"}]
+    cache.mark_stale_after("chat.send", {"sessionKey": "main"}, config=CONFIG)
+    reset = await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+    cache.mark_stale_after("sessions.delete", {"key": "main"}, config=CONFIG)
+
+    assert len(stale.messages) == 10
+    assert len(fresh.messages) == 11
+    assert _ids(reset.messages) == ["r0", "r1"]
+    # Numbering continues past the replaced transcript so old cursors stay unambiguous.
+    assert (reset.before_cursor, reset.after_cursor) == (11, 13)
+    assert cache.stats().sessions == 0
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_cached_per_gateway_token() -> None:
+    cache = _cache(fresh_seconds=60)
+    transcript = _FakeTranscript(10)
+    other_token = GatewayConfig(url=CONFIG.url, token="other")
+
+    await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+    # A backward page for another token is not served from the first token's entry.
+    page = await cache.read("main", config=other_token, fetch=transcript.fetch, before=5)
+    cache.mark_stale_after("sessions.delete", {"key": "main"}, config=other_token)
+    cached = await cache.read("main", config=CONFIG, fetch=transcript.fetch, before=5)
+
+    assert transcript.limits == [100, 100]
+    assert _ids(page.messages) == _ids(cached.messages)
+    assert cache.stats().sessions == 1
+
+
+@pytest.mark.asyncio
+async def test_chat_history_metrics_report_this_workers_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = _cache(fresh_seconds=60)
+    monkeypatch.setattr(session_service, "chat_history_cache", cache)
+    transcript = _FakeTranscript(10)
+
+    await cache.read("main", config=CONFIG, fetch=transcript.fetch)
+    await cache.read("main", config=CONFIG, fetch=transcript.fetch, before=5)
+    metrics = GatewaySessionService.chat_history_metrics()
+
+    assert (metrics.sessions, metrics.messages) == (1, 10)
+    assert (metrics.hits, metrics.incremental, metrics.misses) == (1, 0, 1)
+    assert metrics.hit_rate == 0.5
@@ -0,0 +1,137 @@
+# ruff: noqa: INP001
+"""Tests for per-gateway circuit breakers around gateway RPC calls."""
+
+from __future__ import annotations
+
+import time
+from uuid import uuid4
+
+import pytest
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
+from app.api.gateways import _gateway_read
+from app.core.time import utcnow
+from app.models.gateways import Gateway
+from app.services.openclaw.circuit_breaker import (
+    GatewayCircuitBreaker,
+    GatewayCircuitBreakerRegistry,
+)
+from app.services.openclaw.gateway_rpc import (
+    GatewayCircuitOpenError,
+    GatewayConfig,
+    OpenClawGatewayError,
+    openclaw_call,
+)
+from app.services.openclaw.internal.retry import _is_transient_gateway_error
+
+
+def test_breaker_opens_at_threshold_and_probes_once_half_open() -> None:
+    breaker = GatewayCircuitBreaker("ws://gw", failure_threshold=2, open_seconds=0.05)
+
+    assert breaker.allow()
+    breaker.record_failure("connection refused")
+    assert breaker.state == "closed"
+    breaker.record_failure("connection refused")
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+
+    breaker.record_failure("connection refused")
+    assert breaker.state == "open"
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success(0.01)
+
+    snapshot = breaker.snapshot()
+    assert snapshot.state == "closed"
+    assert snapshot.consecutive_failures == 0
+    assert snapshot.total_failures == 3
+    assert snapshot.total_rejected == 2
+    assert snapshot.latency_ms == 10.0
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_without_contacting_gateway(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registry = GatewayCircuitBreakerRegistry(failure_threshold=2, open_seconds=60)
+    monkeypatch.setattr(gateway_rpc, "gateway_circuit_breakers", registry)
+    attempts = 0
+
+    async def _refused(
+        method: str,
+        params: dict[str, object] | None,
+        *,
+        config: GatewayConfig,
+        gateway_url: str,
+    ) -> object:
+        nonlocal attempts
+        del method, params, config, gateway_url
+        attempts += 1
+        raise ConnectionRefusedError("[Errno 111] Connect call failed")
+
+    monkeypatch.setattr(gateway_rpc, "_openclaw_call_once", _refused)
+    config = GatewayConfig(url="ws://down.example/ws")
+
+    for _ in range(2):
+        with pytest.raises(OpenClawGatewayError):
+            await openclaw_call("chat.send", {"sessionKey": "s"}, config=config)
+    with pytest.raises(GatewayCircuitOpenError, match="Connect call failed") as excinfo:
+        await openclaw_call("chat.send", {"sessionKey": "s"}, config=config)
+
+    assert attempts == 2
+    assert registry.snapshot(config.url).state == "open"
+    assert registry.snapshot("ws://other.example/ws").state == "closed"
+    assert not _is_transient_gateway_error(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_gateway_error_responses_do_not_trip_the_breaker(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registry = GatewayCircuitBreakerRegistry(failure_threshold=1, open_seconds=60)
+    monkeypatch.setattr(gateway_rpc, "gateway_circuit_breakers", registry)
+
+    async def _rejected(
+        method: str,
+        params: dict[str, object] | None,
+        *,
+        config: GatewayConfig,
+        gateway_url: str,
+    ) -> object:
+        del method, params, config, gateway_url
+        raise OpenClawGatewayError("missing scope: operator.admin")
+
+    monkeypatch.setattr(gateway_rpc, "_openclaw_call_once", _rejected)
+    config = GatewayConfig(url="ws://up.example/ws")
+
+    for _ in range(3):
+        with pytest.raises(OpenClawGatewayError, match="missing scope"):
+            await openclaw_call("agents.update", config=config)
+    assert registry.snapshot(config.url).state == "closed"
+
+
+def test_gateway_read_reports_circuit_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = GatewayCircuitBreakerRegistry(failure_threshold=1, open_seconds=60)
+    monkeypatch.setattr("app.api.gateways.gateway_circuit_breakers", registry)
+    now = utcnow()
+    gateway = Gateway(
+        id=uuid4(),
+        organization_id=uuid4(),
+        name="gw",
+        url="ws://down.example/ws",
+        workspace_root="/tmp",
+        created_at=now,
+        updated_at=now,
+    )
+
+    assert _gateway_read(gateway).circuit.state == "closed"
+    registry.get(gateway.url).record_failure("connection refused")
+    circuit = _gateway_read(gateway).circuit
+    assert circuit.state == "open"
+    assert circuit.last_error == "connection refused"
+    assert circuit.retry_at is not None
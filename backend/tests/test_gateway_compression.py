@@ -0,0 +1,169 @@
+# ruff: noqa: INP001
+"""Tests for gateway websocket compression and per-method byte counters."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+import app.services.openclaw.admin_service as admin_service
+import app.services.openclaw.gateway_rpc as gateway_rpc
+from app.services.openclaw.admin_service import GatewayAdminLifecycleService
+from app.services.openclaw.gateway_compat import GatewayVersionCheckResult
+from app.services.openclaw.gateway_metrics import GatewayMetricsRegistry, gateway_metrics_label
+from app.services.openclaw.gateway_rpc import GatewayConfig, openclaw_call
+from app.services.openclaw.session_service import GatewaySessionService
+from scripts.benchmark_gateway_compression import (
+    CompressionBenchmarkOptions,
+    LinkRelay,
+    run_compression_benchmarks,
+    template_files,
+)
+from scripts.fake_gateway import FakeGatewayOptions, FakeOpenClawGateway
+
+
+@pytest.fixture
+def metrics(monkeypatch: pytest.MonkeyPatch) -> Iterator[GatewayMetricsRegistry]:
+    registry = GatewayMetricsRegistry()
+    monkeypatch.setattr(gateway_rpc, "gateway_metrics", registry)
+    yield registry
+
+
+async def _sync_templates(
+    gateway_options: FakeGatewayOptions,
+    *,
+    disable_compression: bool,
+) -> tuple[int, int]:
+    """Write every template file once through a relay; return (wire, payload) bytes."""
+    registry = gateway_rpc.gateway_metrics
+    async with FakeOpenClawGateway(gateway_options) as gateway:
+        gateway.state.files["lead"] = {}
+        async with LinkRelay(gateway.host, gateway.port) as relay:
+            config = GatewayConfig(
+                url=relay.url,
+                disable_device_pairing=True,
+                disable_compression=disable_compression,
+            )
+            for name, content in template_files().items():
+                await openclaw_call(
+                    "agents.files.set",
+                    {"agentId": "lead", "name": name, "content": content},
+                    config=config,
+                )
+            await gateway_rpc.gateway_connection_pool.close()
+            [series] = [
+                row
+                for row in registry.requests()
+                if row.gateway_url == gateway_metrics_label(relay.url)
+            ]
+            return relay.bytes_up + relay.bytes_down, series.bytes_sent + series.bytes_received
+
+
+@pytest.mark.asyncio
+async def test_compression_is_negotiated_unless_the_gateway_opts_out(
+    monkeypatch: pytest.MonkeyPatch,
+    metrics: GatewayMetricsRegistry,
+) -> None:
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_pool_enabled", True)
+
+    compressed, payload = await _sync_templates(FakeGatewayOptions(), disable_compression=False)
+    opted_out, opted_out_payload = await _sync_templates(
+        FakeGatewayOptions(),
+        disable_compression=True,
+    )
+    unsupported, _ = await _sync_templates(
+        FakeGatewayOptions(compression=False),
+        disable_compression=False,
+    )
+
+    # Payload counters measure frames before compression, so they match across modes.
+    assert payload == opted_out_payload
+    assert compressed < payload * 0.6
+    assert opted_out > payload
+    assert unsupported > payload
+
+
+@pytest.mark.asyncio
+async def test_version_check_and_direct_url_status_honour_the_opt_out(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    checked: list[GatewayConfig] = []
+
+    async def _fake_check(config: GatewayConfig, *, minimum_version: str | None = None) -> object:
+        checked.append(config)
+        return GatewayVersionCheckResult(
+            compatible=True,
+            minimum_version="2026.1.30",
+            current_version="2026.2.9",
+            message=None,
+        )
+
+    monkeypatch.setattr(admin_service, "check_gateway_version_compatibility", _fake_check)
+    await GatewayAdminLifecycleService(
+        session=object(),  # type: ignore[arg-type]
+    ).assert_gateway_runtime_compatible(
+        url="ws://gateway.example/ws",
+        token=None,
+        disable_compression=True,
+    )
+    _, config, _ = await GatewaySessionService(
+        session=object(),  # type: ignore[arg-type]
+    ).resolve_gateway(
+        GatewaySessionService.to_resolve_query(
+            board_id=None,
+            gateway_url="ws://gateway.example/ws",
+            gateway_token=None,
+            gateway_disable_compression=True,
+        ),
+    )
+
+    assert [item.disable_compression for item in checked] == [True]
+    assert config.disable_compression is True
+
+
+@pytest.mark.asyncio
+async def test_one_shot_calls_count_request_and_response_bytes_per_method(
+    monkeypatch: pytest.MonkeyPatch,
+    metrics: GatewayMetricsRegistry,
+) -> None:
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_pool_enabled", False)
+    async with FakeOpenClawGateway() as gateway:
+        config = GatewayConfig(url=gateway.url, disable_device_pairing=True)
+        await openclaw_call("sessions.patch", {"key": "agent:a:main"}, config=config)
+        await openclaw_call(
+            "chat.send",
+            {"sessionKey": "agent:a:main", "message": "x" * 2000},
+            config=config,
+        )
+        await openclaw_call("chat.history", {"sessionKey": "agent:a:main"}, config=config)
+
+    rows = {row.method: row for row in metrics.requests()}
+    assert rows["chat.send"].bytes_sent > 2000
+    assert rows["chat.send"].bytes_received < 200
+    assert rows["chat.history"].bytes_received > 2000
+    assert rows["sessions.patch"].bytes_sent < 300
+    text = metrics.render_text()
+    label = gateway_metrics_label(gateway.url)
+    assert (
+        f'openclaw_gateway_request_bytes_total{{gateway="{label}",method="chat.history",'
+        f'direction="received"}} {rows["chat.history"].bytes_received}'
+    ) in text
+
+
+@pytest.mark.asyncio
+async def test_compression_benchmark_compares_both_modes() -> None:
+    results = await run_compression_benchmarks(
+        CompressionBenchmarkOptions(operations=12, concurrency=4, history_messages=10),
+    )
+
+    assert [(result.scenario, result.compression) for result in results] == [
+        ("files", False),
+        ("files", True),
+        ("history", False),
+        ("history", True),
+    ]
+    for plain, deflated in (results[0:2], results[2:4]):
+        assert plain.errors == deflated.errors == 0
+        assert plain.payload_bytes == deflated.payload_bytes
+        assert deflated.wire_bytes < plain.wire_bytes
@@ -0,0 +1,241 @@
+# ruff: noqa: INP001
+"""Tests for pooled, multiplexed gateway websocket connections."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from websockets.asyncio.server import ServerConnection, serve
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
+from app.services.openclaw.gateway_rpc import (
+    GatewayCall,
+    GatewayConfig,
+    GatewayConnectionPool,
+    OpenClawGatewayError,
+    openclaw_batch,
+)
+
+
+@dataclass
+class _GatewayState:
+    handshakes: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+
+async def _respond(ws: ServerConnection, data: dict[str, Any], state: _GatewayState) -> None:
+    params = data.get("params") or {}
+    state.in_flight += 1
+    state.peak_in_flight = max(state.peak_in_flight, state.in_flight)
+    try:
+        await asyncio.sleep(float(params.get("delay", 0)))
+    finally:
+        state.in_flight -= 1
+    if data["method"] == "drop":
+        await ws.close()
+        return
+    if data["method"] == "fail":
+        frame = {"type": "res", "id": data["id"], "ok": False, "error": {"message": "boom"}}
+    else:
+        frame = {"type": "res", "id": data["id"], "ok": True, "payload": params}
+    await ws.send(json.dumps(frame))
+
+
+@pytest_asyncio.fixture
+async def gateway() -> AsyncIterator[tuple[GatewayConfig, _GatewayState]]:
+    state = _GatewayState()
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def _handler(ws: ServerConnection) -> None:
+        await ws.send(
+            json.dumps(
+                {"type": "event", "event": "connect.challenge", "payload": {"nonce": "n"}},
+            ),
+        )
+        async for raw in ws:
+            data = json.loads(raw)
+            if data["method"] == "connect":
+                state.handshakes += 1
+                await ws.send(json.dumps({"type": "res", "id": data["id"], "ok": True}))
+                continue
+            task = asyncio.create_task(_respond(ws, data, state))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    async with serve(_handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        config = GatewayConfig(url=f"ws://127.0.0.1:{port}", disable_device_pairing=True)
+        yield config, state
+
+
+def _pool(**overrides: Any) -> GatewayConnectionPool:
+    options: dict[str, Any] = {"max_connections": 1, "max_in_flight": 16, "idle_seconds": 60}
+    options.update(overrides)
+    return GatewayConnectionPool(**options)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_handshake_and_demux_responses(
+    gateway: tuple[GatewayConfig, _GatewayState],
+) -> None:
+    config, state = gateway
+    pool = _pool()
+
+    results = await asyncio.gather(
+        pool.call("echo", {"delay": 0.06, "n": 1}, config=config, gateway_url=config.url),
+        pool.call("echo", {"delay": 0.02, "n": 2}, config=config, gateway_url=config.url),
+        pool.call("echo", {"delay": 0.04, "n": 3}, config=config, gateway_url=config.url),
+    )
+    await pool.call("echo", {"n": 4}, config=config, gateway_url=config.url)
+
+    assert [result["n"] for result in results] == [1, 2, 3]  # type: ignore[index]
+    assert state.handshakes == 1
+    assert state.peak_in_flight == 3
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_gateway_error_keeps_connection_open(
+    gateway: tuple[GatewayConfig, _GatewayState],
+) -> None:
+    config, state = gateway
+    pool = _pool()
+
+    with pytest.raises(OpenClawGatewayError, match="boom"):
+        await pool.call("fail", None, config=config, gateway_url=config.url)
+    assert await pool.call("echo", {"n": 1}, config=config, gateway_url=config.url) == {"n": 1}
+    assert state.handshakes == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_fails_pending_and_reconnects(
+    gateway: tuple[GatewayConfig, _GatewayState],
+) -> None:
+    config, state = gateway
+    pool = _pool()
+
+    with pytest.raises(ConnectionError):
+        await pool.call("drop", None, config=config, gateway_url=config.url)
+    assert await pool.call("echo", {"n": 1}, config=config, gateway_url=config.url) == {"n": 1}
+    assert state.handshakes == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_in_flight_limit_is_enforced_per_gateway(
+    gateway: tuple[GatewayConfig, _GatewayState],
+) -> None:
+    config, state = gateway
+    pool = _pool(max_connections=2, max_in_flight=2)
+
+    await asyncio.gather(
+        *(
+            pool.call("echo", {"delay": 0.02}, config=config, gateway_url=config.url)
+            for _ in range(6)
+        ),
+    )
+
+    assert state.peak_in_flight == 2
+    assert state.handshakes == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_sweep_closes_idle_connections_of_unused_configs(
+    gateway: tuple[GatewayConfig, _GatewayState],
+) -> None:
+    config, state = gateway
+    rotated = replace(config, token="rotated")
+    pool = _pool(idle_seconds=0.05)
+    await pool.call("echo", {}, config=rotated, gateway_url=rotated.url)
+    await pool.call("echo", {}, config=config, gateway_url=config.url)
+    [stale] = pool._slots[rotated].connections
+    dead_loop = asyncio.new_event_loop()
+    dead_loop.close()
+    pool._slots[replace(config, token="old-loop")] = gateway_rpc._GatewaySlot(
+        loop=dead_loop,
+        semaphore=asyncio.Semaphore(1),
+        lock=asyncio.Lock(),
+    )
+    await asyncio.sleep(0.1)
+
+    busy = asyncio.create_task(
+        pool.call("echo", {"delay": 0.1}, config=config, gateway_url=config.url),
+    )
+    await asyncio.sleep(0.02)
+    dropped = await pool.sweep()
+    await busy
+
+    assert dropped == 2
+    assert stale.closed
+    assert list(pool._slots) == [config]
+    assert state.handshakes == 3
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_pipelines_calls_and_reports_failures_in_order(
+    gateway: tuple[GatewayConfig, _GatewayState],
+) -> None:
+    config, state = gateway
+    pool = _pool()
+
+    outcomes = await pool.call_many(
+        [
+            GatewayCall("echo", {"delay": 0.04, "n": 1}),
+            GatewayCall("fail", {"delay": 0.02}),
+            GatewayCall("echo", {"n": 3}),
+        ],
+        config=config,
+        gateway_url=config.url,
+    )
+
+    assert outcomes[0] == {"delay": 0.04, "n": 1}
+    assert isinstance(outcomes[1], OpenClawGatewayError)
+    assert outcomes[2] == {"n": 3}
+    assert state.peak_in_flight == 3
+    assert state.handshakes == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_openclaw_batch_raises_first_failure_unless_returning_exceptions(
+    gateway: tuple[GatewayConfig, _GatewayState],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    config, _state = gateway
+    monkeypatch.setattr(gateway_rpc, "gateway_connection_pool", _pool())
+
+    calls = [GatewayCall("echo", {"n": 1}), GatewayCall("fail"), GatewayCall("fail")]
+    with pytest.raises(OpenClawGatewayError, match="boom"):
+        await openclaw_batch(calls, config=config)
+
+    outcomes = await openclaw_batch(calls, config=config, return_exceptions=True)
+    assert outcomes[0] == {"n": 1}
+    assert all(isinstance(outcome, OpenClawGatewayError) for outcome in outcomes[1:])
+    await gateway_rpc.gateway_connection_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_unpooled_batch_uses_one_connection(
+    gateway: tuple[GatewayConfig, _GatewayState],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    config, state = gateway
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_pool_enabled", False)
+
+    outcomes = await openclaw_batch(
+        [GatewayCall("echo", {"delay": 0.02, "n": 1}), GatewayCall("echo", {"n": 2})],
+        config=config,
+    )
+
+    assert outcomes == [{"delay": 0.02, "n": 1}, {"n": 2}]
+    assert state.handshakes == 1
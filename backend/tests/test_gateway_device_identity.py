@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import base64
+import os
 
 import pytest
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
 from app.services.openclaw.device_identity import (
+    DeviceIdentityHolder,
     build_device_auth_payload,
     load_or_create_device_identity,
     sign_device_payload,
@@ -65,3 +67,33 @@ def test_sign_device_payload_produces_valid_ed25519_signature(
     loaded = serialization.load_pem_public_key(identity.public_key_pem.encode("utf-8"))
     assert isinstance(loaded, Ed25519PublicKey)
     loaded.verify(_base64url_decode(signature), payload.encode("utf-8"))
+
+
+def test_device_identity_holder_caches_until_file_changes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    identity_path = tmp_path / "identity" / "device.json"
+    monkeypatch.setenv("OPENCLAW_GATEWAY_DEVICE_IDENTITY_PATH", str(identity_path))
+    holder = DeviceIdentityHolder()
+
+    first = holder.get()
+    assert holder.get() is first
+
+    identity_path.unlink()
+    replacement = load_or_create_device_identity()
+    stat = identity_path.stat()
+    os.utime(identity_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = holder.get()
+    assert reloaded is not first
+    assert reloaded.device_id == replacement.device_id
+
+    payload = "v1|device|client|backend|operator|operator.read|1|token"
+    loaded = serialization.load_pem_public_key(replacement.public_key_pem.encode("utf-8"))
+    assert isinstance(loaded, Ed25519PublicKey)
+    loaded.verify(_base64url_decode(reloaded.sign(payload)), payload.encode("utf-8"))
+    assert _base64url_decode(reloaded.public_key_raw_base64url) == loaded.public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw,
+    )
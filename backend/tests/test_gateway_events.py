@@ -0,0 +1,247 @@
+# ruff: noqa: INP001
+"""Tests for the gateway push-event subscriber."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from websockets.asyncio.server import ServerConnection, serve
+
+import app.services.openclaw.gateway_events as gateway_events
+from app.core.agent_presence import AgentPresenceBuffer
+from app.core.time import utcnow
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.gateways import Gateway
+from app.services.openclaw.gateway_events import (
+    GatewayEventBatch,
+    GatewayEventSubscriber,
+    event_session_keys,
+)
+from app.services.openclaw.gateway_rpc import GatewayConfig
+
+
+def test_event_session_keys_reads_single_and_nested_payloads() -> None:
+    assert event_session_keys({"sessionKey": " agent:a:main "}) == ["agent:a:main"]
+    assert event_session_keys(
+        {"presence": [{"sessionKey": "agent:a:main"}, {"session_key": "agent:b:main"}, "x"]},
+    ) == ["agent:a:main", "agent:b:main"]
+    assert event_session_keys([{"sessionKey": "agent:c:main"}, {"sessionKey": ""}]) == [
+        "agent:c:main",
+    ]
+    assert event_session_keys({"ts": 1}) == []
+    assert event_session_keys("tick") == []
+
+
+@pytest.mark.asyncio
+async def test_batch_apply_records_presence_and_heartbeat_activity(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    presence = AgentPresenceBuffer()
+    monkeypatch.setattr(gateway_events, "agent_presence_buffer", presence)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    gateway_id = uuid4()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            beating = Agent(name="a", gateway_id=gateway_id, openclaw_session_id="agent:a:main")
+            chatting = Agent(name="b", gateway_id=gateway_id, openclaw_session_id="agent:b:main")
+            elsewhere = Agent(name="c", gateway_id=uuid4(), openclaw_session_id="agent:a:main")
+            session.add_all([beating, chatting, elsewhere])
+            await session.commit()
+
+            batch = GatewayEventBatch()
+            seen_at = utcnow()
+            batch.record(gateway_id, "heartbeat", {"sessionKey": "agent:a:main"}, seen_at)
+            batch.record(
+                gateway_id,
+                "chat",
+                {"sessionKey": "agent:b:main"},
+                seen_at - timedelta(seconds=3),
+            )
+            batch.record(gateway_id, "chat", {"sessionKey": "agent:b:main"}, seen_at)
+            batch.record(gateway_id, "tick", {"sessionKey": "agent:b:main"}, seen_at)
+            batch.record(gateway_id, "agent", {"sessionKey": "agent:unknown"}, seen_at)
+            assert len(batch) == 3
+
+            assert await batch.apply(session) == 2
+            assert len(batch) == 0
+            assert await batch.apply(session) == 0
+
+            assert presence.last_seen(beating) == seen_at
+            assert presence.last_seen(chatting) == seen_at
+            assert presence.last_seen(elsewhere) is None
+            events = (
+                await session.exec(
+                    select(ActivityEvent).where(col(ActivityEvent.event_type) == "agent.heartbeat"),
+                )
+            ).all()
+            assert [event.agent_id for event in events] == [beating.id]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_batch_apply_dedupes_heartbeats_and_rebuffers_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(gateway_events, "agent_presence_buffer", AgentPresenceBuffer())
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    gateway_id = uuid4()
+    payload = {"sessionKey": "agent:a:main"}
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent = Agent(name="a", gateway_id=gateway_id, openclaw_session_id="agent:a:main")
+            session.add(agent)
+            await session.commit()
+            seen_at = datetime(2026, 1, 1, 12, 0, 10)
+
+            # Two workers' batches see the same heartbeat stream.
+            for _ in range(2):
+                batch = GatewayEventBatch()
+                batch.record(gateway_id, "heartbeat", payload, seen_at)
+                batch.record(gateway_id, "heartbeat", payload, seen_at + timedelta(seconds=30))
+                assert await batch.apply(session) == 1
+
+            failing = GatewayEventBatch()
+            failing.record(gateway_id, "heartbeat", payload, seen_at + timedelta(seconds=90))
+
+            async def _fail() -> None:
+                raise OperationalError("COMMIT", {}, Exception("database is locked"))
+
+            with monkeypatch.context() as patch:
+                patch.setattr(session, "commit", _fail)
+                with pytest.raises(OperationalError):
+                    await failing.apply(session)
+            assert len(failing) == 1
+            assert await failing.apply(session) == 1
+
+            events = (
+                await session.exec(
+                    select(ActivityEvent).order_by(col(ActivityEvent.created_at)),
+                )
+            ).all()
+            assert [event.created_at for event in events] == [
+                seen_at + timedelta(seconds=30),
+                seen_at + timedelta(seconds=90),
+            ]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_subscriber_forwards_events_and_reconnects() -> None:
+    connections = 0
+
+    async def _handler(ws: ServerConnection) -> None:
+        nonlocal connections
+        await ws.send(
+            json.dumps({"type": "event", "event": "connect.challenge", "payload": {"nonce": "n"}}),
+        )
+        async for raw in ws:
+            data = json.loads(raw)
+            if data["method"] != "connect":
+                continue
+            connections += 1
+            await ws.send(json.dumps({"type": "res", "id": data["id"], "ok": True}))
+            for event in ("presence", "node.pair.requested"):
+                payload = {"presence": [{"sessionKey": f"agent:{connections}:main"}]}
+                await ws.send(json.dumps({"type": "event", "event": event, "payload": payload}))
+            await ws.close()
+            return
+
+    received: list[tuple[str, list[str]]] = []
+    done = asyncio.Event()
+
+    def _sink(gateway_id: UUID, event: str, payload: object, seen_at: datetime) -> None:
+        received.append((event, event_session_keys(payload)))
+        if len(received) >= 2:
+            done.set()
+
+    async with serve(_handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        subscriber = GatewayEventSubscriber(
+            uuid4(),
+            GatewayConfig(url=f"ws://127.0.0.1:{port}", disable_device_pairing=True),
+            sink=_sink,
+            max_backoff_seconds=1.0,
+        )
+        subscriber.start()
+        try:
+            await asyncio.wait_for(done.wait(), timeout=10)
+        finally:
+            await subscriber.stop()
+
+    assert received == [("presence", ["agent:1:main"]), ("presence", ["agent:2:main"])]
+    stats = subscriber.stats()
+    assert stats.events == 2
+    assert stats.reconnects >= 1
+    assert stats.connected is False
+
+
+@pytest.mark.asyncio
+async def test_reconcile_restarts_subscribers_that_died(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    opened = 0
+    idle = asyncio.Event()
+
+    class _Connection:
+        async def wait_closed(self) -> None:
+            await idle.wait()
+
+        async def close(self) -> None:
+            return None
+
+    async def _open(config: GatewayConfig, *, on_event: object) -> _Connection:
+        nonlocal opened
+        opened += 1
+        if opened == 1:
+            raise KeyError("malformed frame")
+        return _Connection()
+
+    monkeypatch.setattr(gateway_events, "open_gateway_connection", _open)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    service = gateway_events.GatewayEventService(
+        refresh_seconds=60,
+        flush_seconds=60,
+        max_backoff_seconds=1,
+    )
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add(
+                Gateway(
+                    organization_id=uuid4(),
+                    name="Gateway",
+                    url="ws://gateway.example/ws",
+                    workspace_root="/tmp/openclaw",
+                ),
+            )
+            await session.commit()
+
+            await service.reconcile(session)
+            [subscriber] = service._subscribers.values()
+            await asyncio.sleep(0.01)
+            assert isinstance(subscriber.failure(), KeyError)
+
+            await service.reconcile(session)
+            await asyncio.sleep(0.01)
+            assert subscriber.failure() is None
+            assert service._subscribers == {subscriber.gateway_id: subscriber}
+            assert opened == 2
+    finally:
+        await service.stop(lambda: AsyncSession(engine))
+        await engine.dispose()
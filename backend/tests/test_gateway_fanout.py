@@ -0,0 +1,86 @@
+# ruff: noqa: INP001
+"""Tests for bounded-concurrency gateway fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+import pytest
+
+import app.services.openclaw.fanout as fanout
+from app.services.openclaw.fanout import GatewayFanOutLimiter, fan_out
+from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+
+
+@pytest.mark.asyncio
+async def test_fan_out_bounds_concurrency_per_gateway_and_keeps_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(fanout, "gateway_fan_out_limiter", GatewayFanOutLimiter(max_concurrency=4))
+    active: dict[str, int] = {"a": 0, "b": 0}
+    peak: dict[str, int] = {"a": 0, "b": 0}
+
+    async def _send(target: tuple[str, int]) -> int:
+        gateway, index = target
+        active[gateway] += 1
+        peak[gateway] = max(peak[gateway], active[gateway])
+        try:
+            await asyncio.sleep(0.03)
+        finally:
+            active[gateway] -= 1
+        return index * 10
+
+    targets = [("a" if index % 2 else "b", index) for index in range(16)]
+    started_at = perf_counter()
+    results = await fan_out(targets, _send, limit_key=lambda target: target[0])
+    elapsed = perf_counter() - started_at
+
+    assert [result.target for result in results] == targets
+    assert [result.value for result in results] == [index * 10 for index in range(16)]
+    assert all(result.ok for result in results)
+    assert peak == {"a": 4, "b": 4}
+    # 8 targets per gateway at 4-wide take two waves, not sixteen sequential sends.
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_fan_out_captures_errors_and_per_target_timeouts() -> None:
+    async def _send(target: str) -> str:
+        if target == "slow":
+            await asyncio.sleep(1)
+        if target == "broken":
+            raise OpenClawGatewayError("gateway rejected")
+        return target.upper()
+
+    results = await fan_out(
+        ["ok", "slow", "broken"],
+        _send,
+        limit_key="ws://gateway.example/ws",
+        timeout_s=0.05,
+    )
+
+    assert results[0].ok
+    assert results[0].value == "OK"
+    assert isinstance(results[1].error, TimeoutError)
+    assert isinstance(results[2].error, OpenClawGatewayError)
+    assert results[2].value is None
+
+
+@pytest.mark.asyncio
+async def test_fan_out_propagates_unexpected_errors() -> None:
+    cancelled = asyncio.Event()
+
+    async def _send(target: str) -> None:
+        if target == "bug":
+            raise RuntimeError("unexpected")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(RuntimeError, match="unexpected"):
+        await fan_out(["bug", "slow"], _send, limit_key="ws://gateway.example/ws")
+
+    assert cancelled.is_set()
@@ -0,0 +1,173 @@
+# ruff: noqa: INP001
+"""Tests for per-method gateway RPC latency and error metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from websockets.asyncio.server import ServerConnection, serve
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
+import app.services.openclaw.session_service as session_service
+from app.core.time import utcnow
+from app.models.gateways import Gateway
+from app.services.openclaw.gateway_metrics import GatewayMetricsRegistry, LatencyHistogram
+from app.services.openclaw.gateway_rpc import (
+    GatewayCall,
+    GatewayConfig,
+    GatewayConnectionPool,
+    OpenClawGatewayError,
+)
+from app.services.openclaw.session_service import GatewaySessionService
+
+
+@pytest_asyncio.fixture
+async def gateway() -> AsyncIterator[GatewayConfig]:
+    async def _handler(ws: ServerConnection) -> None:
+        await ws.send(
+            json.dumps(
+                {"type": "event", "event": "connect.challenge", "payload": {"nonce": "n"}},
+            ),
+        )
+        async for raw in ws:
+            data = json.loads(raw)
+            if data["method"] == "fail":
+                frame = {"type": "res", "id": data["id"], "ok": False, "error": {"message": "x"}}
+            else:
+                await asyncio.sleep(float((data.get("params") or {}).get("delay", 0)))
+                frame = {"type": "res", "id": data["id"], "ok": True, "payload": {}}
+            await ws.send(json.dumps(frame))
+
+    async with serve(_handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield GatewayConfig(url=f"ws://127.0.0.1:{port}", token="secret")
+
+
+def test_histogram_quantiles_and_text_exposition() -> None:
+    histogram = LatencyHistogram((0.01, 0.1, 1.0))
+    for seconds in (0.005, 0.005, 0.05, 0.05, 0.5, 5.0):
+        histogram.observe(seconds)
+
+    assert histogram.cumulative() == [2, 4, 5, 6]
+    assert histogram.quantile(0.5) == pytest.approx(0.055)
+    assert histogram.quantile(0.99) == 1.0
+
+    registry = GatewayMetricsRegistry()
+    registry.observe_request("ws://a", "chat.send", 0.02)
+    registry.observe_request("ws://a", "chat.send", 0.2, outcome="transport_error")
+    registry.observe_handshake('ws://b"', 0.3, outcome="gateway_error")
+    text = registry.render_text()
+
+    assert (
+        'openclaw_gateway_request_seconds_bucket{gateway="ws://a",method="chat.send",le="0.025"} 1'
+        in text
+    )
+    assert 'openclaw_gateway_request_seconds_count{gateway="ws://a",method="chat.send"} 2' in text
+    assert (
+        'openclaw_gateway_request_errors_total{gateway="ws://a",method="chat.send",'
+        'kind="transport"} 1'
+    ) in text
+    assert 'openclaw_gateway_handshake_seconds_count{gateway="ws://b\\"",method="connect"} 1' in (
+        text
+    )
+    assert "ws://a" not in registry.render_text({'ws://b"'})
+
+
+@pytest.mark.asyncio
+async def test_pooled_and_one_shot_calls_separate_handshake_from_request_time(
+    monkeypatch: pytest.MonkeyPatch,
+    gateway: GatewayConfig,
+) -> None:
+    registry = GatewayMetricsRegistry()
+    monkeypatch.setattr(gateway_rpc, "gateway_metrics", registry)
+    gateway_url = gateway_rpc._build_gateway_url(gateway)
+    pool = GatewayConnectionPool(max_connections=1, max_in_flight=8, idle_seconds=60)
+
+    await pool.call("status", {"delay": 0.05}, config=gateway, gateway_url=gateway_url)
+    outcomes = await pool.call_many(
+        [GatewayCall("status"), GatewayCall("fail")],
+        config=gateway,
+        gateway_url=gateway_url,
+    )
+    await pool.close()
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_pool_enabled", False)
+    await gateway_rpc._openclaw_call_once(
+        "health",
+        None,
+        config=gateway,
+        gateway_url=gateway_url,
+    )
+
+    assert isinstance(outcomes[1], OpenClawGatewayError)
+    requests = {series.method: series for series in registry.requests()}
+    assert {series.gateway_url for series in requests.values()} == {gateway.url}
+    assert requests["status"].count == 2
+    assert requests["status"].p99_seconds is not None
+    assert requests["status"].total_seconds >= 0.05
+    assert requests["fail"].gateway_errors == 1
+    assert requests["health"].count == 1
+    [handshakes] = registry.handshakes()
+    assert handshakes.gateway_url == gateway.url
+    assert handshakes.count == 2
+    assert "secret" not in registry.render_text()
+
+
+@pytest.mark.asyncio
+async def test_rpc_metrics_only_cover_the_organizations_gateways(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registry = GatewayMetricsRegistry()
+    monkeypatch.setattr(session_service, "gateway_metrics", registry)
+    registry.observe_request("ws://ours.example/ws", "chat.send", 0.02)
+    registry.observe_request("ws://theirs.example/ws", "chat.send", 0.02)
+    registry.observe_handshake("ws://ours.example/ws", 0.1)
+    organization_id = uuid4()
+    now = utcnow()
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all(
+                [
+                    Gateway(
+                        organization_id=organization_id,
+                        name="ours",
+                        url="ws://ours.example/ws?token=abc",
+                        workspace_root="/tmp",
+                        created_at=now,
+                        updated_at=now,
+                    ),
+                    Gateway(
+                        organization_id=uuid4(),
+                        name="theirs",
+                        url="ws://theirs.example/ws",
+                        workspace_root="/tmp",
+                        created_at=now,
+                        updated_at=now,
+                    ),
+                ],
+            )
+            await session.commit()
+
+            service = GatewaySessionService(session)
+            metrics = await service.rpc_metrics(organization_id=organization_id)
+            text = await service.rpc_metrics_text(organization_id=organization_id)
+    finally:
+        await engine.dispose()
+
+    assert [row.gateway_url for row in metrics.requests] == ["ws://ours.example/ws"]
+    assert metrics.requests[0].mean_ms == 20.0
+    assert metrics.requests[0].buckets[-1].le_ms is None
+    assert metrics.requests[0].buckets[-1].count == 1
+    assert [row.method for row in metrics.handshakes] == ["connect"]
+    assert "theirs" not in text
@@ -0,0 +1,155 @@
+# ruff: noqa: INP001
+"""Tests for the coalescing response cache for read-only gateway RPCs."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
+from app.services.openclaw.gateway_cache import GatewayResponseCache
+from app.services.openclaw.gateway_rpc import GatewayConfig, OpenClawGatewayError, openclaw_call
+
+CONFIG = GatewayConfig(url="ws://gateway.example/ws")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_fetch() -> None:
+    cache = GatewayResponseCache(max_entries=16)
+    fetches = 0
+
+    async def _fetch() -> object:
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.02)
+        return {"sessions": [{"key": "main"}]}
+
+    results = await asyncio.gather(
+        *(cache.get_or_fetch("sessions.list", None, config=CONFIG, fetch=_fetch) for _ in range(5)),
+    )
+
+    assert fetches == 1
+    assert all(result == {"sessions": [{"key": "main"}]} for result in results)
+    assert cache.stats().coalesced == 4
+
+    first = results[0]
+    assert isinstance(first, dict)
+    first["sessions"].clear()
+    cached = await cache.get_or_fetch("sessions.list", None, config=CONFIG, fetch=_fetch)
+    assert cached == {"sessions": [{"key": "main"}]}
+    assert fetches == 1
+
+
+@pytest.mark.asyncio
+async def test_mutation_invalidates_only_affected_reads() -> None:
+    cache = GatewayResponseCache(max_entries=16)
+    fetches: list[str] = []
+
+    def _fetcher(method: str) -> Any:
+        async def _fetch() -> object:
+            fetches.append(method)
+            return {"method": method, "n": len(fetches)}
+
+        return _fetch
+
+    for method in ("sessions.list", "models.list"):
+        await cache.get_or_fetch(method, None, config=CONFIG, fetch=_fetcher(method))
+    other = GatewayConfig(url="ws://other.example/ws")
+    await cache.get_or_fetch("sessions.list", None, config=other, fetch=_fetcher("sessions.list"))
+
+    assert cache.invalidate_after("sessions.patch", config=CONFIG) == 1
+    assert cache.invalidate_after("chat.history", config=CONFIG) == 0
+
+    await cache.get_or_fetch("sessions.list", None, config=CONFIG, fetch=_fetcher("sessions.list"))
+    await cache.get_or_fetch("models.list", None, config=CONFIG, fetch=_fetcher("models.list"))
+    await cache.get_or_fetch("sessions.list", None, config=other, fetch=_fetcher("sessions.list"))
+    assert fetches == ["sessions.list", "models.list", "sessions.list", "sessions.list"]
+
+
+@pytest.mark.asyncio
+async def test_read_racing_a_mutation_is_not_stored() -> None:
+    cache = GatewayResponseCache(max_entries=16)
+    release = asyncio.Event()
+    fetches = 0
+
+    async def _fetch() -> object:
+        nonlocal fetches
+        fetches += 1
+        await release.wait()
+        return {"n": fetches}
+
+    pending = asyncio.create_task(
+        cache.get_or_fetch("sessions.list", None, config=CONFIG, fetch=_fetch),
+    )
+    await asyncio.sleep(0)
+    cache.invalidate_after("sessions.delete", config=CONFIG)
+    release.set()
+    assert await pending == {"n": 1}
+
+    assert await cache.get_or_fetch("sessions.list", None, config=CONFIG, fetch=_fetch) == {
+        "n": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_but_not_cached() -> None:
+    cache = GatewayResponseCache(max_entries=16)
+    fetches = 0
+
+    async def _fetch() -> object:
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.01)
+        raise OpenClawGatewayError("boom")
+
+    results = await asyncio.gather(
+        cache.get_or_fetch("status", None, config=CONFIG, fetch=_fetch),
+        cache.get_or_fetch("status", None, config=CONFIG, fetch=_fetch),
+        return_exceptions=True,
+    )
+    assert fetches == 1
+    assert all(isinstance(result, OpenClawGatewayError) for result in results)
+
+    with pytest.raises(OpenClawGatewayError):
+        await cache.get_or_fetch("status", None, config=CONFIG, fetch=_fetch)
+    assert fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_openclaw_call_caches_reads_and_invalidates_after_writes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(gateway_rpc, "gateway_response_cache", GatewayResponseCache(max_entries=16))
+    calls: list[str] = []
+
+    async def _fake_call_once(
+        method: str,
+        params: dict[str, object] | None,
+        *,
+        config: GatewayConfig,
+        gateway_url: str,
+    ) -> object:
+        del params, config, gateway_url
+        calls.append(method)
+        return {"method": method}
+
+    monkeypatch.setattr(gateway_rpc, "_openclaw_call_once", _fake_call_once)
+
+    await openclaw_call("sessions.list", config=CONFIG)
+    await openclaw_call("sessions.list", config=CONFIG)
+    await openclaw_call("sessions.patch", {"key": "main"}, config=CONFIG)
+    await openclaw_call("sessions.list", config=CONFIG)
+    await openclaw_call("sessions.list", config=CONFIG, use_cache=False)
+    await openclaw_call("chat.history", {"sessionKey": "main"}, config=CONFIG)
+    await openclaw_call("chat.history", {"sessionKey": "main"}, config=CONFIG)
+
+    assert calls == [
+        "sessions.list",
+        "sessions.patch",
+        "sessions.list",
+        "sessions.list",
+        "chat.history",
+        "chat.history",
+    ]
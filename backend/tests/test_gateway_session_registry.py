@@ -0,0 +1,99 @@
+# ruff: noqa: INP001
+"""Tests for skipping redundant sessions.patch calls for already-ensured sessions."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import pytest
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
+from app.services.openclaw.gateway_rpc import (
+    GatewayCall,
+    GatewayConfig,
+    OpenClawGatewayError,
+    ensure_session_and_send_message,
+    openclaw_call,
+)
+from app.services.openclaw.session_registry import KnownSessionRegistry
+
+CONFIG = GatewayConfig(url="ws://gateway.example/ws")
+
+
+def test_registry_label_matching_and_forgetting() -> None:
+    registry = KnownSessionRegistry(ttl_seconds=60, max_entries=16)
+    registry.remember(CONFIG.url, "agent:a:main", label="Lead")
+
+    assert registry.is_known(CONFIG.url, "agent:a:main", label="Lead")
+    assert registry.is_known(CONFIG.url, "agent:a:main", label=None)
+    assert not registry.is_known(CONFIG.url, "agent:a:main", label="Renamed")
+    assert not registry.is_known("ws://other.example/ws", "agent:a:main", label="Lead")
+
+    registry.forget_after("sessions.patch", {"key": "agent:a:main"}, gateway_url=CONFIG.url)
+    assert registry.is_known(CONFIG.url, "agent:a:main", label="Lead")
+    registry.forget_after("sessions.reset", {"key": "agent:a:main"}, gateway_url=CONFIG.url)
+    assert not registry.is_known(CONFIG.url, "agent:a:main", label="Lead")
+
+
+@pytest.mark.asyncio
+async def test_known_sessions_skip_patch_until_invalidated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        gateway_rpc,
+        "known_sessions",
+        KnownSessionRegistry(ttl_seconds=60, max_entries=16),
+    )
+    sent: list[list[str]] = []
+    missing = {"value": False}
+
+    async def _fake_call_once(
+        method: str,
+        params: dict[str, object] | None,
+        *,
+        config: GatewayConfig,
+        gateway_url: str,
+    ) -> object:
+        del params, config, gateway_url
+        sent.append([method])
+        if method == "chat.send" and missing["value"]:
+            missing["value"] = False
+            raise OpenClawGatewayError("session not found")
+        return {"ok": True}
+
+    async def _fake_batch_once(
+        calls: Sequence[GatewayCall],
+        *,
+        config: GatewayConfig,
+        gateway_url: str,
+    ) -> list[object]:
+        del config, gateway_url
+        sent.append([call.method for call in calls])
+        return [{"ok": True} for _ in calls]
+
+    monkeypatch.setattr(gateway_rpc, "_openclaw_call_once", _fake_call_once)
+    monkeypatch.setattr(gateway_rpc, "_openclaw_batch_once", _fake_batch_once)
+
+    async def _send() -> None:
+        await ensure_session_and_send_message(
+            "hello",
+            session_key="agent:a:main",
+            config=CONFIG,
+            label="Lead",
+        )
+
+    await _send()
+    await _send()
+    await openclaw_call("sessions.delete", {"key": "agent:a:main"}, config=CONFIG)
+    await _send()
+    missing["value"] = True
+    await _send()
+
+    assert sent == [
+        ["sessions.patch", "chat.send"],
+        ["chat.send"],
+        ["sessions.delete"],
+        ["sessions.patch", "chat.send"],
+        ["chat.send"],
+        ["sessions.patch", "chat.send"],
+    ]
@@ -0,0 +1,187 @@
+# ruff: noqa: INP001
+"""Tests for the concurrent gateway template sync engine."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.services.openclaw.provisioning_db as provisioning_db
+from app.core.time import utcnow
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.users import User
+from app.schemas.gateways import GatewayTemplatesSyncResult
+from app.services.openclaw.gateway_rpc import GatewayConfig, gateway_connection_pool
+from app.services.openclaw.provisioning import OpenClawGatewayControlPlane
+from app.services.openclaw.provisioning_db import (
+    GatewayTemplateSyncOptions,
+    OpenClawProvisioningService,
+)
+from scripts.benchmark_template_sync import (
+    TemplateSyncBenchmarkOptions,
+    run_template_sync_benchmark,
+)
+from scripts.fake_gateway import FakeGatewayOptions, FakeOpenClawGateway
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            yield db_session
+    finally:
+        await engine.dispose()
+
+
+async def _seed_fleet(session: AsyncSession, *, boards: int, agents: int) -> Gateway:
+    gateway = Gateway(
+        organization_id=uuid4(),
+        name="Gateway",
+        url="ws://gateway.example/ws",
+        workspace_root="/tmp/openclaw",
+    )
+    board_rows = [
+        Board(
+            organization_id=gateway.organization_id,
+            name=f"Board {index}",
+            slug=f"board-{index}",
+            gateway_id=gateway.id,
+        )
+        for index in range(boards)
+    ]
+    session.add(gateway)
+    session.add_all(board_rows)
+    created_at = utcnow()
+    # Members are created before their leads, so only lead-first ordering puts leads first.
+    for index in range(agents):
+        session.add(
+            Agent(
+                name=f"Agent {index}",
+                board_id=board_rows[index % boards].id,
+                gateway_id=gateway.id,
+                is_board_lead=index >= agents - boards,
+                created_at=created_at + timedelta(seconds=index),
+            ),
+        )
+    await session.commit()
+    return gateway
+
+
+@pytest.mark.asyncio
+async def test_sync_runs_leads_first_with_bounded_workers_and_ordered_errors(
+    monkeypatch: pytest.MonkeyPatch,
+    session: AsyncSession,
+) -> None:
+    gateway = await _seed_fleet(session, boards=2, agents=14)
+    started: list[str] = []
+    # Keyed by id() with the objects kept alive, so ids of finished workers are not reused.
+    backoffs: dict[int, object] = {}
+    session_locks: dict[int, object] = {}
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _ping(ctx: object, result: object) -> bool:
+        return True
+
+    async def _sync_one(
+        ctx: provisioning_db._SyncContext,
+        result: GatewayTemplatesSyncResult,
+        agent: Agent,
+        board: Board,
+    ) -> bool:
+        nonlocal in_flight, max_in_flight
+        started.append(agent.name)
+        backoffs[id(ctx.backoff)] = ctx.backoff
+        session_locks[id(ctx.session_lock)] = ctx.session_lock
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Agent 1 fails fatally first; Agents 0 and 2 report their errors after it.
+        await asyncio.sleep(0.001 if agent.name == "Agent 1" else 0.02)
+        in_flight -= 1
+        if agent.name == "Agent 1":
+            result.agents_skipped += 1
+            provisioning_db._append_sync_error(result, agent=agent, message="gateway timeout")
+            return True
+        result.agents_updated += 1
+        result.files_written += 2
+        if agent.name in {"Agent 0", "Agent 2", "Agent 13"}:
+            provisioning_db._append_sync_error(result, agent=agent, message="token mismatch")
+        return False
+
+    monkeypatch.setattr(provisioning_db, "_ping_gateway", _ping)
+    monkeypatch.setattr(provisioning_db, "_sync_one_agent", _sync_one)
+    result = await OpenClawProvisioningService(session).sync_gateway_templates(
+        gateway,
+        GatewayTemplateSyncOptions(
+            user=User(clerk_user_id="owner"),
+            include_main=False,
+            concurrency=3,
+        ),
+    )
+
+    # Leads first; after the fatal Agent 1 no new agents start, in-flight ones finish.
+    assert started == ["Agent 12", "Agent 13", "Agent 0", "Agent 1", "Agent 2"]
+    assert max_in_flight == 3
+    # Every worker retries on its own backoff but shares the DB session lock.
+    assert (len(backoffs), len(session_locks)) == (5, 1)
+    assert [error.agent_name for error in result.errors] == [
+        "Agent 13",
+        "Agent 0",
+        "Agent 1",
+        "Agent 2",
+    ]
+    assert (result.agents_updated, result.agents_skipped, result.files_written) == (4, 1, 8)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_heartbeat_patches_are_merged_into_one_config_write() -> None:
+    async with FakeOpenClawGateway(FakeGatewayOptions(latency_ms=5)) as gateway:
+        control_plane = OpenClawGatewayControlPlane(
+            GatewayConfig(url=gateway.url, disable_device_pairing=True),
+        )
+        await asyncio.gather(
+            *(
+                control_plane.patch_agent_heartbeats(
+                    [(f"agent-{index}", f"/tmp/agent-{index}", {"every": "10m"})],
+                )
+                for index in range(12)
+            ),
+        )
+        await gateway_connection_pool.close()
+
+    agent_ids = {entry["id"] for entry in gateway.state.config["agents"]["list"]}
+    assert agent_ids == {f"agent-{index}" for index in range(12)}
+    assert gateway.stats.errors == 0
+    assert gateway.stats.requests["config.patch"] < 12
+
+
+@pytest.mark.asyncio
+async def test_template_sync_benchmark_reports_each_worker_count() -> None:
+    results = await run_template_sync_benchmark(
+        TemplateSyncBenchmarkOptions(
+            agents=8,
+            boards=2,
+            workers=(1, 4),
+            gateway=FakeGatewayOptions(),
+        ),
+    )
+
+    assert [result.workers for result in results] == [1, 4]
+    for result in results:
+        assert (result.agents_updated, result.errors) == (8, 0)
+        assert result.files_written > 0
+        assert result.resync_files_written == 0
+    assert results[0].files_written == results[1].files_written
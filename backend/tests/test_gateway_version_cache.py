@@ -0,0 +1,108 @@
+# ruff: noqa: INP001
+"""Tests for cached gateway version-compatibility checks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+import app.services.openclaw.gateway_compat as gateway_compat
+import app.services.openclaw.gateway_rpc as gateway_rpc
+from app.services.openclaw.gateway_rpc import GatewayConfig, openclaw_call
+from app.services.openclaw.gateway_version_cache import GatewayVersionCache
+from scripts.fake_gateway import FakeGatewayOptions, FakeOpenClawGateway
+
+
+@pytest.fixture
+def version_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[GatewayVersionCache]:
+    cache = GatewayVersionCache(ttl_seconds=300.0, max_entries=16)
+    monkeypatch.setattr(gateway_compat, "gateway_version_cache", cache)
+    monkeypatch.setattr(gateway_rpc, "gateway_version_cache", cache)
+    yield cache
+    cache.clear()
+
+
+def _counting_connect(versions: list[str], calls: list[GatewayConfig]) -> object:
+    async def _connect(*, config: GatewayConfig) -> object:
+        calls.append(config)
+        return {"server": {"version": versions[min(len(calls), len(versions)) - 1]}}
+
+    return _connect
+
+
+@pytest.mark.asyncio
+async def test_repeated_checks_reuse_the_cached_version_per_url_and_token(
+    monkeypatch: pytest.MonkeyPatch,
+    version_cache: GatewayVersionCache,
+) -> None:
+    calls: list[GatewayConfig] = []
+    monkeypatch.setattr(
+        gateway_compat,
+        "openclaw_connect_metadata",
+        _counting_connect(["2026.2.13"], calls),
+    )
+    config = GatewayConfig(url="ws://gateway.example/ws", token="one")
+
+    first = await gateway_compat.check_gateway_version_compatibility(config)
+    second = await gateway_compat.check_gateway_version_compatibility(config)
+    # The verdict is re-evaluated against the requested minimum on every read.
+    stricter = await gateway_compat.check_gateway_version_compatibility(
+        config,
+        minimum_version="2026.3.1",
+    )
+    await gateway_compat.check_gateway_version_compatibility(
+        GatewayConfig(url="ws://gateway.example/ws", token="two"),
+    )
+
+    assert first == second
+    assert first.compatible is True and first.current_version == "2026.2.13"
+    assert stricter.compatible is False
+    assert [call.token for call in calls] == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_pooled_handshakes_record_the_version_without_a_dedicated_check(
+    monkeypatch: pytest.MonkeyPatch,
+    version_cache: GatewayVersionCache,
+) -> None:
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_pool_enabled", True)
+    async with FakeOpenClawGateway(FakeGatewayOptions(version="2026.2.21")) as gateway:
+        config = GatewayConfig(url=gateway.url, disable_device_pairing=True)
+        await openclaw_call("sessions.patch", {"key": "agent:a:main"}, config=config)
+        handshakes = gateway.stats.handshakes
+        result = await gateway_compat.check_gateway_version_compatibility(config)
+        await gateway_rpc.gateway_connection_pool.close()
+
+    assert result.compatible is True
+    assert result.current_version == "2026.2.21"
+    assert gateway.stats.handshakes == handshakes == 1
+    assert version_cache.get(config) is not None
+
+
+@pytest.mark.asyncio
+async def test_entries_past_half_their_ttl_refresh_in_the_background(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = GatewayVersionCache(ttl_seconds=0.2, max_entries=16)
+    monkeypatch.setattr(gateway_compat, "gateway_version_cache", cache)
+    calls: list[GatewayConfig] = []
+    monkeypatch.setattr(
+        gateway_compat,
+        "openclaw_connect_metadata",
+        _counting_connect(["2026.2.13", "2026.2.20"], calls),
+    )
+    config = GatewayConfig(url="ws://gateway.example/ws")
+
+    await gateway_compat.check_gateway_version_compatibility(config)
+    await asyncio.sleep(0.12)
+    stale = await gateway_compat.check_gateway_version_compatibility(config)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    refreshed = await gateway_compat.check_gateway_version_compatibility(config)
+
+    # The stale read is served immediately while the refresh runs behind it.
+    assert stale.current_version == "2026.2.13"
+    assert refreshed.current_version == "2026.2.20"
+    assert len(calls) == 2
@@ -13,9 +13,15 @@ from app.schemas.gateway_api import GatewayResolveQuery
 from app.services.openclaw.admin_service import GatewayAdminLifecycleService
 from app.services.openclaw.gateway_compat import GatewayVersionCheckResult
 from app.services.openclaw.gateway_rpc import GatewayConfig, OpenClawGatewayError
+from app.services.openclaw.gateway_version_cache import gateway_version_cache
 from app.services.openclaw.session_service import GatewaySessionService
 
 
+@pytest.fixture(autouse=True)
+def _clear_version_cache() -> None:
+    gateway_version_cache.clear()
+
+
 def test_extract_connect_server_version_uses_server_version_as_source_of_truth() -> None:
     payload = {
         "version": "dev",
@@ -0,0 +1,72 @@
+# ruff: noqa: INP001
+"""Tests for the bounded KDF executor used by agent token hashing."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+import app.api.auth as auth_api
+from app.core.kdf_executor import KdfBusyError, KdfExecutor
+
+
+@pytest.mark.asyncio
+async def test_run_executes_off_loop_and_records_stats() -> None:
+    executor = KdfExecutor(max_workers=2, max_pending=4)
+    loop_thread = threading.get_ident()
+    try:
+        worker_thread = await executor.run(threading.get_ident)
+    finally:
+        executor.shutdown()
+
+    assert worker_thread != loop_thread
+    stats = executor.stats()
+    assert stats.completed == 1
+    assert stats.pending == 0
+    assert stats.peak_pending == 1
+
+
+@pytest.mark.asyncio
+async def test_saturated_executor_sheds_load_but_not_unbounded_calls() -> None:
+    executor = KdfExecutor(max_workers=1, max_pending=1)
+    release = threading.Event()
+    try:
+        blocked = asyncio.create_task(executor.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        assert executor.stats().pending == 1
+
+        with pytest.raises(KdfBusyError):
+            await executor.run(lambda: None)
+
+        admin_call = asyncio.create_task(executor.run_unbounded(lambda: "minted"))
+        await asyncio.sleep(0.01)
+        release.set()
+        assert await blocked is True
+        assert await admin_call == "minted"
+    finally:
+        release.set()
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert stats.rejected == 1
+    assert stats.completed == 2
+    assert stats.peak_pending == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_metrics_report_kdf_pool_load(monkeypatch: pytest.MonkeyPatch) -> None:
+    executor = KdfExecutor(max_workers=2, max_pending=4)
+    monkeypatch.setattr(auth_api, "kdf_executor", executor)
+    try:
+        await executor.run(lambda: None)
+    finally:
+        executor.shutdown()
+
+    metrics = await auth_api.auth_timing_metrics(_ctx=object())  # type: ignore[arg-type]
+
+    kdf = metrics.kdf
+    assert (kdf.max_workers, kdf.max_pending) == (2, 4)
+    assert (kdf.pending, kdf.peak_pending, kdf.completed, kdf.rejected) == (0, 1, 1, 0)
+    assert kdf.avg_wait_ms >= 0
@@ -0,0 +1,318 @@
+# ruff: noqa: INP001
+"""Tests for the transactional agent notification outbox."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.services.openclaw.notification_outbox as notification_outbox
+from app.core.time import utcnow
+from app.models.activity_events import ActivityEvent
+from app.models.agent_notifications import AgentNotification
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.tasks import Task
+from app.services.openclaw.gateway_rpc import GatewayConfig, OpenClawGatewayError
+from app.services.queue import QueuedTask
+
+
+class _FakeDispatch:
+    sent: list[tuple[str, str, bool]] = []
+    errors: list[OpenClawGatewayError | None] = []
+
+    def __init__(self, session: AsyncSession) -> None:
+        del session
+
+    async def optional_gateway_config_for_board(self, board: Board) -> GatewayConfig | None:
+        del board
+        return GatewayConfig(url="ws://gateway.example/ws")
+
+    async def try_send_agent_message(
+        self,
+        *,
+        session_key: str,
+        config: GatewayConfig,
+        agent_name: str,
+        message: str,
+        deliver: bool = False,
+    ) -> OpenClawGatewayError | None:
+        del config, agent_name
+        self.sent.append((session_key, message, deliver))
+        return self.errors.pop(0) if self.errors else None
+
+
+@pytest_asyncio.fixture
+async def maker(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    _FakeDispatch.sent = []
+    _FakeDispatch.errors = []
+    monkeypatch.setattr(notification_outbox, "async_session_maker", session_maker)
+    monkeypatch.setattr(notification_outbox, "GatewayDispatchService", _FakeDispatch)
+    monkeypatch.setattr(notification_outbox.settings, "notification_outbox_max_attempts", 2)
+    monkeypatch.setattr(notification_outbox.settings, "notification_digest_window_seconds", 0.0)
+    try:
+        yield session_maker
+    finally:
+        await engine.dispose()
+
+
+async def _seed(session: AsyncSession) -> tuple[Board, Agent, Agent, Task]:
+    board = Board(
+        organization_id=uuid4(),
+        name="Ops",
+        slug="ops",
+        gateway_id=uuid4(),
+    )
+    worker = Agent(
+        name="Worker",
+        board_id=board.id,
+        gateway_id=board.gateway_id,
+        openclaw_session_id="agent:worker:main",
+    )
+    offline = Agent(name="Offline", board_id=board.id, gateway_id=board.gateway_id)
+    task = Task(board_id=board.id, title="Ship it")
+    session.add_all([board, worker, offline, task])
+    await session.commit()
+    return board, worker, offline, task
+
+
+async def _activity_types(session: AsyncSession) -> list[str]:
+    events = await ActivityEvent.objects.all().all(session)
+    return sorted(event.event_type for event in events)
+
+
+@pytest.mark.asyncio
+async def test_rows_commit_with_the_caller_and_publish_wakeups_after(
+    monkeypatch: pytest.MonkeyPatch,
+    maker: async_sessionmaker[AsyncSession],
+) -> None:
+    published: list[QueuedTask] = []
+
+    def _enqueue(
+        task: QueuedTask,
+        queue_name: str,
+        *,
+        redis_url: str | None = None,
+        delay_seconds: float = 0,
+    ) -> bool:
+        del queue_name, redis_url, delay_seconds
+        published.append(task)
+        return True
+
+    monkeypatch.setattr(notification_outbox, "enqueue_task", _enqueue)
+    async with maker() as session:
+        board, worker, offline, task = await _seed(session)
+        queued = notification_outbox.queue_agent_notification(
+            session,
+            board=board,
+            agent=worker,
+            task_id=task.id,
+            message="TASK ASSIGNED",
+        )
+        skipped = notification_outbox.queue_agent_notification(
+            session,
+            board=board,
+            agent=offline,
+            message="TASK ASSIGNED",
+        )
+        await session.commit()
+        assert notification_outbox.publish_agent_notifications(session) == 1
+        assert notification_outbox.publish_agent_notifications(session) == 0
+
+        rolled_back = notification_outbox.queue_agent_notification(
+            session,
+            board=board,
+            agent=worker,
+            message="never committed",
+        )
+        assert rolled_back is not None
+        rolled_back_id = rolled_back.id
+        await session.rollback()
+        assert notification_outbox.publish_agent_notifications(session) == 1
+        rows = await AgentNotification.objects.all().all(session)
+
+    assert queued is not None
+    assert skipped is None
+    assert [row.id for row in rows] == [queued.id]
+    assert published[0].task_type == notification_outbox.TASK_TYPE
+    assert published[0].payload == {"notification_id": str(queued.id)}
+    # A wake-up for a rolled-back row finds nothing to deliver.
+    assert published[1].payload == {"notification_id": str(rolled_back_id)}
+    assert await notification_outbox.deliver_agent_notification(rolled_back_id) is None
+    assert _FakeDispatch.sent == []
+
+
+@pytest.mark.asyncio
+async def test_delivery_records_activity_and_removes_the_row(
+    maker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with maker() as session:
+        board, worker, _offline, task = await _seed(session)
+        queued = notification_outbox.queue_agent_notification(
+            session,
+            board=board,
+            agent=worker,
+            task_id=task.id,
+            message="TASK ASSIGNED",
+            activity_event_type="task.assignee",
+            activity_message="Agent notified for assignment: Worker.",
+        )
+        chat = notification_outbox.queue_agent_notification(
+            session,
+            board=board,
+            agent=worker,
+            message="/pause",
+            deliver=True,
+            urgent=True,
+        )
+        await session.commit()
+    assert queued is not None and chat is not None
+
+    assert await notification_outbox.deliver_agent_notification(queued.id) == "delivered"
+    assert await notification_outbox.deliver_agent_notification(queued.id) is None
+    assert await notification_outbox.sweep_agent_notifications() == 1
+
+    assert _FakeDispatch.sent == [
+        ("agent:worker:main", "TASK ASSIGNED", False),
+        ("agent:worker:main", "/pause", True),
+    ]
+    async with maker() as session:
+        assert await AgentNotification.objects.all().all(session) == []
+        assert await _activity_types(session) == ["task.assignee_notified"]
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_retries_then_records_failure_activity(
+    maker: async_sessionmaker[AsyncSession],
+) -> None:
+    _FakeDispatch.errors = [OpenClawGatewayError("down"), OpenClawGatewayError("still down")]
+    async with maker() as session:
+        board, worker, _offline, task = await _seed(session)
+        queued = notification_outbox.queue_agent_notification(
+            session,
+            board=board,
+            agent=worker,
+            task_id=task.id,
+            message="NEW TASK ADDED",
+            activity_event_type="task.lead",
+            failure_message="Lead notify failed",
+        )
+        await session.commit()
+    assert queued is not None
+    notification_id: UUID = queued.id
+
+    assert await notification_outbox.deliver_agent_notification(notification_id) == "retrying"
+    # Not due yet: neither a wake-up nor the sweep resends it.
+    assert await notification_outbox.deliver_agent_notification(notification_id) is None
+    assert await notification_outbox.sweep_agent_notifications() == 0
+
+    async with maker() as session:
+        row = await AgentNotification.objects.by_id(notification_id).first(session)
+        assert row is not None and row.attempts == 1 and row.last_error == "down"
+        row.next_attempt_at = utcnow() - timedelta(seconds=1)
+        session.add(row)
+        await session.commit()
+
+    assert await notification_outbox.sweep_agent_notifications() == 1
+    async with maker() as session:
+        row = await AgentNotification.objects.by_id(notification_id).first(session)
+        assert row is not None
+        assert row.status == notification_outbox.STATUS_FAILED
+        assert row.attempts == 2
+        failed = await ActivityEvent.objects.filter_by(task_id=task.id).all(session)
+        assert [event.event_type for event in failed] == ["task.lead_notify_failed"]
+        assert failed[0].message == "Lead notify failed: still down"
+        pending = await AgentNotification.objects.filter(
+            col(AgentNotification.status) != notification_outbox.STATUS_FAILED,
+        ).all(session)
+        assert pending == []
+    assert len(_FakeDispatch.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_bursts_to_one_session_are_sent_as_one_ordered_digest(
+    monkeypatch: pytest.MonkeyPatch,
+    maker: async_sessionmaker[AsyncSession],
+) -> None:
+    delays: list[float] = []
+
+    def _enqueue(
+        task: QueuedTask,
+        queue_name: str,
+        *,
+        redis_url: str | None = None,
+        delay_seconds: float = 0,
+    ) -> bool:
+        del task, queue_name, redis_url
+        delays.append(delay_seconds)
+        return True
+
+    monkeypatch.setattr(notification_outbox, "enqueue_task", _enqueue)
+    monkeypatch.setattr(notification_outbox.settings, "notification_digest_window_seconds", 30.0)
+    async with maker() as session:
+        board, worker, _offline, task = await _seed(session)
+        first = notification_outbox.queue_agent_notification(
+            session,
+            board=board,
+            agent=worker,
+            task_id=task.id,
+            message="TASK ASSIGNED\nTask: Ship it",
+            activity_event_type="task.assignee",
+        )
+        for body in ("NEW TASK COMMENT\nfirst", "TASK MENTION\nsecond", "NEW TASK COMMENT\nthird"):
+            notification_outbox.queue_agent_notification(
+                session,
+                board=board,
+                agent=worker,
+                task_id=task.id,
+                message=body,
+            )
+        urgent = notification_outbox.queue_agent_notification(
+            session,
+            board=board,
+            agent=worker,
+            message="/pause",
+            deliver=True,
+            urgent=True,
+        )
+        await session.commit()
+        notification_outbox.publish_agent_notifications(session)
+    assert first is not None and urgent is not None
+    assert delays == [30.0, 30.0, 30.0, 30.0, 0.0]
+
+    # Urgent rows go out immediately; the rest wait for the window.
+    assert await notification_outbox.sweep_agent_notifications() == 1
+    assert _FakeDispatch.sent == [("agent:worker:main", "/pause", True)]
+
+    async with maker() as session:
+        row = await AgentNotification.objects.by_id(first.id).first(session)
+        assert row is not None
+        row.next_attempt_at = utcnow()
+        session.add(row)
+        await session.commit()
+    assert await notification_outbox.deliver_agent_notification(first.id) == "delivered"
+
+    assert len(_FakeDispatch.sent) == 2
+    session_key, digest, deliver = _FakeDispatch.sent[1]
+    assert (session_key, deliver) == ("agent:worker:main", False)
+    assert digest.startswith("NOTIFICATION DIGEST (4 messages, oldest first)\n\n")
+    assert "Includes: TASK ASSIGNED, NEW TASK COMMENT x2, TASK MENTION" in digest
+    positions = [
+        digest.index(marker)
+        for marker in ("[1/4]\nTASK ASSIGNED", "\nfirst", "\nsecond", "\nthird")
+    ]
+    assert positions == sorted(positions)
+    async with maker() as session:
+        assert await AgentNotification.objects.all().all(session) == []
+        assert await _activity_types(session) == ["task.assignee_notified"]
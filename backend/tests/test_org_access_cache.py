@@ -0,0 +1,123 @@
+# ruff: noqa: INP001, SLF001
+"""Tests for cached organization membership and board-access decisions."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.boards import Board
+from app.models.organization_board_access import OrganizationBoardAccess
+from app.models.organization_members import OrganizationMember
+from app.models.organizations import Organization
+from app.models.users import User
+from app.schemas.organizations import OrganizationMemberAccessUpdate
+from app.services import organizations
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(engine: AsyncEngine) -> tuple[User, Board, OrganizationMember]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        org = Organization(name="Org")
+        session.add(org)
+        await session.flush()
+        user = User(clerk_user_id="u1", active_organization_id=org.id)
+        board = Board(organization_id=org.id, name="b", slug="b")
+        session.add_all([user, board])
+        await session.flush()
+        member = OrganizationMember(organization_id=org.id, user_id=user.id, role="member")
+        session.add(member)
+        await session.flush()
+        session.add(
+            OrganizationBoardAccess(
+                organization_member_id=member.id,
+                board_id=board.id,
+                can_read=True,
+                can_write=False,
+            ),
+        )
+        await session.commit()
+    return user, board, member
+
+
+@pytest.mark.asyncio
+async def test_board_access_is_cached_and_revocation_invalidates() -> None:
+    organizations.invalidate_org_access_cache()
+    engine = await _make_engine()
+    user, board, member = await _seed(engine)
+    cache = organizations._BOARD_ACCESS_CACHE
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        first = await organizations.require_board_access(
+            session, user=user, board=board, write=False
+        )
+        again = await organizations.require_board_access(
+            session, user=user, board=board, write=False
+        )
+        assert again is first
+        with pytest.raises(HTTPException):
+            await organizations.require_board_access(session, user=user, board=board, write=True)
+    assert cache.misses == 2
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        cached = await organizations.require_board_access(
+            session, user=user, board=board, write=False
+        )
+        assert cached.id == member.id
+    assert cache.hits == 1
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        db_member = await session.get(OrganizationMember, member.id)
+        assert db_member is not None
+        await organizations.apply_member_access_update(
+            session,
+            member=db_member,
+            update=OrganizationMemberAccessUpdate(
+                all_boards_read=False,
+                all_boards_write=False,
+                board_access=[],
+            ),
+        )
+        await session.commit()
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        with pytest.raises(HTTPException) as exc:
+            await organizations.require_board_access(session, user=user, board=board, write=False)
+    assert exc.value.status_code == 403
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_org_context_is_cached_and_member_delete_invalidates() -> None:
+    organizations.invalidate_org_access_cache()
+    engine = await _make_engine()
+    user, _board, member = await _seed(engine)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        ctx = await organizations.resolve_org_context(session, user)
+        assert ctx is not None
+        assert ctx.member.id == member.id
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        cached = await organizations.resolve_org_context(session, user)
+        assert cached is not None
+        assert cached.organization.name == "Org"
+        assert session.info["organization_access_memo"]
+    assert organizations._ORG_CONTEXT_CACHE.hits == 1
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        db_member = await session.get(OrganizationMember, member.id)
+        db_member.role = "admin"
+        session.add(db_member)
+        await session.commit()
+    assert len(organizations._ORG_CONTEXT_CACHE) == 0
+    await engine.dispose()
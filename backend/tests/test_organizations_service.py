@@ -46,6 +46,7 @@ class _FakeExecResult:
 class _FakeSession:
     exec_results: list[Any]
     get_results: dict[tuple[type[Any], Any], Any] = field(default_factory=dict)
+    info: dict[str, Any] = field(default_factory=dict)
     commit_side_effects: list[Exception] = field(default_factory=list)
 
     added: list[Any] = field(default_factory=list)
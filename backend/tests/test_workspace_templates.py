@@ -0,0 +1,96 @@
+# ruff: noqa: INP001
+"""Tests for process-wide compiled agent workspace templates."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from jinja2 import FileSystemLoader, meta
+
+import app.services.openclaw.provisioning as provisioning
+from app.models.agents import Agent
+from app.services.openclaw.constants import BOARD_SHARED_TEMPLATE_MAP, DEFAULT_GATEWAY_FILES
+from app.services.openclaw.workspace_templates import TEMPLATES_ROOT, WorkspaceTemplates
+from scripts.benchmark_template_render import RenderBenchmarkOptions, run_render_benchmark
+
+
+def _context_keys() -> set[str]:
+    templates = WorkspaceTemplates(TEMPLATES_ROOT, override_cache_size=0)
+    keys: set[str] = set()
+    for name in templates.env.list_templates(filter_func=lambda name: name.endswith(".j2")):
+        source, _, _ = templates.env.loader.get_source(templates.env, name)  # type: ignore[union-attr]
+        keys |= meta.find_undeclared_variables(templates.env.parse(source))
+    return keys
+
+
+def test_override_templates_are_compiled_once_per_content_hash() -> None:
+    templates = WorkspaceTemplates(TEMPLATES_ROOT, override_cache_size=2)
+
+    first = templates.from_source("Hello {{ agent_name }}")
+    assert templates.from_source("Hello {{ agent_name }}") is first
+    templates.from_source("Soul of {{ agent_name }}")
+    templates.from_source("Third {{ agent_name }}")
+    # The least recently used source was evicted and is compiled again.
+    assert templates.from_source("Hello {{ agent_name }}") is not first
+
+    stats = templates.override_stats()
+    assert (stats.size, stats.hits, stats.misses) == (2, 1, 4)
+    assert first.render(agent_name="Ada") == "Hello Ada"
+
+
+def test_renders_reuse_compiled_files_and_report_missing_ones(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    context = {name: "" for name in _context_keys()} | {"agent_name": "Ada"}
+    templates = WorkspaceTemplates(TEMPLATES_ROOT, override_cache_size=8)
+    monkeypatch.setattr(provisioning, "workspace_templates", templates)
+    loads: list[str] = []
+    get_source = FileSystemLoader.get_source
+
+    def _counting_get_source(
+        loader: FileSystemLoader,
+        environment: object,
+        template: str,
+    ) -> tuple[str, str, object]:
+        loads.append(template)
+        return get_source(loader, environment, template)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(FileSystemLoader, "get_source", _counting_get_source)
+    assert templates.warm() == len(loads) > 0
+    loads.clear()
+
+    agent = Agent(
+        name="Ada",
+        board_id=uuid4(),
+        identity_template="I am {{ agent_name }}.",
+    )
+    for _ in range(3):
+        rendered = provisioning._render_agent_files(
+            context,
+            agent,
+            set(DEFAULT_GATEWAY_FILES),
+            include_bootstrap=False,
+            template_overrides=BOARD_SHARED_TEMPLATE_MAP,
+        )
+
+    assert loads == []
+    assert rendered["IDENTITY.md"] == "I am Ada."
+    assert templates.override_stats().misses == 1
+    with pytest.raises(FileNotFoundError, match="Missing template file: NOPE.md.j2"):
+        provisioning._render_agent_files(
+            context,
+            agent,
+            {"AGENTS.md"},
+            include_bootstrap=False,
+            template_overrides={"AGENTS.md": "NOPE.md.j2"},
+        )
+
+
+def test_render_benchmark_reports_cold_and_cached_modes() -> None:
+    results = run_render_benchmark(RenderBenchmarkOptions(agents=6, lead_every=3))
+
+    assert [result.mode for result in results] == ["cold", "cached"]
+    cold, cached = results
+    assert cold.files == cached.files > 0
+    assert cached.total_ms < cold.total_ms
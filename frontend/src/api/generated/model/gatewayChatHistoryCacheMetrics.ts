@@ -0,0 +1,21 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+
+/**
+ * Chat history cache size and read counters for this backend worker.
+ */
+export interface GatewayChatHistoryCacheMetrics {
+  sessions: number;
+  messages: number;
+  /** Reads served from the cache without a gateway call. */
+  hits: number;
+  /** Reads refreshed by fetching only a short tail. */
+  incremental: number;
+  /** Reads that fetched the full cached transcript window. */
+  misses: number;
+  hit_rate: number;
+}
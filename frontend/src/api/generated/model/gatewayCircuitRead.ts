@@ -0,0 +1,21 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+import type { GatewayCircuitReadState } from "./gatewayCircuitReadState";
+
+/**
+ * Circuit-breaker state for a gateway as seen by this backend worker.
+ */
+export interface GatewayCircuitRead {
+  state?: GatewayCircuitReadState;
+  consecutive_failures?: number;
+  total_failures?: number;
+  total_rejected?: number;
+  latency_ms?: number | null;
+  opened_at?: string | null;
+  retry_at?: string | null;
+  last_error?: string | null;
+}
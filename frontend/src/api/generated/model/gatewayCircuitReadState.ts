@@ -0,0 +1,15 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+
+export type GatewayCircuitReadState =
+  (typeof GatewayCircuitReadState)[keyof typeof GatewayCircuitReadState];
+
+export const GatewayCircuitReadState = {
+  closed: "closed",
+  open: "open",
+  half_open: "half_open",
+} as const;
@@ -14,5 +14,7 @@ export interface GatewayCreate {
   workspace_root: string;
   allow_insecure_tls?: boolean;
   disable_device_pairing?: boolean;
+  disable_compression?: boolean;
+  event_subscription_enabled?: boolean;
   token?: string | null;
 }
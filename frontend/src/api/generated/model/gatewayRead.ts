@@ -4,6 +4,7 @@
  * Mission Control API
  * OpenAPI spec version: 0.1.0
  */
+import type { GatewayCircuitRead } from "./gatewayCircuitRead";
 
 /**
  * Gateway payload returned from read endpoints.
@@ -14,9 +15,12 @@ export interface GatewayRead {
   workspace_root: string;
   allow_insecure_tls?: boolean;
   disable_device_pairing?: boolean;
+  disable_compression?: boolean;
+  event_subscription_enabled?: boolean;
   id: string;
   organization_id: string;
   token?: string | null;
   created_at: string;
   updated_at: string;
+  circuit?: GatewayCircuitRead;
 }
@@ -0,0 +1,15 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+
+/**
+ * Cumulative latency histogram bucket.
+ */
+export interface GatewayRpcLatencyBucket {
+  /** Bucket upper bound in milliseconds; null for the +Inf bucket. */
+  le_ms?: number | null;
+  count: number;
+}
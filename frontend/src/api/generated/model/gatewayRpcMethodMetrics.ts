@@ -0,0 +1,25 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+import type { GatewayRpcLatencyBucket } from "./gatewayRpcLatencyBucket";
+
+/**
+ * Latency, error and byte counters for one gateway method, or one gateway's handshakes.
+ */
+export interface GatewayRpcMethodMetrics {
+  gateway_url: string;
+  method: string;
+  count: number;
+  gateway_errors: number;
+  transport_errors: number;
+  mean_ms?: number | null;
+  p50_ms?: number | null;
+  p95_ms?: number | null;
+  p99_ms?: number | null;
+  buckets: GatewayRpcLatencyBucket[];
+  bytes_sent?: number;
+  bytes_received?: number;
+}
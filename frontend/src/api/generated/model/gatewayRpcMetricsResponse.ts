@@ -0,0 +1,15 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+import type { GatewayRpcMethodMetrics } from "./gatewayRpcMethodMetrics";
+
+/**
+ * Per-method request and per-gateway handshake metrics for this backend worker.
+ */
+export interface GatewayRpcMetricsResponse {
+  requests: GatewayRpcMethodMetrics[];
+  handshakes: GatewayRpcMethodMetrics[];
+}
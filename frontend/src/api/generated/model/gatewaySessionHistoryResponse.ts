@@ -10,4 +10,10 @@
  */
 export interface GatewaySessionHistoryResponse {
   history: unknown[];
+  /** Position of the first returned message; pass as `before` for older pages. */
+  before_cursor?: number;
+  /** Position after the last returned message; pass as `after` for newer ones. */
+  after_cursor?: number;
+  /** Whether more messages exist in the paging direction. */
+  has_more?: boolean;
 }
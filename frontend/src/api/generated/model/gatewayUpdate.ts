@@ -15,4 +15,6 @@ export interface GatewayUpdate {
   workspace_root?: string | null;
   allow_insecure_tls?: boolean | null;
   disable_device_pairing?: boolean | null;
+  disable_compression?: boolean | null;
+  event_subscription_enabled?: boolean | null;
 }
@@ -7,4 +7,7 @@
 
 export type GetSessionHistoryApiV1GatewaysSessionsSessionIdHistoryGetParams = {
   board_id?: string | null;
+  limit?: number | null;
+  before?: number | null;
+  after?: number | null;
 };
@@ -87,6 +87,9 @@ export * from "./dashboardWipRangeSeries";
 export * from "./dashboardWipRangeSeriesBucket";
 export * from "./dashboardWipRangeSeriesRange";
 export * from "./dashboardWipSeriesSet";
+export * from "./gatewayChatHistoryCacheMetrics";
+export * from "./gatewayCircuitRead";
+export * from "./gatewayCircuitReadState";
 export * from "./gatewayCommandsResponse";
 export * from "./gatewayCreate";
 export * from "./gatewayLeadBroadcastBoardResult";
@@ -99,6 +102,9 @@ export * from "./gatewayLeadMessageResponse";
 export * from "./gatewayMainAskUserRequest";
 export * from "./gatewayMainAskUserResponse";
 export * from "./gatewayRead";
+export * from "./gatewayRpcLatencyBucket";
+export * from "./gatewayRpcMethodMetrics";
+export * from "./gatewayRpcMetricsResponse";
 export * from "./gatewaySessionHistoryResponse";
 export * from "./gatewaySessionMessageRequest";
 export * from "./gatewaySessionResponse";